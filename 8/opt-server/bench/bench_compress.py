@@ -0,0 +1,137 @@
+"""
+Measures the latency of a job with and without compression of the problem
+file and of the solution artifacts.
+
+Usage:
+  python3 bench/bench_compress.py [n] [repeats]
+
+A random sparse LP with n variables (default 200000) is written as an MPS
+file, plain and in each available compression. For each form this reports
+
+  - the file size,
+  - read:     streaming the problem file to plain data, as solio.readProblem
+              does for compressions readdataformat can not handle,
+  - compress: replacing an artifact of the same size by its compressed copy
+              (solve.py -compress),
+  - publish:  restoring the served name (solio.py publish, see tocondor.sh).
+
+When the mosek module is available, solve.py is also run end to end on each
+problem file, with and without -compress, and the wall clock time is
+reported together with the phases from timing.json. The best of the given
+number of repeats (default 3) is reported.
+"""
+import os,os.path,sys
+import json
+import shutil
+import subprocess
+import tempfile
+import time
+import numpy
+
+scriptdir = os.path.join(os.path.dirname(os.path.abspath(__file__)),'..','var','Mosek','server','script')
+sys.path.insert(0,scriptdir)
+import solio
+
+def writemps(fname,n,rng):
+    m = n//4
+    with open(fname,'wt',encoding='ascii') as f:
+        f.write('NAME          BENCH\nROWS\n N  obj\n')
+        for i in range(m):
+            f.write(' L  c%d\n' % i)
+        f.write('COLUMNS\n')
+        for j in range(n):
+            f.write('    x%-8d  obj       %.12g\n' % (j,-rng.rand()))
+            for i in numpy.unique(rng.randint(0,m,4)):
+                f.write('    x%-8d  c%-8d  %.12g\n' % (j,i,rng.rand()))
+        f.write('RHS\n')
+        for i in range(m):
+            f.write('    rhs       c%-8d  %.12g\n' % (i,1.0+rng.rand()))
+        f.write('BOUNDS\n')
+        for j in range(n):
+            f.write(' UP bnd       x%-8d  1\n' % j)
+        f.write('ENDATA\n')
+
+def best(repeats,fn):
+    res = None
+    for r in range(repeats):
+        t0 = time.time()
+        fn()
+        t = time.time()-t0
+        res = t if res is None else min(res,t)
+    return res
+
+def streamread(fname,method):
+    with solio._openread(fname,method) as src, open(os.devnull,'wb') as dst:
+        shutil.copyfileobj(src,dst,solio.blocksize)
+
+def compresspublish(tmpdir,plain,method):
+    workdir = os.path.join(tmpdir,'job')
+    os.makedirs(workdir,exist_ok=True)
+    artifact = os.path.join(workdir,'solution.task')
+    shutil.copyfile(plain,artifact)
+    t0 = time.time()
+    solio.compressFile(artifact,method)
+    t1 = time.time()
+    solio.publishArtifacts(workdir)
+    t2 = time.time()
+    shutil.rmtree(workdir)
+    return t1-t0,t2-t1
+
+def solve(tmpdir,probfile,extra):
+    workdir = tempfile.mkdtemp(dir=tmpdir)
+    t0 = time.time()
+    subprocess.check_call([ sys.executable, os.path.join(scriptdir,'solve.py'), workdir, probfile, '-noPID' ] + extra)
+    if '-noDone' in extra:
+        solio.publishArtifacts(workdir)
+    t = time.time()-t0
+    with open(os.path.join(workdir,'timing.json'),'rt') as f:
+        timing = json.load(f)
+    shutil.rmtree(workdir)
+    return t,timing
+
+def main(n,repeats):
+    rng = numpy.random.RandomState(0)
+    tmpdir = tempfile.mkdtemp()
+    try:
+        plain = os.path.join(tmpdir,'prob.mps')
+        writemps(plain,n,rng)
+        probs = [ (None,plain) ]
+        for method in solio.availableCompressions():
+            fname = plain + solio.suffixes[method]
+            with open(plain,'rb') as src, solio._openwrite(fname,method) as dst:
+                shutil.copyfileobj(src,dst,solio.blocksize)
+            probs.append((method,fname))
+
+        print('n = %d, best of %d' % (n,repeats))
+        print('  %-6s %12s %10s %10s %10s' % ('method','size','read','compress','publish'))
+        for method,fname in probs:
+            tread = best(repeats,lambda: streamread(fname,method))
+            if method is None:
+                tcomp,tpub = 0.0,0.0
+            else:
+                ts = [ compresspublish(tmpdir,plain,method) for r in range(repeats) ]
+                tcomp,tpub = min(t[0] for t in ts),min(t[1] for t in ts)
+            print('  %-6s %12d %10.4f %10.4f %10.4f' % (method or 'none',os.path.getsize(fname),tread,tcomp,tpub))
+
+        try:
+            import mosek
+        except ImportError:
+            print('mosek not available, skipping end to end runs')
+            return
+
+        print('  %-6s %-10s %10s %10s %10s %10s %10s' % ('input','artifacts','wall','read','optimize','write','compress'))
+        for method,fname in probs:
+            for amethod in [ None ] + solio.availableCompressions():
+                extra = [] if amethod is None else [ '-noDone', '-compress', amethod, '-compressThreshold', '0' ]
+                runs = [ solve(tmpdir,fname,extra) for r in range(repeats) ]
+                t,timing = min(runs,key=lambda r: r[0])
+                print('  %-6s %-10s %10.4f %10.4f %10.4f %10.4f %10.4f' %
+                      (method or 'none', amethod or 'none', t,
+                       timing.get('read',0.0), timing.get('optimize',0.0),
+                       timing.get('write',0.0), timing.get('compress',0.0)))
+    finally:
+        shutil.rmtree(tmpdir)
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 3)
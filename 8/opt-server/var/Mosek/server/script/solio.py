@@ -0,0 +1,125 @@
+import os,os.path
+import shutil
+import gzip
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+class UnknownCompression(Exception):
+    pass
+
+suffixes = { 'gzip' : '.gz', 'zstd' : '.zst' }
+
+# Size of the blocks used when streaming data through a compressor
+blocksize = 1 << 20
+
+def compressionOf(fname):
+    """
+    Determine the compression of a file from its extension, or None if
+    it is not compressed.
+    """
+    for method,suffix in suffixes.items():
+        if fname.endswith(suffix):
+            return method
+    return None
+
+def availableCompressions():
+    return [ 'gzip' ] + ([ 'zstd' ] if zstandard is not None else [])
+
+def _openread(fname,method):
+    if method is None:
+        return open(fname,'rb')
+    elif method == 'gzip':
+        return gzip.open(fname,'rb')
+    elif method == 'zstd':
+        if zstandard is None:
+            raise UnknownCompression("zstd support requires the zstandard module")
+        return zstandard.ZstdDecompressor().stream_reader(open(fname,'rb'),closefd=True)
+    else:
+        raise UnknownCompression(method)
+
+def _openwrite(fname,method):
+    if method == 'gzip':
+        # Level 1: we want throughput, not the last few percent
+        return gzip.open(fname,'wb',compresslevel=1)
+    elif method == 'zstd':
+        if zstandard is None:
+            raise UnknownCompression("zstd support requires the zstandard module")
+        return zstandard.ZstdCompressor(level=1).stream_writer(open(fname,'wb'),closefd=True)
+    else:
+        raise UnknownCompression(method)
+
+def readProblem(task,fname,workdir):
+    """
+    Read a problem file that may be compressed. Gzip is handled
+    natively by readdataformat; other compressions are streamed to an
+    uncompressed file in workdir first.
+    """
+    import mosek
+    method = compressionOf(fname)
+    if method is None:
+        task.readdata(fname)
+    elif method == 'gzip':
+        task.readdataformat(fname,mosek.dataformat.extension,mosek.compresstype.gzip)
+    else:
+        tmpfile = os.path.join(workdir,os.path.basename(fname)[:-len(suffixes[method])])
+        try:
+            with _openread(fname,method) as src, open(tmpfile,'wb') as dst:
+                shutil.copyfileobj(src,dst,blocksize)
+            task.readdata(tmpfile)
+        finally:
+            try: os.remove(tmpfile)
+            except OSError: pass
+
+def compressFile(fname,method,threshold=0):
+    """
+    Replace fname by a compressed copy fname.gz or fname.zst if it is at
+    least threshold bytes. Returns the name of the resulting file.
+    """
+    if method is None or not os.path.exists(fname) or os.path.getsize(fname) < threshold:
+        return fname
+    target = fname + suffixes[method]
+    tmpfile = target + '.tmp'
+    with open(fname,'rb') as src, _openwrite(tmpfile,method) as dst:
+        shutil.copyfileobj(src,dst,blocksize)
+    os.rename(tmpfile,target)
+    os.remove(fname)
+    return target
+
+# Files the server serves to clients by these names. They must be
+# uncompressed by the time the job is marked as done.
+served = [ 'solution.task', 'solution.jtask', 'solution.ascii' ]
+
+def publishArtifacts(workdir):
+    """
+    Restore the served file names in workdir: every served file that is
+    only present in compressed form is decompressed and the compressed
+    copy removed. Returns the names of the files that were decompressed.
+    """
+    res = []
+    for name in served:
+        fname = os.path.join(workdir,name)
+        if os.path.exists(fname):
+            continue
+        for method,suffix in suffixes.items():
+            if os.path.exists(fname+suffix):
+                tmpfile = fname + '.tmp'
+                with _openread(fname+suffix,method) as src, open(tmpfile,'wb') as dst:
+                    shutil.copyfileobj(src,dst,blocksize)
+                os.rename(tmpfile,fname)
+                os.remove(fname+suffix)
+                res.append(fname)
+                break
+    return res
+
+if __name__ == '__main__':
+    # Used by launchers that run solve.py with -noDone, see tocondor.sh:
+    #   solio.py publish WORKDIR
+    import sys
+    if len(sys.argv) == 3 and sys.argv[1] == 'publish':
+        publishArtifacts(sys.argv[2])
+    else:
+        sys.stderr.write('Usage: solio.py publish WORKDIR\n')
+        sys.exit(1)
@@ -2,6 +2,8 @@
 import sys
 import os,os.path
 import signal
+import json
+import time
 
 
 if __name__ == '__main__':
@@ -12,11 +14,41 @@ if __name__ == '__main__':
     os.chdir(workdir)
 
     nopid = False
-    try:
-        if sys.argv[3] == '-noPID':
+    # If set, the caller writes the done file, see tocondor.sh
+    nodone = False
+    # Minimum number of seconds between two records in progress.jsonl
+    progressinterval = 1.0
+    # If given, overrides iparam.num_threads (used by tolocal.py)
+    numthreads = None
+    # Compression of solution artifacts: None, 'gzip' or 'zstd'. Files
+    # smaller than the threshold are left uncompressed. The server serves
+    # the uncompressed names, so compressed artifacts are only written
+    # with -noDone, where the caller restores the names with
+    # 'solio.py publish' before it writes the done file.
+    compress = None
+    compressthreshold = 64 << 20
+    args = sys.argv[3:]
+    while args:
+        a = args.pop(0)
+        if a == '-noPID':
             nopid = True
-    except:
-        pass
+        elif a == '-noDone':
+            nodone = True
+        elif a == '-progressInterval' and args:
+            try: progressinterval = float(args.pop(0))
+            except ValueError: pass
+        elif a == '-numThreads' and args:
+            try: numthreads = int(args.pop(0))
+            except ValueError: pass
+        elif a == '-compress' and args:
+            compress = args.pop(0)
+            if compress == 'none': compress = None
+        elif a == '-compressThreshold' and args:
+            try: compressthreshold = int(args.pop(0))
+            except ValueError: pass
+
+    if not nodone:
+        compress = None
 
     logfile = os.path.join(workdir,"solver.log")
     resfile = os.path.join(workdir,"result.res")
@@ -25,11 +57,32 @@ if __name__ == '__main__':
     pidfile = os.path.join(workdir,"PID")
 
     donefile = os.path.join(workdir,"done")
+    progfile = os.path.join(workdir,"progress.jsonl")
+    timefile = os.path.join(workdir,"timing.json")
 
     jsolfile = os.path.join(workdir,"solution.jtask")
     tsolfile = os.path.join(workdir,"solution.task")
     asolfile = os.path.join(workdir,"solution.ascii")
 
+    # Site default parameters and per-job parameters. Both are JSON
+    # objects mapping parameter names, e.g. "MSK_IPAR_NUM_THREADS", to
+    # values. Job parameters are applied after the site defaults.
+    siteparamfile = os.path.join(os.path.dirname(os.path.abspath(__file__)),"params.json")
+    jobparamfile = os.path.join(workdir,"params.json")
+
+    def loadparams(fname,allowstr):
+        """
+        Read a parameter file as a list of (name,value) pairs. Unless
+        allowstr is set, string parameters are dropped, since they may
+        name files to be written.
+        """
+        if not os.path.exists(fname):
+            return []
+        with open(fname,"rt",encoding="utf-8") as f:
+            d = json.load(f)
+        return [ (k,v) for (k,v) in sorted(d.items())
+                 if allowstr or not k.upper().startswith('MSK_SPAR_') ]
+
     global_stop_optimization = 0
 
     def sighandler(signum, frame):
@@ -38,7 +91,7 @@ if __name__ == '__main__':
             #print("GOT SIGTERM")
             with open(os.path.join(workdir,"term"),'wb') as f: pass
             global_stop_optimization = 1
-        elif signum in [signal.SIGSEGV,signal.SIGKILL]: # hmm... can we even do this?!
+        elif signum in [signal.SIGSEGV,signal.SIGKILL] and not nodone: # hmm... can we even do this?!
             with open(donefile,'wt',encoding='ascii') as f:
                 f.write('sig %d' % signum)
     def pgscb(*args):
@@ -48,6 +101,65 @@ if __name__ == '__main__':
             return 1
         return 0
 
+    starttime = time.time()
+    lastprogress = None
+
+    def progressrecord(caller,douinf,intinf):
+        """
+        Collect objective values, gap and iteration counts for the
+        optimizer that issued the callback. Returns None for callbacks
+        that carry no progress information.
+        """
+        if caller in [mosek.callbackcode.intpnt, mosek.callbackcode.conic]:
+            pobj = douinf[mosek.dinfitem.intpnt_primal_obj]
+            dobj = douinf[mosek.dinfitem.intpnt_dual_obj]
+            gap  = abs(pobj-dobj)/max(1.0,abs(pobj))
+        elif caller in [mosek.callbackcode.update_primal_simplex,
+                        mosek.callbackcode.update_dual_simplex,
+                        mosek.callbackcode.primal_simplex,
+                        mosek.callbackcode.dual_simplex]:
+            pobj = douinf[mosek.dinfitem.sim_obj]
+            dobj = None
+            gap  = None
+        elif caller in [mosek.callbackcode.new_int_mio,
+                        mosek.callbackcode.im_mio]:
+            pobj = douinf[mosek.dinfitem.mio_obj_int]
+            dobj = douinf[mosek.dinfitem.mio_obj_bound]
+            gap  = douinf[mosek.dinfitem.mio_obj_rel_gap]
+        else:
+            return None
+
+        return { 'caller'     : repr(caller),
+                 'time'       : time.time()-starttime,
+                 'opttime'    : douinf[mosek.dinfitem.optimizer_time],
+                 'pobj'       : pobj,
+                 'dobj'       : dobj,
+                 'gap'        : gap,
+                 'intpntiter' : intinf[mosek.iinfitem.intpnt_iter],
+                 'simpiter'   : intinf[mosek.iinfitem.sim_primal_iter],
+                 'simditer'   : intinf[mosek.iinfitem.sim_dual_iter],
+                 'mionodes'   : intinf[mosek.iinfitem.mio_num_relax] }
+
+    def infocb(caller,douinf,intinf,lintinf):
+        global lastprogress
+        now = time.time()
+        if lastprogress is None or now-lastprogress >= progressinterval:
+            try:
+                rec = progressrecord(caller,douinf,intinf)
+                if rec is not None:
+                    # A single write() on an O_APPEND descriptor, so
+                    # readers never see a partial line.
+                    data = (json.dumps(rec)+'\n').encode('ascii')
+                    fd = os.open(progfile,os.O_WRONLY|os.O_APPEND|os.O_CREAT,0o644)
+                    try:
+                        os.write(fd,data)
+                    finally:
+                        os.close(fd)
+                    lastprogress = now
+            except:
+                pass
+        return pgscb()
+
     signal.signal(signal.SIGTERM,sighandler)
 
     if not nopid:
@@ -67,21 +179,46 @@ if __name__ == '__main__':
         else:
             try:
                 import solfmt
+                import solio
+
+                # Wall clock time of each phase of the job
+                timing = {}
+                def phase(name,t0):
+                    t1 = time.time()
+                    timing[name] = t1-t0
+                    return t1
 
                 with mosek.Env() as e:
                     with mosek.Task(e) as t:
-                        t.readdata(probfile)
+                        t0 = time.time()
+                        solio.readProblem(t,probfile,workdir)
+                        t0 = phase('read',t0)
                         # Reset all string parameters. This should ensure that no rogue files are written
-                        for p in mosek.sparam.members():
-                            t.putstrparam(p,"")
-
-                        t.set_Progress(pgscb)
+                        params = [ (p,"") for p in mosek.sparam.members() ]
+                        params.extend(loadparams(siteparamfile,True))
+                        params.extend(loadparams(jobparamfile,False))
+                        if numthreads is not None:
+                            params.append((mosek.iparam.num_threads,numthreads))
+                        t.putparams(params)
+
+                        t.set_InfoCallback(infocb)
                         t.linkfiletostream(mosek.streamtype.log,logfile,0)
                         trm = t.optimize()
+                        t0 = phase('optimize',t0)
 
                         t.writetasksolverresult_file(tsolfile)
                         t.writejsonsol(jsolfile)
                         solfmt.formatSolution(t,'ascii',asolfile)
+                        t0 = phase('write',t0)
+
+                        for fname in [tsolfile,jsolfile,asolfile]:
+                            solio.compressFile(fname,compress,compressthreshold)
+                        t0 = phase('compress',t0)
+
+                        timing['total'] = time.time()-starttime
+                        timing['compress-method'] = compress
+                        timing['probfile-size'] = os.path.getsize(probfile)
+                        with open(timefile,"wt",encoding="ascii") as f: json.dump(timing,f)
 
                         with open(resfile,"wt",encoding="ascii") as f: f.write("MSK_RES_OK")
                         with open(trmfile,"wt",encoding="ascii") as f: f.write("MSK_RES_"+repr(trm).upper())
@@ -98,7 +235,8 @@ if __name__ == '__main__':
                     f.write('\n')
                     f.write(str(e))
     finally:
-        with open(donefile,"wt",encoding="ascii") as f:
-            f.write("done")
+        if not nodone:
+            with open(donefile,"wt",encoding="ascii") as f:
+                f.write("done")
         try: os.remove(pidfile)
         except: pass
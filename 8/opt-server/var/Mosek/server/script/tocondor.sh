@@ -16,6 +16,13 @@
 # that runs the actual job (remote or local). This should happen
 # automatically (I hope).
 
+# Large solution files are gzip-compressed on the Condor node to save
+# transfer time over the shared file system. The server only serves the
+# uncompressed names, so they are restored here, on the server host,
+# before the job is marked as done.
+
 echo $BASHPID > "$1/PID"
-condor_run "$(dirname $0)/solve.py" "$1" "$2" "-noPID"
+condor_run "$(dirname $0)/solve.py" "$1" "$2" "-noPID" "-noDone" "-compress" "gzip"
+python3 "$(dirname $0)/solio.py" publish "$1"
+echo -n done > "$1/done"
 rm -rf $BASHPID > "$1/PID"
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+
+# This script can be used to run jobs through a local scheduler instead
+# of starting solve.py directly. It is intended for single-host
+# deployments where many jobs may arrive at once. To use it, set
+#
+#   "cmd" : "$basedir/../script/tolocal.py $workdir $taskfile"
+#
+# in the server configuration. Options may be appended after $taskfile:
+#
+#   -numThreads N   Threads used by each job (iparam.num_threads). At
+#                   most (number of cores)/N jobs run at the same time.
+#   -user NAME      Owner of the job. Defaults to the name of the
+#                   directory containing the work directory.
+#   -priority P     Jobs with higher priority are started first among
+#                   the waiting jobs of the same user. Priority does not
+#                   let a user go ahead of other users.
+#   -maxSize BYTES  Total size of problem files of running jobs. A job
+#                   is only admitted when it fits, or when nothing else
+#                   is running.
+#   -spool DIR      Directory shared by all jobs on the host.
+#
+# Any other options are passed on to solve.py.
+#
+# Jobs coordinate through files in the spool directory guarded by an
+# exclusive lock, so no daemon is needed. Users are served round-robin:
+# the next job started belongs to the user with fewest running jobs.
+#
+# Sending SIGTERM to this process while the job is waiting removes it
+# from the queue and marks it as terminated. While the job is running,
+# SIGTERM is propagated to solve.py, which stops the optimizer.
+
+import sys
+import os,os.path
+import signal
+import json
+import time
+import fcntl
+import subprocess
+import tempfile
+
+
+def pidalive(pid):
+    try:
+        os.kill(pid,0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+class Spool:
+    """
+    Queue and slot table shared between all jobs on the host. All
+    methods must be called while holding the lock.
+    """
+    def __init__(self,spooldir):
+        self.qdir = os.path.join(spooldir,'queue')
+        self.rdir = os.path.join(spooldir,'running')
+        for d in [self.qdir,self.rdir]:
+            try: os.makedirs(d)
+            except FileExistsError: pass
+        self.lockfile = os.path.join(spooldir,'lock')
+
+    def __enter__(self):
+        self.fd = os.open(self.lockfile,os.O_RDWR|os.O_CREAT,0o644)
+        fcntl.flock(self.fd,fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self,exc_type,exc_value,traceback):
+        fcntl.flock(self.fd,fcntl.LOCK_UN)
+        os.close(self.fd)
+
+    def __entries(self,d):
+        res = []
+        for n in os.listdir(d):
+            fname = os.path.join(d,n)
+            try:
+                with open(fname,'rt',encoding='utf-8') as f:
+                    e = json.load(f)
+            except (OSError,ValueError):
+                continue
+            if pidalive(e['pid']):
+                res.append(e)
+            else: # stale entry from a job that died
+                try: os.remove(fname)
+                except OSError: pass
+        return res
+
+    def waiting(self): return self.__entries(self.qdir)
+    def running(self): return self.__entries(self.rdir)
+
+    def nextseq(self):
+        seqs = [ e['seq'] for e in self.waiting() + self.running() ]
+        return max(seqs)+1 if seqs else 0
+
+    def put(self,entry):
+        with open(os.path.join(self.qdir,str(entry['pid'])),'wt',encoding='utf-8') as f:
+            json.dump(entry,f)
+
+    def start(self,entry):
+        os.rename(os.path.join(self.qdir,str(entry['pid'])),
+                  os.path.join(self.rdir,str(entry['pid'])))
+
+    def remove(self,entry):
+        for d in [self.qdir,self.rdir]:
+            try: os.remove(os.path.join(d,str(entry['pid'])))
+            except OSError: pass
+
+def selectnext(waiting,running):
+    """
+    Pick the waiting job to start next. The user is chosen first: the
+    one with fewest running jobs, ties going to the user who has waited
+    longest. Among that user's jobs the highest priority goes first,
+    then the oldest job.
+    """
+    if not waiting:
+        return None
+    peruser = {}
+    for e in running:
+        peruser[e['user']] = peruser.get(e['user'],0)+1
+    user = min(waiting, key = lambda e: (peruser.get(e['user'],0),e['seq']))['user']
+    return min((e for e in waiting if e['user'] == user), key = lambda e: (-e['priority'],e['seq']))
+
+def admissible(entry,running,maxjobs,maxsize):
+    if len(running) >= maxjobs:
+        return False
+    if not running:
+        return True
+    return maxsize is None or sum([ e['size'] for e in running ]) + entry['size'] <= maxsize
+
+
+if __name__ == '__main__':
+
+    workdir = os.path.abspath(sys.argv[1])
+    probfile = os.path.abspath(sys.argv[2])
+
+    numthreads = 1
+    user = os.path.basename(os.path.dirname(workdir))
+    priority = 0
+    maxsize = None
+    spooldir = os.path.join(tempfile.gettempdir(),'mosek-localsched')
+    solveargs = []
+    args = sys.argv[3:]
+    while args:
+        a = args.pop(0)
+        if   a == '-numThreads' and args: numthreads = max(1,int(args.pop(0)))
+        elif a == '-user' and args:       user = args.pop(0)
+        elif a == '-priority' and args:   priority = int(args.pop(0))
+        elif a == '-maxSize' and args:    maxsize = int(args.pop(0))
+        elif a == '-spool' and args:      spooldir = args.pop(0)
+        else:                             solveargs.append(a)
+
+    maxjobs = max(1,(os.cpu_count() or 1)//numthreads)
+
+    pidfile = os.path.join(workdir,"PID")
+    donefile = os.path.join(workdir,"done")
+
+    with open(pidfile,'wt',encoding='ascii') as f:
+        f.write(str(os.getpid()))
+
+    spool = Spool(spooldir)
+    entry = { 'pid'      : os.getpid(),
+              'user'     : user,
+              'priority' : priority,
+              'size'     : os.path.getsize(probfile) if os.path.exists(probfile) else 0,
+              'workdir'  : workdir }
+
+    child = None
+    terminated = False
+
+    def sighandler(signum, frame):
+        global terminated
+        if signum == signal.SIGTERM:
+            terminated = True
+            if child is not None:
+                child.send_signal(signal.SIGTERM)
+
+    signal.signal(signal.SIGTERM,sighandler)
+
+    try:
+        with spool:
+            entry['seq'] = spool.nextseq()
+            spool.put(entry)
+
+        while child is None and not terminated:
+            with spool:
+                running = spool.running()
+                if selectnext(spool.waiting(),running)['pid'] == entry['pid'] and \
+                   admissible(entry,running,maxjobs,maxsize):
+                    spool.start(entry)
+                    child = subprocess.Popen([ sys.executable,
+                                               os.path.join(os.path.dirname(os.path.abspath(__file__)),'solve.py'),
+                                               workdir, probfile, '-noPID',
+                                               '-numThreads', str(numthreads) ] + solveargs)
+            if child is None:
+                time.sleep(0.2)
+
+        if child is not None:
+            if terminated: # SIGTERM arrived while the child was being started
+                child.send_signal(signal.SIGTERM)
+            child.wait()
+        else:
+            # Terminated before the job was started. Report it the same
+            # way solve.py does.
+            with open(os.path.join(workdir,"term"),'wb') as f: pass
+            with open(donefile,"wt",encoding="ascii") as f:
+                f.write("done")
+    finally:
+        with spool:
+            spool.remove(entry)
+        try: os.remove(pidfile)
+        except: pass
@@ -0,0 +1,287 @@
+##
+#  Copyright : Copyright (c) MOSEK ApS, Denmark. All rights reserved.
+#
+#  File :      opt_server_pool.py
+#
+#  Purpose :   Demonstrates how to drive many asynchronous OptServer
+#              jobs at once. Tasks are submitted with asyncoptimize,
+#              the outstanding tokens are polled from a small thread
+#              pool with exponential back-off, and the results are
+#              delivered through concurrent.futures/asyncio futures.
+#
+#              Requires Python 3.5 or later. To test against a local
+#              server, start 8/opt-server/bin/MosekServer and run
+#
+#               opt_server_pool.py localhost 30080 60 file1 [file2 ...]
+##
+import mosek
+import sys
+import time
+import heapq
+import threading
+import asyncio
+import concurrent.futures
+
+
+class TaskPool:
+    """
+    A pool of empty tasks used as handles for asyncpoll and asyncstop,
+    so polling does not allocate a native task per request.
+    """
+    def __init__(self, env):
+        self.__env = env
+        self.__lock = threading.Lock()
+        self.__free = []
+
+    def acquire(self):
+        with self.__lock:
+            if self.__free:
+                return self.__free.pop()
+        return mosek.Task(self.__env, 0, 0)
+
+    def release(self, task):
+        with self.__lock:
+            self.__free.append(task)
+
+    def dispose(self):
+        with self.__lock:
+            for t in self.__free:
+                t.__del__()
+            self.__free = []
+
+
+class _Job:
+    def __init__(self, task, token, future, deadline, delay):
+        self.task = task
+        self.token = token
+        self.future = future
+        self.deadline = deadline
+        self.delay = delay
+
+
+class AsyncClient:
+    """
+    Multiplexes any number of remote jobs on one OptServer.
+
+    Each submitted task is sent with asyncoptimize and its token is kept
+    in a table of outstanding jobs. A scheduler thread hands due tokens
+    to a small pool of worker threads calling asyncpoll; a job that is
+    not finished has its poll interval multiplied by `backoff`, up to
+    `maxdelay`. When the result is available, it is fetched with
+    asyncgetresult into the submitted task and the job's future is
+    resolved with (task, trmcode, rescode).
+
+    A job that passes its timeout, or whose future is cancelled, is
+    stopped on the server with asyncstop.
+    """
+    def __init__(self, env, host, port,
+                 workers=4, mindelay=0.05, maxdelay=5.0, backoff=2.0):
+        self.__env = env
+        self.__host = host
+        self.__port = port
+        self.__mindelay = mindelay
+        self.__maxdelay = maxdelay
+        self.__backoff = backoff
+
+        self.__pool = TaskPool(env)
+        self.__workers = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+
+        self.__cond = threading.Condition()
+        self.__jobs = {}      # token -> _Job
+        self.__queue = []     # heap of (nextpoll, seq, token)
+        self.__seq = 0
+        self.__closed = False
+
+        self.__scheduler = threading.Thread(target=self.__schedule)
+        self.__scheduler.daemon = True
+        self.__scheduler.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def outstanding(self):
+        """ Number of jobs not yet finished. """
+        with self.__cond:
+            return len(self.__jobs)
+
+    def submit(self, task, timeout=None):
+        """
+        Submit a task for remote optimization and return a
+        concurrent.futures.Future.
+
+        The task must stay alive until the future is resolved, since the
+        result is loaded into it.
+        """
+        with self.__cond:
+            if self.__closed:
+                raise RuntimeError("Client is closed")
+        token = task.asyncoptimize(self.__host, self.__port)
+        future = concurrent.futures.Future()
+        deadline = None if timeout is None else time.time() + timeout
+        job = _Job(task, token, future, deadline, self.__mindelay)
+        future.add_done_callback(lambda f: self.__cancelled(token) if f.cancelled() else None)
+        with self.__cond:
+            if not self.__closed:
+                self.__jobs[token] = job
+                self.__push(time.time() + job.delay, token)
+                return future
+        # Closed while the task was sent; do not leave the job running.
+        self.__stop(token)
+        raise RuntimeError("Client is closed")
+
+    def solve(self, task, timeout=None):
+        """
+        Submit a task and return an awaitable resolving to
+        (task, trmcode, rescode). Must be called from a running event loop.
+        """
+        return asyncio.wrap_future(self.submit(task, timeout))
+
+    def close(self):
+        """
+        Stop all outstanding jobs and shut down the worker threads.
+        """
+        with self.__cond:
+            self.__closed = True
+            jobs = list(self.__jobs.values())
+            self.__jobs.clear()
+            self.__queue = []
+            self.__cond.notify()
+        for job in jobs:
+            self.__stop(job.token)
+            job.future.cancel()
+            job.future.set_running_or_notify_cancel()
+        self.__scheduler.join()
+        self.__workers.shutdown(wait=True)
+        self.__pool.dispose()
+
+    def __push(self, when, token):
+        self.__seq += 1
+        heapq.heappush(self.__queue, (when, self.__seq, token))
+        self.__cond.notify()
+
+    def __schedule(self):
+        with self.__cond:
+            while not self.__closed:
+                if not self.__queue:
+                    self.__cond.wait()
+                    continue
+                when, _, token = self.__queue[0]
+                now = time.time()
+                if when > now:
+                    self.__cond.wait(when - now)
+                    continue
+                heapq.heappop(self.__queue)
+                job = self.__jobs.get(token)
+                if job is not None:
+                    self.__workers.submit(self.__poll, job)
+
+    def __finish(self, job):
+        """
+        Take the job out of the table and mark its future as running, so
+        it can no longer be cancelled. Returns True if the caller must now
+        resolve the future, False if the job was already finished or its
+        future was cancelled.
+        """
+        with self.__cond:
+            if self.__jobs.pop(job.token, None) is None:
+                return False
+        if not job.future.set_running_or_notify_cancel():
+            # Cancelled after the job left the table, so __cancelled did
+            # not stop it.
+            self.__stop(job.token)
+            return False
+        return True
+
+    def __poll(self, job):
+        if job.deadline is not None and time.time() > job.deadline:
+            if self.__finish(job):
+                self.__stop(job.token)
+                job.future.set_exception(concurrent.futures.TimeoutError(job.token))
+            return
+
+        t = self.__pool.acquire()
+        try:
+            respavailable, _, _ = t.asyncpoll(self.__host, self.__port, job.token)
+        except Exception as e:
+            if self.__finish(job):
+                job.future.set_exception(e)
+            return
+        finally:
+            self.__pool.release(t)
+
+        if respavailable:
+            if self.__finish(job):
+                try:
+                    _, trm, res = job.task.asyncgetresult(self.__host, self.__port, job.token)
+                except Exception as e:
+                    job.future.set_exception(e)
+                else:
+                    job.future.set_result((job.task, trm, res))
+        else:
+            job.delay = min(job.delay * self.__backoff, self.__maxdelay)
+            when = time.time() + job.delay
+            if job.deadline is not None:
+                when = min(when, job.deadline)
+            with self.__cond:
+                if job.token in self.__jobs:
+                    self.__push(when, job.token)
+
+    def __cancelled(self, token):
+        with self.__cond:
+            job = self.__jobs.pop(token, None)
+        if job is not None:
+            self.__stop(token)
+            # Wakes up concurrent.futures.wait on the future
+            job.future.set_running_or_notify_cancel()
+
+    def __stop(self, token):
+        t = self.__pool.acquire()
+        try:
+            t.asyncstop(self.__host, self.__port, token)
+        except mosek.Error:
+            pass
+        finally:
+            self.__pool.release(t)
+
+
+async def solveall(client, tasks, timeout):
+    return await asyncio.gather(*[client.solve(t, timeout) for t in tasks],
+                                return_exceptions=True)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 5:
+        print("Missing argument, syntax is:")
+        print("  opt_server_pool host port timeout inputfile [inputfile ...]")
+    else:
+        host = sys.argv[1]
+        port = sys.argv[2]
+        timeout = float(sys.argv[3])
+        filenames = sys.argv[4:]
+
+        with mosek.Env() as env:
+            tasks = []
+            for filename in filenames:
+                task = mosek.Task(env, 0, 0)
+                task.readdata(filename)
+                tasks.append(task)
+
+            with AsyncClient(env, host, port) as client:
+                loop = asyncio.new_event_loop()
+                try:
+                    results = loop.run_until_complete(solveall(client, tasks, timeout))
+                finally:
+                    loop.close()
+
+            for filename, r in zip(filenames, results):
+                if isinstance(r, BaseException):
+                    print("%s: failed (%s)" % (filename, repr(r)))
+                else:
+                    task, trm, res = r
+                    print("%s: trm = %s, res = %s, primal obj = %s" %
+                          (filename, repr(trm), repr(res),
+                           repr(task.getprimalobj(mosek.soltype.itr))
+                           if task.solutiondef(mosek.soltype.itr) else '-'))
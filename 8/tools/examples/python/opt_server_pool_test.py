@@ -0,0 +1,132 @@
+##
+#  Copyright : Copyright (c) MOSEK ApS, Denmark. All rights reserved.
+#
+#  File :      opt_server_pool_test.py
+#
+#  Purpose :   Exercises the AsyncClient from opt_server_pool.py against
+#              a running OptServer: results, timeouts, cancellation at
+#              random points and closing the client while tasks are
+#              being submitted.
+#
+#              Start a local server with 8/opt-server/bin/MosekServer
+#              and run
+#
+#               opt_server_pool_test.py localhost 30080 [jobs]
+##
+import mosek
+import sys
+import time
+import random
+import threading
+import concurrent.futures
+
+from opt_server_pool import AsyncClient
+
+# Futures resolved after they were cancelled. Recorded here since the
+# exception is raised in a worker thread, where nobody sees it.
+lateresolved = []
+
+def watch(name):
+    setfn = getattr(concurrent.futures.Future, name)
+    def watched(self, *args):
+        if self.cancelled():
+            lateresolved.append(name)
+        return setfn(self, *args)
+    setattr(concurrent.futures.Future, name, watched)
+
+def randomlp(env, n, m, seed):
+    rnd = random.Random(seed)
+    task = mosek.Task(env, 0, 0)
+    task.appendvars(n)
+    task.appendcons(m)
+    for j in range(n):
+        task.putcj(j, -rnd.random())
+        task.putvarbound(j, mosek.boundkey.ra, 0.0, 1.0)
+    for i in range(m):
+        sub = sorted(rnd.sample(range(n), min(n, 10)))
+        task.putarow(i, sub, [rnd.random() for j in sub])
+        task.putconbound(i, mosek.boundkey.up, -0.0, 1.0 + rnd.random())
+    return task
+
+def wait(client, futures, timeout):
+    concurrent.futures.wait(futures, timeout)
+    assert all(f.done() for f in futures), "jobs still pending"
+    assert client.outstanding() == 0, "jobs left in the client"
+
+def checkresults(env, host, port, jobs):
+    tasks = [randomlp(env, 200, 100, k) for k in range(jobs)]
+    with AsyncClient(env, host, port) as client:
+        futures = [client.submit(t) for t in tasks]
+        wait(client, futures, 600)
+    for t, f in zip(tasks, futures):
+        task, trm, res = f.result()
+        assert task is t and trm == mosek.rescode.ok and res == mosek.rescode.ok
+        local = mosek.Task(t)
+        local.optimize()
+        assert abs(local.getprimalobj(mosek.soltype.itr) -
+                   task.getprimalobj(mosek.soltype.itr)) < 1e-6
+    print("results: %d jobs ok" % jobs)
+
+def checktimeout(env, host, port, jobs):
+    tasks = [randomlp(env, 200, 100, k) for k in range(jobs)]
+    with AsyncClient(env, host, port) as client:
+        futures = [client.submit(t, timeout=0.0) for t in tasks]
+        wait(client, futures, 60)
+    for f in futures:
+        assert isinstance(f.exception(), concurrent.futures.TimeoutError)
+    print("timeout: %d jobs ok" % jobs)
+
+def checkcancel(env, host, port, jobs):
+    # Cancel each job at a random time, so some are cancelled while they
+    # are polled or their result is fetched.
+    rnd = random.Random(0)
+    tasks = [randomlp(env, 200, 100, k) for k in range(jobs)]
+    with AsyncClient(env, host, port, mindelay=0.01) as client:
+        futures = [client.submit(t) for t in tasks]
+        for f in futures:
+            time.sleep(rnd.random() * 0.01)
+            f.cancel()
+        wait(client, futures, 600)
+    ncancelled = sum(1 for f in futures if f.cancelled())
+    print("cancel: %d of %d jobs cancelled" % (ncancelled, jobs))
+
+def checkclose(env, host, port, jobs):
+    # Close the client while another thread is submitting.
+    tasks = [randomlp(env, 200, 100, k) for k in range(jobs)]
+    futures = []
+    refused = []
+    client = AsyncClient(env, host, port)
+    def submitall():
+        for t in tasks:
+            try:
+                futures.append(client.submit(t))
+            except RuntimeError:
+                refused.append(t)
+    submitter = threading.Thread(target=submitall)
+    submitter.start()
+    time.sleep(0.02)
+    client.close()
+    submitter.join()
+    concurrent.futures.wait(futures, 60)
+    assert all(f.done() for f in futures), "jobs still pending"
+    assert len(futures) + len(refused) == jobs
+    print("close: %d submitted, %d refused" % (len(futures), len(refused)))
+
+if __name__ == '__main__':
+    if len(sys.argv) < 3:
+        print("Missing argument, syntax is:")
+        print("  opt_server_pool_test host port [jobs]")
+    else:
+        host = sys.argv[1]
+        port = sys.argv[2]
+        jobs = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+
+        watch('set_result')
+        watch('set_exception')
+        with mosek.Env() as env:
+            checkresults(env, host, port, jobs)
+            checktimeout(env, host, port, jobs)
+            checkcancel(env, host, port, jobs)
+            checkclose(env, host, port, jobs)
+        assert not lateresolved, "%d cancelled futures were resolved" % len(lateresolved)
+        print("ok")
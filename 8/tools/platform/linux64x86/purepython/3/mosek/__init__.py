@@ -9893,6 +9893,34 @@ class Task:
     if res != 0:
       result,msg = self.__getlasterror(res)
       raise Error(rescode(res),Env.getcodedesc(rescode(res))[1])
+  def putparams(self,params):
+    """
+    Sets a number of parameters in one call.
+  
+    putparams(self,params)
+      params: dict or list of (parameter,value) pairs. A parameter is either a
+        mosek.iparam, mosek.dparam or mosek.sparam item, or a parameter name
+        as accepted by putparam. Parameters are applied in the given order.
+    """
+    nativep = self.__nativep
+    if isinstance(params,dict):
+      params = params.items()
+    for param_,parvalue_ in params:
+      if isinstance(param_,iparam):
+        res = __library__.MSK_XX_putintparam(nativep,param_,int(parvalue_))
+      elif isinstance(param_,dparam):
+        res = __library__.MSK_XX_putdouparam(nativep,param_,float(parvalue_))
+      elif isinstance(param_,sparam):
+        res = __library__.MSK_XX_putstrparam(nativep,param_,parvalue_.encode("utf-8",errors="replace"))
+      elif isinstance(param_,str):
+        if isinstance(parvalue_,float):  parvalue_ = repr(parvalue_)
+        elif isinstance(parvalue_,int):  parvalue_ = str(int(parvalue_))
+        res = __library__.MSK_XX_putparam(nativep,param_.encode("utf-8",errors="replace"),str(parvalue_).encode("utf-8",errors="replace"))
+      else:
+        raise TypeError("Invalid parameter %s" % repr(param_))
+      if res != 0:
+        result,msg = self.__getlasterror(res)
+        raise Error(rescode(res),Env.getcodedesc(rescode(res))[1])
   @accepts(_accept_any,_make_intvector,_make_intvector,_make_intvector,_make_doublevector)
   def putqcon(self,qcsubk_,qcsubi_,qcsubj_,qcval_):
     """
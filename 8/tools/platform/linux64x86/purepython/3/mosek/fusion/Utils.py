@@ -1,4 +1,5 @@
 from mosek.fusion.impl._implementation import mosek_fusion_Utils_StringIntMap as StringIntMap
 from mosek.fusion.impl._implementation import mosek_fusion_Utils_IntMap as IntMap
+from mosek.fusion.impl._implementation import mosek_fusion_Utils_SortedIntMap as SortedIntMap
 from mosek.fusion.impl._implementation import mosek_fusion_Utils_StringBuffer as StringBuffer
 from mosek.fusion.impl._implementation import mosek_fusion_Utils_Tools as Tools
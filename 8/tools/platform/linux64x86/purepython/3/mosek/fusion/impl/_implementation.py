@@ -1,6 +1,7 @@
 import numpy
 import types
 import io
+import os
 import sys
 import mosek
 
@@ -39,6 +40,39 @@ def _():
 
 class _monty:
   Enum = _()
+
+  # Conversion of nested lists passed where arrays are expected:
+  #   'numpy'  - regular input is shape checked and converted by a single
+  #              numpy call, irregular input is walked recursively (default),
+  #   'python' - always walk nested lists recursively.
+  # The default may be overridden with the environment variable
+  # MOSEK_FUSION_ARRAYS.
+  arrayimpl = os.environ.get('MOSEK_FUSION_ARRAYS','numpy')
+
+  @staticmethod
+  def regularArray(l,dim,dtype=None):
+    """
+    Convert l to an array of dimension dim with one numpy call. Returns
+    None if l is not a list or array, if it is irregular or of another
+    dimension, or if the 'python' implementation is selected.
+    """
+    if _monty.arrayimpl != 'numpy' or not (isinstance(l,list) or isinstance(l,numpy.ndarray)):
+      return None
+    try:
+      # Catch ragged rows up front; numpy would warn about them or
+      # build an object array
+      if dim > 1 and isinstance(l,list) and len(set(map(len,l))) > 1:
+        return None
+      a = numpy.asarray(l) if dtype is None else numpy.array(l,dtype=dtype)
+    except (TypeError,ValueError):
+      return None
+    return a if a.ndim == dim else None
+  @staticmethod
+  def makeArray(src,dim,dtype):
+    r = _monty.regularArray(src,dim,dtype)
+    if r is None:
+      r = numpy.array(src,ndmin=_monty.checkShape(src,dim),dtype=dtype)
+    return r
   @staticmethod
   def deduceShape(l,dim):
     def _deduceShape(l,dim):
@@ -71,6 +105,12 @@ class _monty:
     return dim
   @staticmethod
   def initJaggedArray(data, nd):
+    if nd == 1:
+      # The elements are usually arrays; assigning the list in one go
+      # would make numpy try to stack them first
+      res = numpy.zeros((len(data),),dtype=object)
+      for i,d in enumerate(data): res[i] = d
+      return res
     dims = []
     d = data
     for i in range(nd):
@@ -112,6 +152,11 @@ class _monty:
       return r
     elif ndims[0] == 1:
       r = numpy.zeros((len(src),),dtype=numpy.dtype(object))
+      if len(ndims) == 2 and dtype != numpy.dtype(object):
+        a = _monty.regularArray(src,2,dtype)
+        if a is not None: # rows of equal length: convert once, store row views
+          for i in range(a.shape[0]): r[i] = a[i]
+          return r
       # Note: This is a bit tricky to do reliably with numpy as it
       # tends to think we are dealing with multidimensional arrays and
       # explode
@@ -140,7 +185,11 @@ class _monty:
       for i in range(len(src)):
         _monty.copyArray(src[i],dst[i],dim-1)
   @staticmethod
-  def arg_match_sloppy_array(v,elmmatch,dim,l=None):
+  def arg_match_sloppy_array(v,elmmatch,dim,l=None,kinds=None):
+    if kinds is not None:
+      # kinds: numpy dtype kinds that elmmatch accepts
+      a = _monty.regularArray(v,dim)
+      if a is not None and a.dtype.kind in kinds: return True
     if dim == 0:
       elmmatch(v)
     elif dim == 1:
@@ -935,7 +984,7 @@ def __mk_mosek_fusion_Variable():
     _0, = args
     return (__arg_alt_match__3_5I__(_0))
   def _pick_alt__3_5I(self,_t__0):
-   _0=numpy.array(_t__0,ndmin=_monty.checkShape(_t__0,2),dtype=numpy.dtype(numpy.int32))
+   _0=_monty.makeArray(_t__0,2,numpy.dtype(numpy.int32))
    _1 = self._pick__3_5I(_0)
    return _1
   def _pick__3_5I(self,_0):
@@ -1264,7 +1313,7 @@ def __mk_mosek_fusion_Expression():
     _0, = args
     return (__arg_alt_match__3_5I__(_0))
   def _pick_alt__3_5I(self,_t__0):
-   _0=numpy.array(_t__0,ndmin=_monty.checkShape(_t__0,2),dtype=numpy.dtype(numpy.int32))
+   _0=_monty.makeArray(_t__0,2,numpy.dtype(numpy.int32))
    _1 = self._pick__3_5I(_0)
    return _1
   def _pick__3_5I(self,_0):
@@ -2279,30 +2328,100 @@ mosek_fusion_IOError=__mk_mosek_fusion_IOError()
 del __mk_mosek_fusion_IOError
 def __mk_mosek_fusion_BaseModel():
   import threading
+  import atexit
+  try:
+    import queue
+  except ImportError:
+    import Queue as queue
   import mosek
   import mosek.fusion
   import numpy
+  import inspect
+  import pickle
+  import tempfile
+  import json
   
   
   class BaseModel(object):
     _lock = threading.Lock()
     _global_env = None
-    _global_env_counter = 0
+    _thread = threading.local()
+    _reaper = None
+    _worker = threading.local()
+    # Version of the file format written by Model.save
+    _save_1version = 2
+    class _Deferred(Exception):
+      pass
   
     @classmethod
     def _globalEnv(self):
+      # Once created the environment never changes, so only its creation
+      # needs the lock.
+      env = BaseModel._global_env
+      if env is not None:
+        return env
       self._lock.acquire()
       try:
         if BaseModel._global_env is None:
           try:
             env = mosek.Env()
             BaseModel._global_env = env
-            BaseModel._global_env_counter += 1
           except mosek.Exception as e:
             raise UnexpectedError(e)
         return BaseModel._global_env
       finally:
         self._lock.release()
+
+    @classmethod
+    def setThreadEnv(self,env):
+      """
+      Set the mosek.Env in which the calling thread creates models.
+
+      By default all models share one Env. Threads that build models
+      concurrently can each be given their own Env, or the threads of one
+      pool can share one, for example by calling this from the pool's
+      initializer. Pass None to return to the shared Env. License settings
+      made with Model.putlicensecode and friends only apply to the shared
+      Env, so a thread's own Env must be set up directly. A model keeps
+      its Env alive for as long as it exists.
+      """
+      BaseModel._thread.env = env
+
+    @classmethod
+    def _threadEnv(self):
+      env = getattr(BaseModel._thread,'env',None)
+      if env is None:
+        env = self._globalEnv()
+      return env
+
+    @classmethod
+    def _reaper_1start(self):
+      # Tasks of disposed models are deleted by a background thread, so
+      # that dropping a large model does not stall the thread dropping it.
+      if BaseModel._reaper is not None:
+        return
+      self._lock.acquire()
+      try:
+        if BaseModel._reaper is None:
+          tasks = getattr(queue,'SimpleQueue',queue.Queue)()
+          def reap(block):
+            while True:
+              try:
+                task,env = tasks.get(block)
+              except queue.Empty:
+                break
+              try:
+                task.__del__()
+              except Exception:
+                pass
+              task = env = None
+          t = threading.Thread(target=reap,args=(True,),name='mosek.fusion.reaper')
+          t.daemon = True
+          t.start()
+          atexit.register(reap,False)
+          BaseModel._reaper = tasks
+      finally:
+        self._lock.release()
   
     @classmethod
     def _env_1putlicensecode(self,code):
@@ -2335,10 +2454,12 @@ def __mk_mosek_fusion_BaseModel():
       return 1 if self.__break else 0
   
     def _ctor_init_SS(self,name,licfile):
-      env = self._globalEnv()
+      env = self._threadEnv()
+      self._reaper_1start()
       self.__modelname = name
       self.__break = False
-      task = mosek.Task(self._global_env, 0, 0);
+      task = mosek.Task(env, 0, 0);
+      self.__env = env
       self.__user_cb = None
       self.__user_pgs = None
       finished = False
@@ -2355,6 +2476,8 @@ def __mk_mosek_fusion_BaseModel():
         self._sol_itg = None
   
         self.__objname = None
+        self.__profiler = None
+        self.__prepared = None
   
         # handler for log output.
         def loghandler(text):
@@ -2371,15 +2494,16 @@ def __mk_mosek_fusion_BaseModel():
         if not finished:
           self.__task.__del__()
           self.__task = None
-          BaseModel._global_env_counter -= 1
   
     def _ctor_init_Lmosek_4fusion_4BaseModel_2(self,m):
-      env = self._globalEnv()
+      env = m.__env
+      self._reaper_1start()
       self.__modelname = m.__modelname
       self.__break = False
       self.__user_cb = None
       self.__user_pgs = None
-      task = mosek.Task(m.__task)
+      task = mosek.Task(m._task_1get_())
+      self.__env = env
       finished = False
       try:
         self.__task = task
@@ -2390,6 +2514,8 @@ def __mk_mosek_fusion_BaseModel():
         self._sol_itg = m._sol_itg._clone_() if m._sol_itg is not None else None
   
         self.__objname = m.__objname
+        self.__profiler = None
+        self.__prepared = None
   
         # handler for log output.
         def loghandler(text):
@@ -2406,24 +2532,25 @@ def __mk_mosek_fusion_BaseModel():
         if not finished:
           self.__task.__del__()
           self.__task = None
-          BaseModel._global_env_counter -= 1
   
     def __del__(self):
+        if getattr(self,'_BaseModel__profiler',None) is not None:
+          self._task_1setBuildProfiler_Lmosek_4fusion_4BuildProfiler_2(None)
         
-        if hasattr(self,'_BaseModel__task'):
-          self._lock.acquire()
-          try:
-            task = self.__task
-            BaseModel._global_env_counter -= 1
+        task = getattr(self,'_BaseModel__task',None)
+        if task is not None:
+          env = getattr(self,'_BaseModel__env',None)
+          for a in self.__class__.__slots__ + ['_sol_itr','_sol_bas','_sol_itg',
+                                               '_BaseModel__user_cb','_BaseModel__user_pgs','_BaseModel__loghandler','_BaseModel__logwriter','_BaseModel__task','_BaseModel__env']:
+            try: delattr(self,a)
+            except AttributeError: pass
+
+          # The task goes with the Env it was created in, which must
+          # outlive it.
+          if BaseModel._reaper is not None:
+            BaseModel._reaper.put((task,env))
+          else:
             task.__del__()
-  
-            for a in self.__class__.__slots__ + ['_sol_itr','_sol_bas','_sol_itg',
-                                                 '_BaseModel__user_cb','_BaseModel__user_pgs','_BaseModel__loghandler','_BaseModel__logwriter','_BaseModel__task']:
-              try: delattr(self,a)
-              except AttributeError: pass
-  
-          finally:
-            self._lock.release()
     def __enter__(self):
       return self
     def __exit__(self,exc_type,exc_val,exc_tb):
@@ -2431,6 +2558,115 @@ def __mk_mosek_fusion_BaseModel():
     def _dispose_(self):
       self.__del__()
   
+    def constraintsParallel(self,blocks,workers=None):
+      """
+      Add several constraints, preparing them concurrently.
+
+      Each element of blocks holds the arguments of one Model.constraint
+      call, for example ('c',expr,domain) or (expr,domain). The expressions
+      are evaluated and their constraint matrices assembled by a pool of
+      worker threads (by default one per CPU). The constraints are then
+      added one by one in the given order, exactly as Model.constraint
+      would add them, so variables and constraints are numbered as in a
+      serial build. Blocks whose assembly has to write to the task, such
+      as those with semidefinite terms, are assembled when they are added.
+
+      Returns the list of created constraints.
+      """
+      blocks = [ tuple(b) for b in blocks ]
+      if workers is None:
+        import multiprocessing
+        workers = multiprocessing.cpu_count()
+
+      exprs = []
+      seen = set()
+      for b in blocks:
+        for a in b:
+          if isinstance(a,mosek_fusion_Expression) and id(a) not in seen:
+            seen.add(id(a))
+            exprs.append(a)
+
+      evals = {}
+      cons  = {}
+      lock  = threading.Lock()
+      todo  = list(reversed(exprs))
+      def work():
+        BaseModel._worker.active = True
+        try:
+          while True:
+            with lock:
+              if len(todo) == 0:
+                break
+              e = todo.pop()
+            try:
+              flat = e.eval()
+              evals[id(e)] = (e,flat)
+              size = e.getShape()._size
+              cons[id(flat)] = (flat,size,self._Model__build_1conA__3JJ_3J_3J_3D_3D_3Lmosek_4fusion_4Variable_2(flat.ptrb,size,flat.inst,flat.subj,flat.cof,flat.bfix,flat.x))
+            except BaseModel._Deferred:
+              pass
+            except Exception:
+              # Left for the serial pass, which raises it in order
+              pass
+        finally:
+          BaseModel._worker.active = False
+
+      threads = [ threading.Thread(target=work) for i in range(max(1,min(workers,len(exprs)))) ]
+      for t in threads:
+        t.start()
+      for t in threads:
+        t.join()
+
+      self.__prepared = (evals,cons)
+      try:
+        return [ self.constraint(*b) for b in blocks ]
+      finally:
+        self.__prepared = None
+
+    def _prepared_1eval_Lmosek_4fusion_4Expression_2(self,e):
+      if self.__prepared is not None:
+        p = self.__prepared[0].get(id(e))
+        if p is not None and p[0] is e:
+          return p[1]
+      return None
+
+    def _prepared_1conA_Lmosek_4fusion_4FlatExpr_2I(self,flat,size):
+      if self.__prepared is not None:
+        p = self.__prepared[1].get(id(flat))
+        if p is not None and p[0] is flat and p[1] == size:
+          return p[2]
+      return None
+
+    def __check_1serial(self):
+      # Worker threads of constraintsParallel must leave the task alone;
+      # the block is then assembled in the serial pass.
+      if getattr(BaseModel._worker,'active',False):
+        raise BaseModel._Deferred()
+
+    def _task_1setBuildProfiler_Lmosek_4fusion_4BuildProfiler_2(self,profiler):
+      # While profiling, all task calls go through a proxy that times them.
+      task = self._task_1get_()
+      if (self.__profiler is None) != (profiler is None):
+        mosek_fusion_BuildProfiler._attach_I(1 if profiler is not None else -1)
+      self.__profiler = profiler
+      self.__task = profiler._task_1wrap(task) if profiler is not None else task
+
+    def _profiling_(self):
+      return self.__profiler is not None and not self.__profiler._active_()
+
+    def _profile_1item_S(self,kind,f,args):
+      return self.__profiler._record_S(kind,f,args)
+
+    def _profile_1call_S(self,section,f,*args):
+      if self.__profiler is None:
+        return f(*args)
+      return self.__profiler._call_S(section,f,args)
+
+    def _profile_1eval_S(self,e,f):
+      if self.__profiler is None:
+        return f()
+      return self.__profiler._eval_S(e,f)
+
     def _task_1setDataCallbackHandler_LSystem_4DataCallbackHandler_2(self,handler):
       self.__user_cb = handler
     def _task_1setCallbackHandler_LSystem_4CallbackHandler_2(self,handler):
@@ -2509,6 +2745,21 @@ def __mk_mosek_fusion_BaseModel():
     
     def _task_1cone_1name_IS(self,idx,name):
       self.__task.putconename(idx,name)
+
+    # Names for many items at once. The task has no bulk name functions,
+    # but this avoids going through Fusion once per element.
+    def _task_1var_1names__3J_3S(self,idxs,names):
+      putvarname = self.__task.putvarname
+      for idx,name in zip(idxs,names):
+        putvarname(idx,name)
+    def _task_1con_1names__3J_3S(self,idxs,names):
+      putconname = self.__task.putconname
+      for idx,name in zip(idxs,names):
+        putconname(idx,name)
+    def _task_1cone_1names__3J_3S(self,idxs,names):
+      putconename = self.__task.putconename
+      for idx,name in zip(idxs,names):
+        putconename(idx,name)
   
     def _task_1numcon_(self):
       return self.__task.getnumcon()
@@ -2631,6 +2882,12 @@ def __mk_mosek_fusion_BaseModel():
   
     def _task_1putaijlist__3I_3I_3DJ(self,subi,subj,cof,num):
       self.__task.putaijlist(subi[:num],subj[:num],cof[:num])
+
+    def _task_1putclist__3I_3D(self,subj,cof):
+      self.__task.putclist(subj,cof)
+
+    def _task_1putarowlist__3I_3J_3I_3D(self,sub,ptrb,subj,cof):
+      self.__task.putarowlist(sub,ptrb[:-1],ptrb[1:],subj,cof)
     
     def _task_1putobjectivename_S(self,name):
       self.__task.putobjname("" if name is None else name)
@@ -2659,8 +2916,46 @@ def __mk_mosek_fusion_BaseModel():
   
     def _task_1append_1barmatrix_I_3I_3I_3D(self,dim,subi, subj, cof):
       return self.__task.appendsparsesymmat(dim,subi,subj,cof)
+
+    def _task_1putbaraijlist__3I_3I_3I(self,subi,subj,matidx):
+      # Puts the single matrix matidx[k] with weight 1.0 as entry
+      # (subi[k],subj[k]); one call where the task supports it.
+      num = len(subi)
+      if num == 0:
+        pass
+      elif hasattr(self.__task,'putbaraijlist'):
+        self.__task.putbaraijlist(numpy.asarray(subi,dtype=numpy.int32),
+                                  numpy.asarray(subj,dtype=numpy.int32),
+                                  numpy.arange(0,num,dtype=numpy.int64),
+                                  numpy.arange(1,num+1,dtype=numpy.int64),
+                                  numpy.asarray(matidx,dtype=numpy.int64),
+                                  numpy.ones((num,)))
+      else:
+        for i,j,k in zip(subi,subj,matidx):
+          self.__task.putbaraij(i,j,[k],[1.0])
+
+    def _task_1append_1barmatrixlist__3I_3J_3I_3I_3D(self,dims,ptrb,subi,subj,cof):
+      self.__check_1serial()
+      # Appends the matrices of dimensions dims, where matrix k has the
+      # entries ptrb[k]:ptrb[k+1] of subi,subj,cof, and returns their indexes.
+      num = len(dims)
+      idx = numpy.zeros((num,),dtype=numpy.int64)
+      if num == 0:
+        pass
+      elif hasattr(self.__task,'appendsparsesymmatlist'):
+        self.__task.appendsparsesymmatlist(numpy.asarray(dims,dtype=numpy.int32),
+                                           numpy.diff(ptrb).astype(numpy.int64),
+                                           numpy.asarray(subi,dtype=numpy.int32),
+                                           numpy.asarray(subj,dtype=numpy.int32),
+                                           numpy.asarray(cof,dtype=numpy.float64),
+                                           idx)
+      else:
+        for k in range(num):
+          idx[k] = self.__task.appendsparsesymmat(dims[k],subi[ptrb[k]:ptrb[k+1]],subj[ptrb[k]:ptrb[k+1]],cof[ptrb[k]:ptrb[k+1]])
+      return idx
   
     def _task_1barvardim_I(self,index):
+      self.__check_1serial()
       return self.__task.getdimbarvarj(index)
   
     def _task_1numbarvar_(self):
@@ -2785,8 +3080,112 @@ def __mk_mosek_fusion_BaseModel():
     
     def _task_1write(self,filename):
       return self._writeProblem_S(filename)
+
+    def _task_1save_S(self,filename):
+      # The archive holds a JSON header with the format version, the task
+      # in the binary task format and the pickled Fusion objects of the
+      # model. The model itself, Fusion classes and enum values are
+      # pickled by reference, and numeric arrays are stored as separate
+      # .npy entries.
+      classes = dict((c,n) for n,c in globals().items() if n.startswith('mosek_fusion_') and inspect.isclass(c))
+      arrays = []
+      arrayidx = {}
+      model = self
+      class Pickler(pickle.Pickler):
+        def persistent_id(self,o):
+          if o is model:
+            return ('model',)
+          elif isinstance(o,numpy.ndarray):
+            if o.dtype.hasobject:
+              return None
+            if id(o) not in arrayidx:
+              arrayidx[id(o)] = len(arrays)
+              arrays.append(o)
+            return ('array',arrayidx[id(o)])
+          elif inspect.isclass(o):
+            return ('class',classes[o]) if o in classes else None
+          elif isinstance(o,_monty.Enum):
+            return ('enum',classes[o.__class__],o.name)
+          else:
+            return None
+      state = {}
+      for a in self.__class__.__slots__ + ['_synched','_sol_itr','_sol_bas','_sol_itg','_BaseModel__objname','_BaseModel__modelname']:
+        if hasattr(self,a):
+          state[a] = getattr(self,a)
+      data = io.BytesIO()
+      Pickler(data,pickle.HIGHEST_PROTOCOL).dump(state)
+
+      fd,taskfile = tempfile.mkstemp(suffix='.task')
+      os.close(fd)
+      try:
+        self.__task.writetask(taskfile)
+        task = numpy.fromfile(taskfile,dtype=numpy.uint8)
+      finally:
+        os.remove(taskfile)
+      header = json.dumps({ 'format' : 'mosek.fusion.Model', 'version' : BaseModel._save_1version, 'arrays' : len(arrays) })
+      with open(filename,'wb') as f:
+        numpy.savez(f,*arrays,
+                    header=numpy.frombuffer(header.encode('ascii'),dtype=numpy.uint8),
+                    task=task,
+                    fusion=numpy.frombuffer(data.getvalue(),dtype=numpy.uint8))
+
+    def _task_1load_S(self,filename):
+      # Counterpart of _task_1save_S. The pickled data may only refer to
+      # the model, Fusion classes and enum values, and the numpy types
+      # needed for scalars and object arrays; anything else is rejected.
+      with numpy.load(filename) as f:
+        if 'header' not in f.files:
+          raise mosek_fusion_ModelError._ctor_S("Not a model file: %s" % filename)
+        header = json.loads(f['header'].tobytes().decode('ascii'))
+        if header.get('format') != 'mosek.fusion.Model' or header.get('version') != BaseModel._save_1version:
+          raise mosek_fusion_ModelError._ctor_S("Unsupported model file format %s version %s" % (header.get('format'),header.get('version')))
+        task = f['task']
+        data = f['fusion'].tobytes()
+        arrays = [ f['arr_%d' % i] for i in range(header['arrays']) ]
+      model = self
+      allowed = set([ ('numpy','dtype'),
+                      ('numpy','ndarray'),
+                      ('numpy.core.multiarray','scalar'),
+                      ('numpy.core.multiarray','_reconstruct'),
+                      ('numpy._core.multiarray','scalar'),
+                      ('numpy._core.multiarray','_reconstruct') ])
+      def fusionclass(name):
+        c = globals().get(name) if name.startswith('mosek_fusion_') else None
+        if not inspect.isclass(c):
+          raise mosek_fusion_ModelError._ctor_S("Invalid class %s in model file" % name)
+        return c
+      class Unpickler(pickle.Unpickler):
+        def find_class(self,module,name):
+          if (module,name) not in allowed:
+            raise mosek_fusion_ModelError._ctor_S("Invalid reference to %s.%s in model file" % (module,name))
+          return pickle.Unpickler.find_class(self,module,name)
+        def persistent_load(self,pid):
+          if pid[0] == 'model':
+            return model
+          elif pid[0] == 'array':
+            return arrays[pid[1]]
+          elif pid[0] == 'class':
+            return fusionclass(pid[1])
+          else:
+            c = fusionclass(pid[1])
+            v = getattr(c,pid[2],None)
+            if not isinstance(v,c):
+              raise mosek_fusion_ModelError._ctor_S("Invalid value %s.%s in model file" % (pid[1],pid[2]))
+            return v
+
+      fd,taskfile = tempfile.mkstemp(suffix='.task')
+      os.close(fd)
+      try:
+        task.tofile(taskfile)
+        self.__task.readtask(taskfile)
+      finally:
+        os.remove(taskfile)
+      for a,v in Unpickler(io.BytesIO(data)).load().items():
+        setattr(self,a,v)
    
     def _task_1get_(self):
+      if isinstance(self.__task,mosek_fusion_BuildProfiler._ProfiledTask):
+        return self.__task._task
       return self.__task
         
     def _task_1break_1solve_(self):
@@ -2910,10 +3309,262 @@ def __mk_mosek_fusion_BaseModel():
   
   return BaseModel
 mosek_fusion_BaseModel=__mk_mosek_fusion_BaseModel()
+def __mk_mosek_fusion_BuildProfiler():
+  import time
+  import json
+  import threading
+  try:
+    import tracemalloc
+  except ImportError:
+    tracemalloc = None
+
+  clock = getattr(time,'perf_counter',time.time)
+
+  class ProfiledTask(object):
+    """
+    Forwards all calls to a task and charges the time spent in them to the
+    profiler's current record, together with the number of nonzeros they
+    write to the constraint matrix.
+    """
+    __slots__ = ['_task','_profiler']
+    _nonzeros = { 'putarow'       : lambda a: len(a[1]),
+                  'putarowlist'   : lambda a: int(numpy.sum(numpy.asarray(a[2])-numpy.asarray(a[1]))),
+                  'putaijlist'    : lambda a: len(a[0]),
+                  'putaij'        : lambda a: 1,
+                  'putbaraij'     : lambda a: 1,
+                  'putbaraijlist' : lambda a: len(a[0]) }
+    def __init__(self,task,profiler):
+      self._task = task
+      self._profiler = profiler
+    def __getattr__(self,name):
+      f = getattr(self._task,name)
+      if name.startswith('__') or not callable(f):
+        return f
+      profiler = self._profiler
+      nonzeros = ProfiledTask._nonzeros.get(name)
+      def call(*args):
+        if not profiler._active_():
+          return f(*args)
+        profiler._enter_S("native")
+        try:
+          return f(*args)
+        finally:
+          profiler._leave_()
+          if nonzeros is not None:
+            profiler._nonzeros_I(nonzeros(args))
+      return call
+
+  class BuildProfiler(object):
+    """
+    Records where the time goes while a model is built.
+
+    Attach the profiler with Model.setBuildProfiler. Every call of
+    Model.variable and Model.constraint then adds one record holding
+      kind      "variable" or "constraint",
+      name      the name given to the call, or "",
+      shape     the shape of the created object,
+      nonzeros  number of nonzeros written to the constraint matrix,
+      time      total time of the call in seconds,
+      eval      time spent building the expression with Expr operations
+                and evaluating it,
+      assembly  time spent assembling the constraint matrix,
+      native    time spent in calls into the task,
+      memory    peak memory allocated during the call in bytes, or None.
+    The times are exclusive, so native calls made while assembling are not
+    counted as assembly. Memory is only measured when memory=True and the
+    tracemalloc module is available; it slows the build down noticeably.
+
+    Expr operations (Expr.mul, Expr.add, ...) do their work when they are
+    called, before the expression reaches Model.constraint. While any model
+    has a profiler attached they are timed, and the time is carried by the
+    resulting expression together with that of its operands. It is charged
+    to eval, and to time, of each constraint made from the expression.
+    """
+    columns = ['kind','name','shape','nonzeros','time','eval','assembly','native','memory']
+
+    # Number of models with a profiler attached; Expr operations are only
+    # timed while it is nonzero.
+    _attached = 0
+    _lock = threading.Lock()
+    _local = threading.local()
+
+    def __init__(self,memory=False):
+      self.__records = []
+      self.__memory = bool(memory) and tracemalloc is not None
+      self.__current = None
+      self.__stack = None
+
+    def _task_1wrap(self,task):
+      return ProfiledTask(task,self)
+
+    @staticmethod
+    def _attach_I(num):
+      with BuildProfiler._lock:
+        BuildProfiler._attached += num
+
+    @staticmethod
+    def _timing_():
+      # Only the outermost Expr operation is timed.
+      return BuildProfiler._attached > 0 and not getattr(BuildProfiler._local,'busy',False)
+
+    @staticmethod
+    def _expr_S(f,args):
+      BuildProfiler._local.busy = True
+      t0 = clock()
+      try:
+        res = f(*args)
+      finally:
+        BuildProfiler._local.busy = False
+      t = clock() - t0
+      for a in args:
+        if isinstance(a,(list,tuple)) and len(a) > 0 and isinstance(a[0],mosek_fusion_Expr):
+          t += sum([ getattr(e,'_Expr__buildtime',0.0) for e in a if isinstance(e,mosek_fusion_Expr) ])
+        elif isinstance(a,mosek_fusion_Expr):
+          t += getattr(a,'_Expr__buildtime',0.0)
+      if isinstance(res,mosek_fusion_Expr):
+        res._Expr__buildtime = t
+      return res
+
+    def _active_(self):
+      return self.__current is not None
+
+    def _enter_S(self,section):
+      now = clock()
+      top = self.__stack[-1]
+      if top[0] is not None:
+        self.__current[top[0]] += now - top[1]
+      self.__stack.append([section,now])
+
+    def _leave_(self):
+      now = clock()
+      section,t = self.__stack.pop()
+      self.__current[section] += now - t
+      self.__stack[-1][1] = now
+
+    def _nonzeros_I(self,num):
+      self.__current['nonzeros'] += num
+
+    def _call_S(self,section,f,args):
+      if self.__current is None:
+        return f(*args)
+      self._enter_S(section)
+      try:
+        return f(*args)
+      finally:
+        self._leave_()
+
+    def _eval_S(self,e,f):
+      if self.__current is not None:
+        t = getattr(e,'_Expr__buildtime',0.0)
+        self.__current['eval'] += t
+        self.__current['time'] += t
+      return self._call_S("eval",f,())
+
+    def _record_S(self,kind,f,args):
+      record = { 'kind'     : kind,
+                 'name'     : args[0] if len(args) > 0 and isinstance(args[0],str) else "",
+                 'shape'    : None,
+                 'nonzeros' : 0,
+                 'time'     : 0.0,
+                 'eval'     : 0.0,
+                 'assembly' : 0.0,
+                 'native'   : 0.0,
+                 'memory'   : None }
+      tracing = self.__memory and not tracemalloc.is_tracing()
+      if tracing:
+        tracemalloc.start()
+      elif self.__memory and hasattr(tracemalloc,'reset_peak'):
+        tracemalloc.reset_peak()
+      if self.__memory:
+        base = tracemalloc.get_traced_memory()[0]
+      self.__current = record
+      self.__stack = [[None,clock()]]
+      t0 = self.__stack[0][1]
+      try:
+        res = f(*args)
+      finally:
+        record['time'] += clock() - t0
+        self.__current = None
+        self.__stack = None
+        if tracing or (self.__memory and hasattr(tracemalloc,'reset_peak')):
+          record['memory'] = max(0,tracemalloc.get_traced_memory()[1] - base)
+        if tracing:
+          tracemalloc.stop()
+        self.__records.append(record)
+      try:
+        shape = res.getShape() if hasattr(res,'getShape') else res.shape()
+        record['shape'] = [ int(shape.dim(i)) for i in range(shape.nd) ]
+      except Exception:
+        pass
+      return res
+
+    def getRecords(self):
+      """
+      Return the records as a list of dicts, in the order the calls were made.
+      """
+      return [ dict(r) for r in self.__records ]
+
+    def clear(self):
+      """
+      Discard all records.
+      """
+      self.__records = []
+
+    def report(self,sortby='time',limit=None):
+      """
+      Return the records as a table sorted by the given column, largest
+      first for numeric columns. At most limit rows are included.
+      """
+      if sortby not in BuildProfiler.columns:
+        raise ValueError('Invalid column %r, expected one of %s' % (sortby,', '.join(BuildProfiler.columns)))
+      records = list(self.__records)
+      if sortby in ['kind','name','shape']:
+        records.sort(key=lambda r: (r[sortby] is None, r[sortby] if r[sortby] is not None else []))
+      else:
+        records.sort(key=lambda r: -1 if r[sortby] is None else r[sortby], reverse=True)
+      if limit is not None:
+        records = records[:limit]
+
+      def fmt(r):
+        return [ r['kind'],
+                 r['name'],
+                 'x'.join([ str(d) for d in r['shape'] ]) if r['shape'] is not None else '-',
+                 str(r['nonzeros']),
+                 '%.4f' % r['time'],
+                 '%.4f' % r['eval'],
+                 '%.4f' % r['assembly'],
+                 '%.4f' % r['native'],
+                 '%.1f' % (r['memory']/1024.0) if r['memory'] is not None else '-' ]
+      header = ['kind','name','shape','nonzeros','time(s)','eval(s)','assembly(s)','native(s)','memory(kB)']
+      rows = [ header ] + [ fmt(r) for r in records ]
+      widths = [ max([ len(row[i]) for row in rows ]) for i in range(len(header)) ]
+      lines = []
+      for row in rows:
+        lines.append('  '.join([ (c.ljust(w) if i < 3 else c.rjust(w)) for i,(c,w) in enumerate(zip(row,widths)) ]).rstrip())
+      total = sum([ r['time'] for r in self.__records ])
+      lines.append('%d records, %.4f s in total' % (len(self.__records),total))
+      return '\n'.join(lines)
+
+    def toJSON(self):
+      """
+      Return the records as a JSON document.
+      """
+      return json.dumps({ 'columns' : BuildProfiler.columns, 'records' : self.__records },indent=1)
+
+    def dump(self,filename):
+      """
+      Write the records as a JSON document to the given file.
+      """
+      with open(filename,'w') as f:
+        f.write(self.toJSON())
+
+  BuildProfiler._ProfiledTask = ProfiledTask
+  return BuildProfiler
+mosek_fusion_BuildProfiler=__mk_mosek_fusion_BuildProfiler()
 #BEFORE CLASS
 def __mk_mosek_fusion_Model():
  class Model(mosek_fusion_BaseModel):
-  __slots__ = ['_Model__task_vars_used','_Model__task_vars_allocated','_Model__con_map','_Model__cons_used','_Model__cons','_vars_used','_vars','_Model__initsol_xx_flag','_Model__initsol_xx','_natbarvarmap_num','_natbarvarmap_Var','_Model__var_map','_Model__natvarmap_num','_Model__natvarmap_idx','_Model__natvarmap_Var','_Model__solutionptr','_Model__acceptable_sol','_Model__model_name']
+  __slots__ = ['_Model__task_vars_used','_Model__task_vars_allocated','_Model__con_map','_Model__cons_used','_Model__cons','_vars_used','_vars','_Model__initsol_xx_flag','_Model__initsol_xx','_natbarvarmap_num','_natbarvarmap_Var','_Model__var_map','_Model__natvarmap_num','_Model__natvarmap_idx','_Model__natvarmap_Var','_Model__solutionptr','_Model__acceptable_sol','_Model__model_name','_Model__params','_Model__objparams','_Model__dirty_cons','_Model__flushinfo','_Model__flushinfo_solve']
   def __init__(self,*args):
     if False: pass
     elif self.__match_ctor_(*args): # 
@@ -2942,6 +3593,14 @@ def __mk_mosek_fusion_Model():
       return self._dispose_alt_(*args)
     else:
       raise ValueError('Invalid argument list dispose('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Model.dispose()')
+  def getParameter(self,*args):
+    if False: pass
+    elif mosek_fusion_Model._match_getParameter_S(*args): # string
+      return self._getParameter_S(*args)
+    elif mosek_fusion_Model._match_alt_getParameter_S(*args): # string
+      return self._getParameter_alt_S(*args)
+    else:
+      raise ValueError('Invalid argument list getParameter('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Model.getParameter(string)')
   def getVariable(self,*args):
     if False: pass
     elif mosek_fusion_Model._match_getVariable_S(*args): # string
@@ -2972,6 +3631,8 @@ def __mk_mosek_fusion_Model():
     else:
       raise ValueError('Invalid argument list dualObjValue('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Model.dualObjValue()')
   def variable(self,*args):
+    if self._profiling_():
+      return self._profile_1item_S("variable",self.variable,args)
     if False: pass
     elif mosek_fusion_Model._match_variable_(*args): # 
       return self._variable_(*args)
@@ -3159,6 +3820,14 @@ def __mk_mosek_fusion_Model():
       return self._variable_alt_SIILmosek_4fusion_4PSDDomain_2(*args)
     else:
       raise ValueError('Invalid argument list variable('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Model.variable()\n\tmosek.fusion.Model.variable(string)\n\tmosek.fusion.Model.variable(mosek.fusion.LinPSDDomain)\n\tmosek.fusion.Model.variable(mosek.fusion.LinearDomain)\n\tmosek.fusion.Model.variable(int32)\n\tmosek.fusion.Model.variable(array(int32,ndim=1))\n\tmosek.fusion.Model.variable(mosek.fusion.PSDDomain)\n\tmosek.fusion.Model.variable(mosek.fusion.QConeDomain)\n\tmosek.fusion.Model.variable(mosek.fusion.RangeDomain)\n\tmosek.fusion.Model.variable(int32,mosek.fusion.LinearDomain)\n\tmosek.fusion.Model.variable(string,mosek.fusion.LinearDomain)\n\tmosek.fusion.Model.variable(string,mosek.fusion.QConeDomain)\n\tmosek.fusion.Model.variable(array(int32,ndim=1),mosek.fusion.RangeDomain)\n\tmosek.fusion.Model.variable(int32,mosek.fusion.SymmetricLinearDomain)\n\tmosek.fusion.Model.variable(string,int32)\n\tmosek.fusion.Model.variable(array(int32,ndim=1),mosek.fusion.LinearDomain)\n\tmosek.fusion.Model.variable(mosek.fusion.Set,mosek.fusion.QConeDomain)\n\tmosek.fusion.Model.variable(int32,mosek.fusion.LinPSDDomain)\n\tmosek.fusion.Model.variable(string,array(int32,ndim=1))\n\tmosek.fusion.Model.variable(int32,mosek.fusion.RangeDomain)\n\tmosek.fusion.Model.variable(mosek.fusion.Set,mosek.fusion.LinearDomain)\n\tmosek.fusion.Model.variable(int32,mosek.fusion.PSDDomain)\n\tmosek.fusion.Model.variable(string,mosek.fusion.RangeDomain)\n\tmosek.fusion.Model.variable(string,mosek.fusion.LinPSDDomain)\n\tmosek.fusion.Model.variable(mosek.fusion.Set,mosek.fusion.RangeDomain)\n\tmosek.fusion.Model.variable(int32,mosek.fusion.QConeDomain)\n\tmosek.fusion.Model.variable(string,mosek.fusion.PSDDomain)\n\tmosek.fusion.Model.variable(string,array(int32,ndim=1),mosek.fusion.LinearDomain)\n\tmosek.fusion.Model.variable(string,int32,mosek.fusion.QConeDomain)\n\tmosek.fusion.Model.variable(string,array(int32,ndim=1),mosek.fusion.PSDDomain)\n\tmosek.fusion.Model.variable(string,mosek.fusion.Set,mosek.fusion.QConeDomain)\n\tmosek.fusion.Model.variable(string,mosek.fusion.Set,mosek.fusion.RangeDomain)\n\tmosek.fusion.Model.variable(string,int32,mosek.fusion.LinPSDDomain)\n\tmosek.fusion.Model.variable(string,array(int32,ndim=1),mosek.fusion.RangeDomain)\n\tmosek.fusion.Model.variable(int32,int32,mosek.fusion.PSDDomain)\n\tmosek.fusion.Model.variable(string,int32,mosek.fusion.RangeDomain)\n\tmosek.fusion.Model.variable(string,int32,mosek.fusion.PSDDomain)\n\tmosek.fusion.Model.variable(string,mosek.fusion.Set,mosek.fusion.PSDDomain)\n\tmosek.fusion.Model.variable(string,mosek.fusion.Set,mosek.fusion.LinearDomain)\n\tmosek.fusion.Model.variable(string,int32,mosek.fusion.LinearDomain)\n\tmosek.fusion.Model.variable(string,array(int32,ndim=1),mosek.fusion.LinPSDDomain)\n\tmosek.fusion.Model.variable(string,int32,mosek.fusion.SymmetricLinearDomain)\n\tmosek.fusion.Model.variable(int32,int32,mosek.fusion.LinPSDDomain)\n\tmosek.fusion.Model.variable(string,mosek.fusion.Set,mosek.fusion.LinPSDDomain)\n\tmosek.fusion.Model.variable(string,int32,int32,mosek.fusion.LinPSDDomain)\n\tmosek.fusion.Model.variable(string,int32,int32,mosek.fusion.PSDDomain)')
+  def setBuildProfiler(self,*args):
+    if False: pass
+    elif mosek_fusion_Model._match_setBuildProfiler_Lmosek_4fusion_4BuildProfiler_2(*args): # mosek.fusion.BuildProfiler
+      return self._setBuildProfiler_Lmosek_4fusion_4BuildProfiler_2(*args)
+    elif mosek_fusion_Model._match_alt_setBuildProfiler_Lmosek_4fusion_4BuildProfiler_2(*args): # mosek.fusion.BuildProfiler
+      return self._setBuildProfiler_alt_Lmosek_4fusion_4BuildProfiler_2(*args)
+    else:
+      raise ValueError('Invalid argument list setBuildProfiler('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Model.setBuildProfiler(mosek.fusion.BuildProfiler)')
   def setLogHandler(self,*args):
     if False: pass
     elif mosek_fusion_Model._match_setLogHandler_LSystem_4StreamWriter_2(*args): # System.StreamWriter
@@ -3248,7 +3917,37 @@ def __mk_mosek_fusion_Model():
       return self._breakSolver_alt_(*args)
     else:
       raise ValueError('Invalid argument list breakSolver('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Model.breakSolver()')
+  def parameter(self,*args):
+    if False: pass
+    elif mosek_fusion_Model._match_parameter_(*args): # 
+      return self._parameter_(*args)
+    elif mosek_fusion_Model._match_alt_parameter_(*args): # 
+      return self._parameter_alt_(*args)
+    elif mosek_fusion_Model._match_parameter_I(*args): # int32
+      return self._parameter_I(*args)
+    elif mosek_fusion_Model._match_alt_parameter_I(*args): # int32
+      return self._parameter_alt_I(*args)
+    elif mosek_fusion_Model._match_parameter__3I(*args): # []int32
+      return self._parameter__3I(*args)
+    elif mosek_fusion_Model._match_alt_parameter__3I(*args): # []int32
+      return self._parameter_alt__3I(*args)
+    elif mosek_fusion_Model._match_parameter_S(*args): # string
+      return self._parameter_S(*args)
+    elif mosek_fusion_Model._match_alt_parameter_S(*args): # string
+      return self._parameter_alt_S(*args)
+    elif mosek_fusion_Model._match_parameter_SI(*args): # string,int32
+      return self._parameter_SI(*args)
+    elif mosek_fusion_Model._match_alt_parameter_SI(*args): # string,int32
+      return self._parameter_alt_SI(*args)
+    elif mosek_fusion_Model._match_parameter_S_3I(*args): # string,[]int32
+      return self._parameter_S_3I(*args)
+    elif mosek_fusion_Model._match_alt_parameter_S_3I(*args): # string,[]int32
+      return self._parameter_alt_S_3I(*args)
+    else:
+      raise ValueError('Invalid argument list parameter('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Model.parameter()\n\tmosek.fusion.Model.parameter(int32)\n\tmosek.fusion.Model.parameter(array(int32,ndim=1))\n\tmosek.fusion.Model.parameter(string)\n\tmosek.fusion.Model.parameter(string,int32)\n\tmosek.fusion.Model.parameter(string,array(int32,ndim=1))')
   def constraint(self,*args):
+    if self._profiling_():
+      return self._profile_1item_S("constraint",self.constraint,args)
     if False: pass
     elif mosek_fusion_Model._match_constraint_Lmosek_4fusion_4Expression_2Lmosek_4fusion_4LinearDomain_2(*args): # mosek.fusion.Expression,mosek.fusion.LinearDomain
       return self._constraint_Lmosek_4fusion_4Expression_2Lmosek_4fusion_4LinearDomain_2(*args)
@@ -3456,6 +4155,23 @@ def __mk_mosek_fusion_Model():
       return self._selectedSolution_alt_Emosek_4fusion_4SolutionType_2(*args)
     else:
       raise ValueError('Invalid argument list selectedSolution('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Model.selectedSolution(mosek.fusion.SolutionType)')
+  def save(self,*args):
+    if False: pass
+    elif mosek_fusion_Model._match_save_S(*args): # string
+      return self._save_S(*args)
+    elif mosek_fusion_Model._match_alt_save_S(*args): # string
+      return self._save_alt_S(*args)
+    else:
+      raise ValueError('Invalid argument list save('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Model.save(string)')
+  @staticmethod
+  def load(*args):
+    if False: pass
+    elif mosek_fusion_Model._match_load_S(*args): # string
+      return mosek_fusion_Model._load_S(*args)
+    elif mosek_fusion_Model._match_alt_load_S(*args): # string
+      return mosek_fusion_Model._load_alt_S(*args)
+    else:
+      raise ValueError('Invalid argument list load('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Model.load(string)')
   def writeTask(self,*args):
     if False: pass
     elif mosek_fusion_Model._match_writeTask_S(*args): # string
@@ -3480,6 +4196,14 @@ def __mk_mosek_fusion_Model():
       return self._hasConstraint_alt_S(*args)
     else:
       raise ValueError('Invalid argument list hasConstraint('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Model.hasConstraint(string)')
+  def getFlushInfo(self,*args):
+    if False: pass
+    elif mosek_fusion_Model._match_getFlushInfo_S(*args): # string
+      return self._getFlushInfo_S(*args)
+    elif mosek_fusion_Model._match_alt_getFlushInfo_S(*args): # string
+      return self._getFlushInfo_alt_S(*args)
+    else:
+      raise ValueError('Invalid argument list getFlushInfo('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Model.getFlushInfo(string)')
   def getSolverLIntInfo(self,*args):
     if False: pass
     elif mosek_fusion_Model._match_getSolverLIntInfo_S(*args): # string
@@ -3592,6 +4316,7 @@ def __mk_mosek_fusion_Model():
   def _ctor_alt_init_Lmosek_4fusion_4Model_2(self,m):
     self._ctor_init_Lmosek_4fusion_4Model_2(m)
   def _ctor_init_Lmosek_4fusion_4Model_2(self,m):
+   m._flushConstraints_()
    mosek_fusion_BaseModel._ctor_init_Lmosek_4fusion_4BaseModel_2(self,m)
    self.__model_name = mosek.fusion.Utils.StringBuffer()._a_S((m.__model_name))._a_S("(clone)")._toString_()
    self.__acceptable_sol = (m.__acceptable_sol)
@@ -3605,11 +4330,16 @@ def __mk_mosek_fusion_Model():
    self.__cons = numpy.array([(m.__cons)[_2]._clone_Lmosek_4fusion_4Model_2(_0) for _2 in range(0,(m.__cons_used))], dtype=numpy.dtype(object))
    self.__cons_used = (m.__cons_used)
    self.__con_map = (m.__con_map)._clone_()
-   self.__natvarmap_Var = numpy.array([(m.__natvarmap_Var)[_3] for _3 in range(0,(m.__natvarmap_num))], dtype=numpy.dtype(numpy.int32))
-   self.__natvarmap_idx = numpy.array([(m.__natvarmap_idx)[_4] for _4 in range(0,(m.__natvarmap_num))], dtype=numpy.dtype(numpy.int64))
+   self.__natvarmap_Var = (m.__natvarmap_Var)[0:(m.__natvarmap_num)]
+   self.__natvarmap_idx = (m.__natvarmap_idx)[0:(m.__natvarmap_num)]
    self.__natvarmap_num = (m.__natvarmap_num)
-   self._natbarvarmap_Var = numpy.array([(m.__natvarmap_Var)[_5] for _5 in range(0,(m.__natvarmap_num))], dtype=numpy.dtype(numpy.int32))
+   self._natbarvarmap_Var = (m._natbarvarmap_Var)[0:(m._natbarvarmap_num)]
    self._natbarvarmap_num = (m._natbarvarmap_num)
+   self.__params = []
+   self.__objparams = None
+   self.__dirty_cons = []
+   self.__flushinfo = numpy.zeros((3,), dtype=numpy.dtype(numpy.int64))
+   self.__flushinfo_solve = numpy.zeros((3,), dtype=numpy.dtype(numpy.int64))
    self.__initsol_xx = None
    self.__initsol_xx_flag = None
   @staticmethod
@@ -3647,6 +4377,11 @@ def __mk_mosek_fusion_Model():
    self.__cons = numpy.zeros((1024,), dtype=numpy.dtype(object))
    self.__cons_used = 0
    self.__con_map = mosek.fusion.Utils.StringIntMap()
+   self.__params = []
+   self.__objparams = None
+   self.__dirty_cons = []
+   self.__flushinfo = numpy.zeros((3,), dtype=numpy.dtype(numpy.int64))
+   self.__flushinfo_solve = numpy.zeros((3,), dtype=numpy.dtype(numpy.int64))
   @staticmethod
   def _ctor_S(name):
     o = Model.__new__(Model)
@@ -3684,6 +4419,11 @@ def __mk_mosek_fusion_Model():
    self.__cons = numpy.zeros((1024,), dtype=numpy.dtype(object))
    self.__cons_used = 0
    self.__con_map = mosek.fusion.Utils.StringIntMap()
+   self.__params = []
+   self.__objparams = None
+   self.__dirty_cons = []
+   self.__flushinfo = numpy.zeros((3,), dtype=numpy.dtype(numpy.int64))
+   self.__flushinfo_solve = numpy.zeros((3,), dtype=numpy.dtype(numpy.int64))
   @staticmethod
   def _match_putlicensewait_Z(*args):
     if len(args) != 1: return False
@@ -3934,6 +4674,7 @@ def __mk_mosek_fusion_Model():
   def _getTask_alt_(self,):
     return self._getTask_()
   def _getTask_(self,):
+   self._flushConstraints_()
    return (self._task_1get_())
   @staticmethod
   def _match_flushNames_(*args):
@@ -3963,11 +4704,65 @@ def __mk_mosek_fusion_Model():
   def _writeTask_alt_S(self,_t__0):
     return self._writeTask_S(_0)
   def _writeTask_S(self,_0):
+   self._flushConstraints_()
    self.flushNames()
    self._task_1setnumvar_I(self.__task_vars_used)
    self.__task_vars_allocated = self.__task_vars_used
    self._task_1write_S(_0)
   @staticmethod
+  def _match_save_S(*args):
+    if len(args) != 1: return False
+    _0, = args
+    return (__arg_match_S__(_0))
+  @staticmethod
+  def _match_alt_save_S(*args):
+    if len(args) != 1: return False
+    _0, = args
+    return (__arg_alt_match_S__(_0))
+  def _save_alt_S(self,_t__0):
+    return self._save_S(_t__0)
+  def _save_S(self,_0):
+   self._flushConstraints_()
+   self.flushNames()
+   self._task_1setnumvar_I(self.__task_vars_used)
+   self.__task_vars_allocated = self.__task_vars_used
+   self._task_1save_S(_0)
+  @staticmethod
+  def _match_load_S(*args):
+    if len(args) != 1: return False
+    _0, = args
+    return (__arg_match_S__(_0))
+  @staticmethod
+  def _match_alt_load_S(*args):
+    if len(args) != 1: return False
+    _0, = args
+    return (__arg_alt_match_S__(_0))
+  @staticmethod
+  def _load_alt_S(_t__0):
+    return mosek_fusion_Model._load_S(_t__0)
+  @staticmethod
+  def _load_S(_0):
+   _1=mosek_fusion_Model._ctor_()
+   _1._task_1load_S(_0)
+   return _1
+  @staticmethod
+  def _match_getFlushInfo_S(*args):
+    if len(args) != 1: return False
+    _0, = args
+    return (__arg_match_S__(_0))
+  @staticmethod
+  def _match_alt_getFlushInfo_S(*args):
+    if len(args) != 1: return False
+    _0, = args
+    return (__arg_alt_match_S__(_0))
+  def _getFlushInfo_alt_S(self,_t__0):
+    return self._getFlushInfo_S(_t__0)
+  def _getFlushInfo_S(self,_0):
+   _1=["aij_entries","rowlist_rows","rowlist_entries"]
+   if (_0 not in _1):
+    raise mosek_fusion_NameError._ctor_S(mosek.fusion.Utils.StringBuffer()._a_S("Unknown flush counter '")._a_S(_0)._a_S("'")._toString_())
+   return numpy.int64(self.__flushinfo_solve[_1.index(_0)])
+  @staticmethod
   def _match_getSolverLIntInfo_S(*args):
     if len(args) != 1: return False
     _0, = args
@@ -4052,6 +4847,20 @@ def __mk_mosek_fusion_Model():
   def _setLogHandler_LSystem_4StreamWriter_2(self,_0):
    self._task_1setLogHandler_LSystem_4StreamWriter_2(_0)
   @staticmethod
+  def _match_setBuildProfiler_Lmosek_4fusion_4BuildProfiler_2(*args):
+    if len(args) != 1: return False
+    _0, = args
+    return (__arg_match_Lmosek_4fusion_4BuildProfiler_2__(_0))
+  @staticmethod
+  def _match_alt_setBuildProfiler_Lmosek_4fusion_4BuildProfiler_2(*args):
+    if len(args) != 1: return False
+    _0, = args
+    return (__arg_alt_match_Lmosek_4fusion_4BuildProfiler_2__(_0))
+  def _setBuildProfiler_alt_Lmosek_4fusion_4BuildProfiler_2(self,_t__0):
+    return self._setBuildProfiler_Lmosek_4fusion_4BuildProfiler_2(_t__0)
+  def _setBuildProfiler_Lmosek_4fusion_4BuildProfiler_2(self,_0):
+   self._task_1setBuildProfiler_Lmosek_4fusion_4BuildProfiler_2(_0)
+  @staticmethod
   def _match_setSolverParam_SD(*args):
     if len(args) != 2: return False
     _0,_1, = args
@@ -4116,6 +4925,10 @@ def __mk_mosek_fusion_Model():
   def _solve_alt_(self,):
     return self._solve_()
   def _solve_(self,):
+   self._flushConstraints_()
+   self.__flush_1params_()
+   self.__flushinfo_solve = self.__flushinfo
+   self.__flushinfo = numpy.zeros((3,), dtype=numpy.dtype(numpy.int64))
    self._task_1setnumvar_I(self.__task_vars_used)
    self.__task_vars_allocated = self.__task_vars_used
    self.__flush_1initsol_Emosek_4fusion_4SolutionType_2(mosek.fusion.SolutionType.Interior)
@@ -4123,6 +4936,251 @@ def __mk_mosek_fusion_Model():
    self.__flush_1initsol_Emosek_4fusion_4SolutionType_2(mosek.fusion.SolutionType.Basic)
    self._task_1solve_()
   @staticmethod
+  def _match_parameter_(*args):
+    if len(args) != 0: return False
+    return True
+  @staticmethod
+  def _match_alt_parameter_(*args):
+    if len(args) != 0: return False
+    return True
+  def _parameter_alt_(self,):
+    return self._parameter_()
+  def _parameter_(self,):
+   return (self.__parameter_1_S_3I("",None))
+  @staticmethod
+  def _match_parameter_I(*args):
+    if len(args) != 1: return False
+    _0, = args
+    return (__arg_match_I__(_0))
+  @staticmethod
+  def _match_alt_parameter_I(*args):
+    if len(args) != 1: return False
+    _0, = args
+    return (__arg_alt_match_I__(_0))
+  def _parameter_alt_I(self,_t__0):
+    return self._parameter_I(numpy.int32(_t__0))
+  def _parameter_I(self,_0):
+   return (self.__parameter_1_S_3I("",numpy.array([_0], dtype=numpy.dtype(numpy.int32))))
+  @staticmethod
+  def _match_parameter__3I(*args):
+    if len(args) != 1: return False
+    _0, = args
+    return (__arg_match__3I__(_0))
+  @staticmethod
+  def _match_alt_parameter__3I(*args):
+    if len(args) != 1: return False
+    _0, = args
+    return (__arg_alt_match__3I__(_0))
+  def _parameter_alt__3I(self,_t__0):
+   _0=numpy.array(_t__0,dtype=numpy.dtype(numpy.int32))
+   return self._parameter__3I(_0)
+  def _parameter__3I(self,_0):
+   assert _0 is None or isinstance(_0,numpy.ndarray)
+   return (self.__parameter_1_S_3I("",_0))
+  @staticmethod
+  def _match_getParameter_S(*args):
+    if len(args) != 1: return False
+    _0, = args
+    return (__arg_match_S__(_0))
+  @staticmethod
+  def _match_alt_getParameter_S(*args):
+    if len(args) != 1: return False
+    _0, = args
+    return (__arg_alt_match_S__(_0))
+  def _getParameter_alt_S(self,_t__0):
+    return self._getParameter_S(_t__0)
+  def _getParameter_S(self,_0):
+   for _1 in self.__params:
+    if (_1.getName()==_0):
+     return (_1)
+   return None
+  @staticmethod
+  def _match_parameter_S(*args):
+    if len(args) != 1: return False
+    _0, = args
+    return (__arg_match_S__(_0))
+  @staticmethod
+  def _match_alt_parameter_S(*args):
+    if len(args) != 1: return False
+    _0, = args
+    return (__arg_alt_match_S__(_0))
+  def _parameter_alt_S(self,_t__0):
+    return self._parameter_S(_t__0)
+  def _parameter_S(self,_0):
+   return (self.__parameter_1_S_3I(_0,None))
+  @staticmethod
+  def _match_parameter_SI(*args):
+    if len(args) != 2: return False
+    _0,_1, = args
+    return (__arg_match_S__(_0) and __arg_match_I__(_1))
+  @staticmethod
+  def _match_alt_parameter_SI(*args):
+    if len(args) != 2: return False
+    _0,_1, = args
+    return (__arg_alt_match_S__(_0) and __arg_alt_match_I__(_1))
+  def _parameter_alt_SI(self,_t__0,_t__1):
+    return self._parameter_SI(_t__0,numpy.int32(_t__1))
+  def _parameter_SI(self,_0,_1):
+   return (self.__parameter_1_S_3I(_0,numpy.array([_1], dtype=numpy.dtype(numpy.int32))))
+  @staticmethod
+  def _match_parameter_S_3I(*args):
+    if len(args) != 2: return False
+    _0,_1, = args
+    return (__arg_match_S__(_0) and __arg_match__3I__(_1))
+  @staticmethod
+  def _match_alt_parameter_S_3I(*args):
+    if len(args) != 2: return False
+    _0,_1, = args
+    return (__arg_alt_match_S__(_0) and __arg_alt_match__3I__(_1))
+  def _parameter_alt_S_3I(self,_t__0,_t__1):
+   _0=_t__0
+   _1=numpy.array(_t__1,dtype=numpy.dtype(numpy.int32))
+   return self._parameter_S_3I(_0,_1)
+  def _parameter_S_3I(self,_0,_1):
+   assert _1 is None or isinstance(_1,numpy.ndarray)
+   return (self.__parameter_1_S_3I(_0,_1))
+  def __parameter_1_S_3I(self,_0,_1):
+   assert _1 is None or isinstance(_1,numpy.ndarray)
+   if ((int(len(_0)) > 0) and any([(_2.getName()==_0) for _2 in self.__params])):
+    raise mosek_fusion_NameError._ctor_S(mosek.fusion.Utils.StringBuffer()._a_S("Duplicate parameter name '")._a_S(_0)._a_S("'")._toString_())
+   if (_1 is not None):
+    for _3 in range(0,int((_1).shape[0])):
+     if (_1[_3] <= 0):
+      raise mosek_fusion_DimensionError._ctor_S("Invalid parameter shape")
+   _4=mosek_fusion_Parameter._ctor_Lmosek_4fusion_4Model_2S_3I(self,_0,(None if ((_1 is None) ) else mosek.fusion.Utils.Tools._arraycopy__3I(_1)))
+   self.__params.append(_4)
+   return (_4)
+  def __use_1parameters_Lmosek_4fusion_4Expression_2(self,_0):
+   if isinstance(_0,mosek_fusion_Expr):
+    for _1 in _0._dependsOn_():
+     _1._useExpr_(_0)
+  def __param_1bindings_ZIILmosek_4fusion_4Expression_2Lmosek_4fusion_4FlatExpr_2Ljava_4lang_4Object_2_3D(self,_0,_1,_2,_3,_4,_5,_6):
+   assert _6 is None or isinstance(_6,numpy.ndarray)
+   _7=[]
+   if ((_5 is not None) and ((_5._params) is not None)):
+    _8=(0,_0,_1,_2,_5,(None if ((_6 is None) ) else mosek.fusion.Utils.Tools._arraycopy__3D(_6[0:(_2 - _1)])))
+    for _9 in (_5._params):
+     _7.append((_9,_8))
+   if (isinstance(_3,mosek_fusion_Expr) and (_3._parameters_() is not None)):
+    _9,_10=_3._parameters_()
+    _11=int(((_4.subj)).shape[0])
+    _12=numpy.zeros((_11,), dtype=numpy.dtype(numpy.int32))
+    _13=numpy.zeros((_11,), dtype=numpy.dtype(numpy.int32))
+    _14=numpy.zeros((_11,), dtype=numpy.dtype(numpy.int32))
+    mosek.fusion.Model.__inst__3Lmosek_4fusion_4Variable_2_3J_3I_3I_3I((_4.x),(_4.subj),_12,_13,_14)
+    if ((_11 > 0) and (_12.min() < 0)):
+     raise mosek_fusion_ExpressionError._ctor_S("Parameters may only be multiplied with linear variables")
+    if (_1 < 0):
+     _15,_16=numpy.unique(_12,return_inverse=True)
+     _7.append((_9,(2,_9,_15.astype(numpy.int32),_16,_10)))
+    else:
+     _17=numpy.diff((_4.ptrb))
+     _18=numpy.repeat(((_4.inst) if (((_4.inst) is not None) ) else numpy.arange(0,int(((_17)).shape[0]),dtype=numpy.int64)),_17)
+     _19=numpy.int64((((_12.max() + 1) if ((_11 > 0) ) else 1)))
+     _15,_16=numpy.unique(((_18 * _19) + _12),return_inverse=True)
+     # The task holds base+parameter for each entry. base is what
+     # Constraint.add contributed; the constraint cache also holds the
+     # parameter contribution at bind time, kept here to subtract it.
+     _21=numpy.bincount(_16,weights=(_4.cof),minlength=int((_15).shape[0]))
+     _7.append((_9,(1,_9,((_15 // _19) + _1).astype(numpy.int32),(_15 % _19).astype(numpy.int32),_16,_10,numpy.zeros((int((_15).shape[0]),), dtype=numpy.dtype(numpy.float64)),_21)))
+    _9._bindExpr_(_3)
+   for _20 in _7:
+    if (_20[0].getModel() is not self):
+     raise mosek_fusion_ModelError._ctor_S("Parameter belongs to a different model")
+   return (_7)
+  def _markDirty_Lmosek_4fusion_4ModelConstraint_2(self,_0):
+   self.__dirty_cons.append(_0)
+  def _flushConstraints_(self,):
+   if (int(len(self.__dirty_cons))==0):
+    return
+   _0=[_2 for _1 in self.__params for _2 in _1._bindings_() if (_2[0]==1)]
+   _3=(numpy.unique(numpy.concatenate([_2[2] for _2 in _0])) if ((int(len(_0)) > 0) ) else None)
+   _4=self.__dirty_cons
+   self.__dirty_cons = []
+   _6=[]
+   for _5 in _4:
+    _7=_5._flush_1cache__3I_3J(_3,self.__flushinfo)
+    if ((_3 is not None) and (_7 is not None)):
+     _6.append(_7)
+   if (int(len(_6)) > 0):
+    _8=numpy.concatenate([_7[0] for _7 in _6])
+    _9=numpy.concatenate([_7[1] for _7 in _6])
+    _10=numpy.concatenate([_7[2] for _7 in _6])
+    for _2 in _0:
+     if self.__rebase_1aij_Ljava_4lang_4Object_2_3I_3I_3D(_2,_8,_9,_10):
+      self.__flush_1aij_Ljava_4lang_4Object_2(_2)
+  def __flush_1params_(self,):
+   _0=[]
+   _1=set()
+   for _2 in self.__params:
+    if _2._isDirty_():
+     _2._clearDirty_()
+     for _3 in _2._bindings_():
+      if (id(_3) not in _1):
+       _1.add(id(_3))
+       _0.append(_3)
+   for _3 in _0:
+    if (_3[0]==0):
+     self.__flush_1bounds_ZIILjava_4lang_4Object_2_3D(_3[1],_3[2],_3[3],_3[4],_3[5])
+    elif (_3[0]==1):
+     self.__flush_1aij_Ljava_4lang_4Object_2(_3)
+    else:
+     self._task_1putclist__3I_3D(_3[2],numpy.bincount(_3[3],weights=(_3[1]._values_())[_3[4]],minlength=int((_3[2]).shape[0])))
+  def __flush_1aij_Ljava_4lang_4Object_2(self,_0):
+   _1=int((_0[2]).shape[0])
+   self._task_1putaijlist__3I_3I_3DJ(_0[2],_0[3],(_0[6] + numpy.bincount(_0[4],weights=(_0[1]._values_())[_0[5]],minlength=_1)),numpy.int64(_1))
+  def __rebase_1aij_Ljava_4lang_4Object_2_3I_3I_3D(self,_0,_1,_2,_3):
+   assert _1 is None or isinstance(_1,numpy.ndarray)
+   assert _2 is None or isinstance(_2,numpy.ndarray)
+   assert _3 is None or isinstance(_3,numpy.ndarray)
+   # _1, _2 and _3 are the rows, columns and cache coefficients of the
+   # entries a constraint flush wrote to the task. Entries of the binding
+   # among them get a new base. Returns whether there were any.
+   if ((int((_0[2]).shape[0])==0) or (int((_1).shape[0])==0)):
+    return (False)
+   _4=numpy.int64((max(_0[3].max(),_2.max()) + 1))
+   _5=((_0[2].astype(numpy.int64) * _4) + _0[3])
+   _6=((_1.astype(numpy.int64) * _4) + _2)
+   _7=numpy.minimum(numpy.searchsorted(_5,_6),(int((_5).shape[0]) - 1))
+   _8=(_5[_7]==_6)
+   if (not _8.any()):
+    return (False)
+   _0[6][_7[_8]] = (_3[_8] - _0[7][_7[_8]])
+   return (True)
+  def __flush_1bounds_ZIILjava_4lang_4Object_2_3D(self,_0,_1,_2,_3,_4):
+   assert _4 is None or isinstance(_4,numpy.ndarray)
+   _5=numpy.int64((_2 - _1))
+   if isinstance(_3,mosek_fusion_RangeDomain):
+    _6=_3._get_1lb_J(_5)
+    _7=_3._get_1ub_J(_5)
+    if (_4 is not None):
+     _6 -= _4
+     _7 -= _4
+    if _0:
+     self._task_1con_1putboundslice_1ra_II_3D_3D(_1,_2,_6,_7)
+    else:
+     self._task_1var_1putboundslice_1ra_II_3D_3D(_1,_2,_6,_7)
+   else:
+    _8=(_3._key)
+    if (_8==mosek.fusion.RelationKey.IsFree):
+     return
+    _6=(_3._get_1rhs_J(_5) if ((_4 is None) ) else (_3._get_1rhs_J(_5) - _4))
+    if (_8==mosek.fusion.RelationKey.LessThan):
+     if _0:
+      self._task_1con_1putboundslice_1up_II_3D(_1,_2,_6)
+     else:
+      self._task_1var_1putboundslice_1up_II_3D(_1,_2,_6)
+    elif (_8==mosek.fusion.RelationKey.GreaterThan):
+     if _0:
+      self._task_1con_1putboundslice_1lo_II_3D(_1,_2,_6)
+     else:
+      self._task_1var_1putboundslice_1lo_II_3D(_1,_2,_6)
+    else:
+     if _0:
+      self._task_1con_1putboundslice_1fx_II_3D(_1,_2,_6)
+     else:
+      self._task_1var_1putboundslice_1fx_II_3D(_1,_2,_6)
+  @staticmethod
   def _match_flushSolutions_(*args):
     if len(args) != 0: return False
     return True
@@ -4499,7 +5557,10 @@ def __mk_mosek_fusion_Model():
     raise mosek_fusion_LengthError._ctor_S("Objective expression must be of size 1.")
    if ((_1!=mosek.fusion.ObjectiveSense.Minimize) and (_1!=mosek.fusion.ObjectiveSense.Maximize)):
     raise mosek_fusion_LengthError._ctor_S("Objective sense required.")
-   _3=_2.eval()
+   _3=self._prepared_1eval_Lmosek_4fusion_4Expression_2(_2)
+   if (_3 is None):
+    _3 = self._profile_1eval_S(_2,_2.eval)
+   self.__use_1parameters_Lmosek_4fusion_4Expression_2(_2)
    for _4 in range(0,int(((_3.x)).shape[0])):
     if (((_3.x)[_4].getModel() is not None) and ((_3.x)[_4].getModel() is not self)):
      raise mosek_fusion_ModelError._ctor_S("Expression belong to different models")
@@ -4541,64 +5602,21 @@ def __mk_mosek_fusion_Model():
    _16=0.0
    if ((_3.bfix) is not None):
     _16 = (_3.bfix)[0]
+   _40=self.__param_1bindings_ZIILmosek_4fusion_4Expression_2Lmosek_4fusion_4FlatExpr_2Ljava_4lang_4Object_2_3D(False,(- 1),0,_2,_3,None,None)
    self._task_1putobjective_Z_3I_3DD((_1==mosek.fusion.ObjectiveSense.Maximize),_5,_6,_16)
+   if (self.__objparams is not None):
+    for _41 in self.__objparams:
+     _41[0]._removeBinding_(_41[1])
+   self.__objparams = _40
+   for _41 in _40:
+    _41[0]._addBinding_(_41[1])
    if (_7 > 0):
-    _17=0
-    _18=(_3.ptrb)[0]
-    while (_18 < (_3.ptrb)[1]):
-     if (_9[_18] < 0):
-      _17 += 1
-     _18 += 1
-    if (_17 > 0):
-     _19=numpy.zeros((_17,), dtype=numpy.dtype(numpy.int64))
-     _20=(_3.ptrb)
-     _21=0
-     _22=_20[0]
-     while (_22 < _20[1]):
-      if (_9[_22] < 0):
-       _19[_21] = numpy.int64(_22)
-       _21 += 1
-      _22 += 1
-     mosek.fusion.Sort._argsort__3J_3IJJ(_19,_9,0,_17)
-     _23=0
-     while (_23 < _17):
-      _24=_23
-      _23 += 1
-      while ((_23 < _17) and (_9[_19[_23]]==_9[_19[(_23 - 1)]])):
-       _23 += 1
-      _25=(_23 - _24)
-      mosek.fusion.Sort._argsort__3J_3I_3IJJ(_19,_10,_11,numpy.int64(_24),numpy.int64(_23))
-      _26=1
-      for _27 in range((_24 + 1),_23):
-       _28=_19[_27]
-       _29=_19[(_27 - 1)]
-       if ((_10[_28]!=_10[_29]) or (_11[_28]!=_11[_29])):
-        _26 += 1
-      _30=0
-      _31=numpy.zeros((_26,), dtype=numpy.dtype(numpy.int32))
-      _32=numpy.zeros((_26,), dtype=numpy.dtype(numpy.int32))
-      _33=numpy.zeros((_26,), dtype=numpy.dtype(numpy.float64))
-      _31[0] = _10[_19[_24]]
-      _32[0] = _11[_19[_24]]
-      if (_31[0]==_32[0]):
-       _33[0] = (_3.cof)[_19[_24]]
-      else:
-       _33[0] = (0.5 * (_3.cof)[_19[_24]])
-      for _34 in range((_24 + 1),_23):
-       _35=_19[_34]
-       _36=_19[(_34 - 1)]
-       if ((_10[_35]!=_10[_36]) or (_11[_35]!=_11[_36])):
-        _30 += 1
-        _31[_30] = _10[_35]
-        _32[_30] = _11[_35]
-       if (_31[_30]==_32[_30]):
-        _33[_30] = (_33[_30] + (_3.cof)[_35])
-       else:
-        _33[_30] = (_33[_30] + (0.5 * (_3.cof)[_35]))
-      _37=(- (_9[_19[_24]] + 1))
-      _38=self._task_1barvardim_I(_37)
-      _39=self._task_1append_1barmatrix_I_3I_3I_3D(_38,_31,_32,_33)
-      self._task_1putbarcj_II(_37,_39)
+    _17=numpy.arange((_3.ptrb)[0],(_3.ptrb)[1])
+    _17=_17[(_9[_17] < 0)]
+    if (int((_17).shape[0]) > 0):
+     _18,_19,_20=self._append_1barmatrices__3J_3I_3I_3I_3D(numpy.zeros((int((_17).shape[0]),), dtype=numpy.dtype(numpy.int64)),((- _9[_17]) - 1),_10[_17],_11[_17],numpy.where((_10[_17]==_11[_17]),(_3.cof)[_17],(0.5 * (_3.cof)[_17])))
+     for _21 in range(0,int((_19).shape[0])):
+      self._task_1putbarcj_II(_19[_21],_20[_21])
   @staticmethod
   def _match_objective_D(*args):
     if len(args) != 1: return False
@@ -5892,8 +6910,10 @@ def __mk_mosek_fusion_Model():
      _11 = self.__task_1alloc_1vars_I(_10)
      self.__natvarmap_1ensure_I(_10)
      self.__natvarmap_num = (self.__natvarmap_num + _10)
-     _12=numpy.array([_2._get_1lb_1item_J((((_13 * (_13 + 1)) // 2) + _14)) for _13 in range(0,_4) for _14 in range(0,_13)], dtype=numpy.dtype(numpy.float64))
-     _15=numpy.array([_2._get_1ub_1item_J((((_16 * (_16 + 1)) // 2) + _17)) for _16 in range(0,_4) for _17 in range(0,_16)], dtype=numpy.dtype(numpy.float64))
+     _13,_14=numpy.tril_indices(_4,-1)
+     _16=(((_13 * (_13 + 1)) // 2) + _14).astype(numpy.dtype(numpy.int64))
+     _12=_2._get_1lb__3J(_16)
+     _15=_2._get_1ub__3J(_16)
      self._task_1var_1putboundslice_1ra_II_3D_3D(_11,(_11 + _10),_12,_15)
      _9 = numpy.zeros((_10,), dtype=numpy.dtype(numpy.int32))
      for _18 in range(0,_10):
@@ -5924,6 +6944,8 @@ def __mk_mosek_fusion_Model():
     _4 = (_2._shape)
     if (_4 is None):
      _4 = mosek_fusion_IntSet._ctor_I(1)
+   if (((_2._params) is not None) and (_2._sparse_flag)):
+    raise mosek_fusion_DomainError._ctor_S("Sparse variable domains cannot depend on parameters")
    _5=self.__task_vars_used
    _6=self._task_1numcon_()
    _7=self._task_1numcone_()
@@ -5932,13 +6954,15 @@ def __mk_mosek_fusion_Model():
     _9=None
     _10=numpy.int32((_4._size))
     _11=0
+    _19=[]
     if (not (_2._sparse_flag)):
      _11 = self.__task_1alloc_1vars_I(_10)
      self.__natvarmap_1ensure_I(_10)
      self.__natvarmap_num = (self.__natvarmap_num + _10)
-     _12=numpy.array([_2._get_1lb_1item_J(_13) for _13 in range(0,_10)], dtype=numpy.dtype(numpy.float64))
-     _14=numpy.array([_2._get_1ub_1item_J(_15) for _15 in range(0,_10)], dtype=numpy.dtype(numpy.float64))
+     _12=_2._get_1lb_J(numpy.int64(_10))
+     _14=_2._get_1ub_J(numpy.int64(_10))
      self._task_1var_1putboundslice_1ra_II_3D_3D(_11,(_11 + _10),_12,_14)
+     _19 = self.__param_1bindings_ZIILmosek_4fusion_4Expression_2Lmosek_4fusion_4FlatExpr_2Ljava_4lang_4Object_2_3D(False,_11,(_11 + _10),None,None,_2,None)
      _9 = numpy.zeros((_10,), dtype=numpy.dtype(numpy.int32))
      for _16 in range(0,_10):
       _9[_16] = (_11 + _16)
@@ -5947,6 +6971,8 @@ def __mk_mosek_fusion_Model():
      for _18 in range(0,_10):
       self.__natvarmap_Var[(_18 + _11)] = self._vars_used
     _3 = mosek_fusion_RangedVariable._ctor_Lmosek_4fusion_4Model_2SLmosek_4fusion_4Set_2Lmosek_4fusion_4RangeDomain_2_3IJ(self,_0,_4,_2,_9,self._numVariables_())
+    for _20 in _19:
+     _20[0]._addBinding_(_20[1])
     if (_2._cardinal_flag):
      _3.makeInteger()
    finally:
@@ -6040,11 +7066,9 @@ def __mk_mosek_fusion_Model():
       self._task_1var_1putboundslice_1fr_II(_12,(_12 + _11))
      else:
       _13=numpy.zeros((_11,), dtype=numpy.dtype(numpy.float64))
-      _14=0
-      for _15 in range(0,_4):
-       for _16 in range(0,_15):
-        _13[_14] = _2._get_1rhs_1item_J(((_15 * _4) + _16))
-        _14 += 1
+      _15,_16=numpy.tril_indices(_4,-1)
+      _14=int((_15).shape[0])
+      _13[0:_14] = _2._get_1rhs__3J(((_15 * _4) + _16).astype(numpy.dtype(numpy.int64)))
       if (_10==mosek.fusion.RelationKey.LessThan):
        self._task_1var_1putboundslice_1up_II_3D(_12,(_12 + _11),_13)
       elif (_10==mosek.fusion.RelationKey.GreaterThan):
@@ -6080,6 +7104,8 @@ def __mk_mosek_fusion_Model():
     _5 = (_2._shape)
     if (_5 is None):
      _5 = mosek_fusion_IntSet._ctor_I(1)
+   if (((_2._params) is not None) and (_2._sparse_flag)):
+    raise mosek_fusion_DomainError._ctor_S("Sparse variable domains cannot depend on parameters")
    _6=self.__task_vars_used
    _7=self._task_1numcon_()
    _8=self._task_1numcone_()
@@ -6089,6 +7115,7 @@ def __mk_mosek_fusion_Model():
     _11=(_2._key)
     _12=numpy.int32((_5._size))
     _13=0
+    _19=[]
     if (not (_2._sparse_flag)):
      _13 = self.__task_1alloc_1vars_I(_12)
      self.__natvarmap_1ensure_I(_12)
@@ -6096,19 +7123,20 @@ def __mk_mosek_fusion_Model():
      if (_11==mosek.fusion.RelationKey.IsFree):
       self._task_1var_1putboundslice_1fr_II(_13,(_13 + _12))
      else:
-      _14=numpy.zeros((_12,), dtype=numpy.dtype(numpy.float64))
-      for _15 in range(0,_12):
-       _14[_15] = _2._get_1rhs_1item_J(numpy.int64(_15))
+      _14=_2._get_1rhs_J(numpy.int64(_12))
       if (_11==mosek.fusion.RelationKey.LessThan):
        self._task_1var_1putboundslice_1up_II_3D(_13,(_13 + _12),_14)
       elif (_11==mosek.fusion.RelationKey.GreaterThan):
        self._task_1var_1putboundslice_1lo_II_3D(_13,(_13 + _12),_14)
       elif (_11==mosek.fusion.RelationKey.EqualsTo):
        self._task_1var_1putboundslice_1fx_II_3D(_13,(_13 + _12),_14)
+     _19 = self.__param_1bindings_ZIILmosek_4fusion_4Expression_2Lmosek_4fusion_4FlatExpr_2Ljava_4lang_4Object_2_3D(False,_13,(_13 + _12),None,None,_2,None)
      _10 = numpy.array([(_13 + _16) for _16 in range(0,_12)], dtype=numpy.dtype(numpy.int32))
      for _17 in range(0,_12):
       self.__natvarmap_idx[(_17 + _13)] = numpy.int64(_17)
     _4 = mosek_fusion_LinearVariable._ctor_Lmosek_4fusion_4Model_2SLmosek_4fusion_4LinearDomain_2Lmosek_4fusion_4Set_2_3IJ(self,_0,_2,_5,_10,self._numVariables_())
+    for _20 in _19:
+     _20[0]._addBinding_(_20[1])
     if (_2._cardinal_flag):
      pass
     _3 = _4
@@ -6191,11 +7219,16 @@ def __mk_mosek_fusion_Model():
    _5 = (_1 if ((_1 is not None) ) else _2.getShape())
    if (not _3._match_1shape_Lmosek_4fusion_4Set_2(_5)):
     raise mosek_fusion_DimensionError._ctor_S("Mismatching shape and domain")
-   _6=_2.eval()
+   _6=self._prepared_1eval_Lmosek_4fusion_4Expression_2(_2)
+   if (_6 is None):
+    _6 = self._profile_1eval_S(_2,_2.eval)
+   self.__use_1parameters_Lmosek_4fusion_4Expression_2(_2)
    for _7 in range(0,int(((_6.x)).shape[0])):
     if (((_6.x)[_7].getModel() is not None) and ((_6.x)[_7].getModel() is not self)):
      raise mosek_fusion_ModelError._ctor_S("Expression belong to different models")
-   _8=self.__build_1conA__3JJ_3J_3J_3D_3D_3Lmosek_4fusion_4Variable_2((_6.ptrb),(_5._size),(_6.inst),(_6.subj),(_6.cof),(_6.bfix),(_6.x))
+   _8=self._prepared_1conA_Lmosek_4fusion_4FlatExpr_2I(_6,(_5._size))
+   if (_8 is None):
+    _8 = self._profile_1call_S("assembly",self.__build_1conA__3JJ_3J_3J_3D_3D_3Lmosek_4fusion_4Variable_2,(_6.ptrb),(_5._size),(_6.inst),(_6.subj),(_6.cof),(_6.bfix),(_6.x))
    _9=(int(((_8.ptrb)).shape[0]) - 1)
    _10=self.__task_vars_used
    _11=self._task_1numcone_()
@@ -6215,23 +7248,19 @@ def __mk_mosek_fusion_Model():
     if (((_8.subj) is not None) and (int(((_8.subj)).shape[0]) > 0)):
      self._task_1putarowslice_II_3J_3I_3D(_15,_16,(_8.ptrb),(_8.subj),(_8.cof))
     if ((_8.barsubi) is not None):
-     for _19 in range(0,int(((_8.barsubi)).shape[0])):
-      self._task_1putbaraij_III(((_8.barsubi)[_19] + _15),(_8.barsubj)[_19],(_8.barmidx)[_19])
-    _20=numpy.zeros((_9,), dtype=numpy.dtype(numpy.float64))
-    _21=numpy.zeros((_9,), dtype=numpy.dtype(numpy.float64))
+     self._task_1putbaraijlist__3I_3I_3I(((_8.barsubi) + _15),(_8.barsubj),(_8.barmidx))
+    _20=_3._get_1lb_J(numpy.int64(_9))
+    _21=_3._get_1ub_J(numpy.int64(_9))
     if ((_8.bfix) is not None):
-     for _22 in range(0,_9):
-      _20[_22] = (_3._get_1lb_1item_J(numpy.int64(_22)) - (_8.bfix)[_22])
-      _21[_22] = (_3._get_1ub_1item_J(numpy.int64(_22)) - (_8.bfix)[_22])
-    else:
-     _23=(int(((_8.ptrb)).shape[0]) - 1)
-     for _24 in range(0,_9):
-      _20[_24] = _3._get_1lb_1item_J(numpy.int64(_24))
-      _21[_24] = _3._get_1ub_1item_J(numpy.int64(_24))
+     _20 -= (_8.bfix)[0:_9]
+     _21 -= (_8.bfix)[0:_9]
     _25=mosek.fusion.Utils.Tools._range_II(_15,_16)
     self._task_1con_1putboundslice_1ra_II_3D_3D(_15,_16,_20,_21)
+    _26=self.__param_1bindings_ZIILmosek_4fusion_4Expression_2Lmosek_4fusion_4FlatExpr_2Ljava_4lang_4Object_2_3D(True,_15,_16,_2,_6,_3,(_8.bfix))
     _4 = mosek_fusion_RangedConstraint._ctor_Lmosek_4fusion_4Model_2SLmosek_4fusion_4Set_2Lmosek_4fusion_4RangeDomain_2_3I_3J_3I_3D_3D_3I_3I_3I(self,_0,_5,_3,_25,(_8.ptrb),(_8.subj),(_8.cof),(_8.bfix),(_8.barsubi),(_8.barsubj),(_8.barmidx))
     self.__addConstraint_SLmosek_4fusion_4ModelConstraint_2(_0,_4)
+    for _27 in _26:
+     _27[0]._addBinding_(_27[1])
    finally:
     if (_4 is None):
      self.__natvarmap_num = _10
@@ -6260,11 +7289,16 @@ def __mk_mosek_fusion_Model():
    _13=1
    for _14 in range((_7 + 1),(_6.nd)):
     _13 *= _6.dim(_14)
-   _15=_2.eval()
+   _15=self._prepared_1eval_Lmosek_4fusion_4Expression_2(_2)
+   if (_15 is None):
+    _15 = self._profile_1eval_S(_2,_2.eval)
+   self.__use_1parameters_Lmosek_4fusion_4Expression_2(_2)
    for _16 in range(0,int(((_15.x)).shape[0])):
     if (((_15.x)[_16].getModel() is not None) and ((_15.x)[_16].getModel() is not self)):
      raise mosek_fusion_ModelError._ctor_S("Expression belong to different models")
-   _17=self.__build_1conA__3JJ_3J_3J_3D_3D_3Lmosek_4fusion_4Variable_2((_15.ptrb),(_6._size),(_15.inst),(_15.subj),(_15.cof),(_15.bfix),(_15.x))
+   _17=self._prepared_1conA_Lmosek_4fusion_4FlatExpr_2I(_15,(_6._size))
+   if (_17 is None):
+    _17 = self._profile_1call_S("assembly",self.__build_1conA__3JJ_3J_3J_3D_3D_3Lmosek_4fusion_4Variable_2,(_15.ptrb),(_6._size),(_15.inst),(_15.subj),(_15.cof),(_15.bfix),(_15.x))
    _18=(int(((_17.ptrb)).shape[0]) - 1)
    _19=self.__task_vars_used
    _20=self._task_1numcon_()
@@ -6276,8 +7310,7 @@ def __mk_mosek_fusion_Model():
     if (((_17.subj) is not None) and (int(((_17.subj)).shape[0]) > 0)):
      self._task_1putarowslice_II_3J_3I_3D(_23,_24,(_17.ptrb),(_17.subj),(_17.cof))
     if ((_17.barsubi) is not None):
-     for _25 in range(0,int(((_17.barsubi)).shape[0])):
-      self._task_1putbaraij_III(((_17.barsubi)[_25] + _23),(_17.barsubj)[_25],(_17.barmidx)[_25])
+     self._task_1putbaraijlist__3I_3I_3I(((_17.barsubi) + _23),(_17.barsubj),(_17.barmidx))
     _26=mosek.fusion.Utils.Tools._range_II(_23,_24)
     _27=numpy.zeros(((_24 - _23),), dtype=numpy.dtype(numpy.float64))
     _28=(_8 * _9)
@@ -6319,11 +7352,16 @@ def __mk_mosek_fusion_Model():
    _6 = (_1 if ((_1 is not None) ) else ((_3._shape) if (((_3._shape) is not None) ) else _2.getShape()))
    if ((((_3._shape) is not None) and (not _3._match_1shape_Lmosek_4fusion_4Set_2(_6))) or ((_2.getShape() is not None) and (not _6.compare(_2.getShape())))):
     raise mosek_fusion_DimensionError._ctor_S("Mismatching shape and domain")
-   _7=_2.eval()
+   _7=self._prepared_1eval_Lmosek_4fusion_4Expression_2(_2)
+   if (_7 is None):
+    _7 = self._profile_1eval_S(_2,_2.eval)
+   self.__use_1parameters_Lmosek_4fusion_4Expression_2(_2)
    for _8 in range(0,int(((_7.x)).shape[0])):
     if (((_7.x)[_8].getModel() is not None) and ((_7.x)[_8].getModel() is not self)):
      raise mosek_fusion_ModelError._ctor_S("Expression belong to different models")
-   _9=self.__build_1conA__3JJ_3J_3J_3D_3D_3Lmosek_4fusion_4Variable_2((_7.ptrb),(_6._size),(_7.inst),(_7.subj),(_7.cof),(_7.bfix),(_7.x))
+   _9=self._prepared_1conA_Lmosek_4fusion_4FlatExpr_2I(_7,(_6._size))
+   if (_9 is None):
+    _9 = self._profile_1call_S("assembly",self.__build_1conA__3JJ_3J_3J_3D_3D_3Lmosek_4fusion_4Variable_2,(_7.ptrb),(_6._size),(_7.inst),(_7.subj),(_7.cof),(_7.bfix),(_7.x))
    _10=(int(((_9.ptrb)).shape[0]) - 1)
    _11=self.__task_vars_used
    _12=self._task_1numcon_()
@@ -6336,10 +7374,9 @@ def __mk_mosek_fusion_Model():
     if (((_9.subj) is not None) and (int(((_9.subj)).shape[0]) > 0)):
      self._task_1putarowslice_II_3J_3I_3D(_16,_17,(_9.ptrb),(_9.subj),(_9.cof))
     if ((_9.barsubi) is not None):
-     for _18 in range(0,int(((_9.barsubi)).shape[0])):
-      self._task_1putbaraij_III(((_9.barsubi)[_18] + _16),(_9.barsubj)[_18],(_9.barmidx)[_18])
+     self._task_1putbaraijlist__3I_3I_3I(((_9.barsubi) + _16),(_9.barsubj),(_9.barmidx))
     _19=mosek.fusion.Utils.Tools._range_II(_16,_17)
-    _20=(numpy.array([_3._get_1rhs_1item_J(_21) for _21 in range(0,(_17 - _16))], dtype=numpy.dtype(numpy.float64)) if (((_9.bfix) is None) ) else numpy.array([(_3._get_1rhs_1item_J(_22) - (_9.bfix)[_22]) for _22 in range(0,(_17 - _16))], dtype=numpy.dtype(numpy.float64)))
+    _20=(_3._get_1rhs_J(numpy.int64((_17 - _16))) if (((_9.bfix) is None) ) else (_3._get_1rhs_J(numpy.int64((_17 - _16))) - (_9.bfix)[0:(_17 - _16)]))
     _23=(_3._key)
     if (_23==mosek.fusion.RelationKey.IsFree):
      self._task_1con_1putboundslice_1fr_II(_16,_17)
@@ -6349,14 +7386,31 @@ def __mk_mosek_fusion_Model():
      self._task_1con_1putboundslice_1lo_II_3D(_16,_17,_20)
     else:
      self._task_1con_1putboundslice_1fx_II_3D(_16,_17,_20)
+    _24=self.__param_1bindings_ZIILmosek_4fusion_4Expression_2Lmosek_4fusion_4FlatExpr_2Ljava_4lang_4Object_2_3D(True,_16,_17,_2,_7,_3,(_9.bfix))
     _4 = mosek_fusion_LinearConstraint._ctor_Lmosek_4fusion_4Model_2SLmosek_4fusion_4LinearDomain_2Lmosek_4fusion_4Set_2_3I_3J_3I_3D_3D_3I_3I_3I(self,_0,_3,_6,_19,(_9.ptrb),(_9.subj),(_9.cof),(_9.bfix),(_9.barsubi),(_9.barsubj),(_9.barmidx))
     self.__addConstraint_SLmosek_4fusion_4ModelConstraint_2(_0,_4)
+    for _25 in _24:
+     _25[0]._addBinding_(_25[1])
     return (_4)
    finally:
     if (_4 is None):
      self.__natvarmap_num = _11
      self._natbarvarmap_num = _14
      self._task_1cleanup_IIII(_11,_12,_13,_14)
+  def _append_1barmatrices__3J_3I_3I_3I_3D(self,_0,_1,_2,_3,_4):
+   _5=numpy.lexsort((_3,_2,_1,_0))
+   _6=numpy.ones((int((_5).shape[0]),), dtype=numpy.dtype(bool))
+   _6[1:] = ((_0[_5[1:]]!=_0[_5[:-1]]) | (_1[_5[1:]]!=_1[_5[:-1]]) | (_2[_5[1:]]!=_2[_5[:-1]]) | (_3[_5[1:]]!=_3[_5[:-1]]))
+   _7=numpy.bincount((numpy.cumsum(_6) - 1),weights=_4[_5])
+   _5=_5[_6]
+   _8=numpy.ones((int((_5).shape[0]),), dtype=numpy.dtype(bool))
+   _8[1:] = ((_0[_5[1:]]!=_0[_5[:-1]]) | (_1[_5[1:]]!=_1[_5[:-1]]))
+   _9=numpy.append(numpy.flatnonzero(_8),int((_5).shape[0]))
+   _10=_1[_5[_8]].astype(numpy.dtype(numpy.int32))
+   _11,_12=numpy.unique(_10,return_inverse=True)
+   _13=numpy.array([self._task_1barvardim_I(_14) for _14 in _11], dtype=numpy.dtype(numpy.int32))[_12]
+   _15=self._task_1append_1barmatrixlist__3I_3J_3I_3I_3D(_13,_9,_2[_5],_3[_5],_7)
+   return (_0[_5[_8]],_10,_15.astype(numpy.dtype(numpy.int32)))
   def __build_1conA_alt__3JJ_3J_3J_3D_3D_3Lmosek_4fusion_4Variable_2(self,_t__0,_t__1,_t__2,_t__3,_t__4,_t__5,_t__6):
    _0=numpy.array(_t__0,dtype=numpy.dtype(numpy.int64))
    _1=numpy.int64(_t__1)
@@ -6484,68 +7538,10 @@ def __mk_mosek_fusion_Model():
    _39=None
    _40=0
    if (_13 > 0):
-    for _41 in range(0,(int((_0).shape[0]) - 1)):
-     _42=_0[_41]
-     while ((_42 < _0[(_41 + 1)]) and (_15[_18[_42]] < 0)):
-      _42 += 1
-     if (_42 > _0[_41]):
-      _40 += 1
-      for _43 in range((_0[_41] + 1),_42):
-       if (_15[_18[(_43 - 1)]]!=_15[_18[_43]]):
-        _40 += 1
-    if (_40 > 0):
-     _44=0
-     _37 = numpy.zeros((_40,), dtype=numpy.dtype(numpy.int32))
-     _38 = numpy.zeros((_40,), dtype=numpy.dtype(numpy.int32))
-     _39 = numpy.zeros((_40,), dtype=numpy.dtype(numpy.int32))
-     for _45 in range(0,(int((_0).shape[0]) - 1)):
-      _46=_0[_45]
-      while ((_46 < _0[(_45 + 1)]) and (_15[_18[_46]] < 0)):
-       _47=_46
-       _48=_15[_18[_46]]
-       _46 += 1
-       while ((_46 < _0[(_45 + 1)]) and (_15[_18[_46]]==_48)):
-        _46 += 1
-       _49=(- (_48 + 1))
-       _50=self._task_1barvardim_I(_49)
-       for _51 in range(_47,_46):
-        _52=_18[_51]
-        if (_16[_52] < _17[_52]):
-         _53=_16[_52]
-         _16[_52] = _17[_52]
-         _17[_52] = _53
-         _4[_52] *= 0.5
-        elif (_16[_52] > _17[_52]):
-         _4[_52] *= 0.5
-       if ((_46 - _47) > 1):
-        if ((_46 - _47) < (2 * _50)):
-         mosek.fusion.Sort._argsort__3J_3I_3IJJZ(_18,_16,_17,_47,_46,True)
-        else:
-         mosek.fusion.Sort._argbucketsort__3J_3IJJII(_18,_17,_47,_46,0,_50)
-         mosek.fusion.Sort._argbucketsort__3J_3IJJII(_18,_16,_47,_46,0,_50)
-       _54=1
-       for _55 in range((_47 + 1),_46):
-        if ((_17[_18[_55]]!=_17[_18[(_55 - 1)]]) or (_16[_18[_55]]!=_16[_18[(_55 - 1)]])):
-         _54 += 1
-       _56=numpy.zeros((_54,), dtype=numpy.dtype(numpy.int32))
-       _57=numpy.zeros((_54,), dtype=numpy.dtype(numpy.int32))
-       _58=numpy.zeros((_54,), dtype=numpy.dtype(numpy.float64))
-       _59=0
-       _56[0] = _16[_18[_47]]
-       _57[0] = _17[_18[_47]]
-       _58[0] = _4[_18[_47]]
-       for _60 in range((_47 + 1),_46):
-        if ((_17[_18[_60]]!=_17[_18[(_60 - 1)]]) or (_16[_18[_60]]!=_16[_18[(_60 - 1)]])):
-         _59 += 1
-         _56[_59] = _16[_18[_60]]
-         _57[_59] = _17[_18[_60]]
-         _58[_59] = _4[_18[_60]]
-        else:
-         _58[_59] += _4[_18[_60]]
-       _37[_44] = numpy.int32(_10[_45])
-       _38[_44] = _49
-       _39[_44] = self._task_1append_1barmatrix_I_3I_3I_3D(_50,_56,_57,_58)
-       _44 += 1
+    _41=numpy.flatnonzero((_15 < 0))
+    _42=(_16[_41] < _17[_41])
+    _37,_38,_39=self._append_1barmatrices__3J_3I_3I_3I_3D(_20[_41].astype(numpy.dtype(numpy.int64)),((- _15[_41]) - 1),numpy.where(_42,_17[_41],_16[_41]),numpy.where(_42,_16[_41],_17[_41]),numpy.where((_16[_41]==_17[_41]),_4[_41],(0.5 * _4[_41])))
+    _37 = _10[_37].astype(numpy.dtype(numpy.int32))
    _61=numpy.zeros((_1,), dtype=numpy.dtype(numpy.float64))
    if (_5 is not None):
     for _62 in range(0,int((_10).shape[0])):
@@ -6569,11 +7565,16 @@ def __mk_mosek_fusion_Model():
    _9=1
    for _10 in range(1,(_5.nd)):
     _9 *= _5.dim(_10)
-   _11=_1.eval()
+   _11=self._prepared_1eval_Lmosek_4fusion_4Expression_2(_1)
+   if (_11 is None):
+    _11 = self._profile_1eval_S(_1,_1.eval)
+   self.__use_1parameters_Lmosek_4fusion_4Expression_2(_1)
    for _12 in range(0,int(((_11.x)).shape[0])):
     if (((_11.x)[_12].getModel() is not None) and ((_11.x)[_12].getModel() is not self)):
      raise mosek_fusion_ModelError._ctor_S("Expression belong to different models")
-   _13=self.__build_1conA__3JJ_3J_3J_3D_3D_3Lmosek_4fusion_4Variable_2((_11.ptrb),(_5._size),(_11.inst),(_11.subj),(_11.cof),(_11.bfix),(_11.x))
+   _13=self._prepared_1conA_Lmosek_4fusion_4FlatExpr_2I(_11,(_5._size))
+   if (_13 is None):
+    _13 = self._profile_1call_S("assembly",self.__build_1conA__3JJ_3J_3J_3D_3D_3Lmosek_4fusion_4Variable_2,(_11.ptrb),(_5._size),(_11.inst),(_11.subj),(_11.cof),(_11.bfix),(_11.x))
    _14=(int(((_13.ptrb)).shape[0]) - 1)
    _15=self.__task_vars_used
    _16=self._task_1numcon_()
@@ -6585,27 +7586,18 @@ def __mk_mosek_fusion_Model():
     if (((_13.subj) is not None) and (int(((_13.subj)).shape[0]) > 0)):
      self._task_1putarowslice_II_3J_3I_3D(_19,_20,(_13.ptrb),(_13.subj),(_13.cof))
     if ((_13.barsubi) is not None):
-     for _21 in range(0,int(((_13.barsubi)).shape[0])):
-      self._task_1putbaraij_III(((_13.barsubi)[_21] + _19),(_13.barsubj)[_21],(_13.barmidx)[_21])
+     self._task_1putbaraijlist__3I_3I_3I(((_13.barsubi) + _19),(_13.barsubj),(_13.barmidx))
     _22=mosek.fusion.Utils.Tools._range_II(_19,_20)
     _23=(numpy.zeros(((_20 - _19),), dtype=numpy.dtype(numpy.float64)) if (((_13.bfix) is None) ) else numpy.array([(- (_13.bfix)[_24]) for _24 in range(0,(_20 - _19))], dtype=numpy.dtype(numpy.float64)))
     _25=(_8 * _9)
     _26=(numpy.array([(- (_13.bfix)[_27]) for _27 in range(0,_25)], dtype=numpy.dtype(numpy.float64)) if (((_11.bfix) is not None) ) else numpy.zeros((_25,), dtype=numpy.dtype(numpy.float64)))
     self._task_1con_1putboundslice_1fx_II_3D(_19,_20,_26)
     _28=self._task_1append_1barvar_II(_6,_9)
-    _29=numpy.zeros((1,), dtype=numpy.dtype(numpy.int32))
-    _30=numpy.zeros((1,), dtype=numpy.dtype(numpy.int32))
-    _31=numpy.zeros((1,), dtype=numpy.dtype(numpy.float64))
-    _32=0
-    for _33 in range(0,_6):
-     _30[0] = _33
-     for _34 in range(_33,_6):
-      _29[0] = _34
-      _31[0] = (- (1.0 if ((_34==_33) ) else 0.5))
-      _35=self._task_1append_1barmatrix_I_3I_3I_3D(_6,_29,_30,_31)
-      for _36 in range(0,_9):
-       self._task_1putbaraij_III(((_19 + _32) + (_36 * _8)),(_28 + _36),_35)
-      _32 += 1
+    _30,_29=numpy.triu_indices(_6)
+    _32=numpy.arange(0,int((_29).shape[0]))
+    _35=self._task_1append_1barmatrixlist__3I_3J_3I_3I_3D(numpy.full((int((_32).shape[0]),),_6,dtype=numpy.dtype(numpy.int32)),numpy.arange(0,(int((_32).shape[0]) + 1)),_29,_30,numpy.where((_29==_30),(- 1.0),(- 0.5)))
+    _36=numpy.arange(0,_9)
+    self._task_1putbaraijlist__3I_3I_3I(((_19 + _32)[None,:] + (_36 * _8)[:,None]).reshape(-1),numpy.repeat((_28 + _36),int((_32).shape[0])),numpy.tile(_35,_9))
     _3 = mosek_fusion_LinearPSDConstraint._ctor_Lmosek_4fusion_4Model_2SLmosek_4fusion_4Set_2_3IIII_3J_3I_3D_3D_3I_3I_3I(self,_0,_5,mosek.fusion.Utils.Tools._range_II(_19,_20),_8,_28,_9,(_13.ptrb),(_13.subj),(_13.cof),(_13.bfix),(_13.barsubi),(_13.barsubj),(_13.barmidx))
     self.__addConstraint_SLmosek_4fusion_4ModelConstraint_2(_0,_3)
    finally:
@@ -6620,7 +7612,10 @@ def __mk_mosek_fusion_Model():
    if ((_2._key)==mosek.fusion.PSDKey.IsSymPSD):
     return (self.__nonsym_1psdconstraint_SLmosek_4fusion_4Expression_2Lmosek_4fusion_4PSDDomain_2(_0,_1,_2))
    elif ((_2._key)==mosek.fusion.PSDKey.IsTrilPSD):
-    _4=_1.eval()
+    _4=self._prepared_1eval_Lmosek_4fusion_4Expression_2(_1)
+    if (_4 is None):
+     _4 = self._profile_1eval_S(_1,_1.eval)
+    self.__use_1parameters_Lmosek_4fusion_4Expression_2(_1)
     for _5 in range(0,int(((_4.x)).shape[0])):
      if (((_4.x)[_5].getModel() is not None) and ((_4.x)[_5].getModel() is not self)):
       raise mosek_fusion_ModelError._ctor_S("Expression belong to different models")
@@ -6641,13 +7636,16 @@ def __mk_mosek_fusion_Model():
     _14=(_4.bfix)
     if (_14 is None):
      _14 = numpy.zeros(((int(((_4.ptrb)).shape[0]) - 1),), dtype=numpy.dtype(numpy.float64))
-    return (self.__sdptrilcon_SII_3J_3J_3J_3J_3D_3D_3Lmosek_4fusion_4Variable_2(_0,_7,_6,(_4.ptrb),(_4.inst),_9,(_4.subj),(_4.cof),_14,(_4.x)))
+    return (self._profile_1call_S("assembly",self.__sdptrilcon_SII_3J_3J_3J_3J_3D_3D_3Lmosek_4fusion_4Variable_2,_0,_7,_6,(_4.ptrb),(_4.inst),_9,(_4.subj),(_4.cof),_14,(_4.x)))
    else:
     raise mosek_fusion_UnexpectedError._ctor_S("Invalid domain")
   def __nonsym_1psdconstraint_alt_SLmosek_4fusion_4Expression_2Lmosek_4fusion_4PSDDomain_2(self,_t__0,_t__1,_t__2):
     return self.__nonsym_1psdconstraint_SLmosek_4fusion_4Expression_2Lmosek_4fusion_4PSDDomain_2(_0,_1,_2)
   def __nonsym_1psdconstraint_SLmosek_4fusion_4Expression_2Lmosek_4fusion_4PSDDomain_2(self,_0,_1,_2):
-   _3=_1.eval()
+   _3=self._prepared_1eval_Lmosek_4fusion_4Expression_2(_1)
+   if (_3 is None):
+    _3 = self._profile_1eval_S(_1,_1.eval)
+   self.__use_1parameters_Lmosek_4fusion_4Expression_2(_1)
    if ((((_3.shape).nd)==2) and ((_3.shape).dim(0)!=(_3.shape).dim(1))):
     raise mosek_fusion_DomainError._ctor_S("Invalid expression shape for semidefinite constraint")
    elif ((((_3.shape).nd)==3) and ((_3.shape).dim(1)!=(_3.shape).dim(2))):
@@ -6716,7 +7714,7 @@ def __mk_mosek_fusion_Model():
         for _37 in range(0,_35):
          _10[((_9[_28] + _34) + _37)] = (0.5 * (_3.cof)[((_3.ptrb)[_33] + _37)])
        _28 += 1
-    return (self.__sdptrilcon_SII_3J_3J_3J_3J_3D_3D_3Lmosek_4fusion_4Variable_2(_0,_4,_5,_9,_8,_12,_11,_10,_14,(_3.x)))
+    return (self._profile_1call_S("assembly",self.__sdptrilcon_SII_3J_3J_3J_3J_3D_3D_3Lmosek_4fusion_4Variable_2,_0,_4,_5,_9,_8,_12,_11,_10,_14,(_3.x)))
    else:
     _38=(_4 * _4)
     _39=mosek.fusion.Utils.Tools._arraycopy__3J((_3.inst))
@@ -6744,7 +7742,7 @@ def __mk_mosek_fusion_Model():
       if (_39[_45[_49]] > _39[_45[(_49 - 1)]]):
        _48 += 1
     if (int((_39).shape[0])==_48):
-     return (self.__sdptrilcon_SII_3J_3J_3J_3J_3D_3D_3Lmosek_4fusion_4Variable_2(_0,_4,_5,(_3.ptrb),_39,_45,(_3.subj),(_3.cof),(_3.bfix),(_3.x)))
+     return (self._profile_1call_S("assembly",self.__sdptrilcon_SII_3J_3J_3J_3J_3D_3D_3Lmosek_4fusion_4Variable_2,_0,_4,_5,(_3.ptrb),_39,_45,(_3.subj),(_3.cof),(_3.bfix),(_3.x)))
     else:
      _50=numpy.zeros(((_48 + 1),), dtype=numpy.dtype(numpy.int64))
      _51=numpy.zeros((_48,), dtype=numpy.dtype(numpy.int64))
@@ -6770,7 +7768,7 @@ def __mk_mosek_fusion_Model():
        _61=(((_3.inst)[_45[_60]] // _4) % _4)
        _62=((_3.inst)[_45[_60]] % _4)
        _54[_59] += (_3.bfix)[_45[_60]]
-     return (self.__sdptrilcon_SII_3J_3J_3J_3J_3D_3D_3Lmosek_4fusion_4Variable_2(_0,_4,_5,_50,_51,mosek.fusion.Utils.Tools._range_J(int((_51).shape[0])),_52,_53,_54,(_3.x)))
+     return (self._profile_1call_S("assembly",self.__sdptrilcon_SII_3J_3J_3J_3J_3D_3D_3Lmosek_4fusion_4Variable_2,_0,_4,_5,_50,_51,mosek.fusion.Utils.Tools._range_J(int((_51).shape[0])),_52,_53,_54,(_3.x)))
   def __sdptrilcon_alt_SII_3J_3J_3J_3J_3D_3D_3Lmosek_4fusion_4Variable_2(self,_t__0,_t__1,_t__2,_t__3,_t__4,_t__5,_t__6,_t__7,_t__8,_t__9):
    _0=_t__0
    _1=numpy.int32(_t__1)
@@ -6909,56 +7907,16 @@ def __mk_mosek_fusion_Model():
       _52[_29[_53]] = (- _8[_5[_53]])
     self._task_1con_1putboundslice_1fx_II_3D(_42,_43,_52)
     if (_20 > 0):
-     for _54 in range(0,int((_5).shape[0])):
-      _55=_3[_5[_54]]
-      _56=_3[(_5[_54] + 1)]
-      _57=_55
-      while ((_57 < _56) and (_13[_23[_57]] < 0)):
-       _57 += 1
-      if (_55 < _57):
-       _58=_13[_23[_55]]
-       while (_55 < _57):
-        _59=_55
-        while ((_55 < _57) and (_13[_23[_55]]==_58)):
-         _55 += 1
-        _60=(- (_58 + 1))
-        mosek.fusion.CommonTools._argQsort__3J_3I_3IJJ(_23,_14,_15,_59,_55)
-        _61=1
-        for _62 in range((_59 + 1),_55):
-         if ((_14[_23[_62]]!=_14[_23[(_62 - 1)]]) or (_15[_23[_62]]!=_15[_23[(_62 - 1)]])):
-          _61 += 1
-        _63=numpy.zeros((_61,), dtype=numpy.dtype(numpy.int32))
-        _64=numpy.zeros((_61,), dtype=numpy.dtype(numpy.int32))
-        _65=numpy.zeros((_61,), dtype=numpy.dtype(numpy.float64))
-        _66=(- 1)
-        _67=(- 1)
-        _68=0
-        for _69 in range(_59,_55):
-         if ((_14[_23[_69]]==_67) and (_15[_23[_69]]==_68)):
-          _65[_66] = (_65[_66] + _7[_23[_69]])
-         else:
-          _66 += 1
-          _63[_66] = _14[_23[_69]]
-          _64[_66] = _15[_23[_69]]
-          _65[_66] = _7[_23[_69]]
-          _67 = _63[_66]
-          _68 = _64[_66]
-        _70=self._task_1barvardim_I(_60)
-        _71=self._task_1append_1barmatrix_I_3I_3I_3D(_70,_63,_64,_65)
-        self._task_1putbaraij_III(numpy.int32((_29[_54] + _42)),_60,_71)
+     _54=numpy.repeat(numpy.arange(0,int((_5).shape[0])),numpy.diff(_16))
+     _55=numpy.flatnonzero((_13 < 0))
+     _56,_57,_58=self._append_1barmatrices__3J_3I_3I_3I_3D(_54[_55],((- _13[_55]) - 1),_14[_55],_15[_55],_7[_55])
+     self._task_1putbaraijlist__3I_3I_3I((_29[_56] + _42),_57,_58)
     _72=self._task_1append_1barvar_II(_1,_2)
-    _73=numpy.zeros((1,), dtype=numpy.dtype(numpy.int32))
-    _74=numpy.zeros((1,), dtype=numpy.dtype(numpy.int32))
-    _75=numpy.zeros((1,), dtype=numpy.dtype(numpy.float64))
-    for _76 in range(0,_1):
-     for _77 in range(0,(_76 + 1)):
-      _73[0] = _76
-      _74[0] = _77
-      _75[0] = (- (1.0 if ((_76==_77) ) else 0.5))
-      _78=self._task_1append_1barmatrix_I_3I_3I_3D(_1,_73,_74,_75)
-      for _79 in range(0,_2):
-       _80=(((((_79 * _1) * (_1 + 1)) // 2) + ((_76 * (_76 + 1)) // 2)) + _77)
-       self._task_1putbaraij_III((_42 + _80),(_72 + _79),_78)
+    _73,_74=numpy.tril_indices(_1)
+    _75=numpy.arange(0,int((_73).shape[0]))
+    _76=self._task_1append_1barmatrixlist__3I_3J_3I_3I_3D(numpy.full((int((_75).shape[0]),),_1,dtype=numpy.dtype(numpy.int32)),numpy.arange(0,(int((_75).shape[0]) + 1)),_73,_74,numpy.where((_73==_74),(- 1.0),(- 0.5)))
+    _77=numpy.arange(0,_2)
+    self._task_1putbaraijlist__3I_3I_3I(((_42 + _75)[None,:] + (_77 * ((_1 * (_1 + 1)) // 2))[:,None]).reshape(-1),numpy.repeat((_72 + _77),int((_75).shape[0])),numpy.tile(_76,_2))
     _81=None
     if (_2==1):
      _81 = mosek_fusion_NDSet._ctor_II(_1,_1)
@@ -7141,8 +8099,7 @@ def __mk_mosek_fusion_Model():
      _1 = (self._natbarvarmap_num + _0)
     _2=numpy.zeros((_1,), dtype=numpy.dtype(numpy.int32))
     _3=numpy.zeros((_1,), dtype=numpy.dtype(numpy.int32))
-    for _4 in range(0,self._natbarvarmap_num):
-     _2[_4] = self._natbarvarmap_Var[_4]
+    _2[0:self._natbarvarmap_num] = self._natbarvarmap_Var[0:self._natbarvarmap_num]
     self._natbarvarmap_Var = _2
   def __natvarmap_1ensure_alt_I(self,_t__0):
     return self.__natvarmap_1ensure_I(numpy.int32(__0))
@@ -7154,8 +8111,7 @@ def __mk_mosek_fusion_Model():
     _2=numpy.zeros((_1,), dtype=numpy.dtype(numpy.int64))
     mosek.fusion.Utils.Tools._arraycopy__3JI_3JII(self.__natvarmap_idx,0,_2,0,self.__natvarmap_num)
     _3=numpy.zeros((_1,), dtype=numpy.dtype(numpy.int32))
-    for _4 in range(0,self.__natvarmap_num):
-     _3[_4] = self.__natvarmap_Var[_4]
+    _3[0:self.__natvarmap_num] = self.__natvarmap_Var[0:self.__natvarmap_num]
     self.__natvarmap_idx = _2
     self.__natvarmap_Var = _3
   def __task_1alloc_1vars_alt_I(self,_t__0):
@@ -7171,6 +8127,265 @@ def __mk_mosek_fusion_Model():
  return Model
 mosek_fusion_Model=__mk_mosek_fusion_Model()
 del __mk_mosek_fusion_Model
+#BEFORE CLASS
+def __mk_mosek_fusion_Parameter():
+ import threading
+ class Parameter(object):
+  __slots__ = ['_Parameter__uses','_Parameter__exprs','_Parameter__bindings','_Parameter__dirty','_Parameter__value','_Parameter__dims','_Parameter__shape','_Parameter__name','_Parameter__model']
+  # Set when the first parameter is created. From then on Expr operations
+  # record which parameters their result was computed from, see _track_S.
+  _exists = False
+  _local = threading.local()
+  def getModel(self,*args):
+    if False: pass
+    elif mosek_fusion_Parameter._match_getModel_(*args): # 
+      return self._getModel_(*args)
+    elif mosek_fusion_Parameter._match_alt_getModel_(*args): # 
+      return self._getModel_alt_(*args)
+    else:
+      raise ValueError('Invalid argument list getModel('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Parameter.getModel()')
+  def getName(self,*args):
+    if False: pass
+    elif mosek_fusion_Parameter._match_getName_(*args): # 
+      return self._getName_(*args)
+    elif mosek_fusion_Parameter._match_alt_getName_(*args): # 
+      return self._getName_alt_(*args)
+    else:
+      raise ValueError('Invalid argument list getName('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Parameter.getName()')
+  def getShape(self,*args):
+    if False: pass
+    elif mosek_fusion_Parameter._match_getShape_(*args): # 
+      return self._getShape_(*args)
+    elif mosek_fusion_Parameter._match_alt_getShape_(*args): # 
+      return self._getShape_alt_(*args)
+    else:
+      raise ValueError('Invalid argument list getShape('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Parameter.getShape()')
+  def getSize(self,*args):
+    if False: pass
+    elif mosek_fusion_Parameter._match_getSize_(*args): # 
+      return self._getSize_(*args)
+    elif mosek_fusion_Parameter._match_alt_getSize_(*args): # 
+      return self._getSize_alt_(*args)
+    else:
+      raise ValueError('Invalid argument list getSize('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Parameter.getSize()')
+  def getValue(self,*args):
+    if False: pass
+    elif mosek_fusion_Parameter._match_getValue_(*args): # 
+      return self._getValue_(*args)
+    elif mosek_fusion_Parameter._match_alt_getValue_(*args): # 
+      return self._getValue_alt_(*args)
+    else:
+      raise ValueError('Invalid argument list getValue('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Parameter.getValue()')
+  def setValue(self,*args):
+    if False: pass
+    elif mosek_fusion_Parameter._match_setValue_D(*args): # double
+      return self._setValue_D(*args)
+    elif mosek_fusion_Parameter._match_alt_setValue_D(*args): # double
+      return self._setValue_alt_D(*args)
+    elif mosek_fusion_Parameter._match_setValue__3D(*args): # []double
+      return self._setValue__3D(*args)
+    elif mosek_fusion_Parameter._match_alt_setValue__3D(*args): # []double
+      return self._setValue_alt__3D(*args)
+    elif mosek_fusion_Parameter._match_setValue__3_5D(*args): # [,]double
+      return self._setValue__3_5D(*args)
+    elif mosek_fusion_Parameter._match_alt_setValue__3_5D(*args): # [,]double
+      return self._setValue_alt__3_5D(*args)
+    else:
+      raise ValueError('Invalid argument list setValue('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Parameter.setValue(double)\n\tmosek.fusion.Parameter.setValue(array(double,ndim=1))\n\tmosek.fusion.Parameter.setValue(array(double,ndim=2))')
+  def __repr__(self): return 'mosek.fusion.Parameter'
+  @staticmethod
+  def _ctor_Lmosek_4fusion_4Model_2S_3I(model,name,dims):
+    o = Parameter.__new__(Parameter)
+    o._ctor_init_Lmosek_4fusion_4Model_2S_3I(model,name,dims)
+    return o
+  def _ctor_init_Lmosek_4fusion_4Model_2S_3I(self,model,name,dims):
+   assert dims is None or isinstance(dims,numpy.ndarray)
+   object.__init__(self)
+   self.__model = model
+   self.__name = name
+   self.__dims = dims
+   self.__shape = (mosek.fusion.Set._make__3I(dims) if ((dims is not None) ) else None)
+   self.__value = numpy.zeros(((1 if ((dims is None) ) else (self.__shape._size)),), dtype=numpy.dtype(numpy.float64))
+   self.__dirty = False
+   self.__bindings = []
+   self.__exprs = []
+   self.__uses = []
+   Parameter._exists = True
+  @staticmethod
+  def _match_getModel_(*args):
+    if len(args) != 0: return False
+    return True
+  @staticmethod
+  def _match_alt_getModel_(*args):
+    if len(args) != 0: return False
+    return True
+  def _getModel_alt_(self,):
+    return self._getModel_()
+  def _getModel_(self,):
+   return (self.__model)
+  @staticmethod
+  def _match_getName_(*args):
+    if len(args) != 0: return False
+    return True
+  @staticmethod
+  def _match_alt_getName_(*args):
+    if len(args) != 0: return False
+    return True
+  def _getName_alt_(self,):
+    return self._getName_()
+  def _getName_(self,):
+   return (self.__name)
+  @staticmethod
+  def _match_getShape_(*args):
+    if len(args) != 0: return False
+    return True
+  @staticmethod
+  def _match_alt_getShape_(*args):
+    if len(args) != 0: return False
+    return True
+  def _getShape_alt_(self,):
+    return self._getShape_()
+  def _getShape_(self,):
+   return ((self.__shape if ((self.__shape is not None) ) else mosek.fusion.Set._scalar_()))
+  @staticmethod
+  def _match_getSize_(*args):
+    if len(args) != 0: return False
+    return True
+  @staticmethod
+  def _match_alt_getSize_(*args):
+    if len(args) != 0: return False
+    return True
+  def _getSize_alt_(self,):
+    return self._getSize_()
+  def _getSize_(self,):
+   return (numpy.int64(int((self.__value).shape[0])))
+  @staticmethod
+  def _match_getValue_(*args):
+    if len(args) != 0: return False
+    return True
+  @staticmethod
+  def _match_alt_getValue_(*args):
+    if len(args) != 0: return False
+    return True
+  def _getValue_alt_(self,):
+    return self._getValue_()
+  def _getValue_(self,):
+   return (mosek.fusion.Utils.Tools._arraycopy__3D(self.__value))
+  @staticmethod
+  def _match_setValue_D(*args):
+    if len(args) != 1: return False
+    _0, = args
+    return (__arg_match_D__(_0))
+  @staticmethod
+  def _match_alt_setValue_D(*args):
+    if len(args) != 1: return False
+    _0, = args
+    return (__arg_alt_match_D__(_0))
+  def _setValue_alt_D(self,_t__0):
+    return self._setValue_D(numpy.float64(_t__0))
+  def _setValue_D(self,_0):
+   self.__update_1value__3D(numpy.array([_0], dtype=numpy.dtype(numpy.float64)))
+  @staticmethod
+  def _match_setValue__3D(*args):
+    if len(args) != 1: return False
+    _0, = args
+    return (__arg_match__3D__(_0))
+  @staticmethod
+  def _match_alt_setValue__3D(*args):
+    if len(args) != 1: return False
+    _0, = args
+    return (__arg_alt_match__3D__(_0))
+  def _setValue_alt__3D(self,_t__0):
+   _0=numpy.array(_t__0,dtype=numpy.dtype(numpy.float64))
+   return self._setValue__3D(_0)
+  def _setValue__3D(self,_0):
+   assert _0 is None or isinstance(_0,numpy.ndarray)
+   if (_0 is None):
+    raise ValueError("Arguments for setValue may not be null")
+   if (int((_0).shape[0])!=int((self.__value).shape[0])):
+    raise mosek_fusion_LengthError._ctor_S("Mismatching length of parameter value")
+   self.__update_1value__3D(_0)
+  @staticmethod
+  def _match_setValue__3_5D(*args):
+    if len(args) != 1: return False
+    _0, = args
+    return (__arg_match__3_5D__(_0))
+  @staticmethod
+  def _match_alt_setValue__3_5D(*args):
+    if len(args) != 1: return False
+    _0, = args
+    return (__arg_alt_match__3_5D__(_0))
+  def _setValue_alt__3_5D(self,_t__0):
+   _0=_monty.makeArray(_t__0,2,numpy.dtype(numpy.float64))
+   return self._setValue__3_5D(_0)
+  def _setValue__3_5D(self,_0):
+   assert _0 is None or isinstance(_0,numpy.ndarray)
+   if (_0 is None):
+    raise ValueError("Arguments for setValue may not be null")
+   if ((self.__dims is None) or (int((self.__dims).shape[0])!=2) or (self.__dims[0]!=(_0).shape[0]) or (self.__dims[1]!=(_0).shape[1])):
+    raise mosek_fusion_DimensionError._ctor_S("Mismatching shape of parameter value")
+   self.__update_1value__3D((_0).reshape(-1))
+  def __update_1value__3D(self,_0):
+   assert _0 is None or isinstance(_0,numpy.ndarray)
+   if (len(self.__uses) > 0):
+    raise mosek_fusion_ExpressionError._ctor_S("Parameter is used in an expression that was not passed directly to Model.constraint or Model.objective")
+   self.__value[:] = _0
+   for _1 in self.__exprs:
+    _1._refreshParameter_()
+   self.__dirty = True
+  def _values_(self,):
+   return (self.__value)
+  def _dims_(self,):
+   return (self.__dims)
+  def _isDirty_(self,):
+   return (self.__dirty)
+  def _clearDirty_(self,):
+   self.__dirty = False
+  def _bindings_(self,):
+   return (self.__bindings)
+  def _addBinding_(self,_0):
+   self.__bindings.append(_0)
+  def _removeBinding_(self,_0):
+   self.__bindings = [_1 for _1 in self.__bindings if (_1 is not _0)]
+  def _addExpr_(self,_0):
+   self.__exprs.append(_0)
+  def _useExpr_(self,_0):
+   self.__uses.append(_0)
+  def _bindExpr_(self,_0):
+   for _1 in range((int(len(self.__uses)) - 1),(- 1),(- 1)):
+    if (self.__uses[_1] is _0):
+     del self.__uses[_1]
+     return
+  @staticmethod
+  def _tracking_():
+   return (Parameter._exists and (not getattr(Parameter._local,'busy',False)))
+  @staticmethod
+  def _track_S(_0,_1):
+   # Only the outermost Expr operation is tracked.
+   Parameter._local.busy = True
+   try:
+    _2=_0(*_1)
+   finally:
+    Parameter._local.busy = False
+   _3=[]
+   for _4 in _1:
+    if (isinstance(_4,(list,tuple)) and (len(_4) > 0) and isinstance(_4[0],(mosek_fusion_Expression,mosek_fusion_Variable))):
+     _3.extend(_4)
+    else:
+     _3.append(_4)
+   _3=[_4 for _4 in _3 if isinstance(_4,mosek_fusion_Expr)]
+   if (isinstance(_2,mosek_fusion_Expr) and (not any([(_4 is _2) for _4 in _3]))):
+    _5=[]
+    for _4 in _3:
+     for _6 in _4._dependsOn_():
+      if (not any([(_6 is _7) for _7 in _5])):
+       _5.append(_6)
+    if (int(len(_5)) > 0):
+     _2._Expr__derived = tuple(_5)
+   return (_2)
+ return Parameter
+mosek_fusion_Parameter=__mk_mosek_fusion_Parameter()
+del __mk_mosek_fusion_Parameter
 def __mk_mosek_fusion_Debug():
   class Debug:
     @staticmethod 
@@ -8167,6 +9382,14 @@ def __mk_mosek_fusion_IndexCounter():
       return self._reset_alt_(*args)
     else:
       raise ValueError('Invalid argument list reset('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.IndexCounter.reset()')
+  def materialize(self,*args):
+    if False: pass
+    elif mosek_fusion_IndexCounter._match_materialize_(*args): # 
+      return self._materialize_(*args)
+    elif mosek_fusion_IndexCounter._match_alt_materialize_(*args): # 
+      return self._materialize_alt_(*args)
+    else:
+      raise ValueError('Invalid argument list materialize('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.IndexCounter.materialize()')
   def getIndex(self,*args):
     if False: pass
     elif mosek_fusion_IndexCounter._match_getIndex_(*args): # 
@@ -8381,6 +9604,24 @@ def __mk_mosek_fusion_IndexCounter():
    self.__st = numpy.zeros((self.__n,), dtype=numpy.dtype(numpy.int64))
    for _0 in range(0,self.__n):
     self.__st[_0] = self.__start
+  @staticmethod
+  def _match_materialize_(*args):
+    if len(args) != 0: return False
+    return True
+  @staticmethod
+  def _match_alt_materialize_(*args):
+    if len(args) != 0: return False
+    return True
+  def _materialize_alt_(self,):
+    return self._materialize_()
+  # The whole index sequence from the start position, in the order
+  # produced by repeated _next_(), as one int64 array. The iteration
+  # state of the counter is left untouched.
+  def _materialize_(self,):
+   _0=numpy.array([self.__start],dtype=numpy.dtype(numpy.int64))
+   for _1 in range(0,self.__n):
+    _0=numpy.add.outer(_0,numpy.arange(0,self.__dims[_1],dtype=numpy.dtype(numpy.int64))*self.__strides[_1]).ravel()
+   return (_0)
  return IndexCounter
 mosek_fusion_IndexCounter=__mk_mosek_fusion_IndexCounter()
 del __mk_mosek_fusion_IndexCounter
@@ -8480,6 +9721,7 @@ def __mk_mosek_fusion_CommonTools():
    while ((_3 > 0) and (_0[_3] >= _2[_3])):
     _0[_3] = _1[_3]
     _0[(_3 - 1)] += 1
+    _3 -= 1
   @staticmethod
   def _match_transposeTriplets__3I_3I_3D_3_3J_3_3J_3_3DJII(*args):
     if len(args) != 9: return False
@@ -8535,37 +9777,10 @@ def __mk_mosek_fusion_CommonTools():
    assert _3 is None or isinstance(_3,numpy.ndarray)
    assert _4 is None or isinstance(_4,numpy.ndarray)
    assert _5 is None or isinstance(_5,numpy.ndarray)
-   _9=numpy.zeros(((_7 + 2),), dtype=numpy.dtype(numpy.int64))
-   _10=numpy.zeros(((_8 + 2),), dtype=numpy.dtype(numpy.int64))
-   _11=0
-   while (_11 < _6):
-    _10[(_1[_11] + 2)] = (_10[(_1[_11] + 2)] + 1)
-    _9[(_0[_11] + 2)] = (_9[(_0[_11] + 2)] + 1)
-    _11 += 1
-   _12=1
-   while (_12 < _7):
-    _9[(_12 + 1)] = (_9[(_12 + 1)] + _9[_12])
-    _12 += 1
-   _13=1
-   while (_13 < _8):
-    _10[(_13 + 1)] = (_10[(_13 + 1)] + _10[_13])
-    _13 += 1
-   _14=numpy.zeros((_6,), dtype=numpy.dtype(numpy.int64))
-   _15=numpy.zeros((_6,), dtype=numpy.dtype(numpy.int64))
-   _16=numpy.zeros((_6,), dtype=numpy.dtype(numpy.float64))
-   for _17 in range(0,_7):
-    _18=_9[_17]
-    while (_18 < _9[(_17 + 1)]):
-     _19=_1[_18]
-     _20=_10[_19]
-     _14[_20] = _17
-     _15[_20] = _19
-     _16[_20] = _2[_18]
-     _10[_19] = (_20 + 1)
-     _18 += 1
-   _3[0] = _15
-   _4[0] = _14
-   _5[0] = _16
+   _9=numpy.lexsort((_0[:_6],_1[:_6]))
+   _3[0] = _1[_9].astype(numpy.dtype(numpy.int64))
+   _4[0] = _0[_9].astype(numpy.dtype(numpy.int64))
+   _5[0] = numpy.array(_2[_9],dtype=numpy.dtype(numpy.float64))
   @staticmethod
   def _match_transposeTriplets__3I_3I_3D_3_3I_3_3I_3_3DJII(*args):
     if len(args) != 9: return False
@@ -8621,37 +9836,10 @@ def __mk_mosek_fusion_CommonTools():
    assert _3 is None or isinstance(_3,numpy.ndarray)
    assert _4 is None or isinstance(_4,numpy.ndarray)
    assert _5 is None or isinstance(_5,numpy.ndarray)
-   _9=numpy.zeros(((_7 + 2),), dtype=numpy.dtype(numpy.int64))
-   _10=numpy.zeros(((_8 + 2),), dtype=numpy.dtype(numpy.int64))
-   _11=0
-   while (_11 < _6):
-    _10[(_1[_11] + 2)] = (_10[(_1[_11] + 2)] + 1)
-    _9[(_0[_11] + 2)] = (_9[(_0[_11] + 2)] + 1)
-    _11 += 1
-   _12=1
-   while (_12 < _7):
-    _9[(_12 + 1)] = (_9[(_12 + 1)] + _9[_12])
-    _12 += 1
-   _13=1
-   while (_13 < _8):
-    _10[(_13 + 1)] = (_10[(_13 + 1)] + _10[_13])
-    _13 += 1
-   _14=numpy.zeros((_6,), dtype=numpy.dtype(numpy.int32))
-   _15=numpy.zeros((_6,), dtype=numpy.dtype(numpy.int32))
-   _16=numpy.zeros((_6,), dtype=numpy.dtype(numpy.float64))
-   _17=0
-   while (_17 < _7):
-    for _18 in range(_9[_17],_9[(_17 + 1)]):
-     _19=_1[_18]
-     _20=_10[_19]
-     _14[_20] = _17
-     _15[_20] = _19
-     _16[_20] = _2[_18]
-     _10[_19] = (_20 + 1)
-    _17 += 1
-   _3[0] = _15
-   _4[0] = _14
-   _5[0] = _16
+   _9=numpy.lexsort((_0[:_6],_1[:_6]))
+   _3[0] = _1[_9].astype(numpy.dtype(numpy.int32))
+   _4[0] = _0[_9].astype(numpy.dtype(numpy.int32))
+   _5[0] = numpy.array(_2[_9],dtype=numpy.dtype(numpy.float64))
   @staticmethod
   def _match_tripletSort__3I_3I_3D_3_3I_3_3I_3_3DJII(*args):
     if len(args) != 9: return False
@@ -8707,66 +9895,15 @@ def __mk_mosek_fusion_CommonTools():
    assert _3 is None or isinstance(_3,numpy.ndarray)
    assert _4 is None or isinstance(_4,numpy.ndarray)
    assert _5 is None or isinstance(_5,numpy.ndarray)
-   _9=numpy.zeros((_6,), dtype=numpy.dtype(numpy.int32))
-   _10=numpy.zeros(((_8 + 2),), dtype=numpy.dtype(numpy.int64))
-   for _11 in range(0,_6):
-    _10[(_1[_11] + 2)] = (_10[(_1[_11] + 2)] + 1)
-   for _12 in range(1,_8):
-    _10[(_12 + 1)] = (_10[(_12 + 1)] + _10[_12])
-   for _13 in range(0,numpy.int32(_6)):
-    _14=_1[_13]
-    _9[_10[(_14 + 1)]] = _13
-    _10[(_14 + 1)] = (_10[(_14 + 1)] + 1)
-   _15=numpy.zeros(((_7 + 2),), dtype=numpy.dtype(numpy.int64))
-   _16=numpy.zeros((_6,), dtype=numpy.dtype(numpy.int32))
-   _17=0
-   while (_17 < _6):
-    _15[(_0[_17] + 2)] = (_15[(_0[_17] + 2)] + 1)
-    _17 += 1
-   _18=1
-   while (_18 < _7):
-    _15[(_18 + 1)] = (_15[(_18 + 1)] + _15[_18])
-    _18 += 1
-   _19=0
-   while (_19 < _8):
-    _20=_10[_19]
-    while (_20 < _10[(_19 + 1)]):
-     _21=_0[_9[_20]]
-     _16[_15[(_21 + 1)]] = _9[_20]
-     _15[(_21 + 1)] = (_15[(_21 + 1)] + 1)
-     _20 += 1
-    _19 += 1
-   _22=1
-   _23=_0[_16[0]]
-   _24=_1[_16[0]]
-   _25=1
-   while (_25 < _6):
-    _26=_16[_25]
-    if ((_23!=_0[_26]) or (_24!=_1[_26])):
-     _23 = _0[_26]
-     _24 = _1[_26]
-     _22 += 1
-    _25 += 1
-   _27=numpy.zeros((_22,), dtype=numpy.dtype(numpy.int32))
-   _28=numpy.zeros((_22,), dtype=numpy.dtype(numpy.int32))
-   _29=numpy.zeros((_22,), dtype=numpy.dtype(numpy.float64))
-   _30=_16[0]
-   _27[0] = _0[_30]
-   _28[0] = _1[_30]
-   _29[0] = _2[_30]
-   _31=1
-   for _32 in range(1,_6):
-    _33=_16[_32]
-    if ((_27[(_31 - 1)]==_0[_33]) and (_28[(_31 - 1)]==_1[_33])):
-     _29[(_31 - 1)] = (_29[(_31 - 1)] + _2[_33])
-    else:
-     _27[_31] = _0[_33]
-     _28[_31] = _1[_33]
-     _29[_31] = _2[_33]
-     _31 += 1
-   _3[0] = _27
-   _4[0] = _28
-   _5[0] = _29
+   _9=numpy.lexsort((_1[:_6],_0[:_6]))
+   _10=_0[_9]
+   _11=_1[_9]
+   _12=numpy.concatenate((numpy.ones((min(_6,1),),dtype=numpy.dtype(bool)),((_10[1:]!=_10[:-1]) | (_11[1:]!=_11[:-1]))))
+   _13=numpy.nonzero(_12)[0]
+   _3[0] = _10[_13].astype(numpy.dtype(numpy.int32))
+   _4[0] = _11[_13].astype(numpy.dtype(numpy.int32))
+   # bincount adds duplicates in order, like the loop it replaces
+   _5[0] = numpy.bincount((numpy.cumsum(_12) - 1),weights=_2[_9],minlength=int((_13).shape[0]))
   @staticmethod
   def _match_argMSort__3I_3I(*args):
     if len(args) != 2: return False
@@ -8945,7 +10082,7 @@ del __mk_mosek_fusion_CommonTools
 #BEFORE CLASS
 def __mk_mosek_fusion_SolutionStruct():
  class SolutionStruct(object):
-  __slots__ = ['snx','sux','slx','bars','barx','y','suc','slc','xx','xc','dobj','pobj','probstatus','dstatus','pstatus','sol_numbarvar','sol_numcone','sol_numvar','sol_numcon']
+  __slots__ = ['snx','sux','slx','bars','barx','y','suc','slc','xx','xc','dobj','pobj','probstatus','dstatus','pstatus','sol_numbarvar','sol_numcone','sol_numvar','sol_numcon','_shared']
   def __init__(self,*args):
     if False: pass
     elif self.__match_ctor_Lmosek_4fusion_4SolutionStruct_2(*args): # mosek.fusion.SolutionStruct
@@ -9010,6 +10147,7 @@ def __mk_mosek_fusion_SolutionStruct():
     self._ctor_init_IIII(numpy.int32(numvar),numpy.int32(numcon),numpy.int32(numcone),numpy.int32(numbarvar))
   def _ctor_init_IIII(self,numvar,numcon,numcone,numbarvar):
    object.__init__(self)
+   self._shared = False
    self.pobj = 0.0
    self.dobj = 0.0
    self.pstatus = mosek.fusion.SolutionStatus.Unknown
@@ -9071,22 +10209,30 @@ def __mk_mosek_fusion_SolutionStruct():
    self.probstatus = (that.probstatus)
    self.pobj = (that.pobj)
    self.dobj = (that.dobj)
-   self.xc = (mosek.fusion.Utils.Tools._arraycopy__3D((that.xc)) if (((that.xc) is not None) ) else None)
-   self.xx = (mosek.fusion.Utils.Tools._arraycopy__3D((that.xx)) if (((that.xx) is not None) ) else None)
-   self.slc = (mosek.fusion.Utils.Tools._arraycopy__3D((that.slx)) if (((that.slc) is not None) ) else None)
-   self.suc = (mosek.fusion.Utils.Tools._arraycopy__3D((that.sux)) if (((that.suc) is not None) ) else None)
-   self.y = (mosek.fusion.Utils.Tools._arraycopy__3D((that.y)) if (((that.y) is not None) ) else None)
-   if ((that.barx) is not None):
-    self.barx = _monty.initJaggedArray([mosek.fusion.Utils.Tools._arraycopy__3D((that.barx)[_0]) for _0 in range(0,int(((that.barx)).shape[0]))], 1)
-   else:
-    self.barx = None
-   if ((that.bars) is not None):
-    self.bars = _monty.initJaggedArray([mosek.fusion.Utils.Tools._arraycopy__3D((that.bars)[_1]) for _1 in range(0,int(((that.bars)).shape[0]))], 1)
-   else:
-    self.bars = None
-   self.slx = (mosek.fusion.Utils.Tools._arraycopy__3D((that.slx)) if (((that.slx) is not None) ) else None)
-   self.sux = (mosek.fusion.Utils.Tools._arraycopy__3D((that.sux)) if (((that.sux) is not None) ) else None)
-   self.snx = (mosek.fusion.Utils.Tools._arraycopy__3D((that.snx)) if (((that.snx) is not None) ) else None)
+   self.xc = (that.xc)
+   self.xx = (that.xx)
+   self.slc = (that.slc)
+   self.suc = (that.suc)
+   self.y = (that.y)
+   self.barx = (that.barx)
+   self.bars = (that.bars)
+   self.slx = (that.slx)
+   self.sux = (that.sux)
+   self.snx = (that.snx)
+   self._shared = True
+   that._shared = True
+  def __unshare_(self,):
+   self.xc = (mosek.fusion.Utils.Tools._arraycopy__3D(self.xc) if ((self.xc is not None) ) else None)
+   self.xx = (mosek.fusion.Utils.Tools._arraycopy__3D(self.xx) if ((self.xx is not None) ) else None)
+   self.slc = (mosek.fusion.Utils.Tools._arraycopy__3D(self.slc) if ((self.slc is not None) ) else None)
+   self.suc = (mosek.fusion.Utils.Tools._arraycopy__3D(self.suc) if ((self.suc is not None) ) else None)
+   self.y = (mosek.fusion.Utils.Tools._arraycopy__3D(self.y) if ((self.y is not None) ) else None)
+   self.slx = (mosek.fusion.Utils.Tools._arraycopy__3D(self.slx) if ((self.slx is not None) ) else None)
+   self.sux = (mosek.fusion.Utils.Tools._arraycopy__3D(self.sux) if ((self.sux is not None) ) else None)
+   self.snx = (mosek.fusion.Utils.Tools._arraycopy__3D(self.snx) if ((self.snx is not None) ) else None)
+   self.barx = (self.barx.copy() if ((self.barx is not None) ) else None)
+   self.bars = (self.bars.copy() if ((self.bars is not None) ) else None)
+   self._shared = False
   @staticmethod
   def _match_clone_(*args):
     if len(args) != 0: return False
@@ -9112,6 +10258,8 @@ def __mk_mosek_fusion_SolutionStruct():
   def _resize_alt_IIII(self,_t__0,_t__1,_t__2,_t__3):
     return self._resize_IIII(numpy.int32(__0),numpy.int32(__1),numpy.int32(__2),numpy.int32(__3))
   def _resize_IIII(self,_0,_1,_2,_3):
+   if self._shared:
+    self.__unshare_()
    if (_3 < 0):
     pass
    elif (_3 <= self.sol_numbarvar):
@@ -10235,7 +11383,7 @@ def __mk_mosek_fusion_BaseVariable():
     _0, = args
     return (__arg_alt_match__3_5I__(_0))
   def _pick_alt__3_5I(self,_t__0):
-   _0=numpy.array(_t__0,ndmin=_monty.checkShape(_t__0,2),dtype=numpy.dtype(numpy.int32))
+   _0=_monty.makeArray(_t__0,2,numpy.dtype(numpy.int32))
    _1 = self._pick__3_5I(_0)
    return _1
   def _pick__3_5I(self,_0):
@@ -11278,6 +12426,24 @@ def __mk_mosek_fusion_RepeatVariable():
    self.__d1 = (self.__xdims[(self.__dim)] * count)
    for _5 in range((dim + 1),int((self.__xdims).shape[0])):
     self.__d2 *= self.__xdims[_5]
+  def _origin_(self):
+   return (self.__x)
+  # The elements of self.__x for the linear indexes _0, as in inst().
+  def _gather__3J(self,_0):
+   if (self.__dim==0):
+    return ((_0 % self.__xsize))
+   elif ((self.__d1 * self.__d2)==1):
+    return ((_0 // self.__count))
+   else:
+    _1=(self.__xdims[self.__dim] * self.__d2)
+    return ((((_0 // (_1 * self.__count)) * _1) + (_0 % _1)))
+  def _inst__3JIIJJ_3I_3I_3I(self,_0,_1,_2,_3,_4,_5,_6,_7):
+   assert _0 is None or isinstance(_0,numpy.ndarray)
+   assert _5 is None or isinstance(_5,numpy.ndarray)
+   assert _6 is None or isinstance(_6,numpy.ndarray)
+   assert _7 is None or isinstance(_7,numpy.ndarray)
+   _8=self._gather__3J((_0[_1:_2] - _3))
+   self.__x.inst(_8,0,int((_8).shape[0]),0,_4,_5,_7,_6)
   @staticmethod
   def _match_elementDesc_JLmosek_4fusion_4Utils_4StringBuffer_2(*args):
     if len(args) != 2: return False
@@ -11456,19 +12622,7 @@ def __mk_mosek_fusion_RepeatVariable():
   def _set_1values__3J_3DZ(self,_0,_1,_2):
    assert _0 is None or isinstance(_0,numpy.ndarray)
    assert _1 is None or isinstance(_1,numpy.ndarray)
-   if (self.__dim==0):
-    self.__x.set_values(numpy.array([(_0[_3] % self.__xsize) for _3 in range(0,int((_0).shape[0]))], dtype=numpy.dtype(numpy.int64)),_1,_2)
-   elif ((self.__d1 * self.__d2)==1):
-    self.__x.set_values(numpy.array([(_0[_4] // self.__count) for _4 in range(0,int((_0).shape[0]))], dtype=numpy.dtype(numpy.int64)),_1,_2)
-   else:
-    _5=self.__d0
-    _6=(self.__x.getShape().dim(self.__dim) * self.__d2)
-    _7=numpy.zeros((int((_0).shape[0]),), dtype=numpy.dtype(numpy.int64))
-    for _8 in range(0,int((_0).shape[0])):
-     _9=(_0[_8] % _6)
-     _10=(_0[_8] // (_6 * self.__count))
-     _7[_8] = ((_10 * _6) + _9)
-    self.__x.set_values(_7,_1,_2)
+   self.__x.set_values(self._gather__3J(_0),_1,_2)
   @staticmethod
   def _match_values_J_3I_3JI_3DZ(*args):
     if len(args) != 6: return False
@@ -11556,19 +12710,7 @@ def __mk_mosek_fusion_RepeatVariable():
   def _values__3JI_3DZ(self,_0,_1,_2,_3):
    assert _0 is None or isinstance(_0,numpy.ndarray)
    assert _2 is None or isinstance(_2,numpy.ndarray)
-   if (self.__d0==1):
-    self.__x.values(numpy.array([(_0[_4] % self.__xsize) for _4 in range(0,int((_0).shape[0]))], dtype=numpy.dtype(numpy.int64)),_1,_2,_3)
-   elif ((self.__d1 * self.__d2)==1):
-    self.__x.values(numpy.array([(_0[_5] // self.__count) for _5 in range(0,int((_0).shape[0]))], dtype=numpy.dtype(numpy.int64)),_1,_2,_3)
-   else:
-    _6=self.__d0
-    _7=(self.__x.getShape().dim(self.__dim) * self.__d2)
-    _8=numpy.zeros((int((_0).shape[0]),), dtype=numpy.dtype(numpy.int64))
-    for _9 in range(0,int((_0).shape[0])):
-     _10=(_0[_9] % _7)
-     _11=(_0[_9] // (_7 * self.__count))
-     _8[_9] = ((_11 * _7) + _10)
-    self.__x.values(_8,_1,_2,_3)
+   self.__x.values(self._gather__3J(_0),_1,_2,_3)
   @staticmethod
   def _match_make_1continuous__3J(*args):
     if len(args) != 1: return False
@@ -11589,19 +12731,7 @@ def __mk_mosek_fusion_RepeatVariable():
    return _1
   def _make_1continuous__3J(self,_0):
    assert _0 is None or isinstance(_0,numpy.ndarray)
-   if (self.__d0==1):
-    self.__x.make_continuous(numpy.array([(_0[_1] % self.__xsize) for _1 in range(0,int((_0).shape[0]))], dtype=numpy.dtype(numpy.int64)))
-   elif ((self.__d1 * self.__d2)==1):
-    self.__x.make_continuous(numpy.array([(_0[_2] // self.__count) for _2 in range(0,int((_0).shape[0]))], dtype=numpy.dtype(numpy.int64)))
-   else:
-    _3=self.__d0
-    _4=(self.__x.getShape().dim(self.__dim) * self.__d2)
-    _5=numpy.zeros((int((_0).shape[0]),), dtype=numpy.dtype(numpy.int64))
-    for _6 in range(0,int((_0).shape[0])):
-     _7=(_0[_6] % _4)
-     _8=(_0[_6] // (_4 * self.__count))
-     _5[_6] = ((_8 * _4) + _7)
-    self.__x.make_continuous(_5)
+   self.__x.make_continuous(self._gather__3J(_0))
   @staticmethod
   def _match_make_1integer__3J(*args):
     if len(args) != 1: return False
@@ -11622,19 +12752,7 @@ def __mk_mosek_fusion_RepeatVariable():
    return _1
   def _make_1integer__3J(self,_0):
    assert _0 is None or isinstance(_0,numpy.ndarray)
-   if (self.__dim==0):
-    self.__x.make_integer(numpy.array([(_0[_1] % self.__xsize) for _1 in range(0,int((_0).shape[0]))], dtype=numpy.dtype(numpy.int64)))
-   elif ((self.__d1 * self.__d2)==1):
-    self.__x.make_integer(numpy.array([(_0[_2] // self.__count) for _2 in range(0,int((_0).shape[0]))], dtype=numpy.dtype(numpy.int64)))
-   else:
-    _3=self.__d0
-    _4=(self.__x.getShape().dim(self.__dim) * self.__d2)
-    _5=numpy.zeros((int((_0).shape[0]),), dtype=numpy.dtype(numpy.int64))
-    for _6 in range(0,int((_0).shape[0])):
-     _7=(_0[_6] % _4)
-     _8=(_0[_6] // (_4 * self.__count))
-     _5[_6] = ((_8 * _4) + _7)
-    self.__x.make_integer(_5)
+   self.__x.make_integer(self._gather__3J(_0))
   @staticmethod
   def __compute_1shape_alt_Lmosek_4fusion_4Variable_2II(_t__0,_t__1,_t__2):
     return mosek_fusion_RepeatVariable.__compute_1shape_Lmosek_4fusion_4Variable_2II(_0,numpy.int32(__1),numpy.int32(__2))
@@ -11774,12 +12892,28 @@ def __mk_mosek_fusion_PickVariable():
   def _ctor_init_Lmosek_4fusion_4Variable_2_3J(self,origin,idxs):
    assert idxs is None or isinstance(idxs,numpy.ndarray)
    mosek_fusion_BaseVariable._ctor_init_Lmosek_4fusion_4Model_2Lmosek_4fusion_4Set_2(self,origin.getModel(),mosek.fusion.Set._make_I(int((idxs).shape[0])))
-   (self.__origin) = origin
    _0=origin.getShape().getSize()
-   for _1 in range(0,int((idxs).shape[0])):
-    if ((idxs[_1] < 0) or (idxs[_1] >= _0)):
-     raise mosek_fusion_IndexError._ctor_S(mosek.fusion.Utils.StringBuffer()._a_S("Index (")._a_J(idxs[_1])._a_S(") is out of bounds")._toString_())
+   _1=numpy.nonzero(((idxs < 0) | (idxs >= _0)))[0]
+   if (int((_1).shape[0]) > 0):
+    raise mosek_fusion_IndexError._ctor_S(mosek.fusion.Utils.StringBuffer()._a_S("Index (")._a_J(idxs[_1[0]])._a_S(") is out of bounds")._toString_())
+   # Compose with views of views, so that any chain of views gathers
+   # directly from the variable underneath.
+   while isinstance(origin,(mosek_fusion_PickVariable,mosek_fusion_SliceVariable,mosek_fusion_RepeatVariable)):
+    idxs = origin._gather__3J(idxs)
+    origin = origin._origin_()
+   (self.__origin) = origin
    (self.__indexes) = idxs
+  def _origin_(self):
+   return (self.__origin)
+  def _gather__3J(self,_0):
+   return (self.__indexes[_0])
+  def _inst__3JIIJJ_3I_3I_3I(self,_0,_1,_2,_3,_4,_5,_6,_7):
+   assert _0 is None or isinstance(_0,numpy.ndarray)
+   assert _5 is None or isinstance(_5,numpy.ndarray)
+   assert _6 is None or isinstance(_6,numpy.ndarray)
+   assert _7 is None or isinstance(_7,numpy.ndarray)
+   _8=self.__indexes[(_0[_1:_2] - _3)]
+   self.__origin.inst(_8,0,int((_8).shape[0]),0,_4,_5,_6,_7)
   @staticmethod
   def _match_inst_JJ_3I_3I_3I(*args):
     if len(args) != 5: return False
@@ -11850,7 +12984,7 @@ def __mk_mosek_fusion_PickVariable():
    assert _1 is None or isinstance(_1,numpy.ndarray)
    assert _2 is None or isinstance(_2,numpy.ndarray)
    assert _4 is None or isinstance(_4,numpy.ndarray)
-   self.set_values(numpy.array([(_0 + (_2[0] * _6)) for _6 in range(0,_1[0])], dtype=numpy.dtype(numpy.int64)),(_4 if ((_3==0) ) else numpy.array([_4[(_7 + _3)] for _7 in range(0,_1[0])], dtype=numpy.dtype(numpy.float64))),_5)
+   self.set_values((_0 + (_2[0] * numpy.arange(0,_1[0],dtype=numpy.dtype(numpy.int64)))),(_4 if ((_3==0) ) else _4[_3:(_3 + _1[0])]),_5)
   @staticmethod
   def _match_set_1values__3J_3DZ(*args):
     if len(args) != 3: return False
@@ -11878,7 +13012,7 @@ def __mk_mosek_fusion_PickVariable():
   def _set_1values__3J_3DZ(self,_0,_1,_2):
    assert _0 is None or isinstance(_0,numpy.ndarray)
    assert _1 is None or isinstance(_1,numpy.ndarray)
-   self.__origin.set_values(numpy.array([self.__indexes[_0[_3]] for _3 in range(0,int((_0).shape[0]))], dtype=numpy.dtype(numpy.int64)),_1,_2)
+   self.__origin.set_values(self.__indexes[_0],_1,_2)
   @staticmethod
   def _match_elementDesc_JLmosek_4fusion_4Utils_4StringBuffer_2(*args):
     if len(args) != 2: return False
@@ -11920,7 +13054,7 @@ def __mk_mosek_fusion_PickVariable():
   def _slice_alt_II(self,_t__0,_t__1):
     return self._slice_II(numpy.int32(__0),numpy.int32(__1))
   def _slice_II(self,_0,_1):
-   return (mosek_fusion_PickVariable._ctor_Lmosek_4fusion_4Variable_2_3J(self.__origin,numpy.array([self.__indexes[_2] for _2 in range(_0,_1)], dtype=numpy.dtype(numpy.int64))))
+   return (mosek_fusion_PickVariable._ctor_Lmosek_4fusion_4Variable_2_3J(self.__origin,self.__indexes[numpy.arange(_0,_1)]))
   @staticmethod
   def _match_values_J_3I_3JI_3DZ(*args):
     if len(args) != 6: return False
@@ -11956,7 +13090,7 @@ def __mk_mosek_fusion_PickVariable():
    assert _1 is None or isinstance(_1,numpy.ndarray)
    assert _2 is None or isinstance(_2,numpy.ndarray)
    assert _4 is None or isinstance(_4,numpy.ndarray)
-   _6=numpy.array([(_0 + (_7 * _2[0])) for _7 in range(0,_1[0])], dtype=numpy.dtype(numpy.int64))
+   _6=(_0 + (numpy.arange(0,_1[0],dtype=numpy.dtype(numpy.int64)) * _2[0]))
    self.values(_6,_3,_4,_5)
   @staticmethod
   def _match_values__3JI_3DZ(*args):
@@ -11986,8 +13120,7 @@ def __mk_mosek_fusion_PickVariable():
   def _values__3JI_3DZ(self,_0,_1,_2,_3):
    assert _0 is None or isinstance(_0,numpy.ndarray)
    assert _2 is None or isinstance(_2,numpy.ndarray)
-   _4=numpy.array([self.__indexes[_0[_5]] for _5 in range(0,int((_0).shape[0]))], dtype=numpy.dtype(numpy.int64))
-   self.__origin.values(_4,_1,_2,_3)
+   self.__origin.values(self.__indexes[_0],_1,_2,_3)
   @staticmethod
   def _match_make_1continuous__3J(*args):
     if len(args) != 1: return False
@@ -12008,7 +13141,7 @@ def __mk_mosek_fusion_PickVariable():
    return _1
   def _make_1continuous__3J(self,_0):
    assert _0 is None or isinstance(_0,numpy.ndarray)
-   self.__origin.make_continuous(numpy.array([self.__indexes[_0[_1]] for _1 in range(0,int((_0).shape[0]))], dtype=numpy.dtype(numpy.int64)))
+   self.__origin.make_continuous(self.__indexes[_0])
   @staticmethod
   def _match_make_1integer__3J(*args):
     if len(args) != 1: return False
@@ -12029,7 +13162,7 @@ def __mk_mosek_fusion_PickVariable():
    return _1
   def _make_1integer__3J(self,_0):
    assert _0 is None or isinstance(_0,numpy.ndarray)
-   self.__origin.make_integer(numpy.array([self.__indexes[_0[_1]] for _1 in range(0,int((_0).shape[0]))], dtype=numpy.dtype(numpy.int64)))
+   self.__origin.make_integer(self.__indexes[_0])
  return PickVariable
 mosek_fusion_PickVariable=__mk_mosek_fusion_PickVariable()
 del __mk_mosek_fusion_PickVariable
@@ -12124,6 +13257,9 @@ def __mk_mosek_fusion_SliceVariable():
   def __repr__(self): return 'mosek.fusion.SliceVariable'
   @staticmethod
   def _ctor_Lmosek_4fusion_4Variable_2Lmosek_4fusion_4Set_2J_3J(origin,shape,first,strides):
+    if (isinstance(origin,mosek_fusion_PickVariable) and ((shape.nd)==1)):
+      # A one-dimensional slice of a pick is again a pick
+      return mosek_fusion_PickVariable._ctor_Lmosek_4fusion_4Variable_2_3J(origin,(first + (numpy.arange(0,(shape._size),dtype=numpy.dtype(numpy.int64)) * strides[0])))
     o = SliceVariable.__new__(SliceVariable)
     o._ctor_init_Lmosek_4fusion_4Variable_2Lmosek_4fusion_4Set_2J_3J(origin,shape,first,strides)
     return o
@@ -12142,9 +13278,38 @@ def __mk_mosek_fusion_SliceVariable():
   def _ctor_init_Lmosek_4fusion_4Variable_2Lmosek_4fusion_4Set_2J_3J(self,origin,shape,first,strides):
    assert strides is None or isinstance(strides,numpy.ndarray)
    mosek_fusion_BaseVariable._ctor_init_Lmosek_4fusion_4Model_2Lmosek_4fusion_4Set_2(self,origin.getModel(),shape)
+   if (isinstance(origin,mosek_fusion_SliceVariable) and ((shape._size) > 0)):
+    # A slice of a slice indexes the variable underneath directly when the
+    # two maps compose to an affine one, that is, when stepping along any
+    # dimension of the slice never wraps around a dimension of the origin.
+    _0=numpy.concatenate(([first],(first + strides)))
+    _1=origin._shape_p._idxtokeys__3J(_0).astype(numpy.int64)
+    _2=(_1[1:] - _1[0])
+    _3=numpy.array([(shape._dim_I(_4) - 1) for _4 in range(0,(shape.nd))], dtype=numpy.dtype(numpy.int64))
+    _5=numpy.array([origin._shape_p._dim_I(_6) for _6 in range(0,(origin._shape_p.nd))], dtype=numpy.dtype(numpy.int64))
+    if (numpy.all(((_1[0] + numpy.dot(_3,numpy.minimum(_2,0))) >= 0)) and numpy.all(((_1[0] + numpy.dot(_3,numpy.maximum(_2,0))) < _5))):
+     _7=origin._gather__3J(_0)
+     origin = origin._origin_()
+     first = _7[0]
+     strides = (_7[1:] - _7[0])
    (self.__origin) = origin
    (self.__first) = first
    (self.__strides) = strides
+  def _origin_(self):
+   return (self.__origin)
+  # The elements of self.__origin for the linear indexes _0.
+  def _gather__3J(self,_0):
+   return ((self.__first + numpy.dot(self._shape_p._idxtokeys__3J(_0).astype(numpy.int64),self.__strides)))
+  def _inst__3JIIJJ_3I_3I_3I(self,_0,_1,_2,_3,_4,_5,_6,_7):
+   assert _0 is None or isinstance(_0,numpy.ndarray)
+   assert _5 is None or isinstance(_5,numpy.ndarray)
+   assert _6 is None or isinstance(_6,numpy.ndarray)
+   assert _7 is None or isinstance(_7,numpy.ndarray)
+   _8=(_0[_1:_2] - _3)
+   if ((int((_8).shape[0]) > 0) and ((numpy.min(_8) < 0) or (numpy.max(_8) >= (self._shape_p._size)))):
+    raise mosek_fusion_IndexError._ctor_S("Index out of bounds")
+   _9=self._gather__3J(_8)
+   self.__origin.inst(_9,0,int((_9).shape[0]),0,_4,_5,_6,_7)
   @staticmethod
   def _match_inst_JJ_3I_3I_3I(*args):
     if len(args) != 5: return False
@@ -12223,44 +13388,8 @@ def __mk_mosek_fusion_SliceVariable():
    assert _1 is None or isinstance(_1,numpy.ndarray)
    assert _2 is None or isinstance(_2,numpy.ndarray)
    assert _4 is None or isinstance(_4,numpy.ndarray)
-   if ((_0==0) and ((int((_1).shape[0])==1) and ((_1[0]==(self._shape_p._size)) and (_2[0]==1)))):
-    _6=numpy.array([self._shape_p.dim(_7) for _7 in range(0,(self._shape_p.nd))], dtype=numpy.dtype(numpy.int32))
-    self.__origin.set_values(self.__first,_6,self.__strides,_3,_4,_5)
-   else:
-    _8=int((_1).shape[0])
-    _9=(_8==(self._shape_p.nd))
-    _10=0
-    while ((_10 < _8) and _9):
-     _9 = (_2[_10]==self._shape_p.stride(_10))
-     _10 += 1
-    if _9:
-     _11=self.__first
-     _12=_0
-     for _13 in range(0,((self._shape_p.nd) - 1)):
-      _14=(_12 // _2[_13])
-      _12 = (_12 - (_2[_13] * _14))
-      _11 = (_11 + (self._shape_p.stride(_13) * _14))
-     self.__origin.set_values(_11,_1,self.__strides,_3,_4,_5)
-    else:
-     _15=1
-     for _16 in range(0,int((_1).shape[0])):
-      _15 = (_15 * _1[_16])
-     _17=numpy.zeros((_15,), dtype=numpy.dtype(numpy.int64))
-     _18=numpy.zeros((int((_1).shape[0]),), dtype=numpy.dtype(numpy.int32))
-     _19=numpy.zeros((int((_1).shape[0]),), dtype=numpy.dtype(numpy.int64))
-     for _20 in range(0,_15):
-      _17[_20] = (self.__origin.getShape()._linearidx__3I(self._shape_p._idxtokey_J((_0 + _19[0]))) + self.__first)
-      _21=0
-      _18[0] += 1
-      _19[0] = (_19[0] + _2[(_8 - 1)])
-      while ((_21 < (_8 - 1)) and (_18[_21] >= _1[((_8 - _21) - 1)])):
-       _19[(_21 + 1)] = (_19[(_21 + 1)] + _2[((_8 - _21) - 2)])
-       _18[_21] = 0
-       _18[(_21 + 1)] += 1
-       _21 += 1
-      for _22 in range(0,_21):
-       _19[_22] = _19[_21]
-     self.__origin.set_values(_17,(_4 if ((_3==0) ) else numpy.array([_4[(_23 + _3)] for _23 in range(0,_15)], dtype=numpy.dtype(numpy.float64))),_5)
+   _6=mosek_fusion_IndexCounter._ctor_J_3I_3J(_0,_1,_2)._materialize_()
+   self.__origin.set_values(self._gather__3J(_6),_4[_3:(_3 + int((_6).shape[0]))],_5)
   @staticmethod
   def _match_set_1values__3J_3DZ(*args):
     if len(args) != 3: return False
@@ -12288,14 +13417,7 @@ def __mk_mosek_fusion_SliceVariable():
   def _set_1values__3J_3DZ(self,_0,_1,_2):
    assert _0 is None or isinstance(_0,numpy.ndarray)
    assert _1 is None or isinstance(_1,numpy.ndarray)
-   _3=numpy.zeros((int((_0).shape[0]),), dtype=numpy.dtype(numpy.int64))
-   for _4 in range(0,int((_0).shape[0])):
-    _5=self._shape_p._idxtokey_J(_0[_4])
-    _6=self.__first
-    for _7 in range(0,(self._shape_p.nd)):
-     _6 = (_6 + (numpy.int64(_5[_7]) * self.__strides[_7]))
-    _3[_4] = _6
-   self.__origin.set_values(_3,_1,_2)
+   self.__origin.set_values(self._gather__3J(_0),_1,_2)
   @staticmethod
   def _match_elementDesc_JLmosek_4fusion_4Utils_4StringBuffer_2(*args):
     if len(args) != 2: return False
@@ -12387,7 +13509,7 @@ def __mk_mosek_fusion_SliceVariable():
   def _slice_alt_II(self,_t__0,_t__1):
     return self._slice_II(numpy.int32(__0),numpy.int32(__1))
   def _slice_II(self,_0,_1):
-   return (mosek_fusion_SliceVariable._ctor_Lmosek_4fusion_4Variable_2Lmosek_4fusion_4Set_2J_3J(self.__origin,self._shape_p.slice(_0,_1),(self.__first + numpy.int64(_0)),self.__strides))
+   return (mosek_fusion_SliceVariable._ctor_Lmosek_4fusion_4Variable_2Lmosek_4fusion_4Set_2J_3J(self.__origin,self._shape_p.slice(_0,_1),(self.__first + (numpy.int64(_0) * self.__strides[0])),self.__strides))
   @staticmethod
   def _match_values_J_3I_3JI_3DZ(*args):
     if len(args) != 6: return False
@@ -12423,44 +13545,8 @@ def __mk_mosek_fusion_SliceVariable():
    assert _1 is None or isinstance(_1,numpy.ndarray)
    assert _2 is None or isinstance(_2,numpy.ndarray)
    assert _4 is None or isinstance(_4,numpy.ndarray)
-   if ((_0==0) and ((int((_1).shape[0])==1) and ((_1[0]==(self._shape_p._size)) and (_2[0]==1)))):
-    _6=numpy.array([self._shape_p.dim(_7) for _7 in range(0,(self._shape_p.nd))], dtype=numpy.dtype(numpy.int32))
-    self.__origin.values(self.__first,_6,self.__strides,_3,_4,_5)
-   else:
-    _8=int((_1).shape[0])
-    _9=(_8==(self._shape_p.nd))
-    _10=0
-    while ((_10 < _8) and _9):
-     _9 = (_2[_10]==self._shape_p.stride(_10))
-     _10 += 1
-    if _9:
-     _11=self.__first
-     _12=_0
-     for _13 in range(0,((self._shape_p.nd) - 1)):
-      _14=(_12 // _2[_13])
-      _12 = (_12 - (_2[_13] * _14))
-      _11 = (_11 + (self._shape_p.stride(_13) * _14))
-     self.__origin.values(_11,_1,self.__strides,_3,_4,_5)
-    else:
-     _15=1
-     for _16 in range(0,int((_1).shape[0])):
-      _15 = (_15 * _1[_16])
-     _17=numpy.zeros((_15,), dtype=numpy.dtype(numpy.int64))
-     _18=numpy.zeros((int((_1).shape[0]),), dtype=numpy.dtype(numpy.int32))
-     _19=numpy.zeros((int((_1).shape[0]),), dtype=numpy.dtype(numpy.int64))
-     for _20 in range(0,_15):
-      _17[_20] = (self.__origin.getShape()._linearidx__3I(self._shape_p._idxtokey_J((_0 + _19[0]))) + self.__first)
-      _21=0
-      _18[0] += 1
-      _19[0] = (_19[0] + _2[(_8 - 1)])
-      while ((_21 < (_8 - 1)) and (_18[_21] >= _1[((_8 - _21) - 1)])):
-       _19[(_21 + 1)] = (_19[(_21 + 1)] + _2[((_8 - _21) - 2)])
-       _18[_21] = 0
-       _18[(_21 + 1)] += 1
-       _21 += 1
-      for _22 in range(0,_21):
-       _19[_22] = _19[_21]
-     self.__origin.values(_17,_3,_4,_5)
+   _6=mosek_fusion_IndexCounter._ctor_J_3I_3J(_0,_1,_2)._materialize_()
+   self.__origin.values(self._gather__3J(_6),_3,_4,_5)
   @staticmethod
   def _match_values__3JI_3DZ(*args):
     if len(args) != 4: return False
@@ -12489,14 +13575,7 @@ def __mk_mosek_fusion_SliceVariable():
   def _values__3JI_3DZ(self,_0,_1,_2,_3):
    assert _0 is None or isinstance(_0,numpy.ndarray)
    assert _2 is None or isinstance(_2,numpy.ndarray)
-   _4=numpy.zeros((int((_0).shape[0]),), dtype=numpy.dtype(numpy.int64))
-   for _5 in range(0,int((_0).shape[0])):
-    _6=self._shape_p._idxtokey_J(_0[_5])
-    _7=self.__first
-    for _8 in range(0,(self._shape_p.nd)):
-     _7 = (_7 + (numpy.int64(_6[_8]) * self.__strides[_8]))
-    _4[_5] = _7
-   self.__origin.values(_4,_1,_2,_3)
+   self.__origin.values(self._gather__3J(_0),_1,_2,_3)
   @staticmethod
   def _match_make_1continuous__3J(*args):
     if len(args) != 1: return False
@@ -12517,14 +13596,7 @@ def __mk_mosek_fusion_SliceVariable():
    return _1
   def _make_1continuous__3J(self,_0):
    assert _0 is None or isinstance(_0,numpy.ndarray)
-   _1=numpy.zeros((int((_0).shape[0]),), dtype=numpy.dtype(numpy.int64))
-   for _2 in range(0,int((_0).shape[0])):
-    _3=self._shape_p._idxtokey_J(_0[_2])
-    _4=self.__first
-    for _5 in range(0,(self._shape_p.nd)):
-     _4 = (_4 + (numpy.int64(_3[_5]) * self.__strides[_5]))
-    _1[_2] = _4
-   self.__origin.make_continuous(_1)
+   self.__origin.make_continuous(self._gather__3J(_0))
   @staticmethod
   def _match_make_1integer__3J(*args):
     if len(args) != 1: return False
@@ -12545,14 +13617,7 @@ def __mk_mosek_fusion_SliceVariable():
    return _1
   def _make_1integer__3J(self,_0):
    assert _0 is None or isinstance(_0,numpy.ndarray)
-   _1=numpy.zeros((int((_0).shape[0]),), dtype=numpy.dtype(numpy.int64))
-   for _2 in range(0,int((_0).shape[0])):
-    _3=self._shape_p._idxtokey_J(_0[_2])
-    _4=self.__first
-    for _5 in range(0,(self._shape_p.nd)):
-     _4 = (_4 + (numpy.int64(_3[_5]) * self.__strides[_5]))
-    _1[_2] = _4
-   self.__origin.make_integer(_1)
+   self.__origin.make_integer(self._gather__3J(_0))
  return SliceVariable
 mosek_fusion_SliceVariable=__mk_mosek_fusion_SliceVariable()
 del __mk_mosek_fusion_SliceVariable
@@ -12887,7 +13952,7 @@ def __mk_mosek_fusion_SymRangedVariable():
     self._ctor_init_Lmosek_4fusion_4SymRangedVariable_2Lmosek_4fusion_4Model_2(v,m)
   def _ctor_init_Lmosek_4fusion_4SymRangedVariable_2Lmosek_4fusion_4Model_2(self,v,m):
    mosek_fusion_ModelVariable._ctor_init_Lmosek_4fusion_4ModelVariable_2Lmosek_4fusion_4Model_2(self,v,m)
-   self.__nativeidxs = (numpy.array([(v.__nativeidxs)[_0] for _0 in range(0,int(((v.__nativeidxs)).shape[0]))], dtype=numpy.dtype(numpy.int32)) if (((v.__nativeidxs) is not None) ) else None)
+   self.__nativeidxs = ((v.__nativeidxs) if (((v.__nativeidxs) is not None) ) else None)
    self.__idxmap = ((v.__idxmap)._clone_() if (((v.__idxmap) is not None) ) else None)
    self.__dom = (v.__dom)
    (self._dim) = (v._dim)
@@ -12915,7 +13980,7 @@ def __mk_mosek_fusion_SymRangedVariable():
    (self._dim) = dim
    self.__nativeidxs = nativeidxs_
    if (nativeidxs_ is None):
-    self.__idxmap = mosek.fusion.Utils.IntMap()
+    self.__idxmap = mosek.fusion.Utils.SortedIntMap()
    else:
     self.__idxmap = None
    self.__dom = dom_
@@ -12945,13 +14010,11 @@ def __mk_mosek_fusion_SymRangedVariable():
   def _flushNames_(self,):
    if ((not self.__names_flushed) and (int(len(self._name)) > 0)):
     if (self.__nativeidxs is not None):
-     for _0 in range(0,int((self.__nativeidxs).shape[0])):
-      self._model._varname_IS(self.__nativeidxs[_0],mosek.fusion.Utils.StringBuffer()._a_S(self._name)._a_S("[")._a_S(self._shape_p.getname(_0))._a_S("]")._toString_())
+     self._model._task_1var_1names__3J_3S(self.__nativeidxs,self._shape_p._getnames_S_3JS(self._name,numpy.arange(0,int((self.__nativeidxs).shape[0]),dtype=numpy.dtype(numpy.int64)),""))
     else:
      _1=self.__idxmap._keys_()
      _2=self.__idxmap._values_()
-     for _3 in range(0,int((_1).shape[0])):
-      self._model._varname_IS(_2[_3],mosek.fusion.Utils.StringBuffer()._a_S(self._name)._a_S("[")._a_S(self._shape_p.getname(_3))._a_S("]")._toString_())
+     self._model._task_1var_1names__3J_3S(_2,self._shape_p._getnames_S_3JS(self._name,_1,""))
     self.__names_flushed = True
   @staticmethod
   def _match_inst__3JIIJJ_3I_3I_3I(*args):
@@ -13089,14 +14152,15 @@ def __mk_mosek_fusion_SymRangedVariable():
    for _9 in range(0,_6):
     _5 = (_5 * _1[_9])
    if (self.__nativeidxs is not None):
+    _16=_7._materialize_()
     for _10 in range(0,_5):
-     _11=self.__nativeidxs[self.__tril_1lin_1idx_J(_7.get())]
+     _11=self.__nativeidxs[self.__tril_1lin_1idx_J(_16[_10])]
      _4[(_10 + _3)] = _8[_11]
-     _7.inc()
    else:
     _12=self._model.getPrimalSolutionStatus()
+    _17=_7._materialize_()
     for _13 in range(0,numpy.int32(_5)):
-     _14=self.__tril_1idx_J(_7.get())
+     _14=self.__tril_1idx_J(_17[_13])
      if self.__idxmap._hasItem_J(_14):
       _15=self.__idxmap._getItem_J(_14)
       _4[_13] = _8[_15]
@@ -13105,7 +14169,6 @@ def __mk_mosek_fusion_SymRangedVariable():
        _4[(_3 + _13)] = self.__dom._get_1ub_1item_J(_14)
       else:
        _4[(_3 + _13)] = 0.0
-     _7.inc()
   def _dual_1u_alt__3JI_3D(self,_t__0,_t__1,_t__2):
    _0=numpy.array(_t__0,dtype=numpy.dtype(numpy.int64))
    _1=numpy.int32(_t__1)
@@ -13171,14 +14234,15 @@ def __mk_mosek_fusion_SymRangedVariable():
    for _9 in range(0,_6):
     _5 = (_5 * _1[_9])
    if (self.__nativeidxs is not None):
+    _16=_7._materialize_()
     for _10 in range(0,_5):
-     _11=self.__nativeidxs[self.__tril_1lin_1idx_J(_7.get())]
+     _11=self.__nativeidxs[self.__tril_1lin_1idx_J(_16[_10])]
      _4[(_10 + _3)] = _8[_11]
-     _7.inc()
    else:
     _12=self._model.getPrimalSolutionStatus()
+    _17=_7._materialize_()
     for _13 in range(0,numpy.int32(_5)):
-     _14=self.__tril_1idx_J(_7.get())
+     _14=self.__tril_1idx_J(_17[_13])
      if self.__idxmap._hasItem_J(_14):
       _15=self.__idxmap._getItem_J(_14)
       _4[_13] = _8[_15]
@@ -13187,7 +14251,6 @@ def __mk_mosek_fusion_SymRangedVariable():
        _4[(_3 + _13)] = self.__dom._get_1ub_1item_J(_14)
       else:
        _4[(_3 + _13)] = 0.0
-     _7.inc()
   def _dual_1l_alt__3JI_3D(self,_t__0,_t__1,_t__2):
    _0=numpy.array(_t__0,dtype=numpy.dtype(numpy.int64))
    _1=numpy.int32(_t__1)
@@ -13253,22 +14316,22 @@ def __mk_mosek_fusion_SymRangedVariable():
    for _10 in range(0,_6):
     _5 = (_5 * _1[_10])
    if (self.__nativeidxs is not None):
+    _16=_7._materialize_()
     for _11 in range(0,_5):
-     _12=self.__nativeidxs[self.__tril_1lin_1idx_J(_7.get())]
+     _12=self.__nativeidxs[self.__tril_1lin_1idx_J(_16[_11])]
      _4[(_11 + _3)] = (_8[_12] - _9[_12])
-     _7.inc()
    else:
     _13=self._model.getPrimalSolutionStatus()
+    _17=_7._materialize_()
     for _14 in range(0,numpy.int32(_5)):
-     if self.__idxmap._hasItem_J(_7.get()):
-      _15=self.__idxmap._getItem_J(self.__tril_1idx_J(_7.get()))
+     if self.__idxmap._hasItem_J(_17[_14]):
+      _15=self.__idxmap._getItem_J(self.__tril_1idx_J(_17[_14]))
       _4[_14] = (_8[_15] - _9[_15])
      else:
       if ((_13==mosek.fusion.SolutionStatus.Optimal) or ((_13==mosek.fusion.SolutionStatus.NearOptimal) or ((_13==mosek.fusion.SolutionStatus.Feasible) or (_13==mosek.fusion.SolutionStatus.NearFeasible)))):
-       _4[(_3 + _14)] = self.__dom._get_1ub_1item_J(self.__tril_1idx_J(_7.get()))
+       _4[(_3 + _14)] = self.__dom._get_1ub_1item_J(self.__tril_1idx_J(_17[_14]))
       else:
        _4[(_3 + _14)] = 0.0
-     _7.inc()
   def __dual_1values_alt__3JI_3D(self,_t__0,_t__1,_t__2):
    _0=numpy.array(_t__0,dtype=numpy.dtype(numpy.int64))
    _1=numpy.int32(_t__1)
@@ -13345,14 +14408,15 @@ def __mk_mosek_fusion_SymRangedVariable():
     for _9 in range(0,_7):
      _6 = (_6 * _1[_9])
     if (self.__nativeidxs is not None):
-     _10=int((self.__nativeidxs).shape[0])
-     _11=numpy.array([self.__nativeidxs[self.__tril_1lin_1idx_J(_8.next())] for _12 in range(0,_6)], dtype=numpy.dtype(numpy.int32))
+     _11=numpy.array([self.__nativeidxs[self.__tril_1lin_1idx_J(_12)] for _12 in _8._materialize_()], dtype=numpy.dtype(numpy.int32))
+     _10=int((_11).shape[0])
      _13=(numpy.array([_4[(_3 + _14)] for _14 in range(0,_10)], dtype=numpy.dtype(numpy.float64)) if ((_3 > 0) ) else _4)
      self._model._setSolution_1xx__3I_3D(_11,_13)
     else:
      _15=numpy.zeros((_6,), dtype=numpy.dtype(numpy.int32))
+     _19=_8._materialize_()
      for _16 in range(0,_6):
-      self.inst(_8.next(),_16,_15,None,None)
+      self.inst(_19[_16],_16,_15,None,None)
      _17=numpy.array([_4[(_3 + _18)] for _18 in range(0,_6)], dtype=numpy.dtype(numpy.float64))
      self._model._setSolution_1xx__3I_3D(_15,_17)
    else:
@@ -13386,7 +14450,7 @@ def __mk_mosek_fusion_SymRangedVariable():
    assert _1 is None or isinstance(_1,numpy.ndarray)
    if _2:
     if (self.__nativeidxs is not None):
-     _3=int((self.__nativeidxs).shape[0])
+     _3=int((_0).shape[0])
      _4=numpy.array([self.__nativeidxs[self.__tril_1lin_1idx_J(_0[_5])] for _5 in range(0,_3)], dtype=numpy.dtype(numpy.int32))
      _6=numpy.array([_1[_7] for _7 in range(0,_3)], dtype=numpy.dtype(numpy.float64))
      self._model._setSolution_1xx__3I_3D(_4,_6)
@@ -13441,20 +14505,20 @@ def __mk_mosek_fusion_SymRangedVariable():
     for _10 in range(0,_7):
      _6 = (_6 * _1[_10])
     if (self.__nativeidxs is not None):
+     _14=_8._materialize_()
      for _11 in range(0,_6):
-      _4[(_11 + _3)] = _9[self.__nativeidxs[self.__tril_1lin_1idx_J(_8.get())]]
-      _8.inc()
+      _4[(_11 + _3)] = _9[self.__nativeidxs[self.__tril_1lin_1idx_J(_14[_11])]]
     else:
      _12=self._model.getPrimalSolutionStatus()
+     _15=_8._materialize_()
      for _13 in range(0,numpy.int32(_6)):
-      if self.__idxmap._hasItem_J(_8.get()):
-       _4[_13] = _9[self.__idxmap._getItem_J(self.__tril_1idx_J(_8.get()))]
+      if self.__idxmap._hasItem_J(_15[_13]):
+       _4[_13] = _9[self.__idxmap._getItem_J(self.__tril_1idx_J(_15[_13]))]
       else:
        if ((_12==mosek.fusion.SolutionStatus.Optimal) or ((_12==mosek.fusion.SolutionStatus.NearOptimal) or ((_12==mosek.fusion.SolutionStatus.Feasible) or (_12==mosek.fusion.SolutionStatus.NearFeasible)))):
-        _4[(_3 + _13)] = self.__dom._get_1lb_1item_J(self.__tril_1idx_J(_8.get()))
+        _4[(_3 + _13)] = self.__dom._get_1lb_1item_J(self.__tril_1idx_J(_15[_13]))
        else:
         _4[(_3 + _13)] = 0.0
-      _8.inc()
    else:
     self.__dual_1values_J_3I_3JI_3D(_0,_1,_2,_3,_4)
   @staticmethod
@@ -13690,7 +14754,7 @@ def __mk_mosek_fusion_RangedVariable():
    mosek_fusion_ModelVariable._ctor_init_Lmosek_4fusion_4ModelVariable_2Lmosek_4fusion_4Model_2(self,v,m)
    self.__dom = (v.__dom)
    self.__idxmap = ((v.__idxmap)._clone_() if (((v.__idxmap) is not None) ) else None)
-   self.__nativeidxs = (numpy.array([(v.__nativeidxs)[_0] for _0 in range(0,int(((v.__nativeidxs)).shape[0]))], dtype=numpy.dtype(numpy.int32)) if (((v.__nativeidxs) is not None) ) else None)
+   self.__nativeidxs = ((v.__nativeidxs) if (((v.__nativeidxs) is not None) ) else None)
    self.__names_flushed = (v.__names_flushed)
   @staticmethod
   def _ctor_Lmosek_4fusion_4Model_2SLmosek_4fusion_4Set_2Lmosek_4fusion_4RangeDomain_2_3IJ(model_,name_,shape_p,dom_,nativeidxs_,varid_):
@@ -13714,7 +14778,7 @@ def __mk_mosek_fusion_RangedVariable():
    mosek_fusion_ModelVariable._ctor_init_Lmosek_4fusion_4Model_2SLmosek_4fusion_4Set_2J(self,model_,name_,shape_p,varid_)
    self.__nativeidxs = nativeidxs_
    if (nativeidxs_ is None):
-    self.__idxmap = mosek.fusion.Utils.IntMap()
+    self.__idxmap = mosek.fusion.Utils.SortedIntMap()
    else:
     self.__idxmap = None
    self.__dom = dom_
@@ -13740,13 +14804,11 @@ def __mk_mosek_fusion_RangedVariable():
   def _flushNames_(self,):
    if ((not self.__names_flushed) and (int(len(self._name)) > 0)):
     if (self.__nativeidxs is not None):
-     for _0 in range(0,int((self.__nativeidxs).shape[0])):
-      self._model._varname_IS(self.__nativeidxs[_0],mosek.fusion.Utils.StringBuffer()._a_S(self._name)._a_S("[")._a_S(self._shape_p.getname(_0))._a_S("]")._toString_())
+     self._model._task_1var_1names__3J_3S(self.__nativeidxs,self._shape_p._getnames_S_3JS(self._name,numpy.arange(0,int((self.__nativeidxs).shape[0]),dtype=numpy.dtype(numpy.int64)),""))
     else:
      _1=self.__idxmap._keys_()
      _2=self.__idxmap._values_()
-     for _3 in range(0,int((_1).shape[0])):
-      self._model._varname_IS(_2[_3],mosek.fusion.Utils.StringBuffer()._a_S(self._name)._a_S("[")._a_S(self._shape_p.getname(_3))._a_S("]")._toString_())
+     self._model._task_1var_1names__3J_3S(_2,self._shape_p._getnames_S_3JS(self._name,_1,""))
     self.__names_flushed = True
   @staticmethod
   def _match_inst__3JIIJJ_3I_3I_3I(*args):
@@ -13794,7 +14856,9 @@ def __mk_mosek_fusion_RangedVariable():
     for _8 in range(_1,_2):
      _5[((_4 + _8) - _1)] = self.__nativeidxs[_0[(_8 - _3)]]
    else:
-    for _9 in range(_1,_2):
+    _11=self.__idxmap._getItems__3J(_0[(_1 - _3):(_2 - _3)])
+    _5[_4:(_4 + (_2 - _1))] = _11
+    for _9 in (numpy.nonzero(_11 < 0)[0] + _1):
      if (not self.__idxmap._hasItem_J(_0[(numpy.int64(_9) - _3)])):
       _10=self._model._append_1rangedvar_Lmosek_4fusion_4ModelVariable_2JDD(self,_0[(_9 - _3)],self.__dom._get_1lb_1item_J(_0[(_9 - _3)]),self.__dom._get_1ub_1item_J(_0[(_9 - _3)]))
       self.__idxmap._setItem_JI(_0[(_9 - _3)],_10)
@@ -13916,22 +14980,22 @@ def __mk_mosek_fusion_RangedVariable():
    for _9 in range(0,_6):
     _5 = (_5 * _1[_9])
    if (self.__nativeidxs is not None):
-    for _10 in range(0,_5):
-     _11=self.__nativeidxs[_7.get()]
-     _4[(_10 + _3)] = _8[_11]
-     _7.inc()
+    _18=_7._materialize_()
+    _10=numpy.arange(0,_5)
+    _11=self.__nativeidxs[_18]
+    _4[(_10 + _3)] = _8[_11]
    else:
+    _15=_7._materialize_()
     _12=self._model.getPrimalSolutionStatus()
-    for _13 in range(0,numpy.int32(_5)):
-     if self.__idxmap._hasItem_J(_7.get()):
-      _14=self.__idxmap._getItem_J(_7.get())
-      _4[_13] = _8[_14]
-     else:
-      if ((_12==mosek.fusion.SolutionStatus.Optimal) or ((_12==mosek.fusion.SolutionStatus.NearOptimal) or ((_12==mosek.fusion.SolutionStatus.Feasible) or (_12==mosek.fusion.SolutionStatus.NearFeasible)))):
-       _4[(_3 + _13)] = self.__dom._get_1ub_1item_J(_7.get())
-      else:
-       _4[(_3 + _13)] = 0.0
-     _7.inc()
+    _14=self.__idxmap._getItems__3J(_15)
+    _13=numpy.nonzero(_14 >= 0)[0]
+    _4[(_3 + _13)] = _8[_14[_13]]
+    _16=numpy.nonzero(_14 < 0)[0]
+    if ((_12==mosek.fusion.SolutionStatus.Optimal) or ((_12==mosek.fusion.SolutionStatus.NearOptimal) or ((_12==mosek.fusion.SolutionStatus.Feasible) or (_12==mosek.fusion.SolutionStatus.NearFeasible)))):
+     for _17 in _16:
+      _4[(_3 + _17)] = self.__dom._get_1ub_1item_J(_15[_17])
+    else:
+     _4[(_3 + _16)] = 0.0
   def _dual_1u_alt__3JI_3D(self,_t__0,_t__1,_t__2):
    _0=numpy.array(_t__0,dtype=numpy.dtype(numpy.int64))
    _1=numpy.int32(_t__1)
@@ -13956,15 +15020,15 @@ def __mk_mosek_fusion_RangedVariable():
      _2[(_1 + _4)] = _3[_5]
    else:
     _6=self._model.getPrimalSolutionStatus()
-    for _7 in range(0,int((_0).shape[0])):
-     if self.__idxmap._hasItem_J(_0[_7]):
-      _8=self.__idxmap._getItem_J(_0[_7])
-      _2[(_1 + _7)] = _3[_8]
-     else:
-      if ((_6==mosek.fusion.SolutionStatus.Optimal) or ((_6==mosek.fusion.SolutionStatus.NearOptimal) or ((_6==mosek.fusion.SolutionStatus.Feasible) or (_6==mosek.fusion.SolutionStatus.NearFeasible)))):
-       _2[(_1 + _7)] = self.__dom._get_1ub_1item_J(_0[_7])
-      else:
-       _2[(_1 + _7)] = 0.0
+    _8=self.__idxmap._getItems__3J(_0)
+    _7=numpy.nonzero(_8 >= 0)[0]
+    _2[(_1 + _7)] = _3[_8[_7]]
+    _9=numpy.nonzero(_8 < 0)[0]
+    if ((_6==mosek.fusion.SolutionStatus.Optimal) or ((_6==mosek.fusion.SolutionStatus.NearOptimal) or ((_6==mosek.fusion.SolutionStatus.Feasible) or (_6==mosek.fusion.SolutionStatus.NearFeasible)))):
+     for _10 in _9:
+      _2[(_1 + _10)] = self.__dom._get_1ub_1item_J(_0[_10])
+    else:
+     _2[(_1 + _9)] = 0.0
   def _dual_1l_alt_J_3I_3JI_3D(self,_t__0,_t__1,_t__2,_t__3,_t__4):
    _0=numpy.int64(_t__0)
    _1=numpy.array(_t__1,dtype=numpy.dtype(numpy.int32))
@@ -13996,22 +15060,22 @@ def __mk_mosek_fusion_RangedVariable():
    for _9 in range(0,_6):
     _5 = (_5 * _1[_9])
    if (self.__nativeidxs is not None):
-    for _10 in range(0,_5):
-     _11=self.__nativeidxs[_7.get()]
-     _4[(_10 + _3)] = _8[_11]
-     _7.inc()
+    _18=_7._materialize_()
+    _10=numpy.arange(0,_5)
+    _11=self.__nativeidxs[_18]
+    _4[(_10 + _3)] = _8[_11]
    else:
+    _15=_7._materialize_()
     _12=self._model.getPrimalSolutionStatus()
-    for _13 in range(0,numpy.int32(_5)):
-     if self.__idxmap._hasItem_J(_7.get()):
-      _14=self.__idxmap._getItem_J(_7.get())
-      _4[_13] = _8[_14]
-     else:
-      if ((_12==mosek.fusion.SolutionStatus.Optimal) or ((_12==mosek.fusion.SolutionStatus.NearOptimal) or ((_12==mosek.fusion.SolutionStatus.Feasible) or (_12==mosek.fusion.SolutionStatus.NearFeasible)))):
-       _4[(_3 + _13)] = self.__dom._get_1ub_1item_J(_7.get())
-      else:
-       _4[(_3 + _13)] = 0.0
-     _7.inc()
+    _14=self.__idxmap._getItems__3J(_15)
+    _13=numpy.nonzero(_14 >= 0)[0]
+    _4[(_3 + _13)] = _8[_14[_13]]
+    _16=numpy.nonzero(_14 < 0)[0]
+    if ((_12==mosek.fusion.SolutionStatus.Optimal) or ((_12==mosek.fusion.SolutionStatus.NearOptimal) or ((_12==mosek.fusion.SolutionStatus.Feasible) or (_12==mosek.fusion.SolutionStatus.NearFeasible)))):
+     for _17 in _16:
+      _4[(_3 + _17)] = self.__dom._get_1ub_1item_J(_15[_17])
+    else:
+     _4[(_3 + _16)] = 0.0
   def _dual_1l_alt__3JI_3D(self,_t__0,_t__1,_t__2):
    _0=numpy.array(_t__0,dtype=numpy.dtype(numpy.int64))
    _1=numpy.int32(_t__1)
@@ -14036,15 +15100,15 @@ def __mk_mosek_fusion_RangedVariable():
      _2[(_1 + _4)] = _3[_5]
    else:
     _6=self._model.getPrimalSolutionStatus()
-    for _7 in range(0,int((_0).shape[0])):
-     if self.__idxmap._hasItem_J(_0[_7]):
-      _8=self.__idxmap._getItem_J(_0[_7])
-      _2[(_1 + _7)] = _3[_8]
-     else:
-      if ((_6==mosek.fusion.SolutionStatus.Optimal) or ((_6==mosek.fusion.SolutionStatus.NearOptimal) or ((_6==mosek.fusion.SolutionStatus.Feasible) or (_6==mosek.fusion.SolutionStatus.NearFeasible)))):
-       _2[(_1 + _7)] = self.__dom._get_1ub_1item_J(_0[_7])
-      else:
-       _2[(_1 + _7)] = 0.0
+    _8=self.__idxmap._getItems__3J(_0)
+    _7=numpy.nonzero(_8 >= 0)[0]
+    _2[(_1 + _7)] = _3[_8[_7]]
+    _9=numpy.nonzero(_8 < 0)[0]
+    if ((_6==mosek.fusion.SolutionStatus.Optimal) or ((_6==mosek.fusion.SolutionStatus.NearOptimal) or ((_6==mosek.fusion.SolutionStatus.Feasible) or (_6==mosek.fusion.SolutionStatus.NearFeasible)))):
+     for _10 in _9:
+      _2[(_1 + _10)] = self.__dom._get_1ub_1item_J(_0[_10])
+    else:
+     _2[(_1 + _9)] = 0.0
   def __dual_1values_alt_J_3I_3JI_3D(self,_t__0,_t__1,_t__2,_t__3,_t__4):
    _0=numpy.int64(_t__0)
    _1=numpy.array(_t__1,dtype=numpy.dtype(numpy.int32))
@@ -14077,22 +15141,22 @@ def __mk_mosek_fusion_RangedVariable():
    for _10 in range(0,_6):
     _5 = (_5 * _1[_10])
    if (self.__nativeidxs is not None):
-    for _11 in range(0,_5):
-     _12=self.__nativeidxs[_7.get()]
-     _4[(_11 + _3)] = (_8[_12] - _9[_12])
-     _7.inc()
+    _19=_7._materialize_()
+    _11=numpy.arange(0,_5)
+    _12=self.__nativeidxs[_19]
+    _4[(_11 + _3)] = (_8[_12] - _9[_12])
    else:
+    _16=_7._materialize_()
     _13=self._model.getPrimalSolutionStatus()
-    for _14 in range(0,numpy.int32(_5)):
-     if self.__idxmap._hasItem_J(_7.get()):
-      _15=self.__idxmap._getItem_J(_7.get())
-      _4[_14] = (_8[_15] - _9[_15])
-     else:
-      if ((_13==mosek.fusion.SolutionStatus.Optimal) or ((_13==mosek.fusion.SolutionStatus.NearOptimal) or ((_13==mosek.fusion.SolutionStatus.Feasible) or (_13==mosek.fusion.SolutionStatus.NearFeasible)))):
-       _4[(_3 + _14)] = self.__dom._get_1ub_1item_J(_7.get())
-      else:
-       _4[(_3 + _14)] = 0.0
-     _7.inc()
+    _15=self.__idxmap._getItems__3J(_16)
+    _14=numpy.nonzero(_15 >= 0)[0]
+    _4[(_3 + _14)] = (_8[_15[_14]] - _9[_15[_14]])
+    _17=numpy.nonzero(_15 < 0)[0]
+    if ((_13==mosek.fusion.SolutionStatus.Optimal) or ((_13==mosek.fusion.SolutionStatus.NearOptimal) or ((_13==mosek.fusion.SolutionStatus.Feasible) or (_13==mosek.fusion.SolutionStatus.NearFeasible)))):
+     for _18 in _17:
+      _4[(_3 + _18)] = self.__dom._get_1ub_1item_J(_16[_18])
+    else:
+     _4[(_3 + _17)] = 0.0
   def __dual_1values_alt__3JI_3D(self,_t__0,_t__1,_t__2):
    _0=numpy.array(_t__0,dtype=numpy.dtype(numpy.int64))
    _1=numpy.int32(_t__1)
@@ -14118,15 +15182,15 @@ def __mk_mosek_fusion_RangedVariable():
      _2[(_1 + _5)] = (_3[_6] - _4[_6])
    else:
     _7=self._model.getPrimalSolutionStatus()
-    for _8 in range(0,int((_0).shape[0])):
-     if self.__idxmap._hasItem_J(_0[_8]):
-      _9=self.__idxmap._getItem_J(_0[_8])
-      _2[(_1 + _8)] = (_3[_9] - _4[_9])
-     else:
-      if ((_7==mosek.fusion.SolutionStatus.Optimal) or ((_7==mosek.fusion.SolutionStatus.NearOptimal) or ((_7==mosek.fusion.SolutionStatus.Feasible) or (_7==mosek.fusion.SolutionStatus.NearFeasible)))):
-       _2[(_1 + _8)] = self.__dom._get_1ub_1item_J(_0[_8])
-      else:
-       _2[(_1 + _8)] = 0.0
+    _9=self.__idxmap._getItems__3J(_0)
+    _8=numpy.nonzero(_9 >= 0)[0]
+    _2[(_1 + _8)] = (_3[_9[_8]] - _4[_9[_8]])
+    _10=numpy.nonzero(_9 < 0)[0]
+    if ((_7==mosek.fusion.SolutionStatus.Optimal) or ((_7==mosek.fusion.SolutionStatus.NearOptimal) or ((_7==mosek.fusion.SolutionStatus.Feasible) or (_7==mosek.fusion.SolutionStatus.NearFeasible)))):
+     for _11 in _10:
+      _2[(_1 + _11)] = self.__dom._get_1ub_1item_J(_0[_11])
+    else:
+     _2[(_1 + _10)] = 0.0
   @staticmethod
   def _match_set_1values_J_3I_3JI_3DZ(*args):
     if len(args) != 6: return False
@@ -14169,14 +15233,15 @@ def __mk_mosek_fusion_RangedVariable():
     for _9 in range(0,_7):
      _6 = (_6 * _1[_9])
     if (self.__nativeidxs is not None):
-     _10=int((self.__nativeidxs).shape[0])
-     _11=numpy.array([self.__nativeidxs[_8.next()] for _12 in range(0,_6)], dtype=numpy.dtype(numpy.int32))
+     _11=self.__nativeidxs[_8._materialize_()]
+     _10=int((_11).shape[0])
      _13=(numpy.array([_4[(_3 + _14)] for _14 in range(0,_10)], dtype=numpy.dtype(numpy.float64)) if ((_3 > 0) ) else _4)
      self._model._setSolution_1xx__3I_3D(_11,_13)
     else:
      _15=numpy.zeros((_6,), dtype=numpy.dtype(numpy.int32))
+     _19=_8._materialize_()
      for _16 in range(0,_6):
-      self.inst(_8.next(),_16,_15,None,None)
+      self.inst(_19[_16],_16,_15,None,None)
      _17=numpy.array([_4[(_3 + _18)] for _18 in range(0,_6)], dtype=numpy.dtype(numpy.float64))
      self._model._setSolution_1xx__3I_3D(_15,_17)
    else:
@@ -14210,7 +15275,7 @@ def __mk_mosek_fusion_RangedVariable():
    assert _1 is None or isinstance(_1,numpy.ndarray)
    if _2:
     if (self.__nativeidxs is not None):
-     _3=int((self.__nativeidxs).shape[0])
+     _3=int((_0).shape[0])
      _4=numpy.array([self.__nativeidxs[_0[_5]] for _5 in range(0,_3)], dtype=numpy.dtype(numpy.int32))
      _6=numpy.array([_1[_7] for _7 in range(0,_3)], dtype=numpy.dtype(numpy.float64))
      self._model._setSolution_1xx__3I_3D(_4,_6)
@@ -14265,20 +15330,21 @@ def __mk_mosek_fusion_RangedVariable():
     for _10 in range(0,_7):
      _6 = (_6 * _1[_10])
     if (self.__nativeidxs is not None):
-     for _11 in range(0,_6):
-      _4[(_11 + _3)] = _9[self.__nativeidxs[_8.get()]]
-      _8.inc()
+     _18=_8._materialize_()
+     _11=numpy.arange(0,_6)
+     _4[(_11 + _3)] = _9[self.__nativeidxs[_18]]
     else:
+     _14=_8._materialize_()
      _12=self._model.getPrimalSolutionStatus()
-     for _13 in range(0,numpy.int32(_6)):
-      if self.__idxmap._hasItem_J(_8.get()):
-       _4[_13] = _9[self.__idxmap._getItem_J(_8.get())]
-      else:
-       if ((_12==mosek.fusion.SolutionStatus.Optimal) or ((_12==mosek.fusion.SolutionStatus.NearOptimal) or ((_12==mosek.fusion.SolutionStatus.Feasible) or (_12==mosek.fusion.SolutionStatus.NearFeasible)))):
-        _4[(_3 + _13)] = self.__dom._get_1ub_1item_J(_8.get())
-       else:
-        _4[(_3 + _13)] = 0.0
-      _8.inc()
+     _15=self.__idxmap._getItems__3J(_14)
+     _13=numpy.nonzero(_15 >= 0)[0]
+     _4[(_3 + _13)] = _9[_15[_13]]
+     _16=numpy.nonzero(_15 < 0)[0]
+     if ((_12==mosek.fusion.SolutionStatus.Optimal) or ((_12==mosek.fusion.SolutionStatus.NearOptimal) or ((_12==mosek.fusion.SolutionStatus.Feasible) or (_12==mosek.fusion.SolutionStatus.NearFeasible)))):
+      for _17 in _16:
+       _4[(_3 + _17)] = self.__dom._get_1ub_1item_J(_14[_17])
+     else:
+      _4[(_3 + _16)] = 0.0
    else:
     self.__dual_1values_J_3I_3JI_3D(_0,_1,_2,_3,_4)
   @staticmethod
@@ -14316,14 +15382,15 @@ def __mk_mosek_fusion_RangedVariable():
       _2[(_1 + _5)] = _4[self.__nativeidxs[_0[_5]]]
     else:
      _6=self._model.getPrimalSolutionStatus()
-     for _7 in range(0,int((_0).shape[0])):
-      if self.__idxmap._hasItem_J(_0[_7]):
-       _2[(_1 + _7)] = _4[self.__idxmap._getItem_J(_0[_7])]
-      else:
-       if ((_6==mosek.fusion.SolutionStatus.Optimal) or ((_6==mosek.fusion.SolutionStatus.NearOptimal) or ((_6==mosek.fusion.SolutionStatus.Feasible) or (_6==mosek.fusion.SolutionStatus.NearFeasible)))):
-        _2[(_1 + _7)] = self.__dom._get_1ub_1item_J(_0[_7])
-       else:
-        _2[(_1 + _7)] = 0.0
+     _8=self.__idxmap._getItems__3J(_0)
+     _7=numpy.nonzero(_8 >= 0)[0]
+     _2[(_1 + _7)] = _4[_8[_7]]
+     _9=numpy.nonzero(_8 < 0)[0]
+     if ((_6==mosek.fusion.SolutionStatus.Optimal) or ((_6==mosek.fusion.SolutionStatus.NearOptimal) or ((_6==mosek.fusion.SolutionStatus.Feasible) or (_6==mosek.fusion.SolutionStatus.NearFeasible)))):
+      for _10 in _9:
+       _2[(_1 + _10)] = self.__dom._get_1ub_1item_J(_0[_10])
+     else:
+      _2[(_1 + _9)] = 0.0
    else:
     self.__dual_1values__3JI_3D(_0,_1,_2)
   @staticmethod
@@ -14743,11 +15810,11 @@ def __mk_mosek_fusion_LinearPSDVariable():
    _9=(self._model._getSolution_1barx_Emosek_4fusion_4SolutionType_2(mosek.fusion.SolutionType.Default) if (_5 ) else self._model._getSolution_1bars_Emosek_4fusion_4SolutionType_2(mosek.fusion.SolutionType.Default))
    for _10 in range(0,_7):
     _6 = (_6 * _1[_10])
+   _14=_8._materialize_()
    for _11 in range(0,_6):
-    _12=(_8.get() // self.__blocksize)
-    _13=(_8.get() % self.__blocksize)
+    _12=(_14[_11] // self.__blocksize)
+    _13=(_14[_11] % self.__blocksize)
     _4[_11] = _9[(numpy.int64(self.__coneidx) + _12)][_13]
-    _8.inc()
   @staticmethod
   def _match_values__3JI_3DZ(*args):
     if len(args) != 4: return False
@@ -15244,16 +16311,16 @@ def __mk_mosek_fusion_PSDVariable():
    _10=(self.__conesize * self.__conesize)
    for _11 in range(0,_7):
     _6 = (_6 * _1[_11])
+   _17=_8._materialize_()
    for _12 in range(0,_6):
-    _13=(_8.get() // _10)
-    _14=(_8.get() - (_13 * _10))
+    _13=(_17[_12] // _10)
+    _14=(_17[_12] - (_13 * _10))
     _15=(_14 // self.__conesize)
     _16=(_14 - (_15 * self.__conesize))
     if (_16 > _15):
      _4[_12] = _9[(numpy.int64(self.__coneidx) + _13)][(((_15 * self.__conesize) + _16) - ((_15 * (_15 + 1)) // 2))]
     else:
      _4[_12] = _9[(numpy.int64(self.__coneidx) + _13)][(((_16 * self.__conesize) + _15) - ((_16 * (_16 + 1)) // 2))]
-    _8.inc()
   @staticmethod
   def _match_values__3JI_3DZ(*args):
     if len(args) != 4: return False
@@ -15431,7 +16498,7 @@ def __mk_mosek_fusion_SymLinearVariable():
     self._ctor_init_Lmosek_4fusion_4SymLinearVariable_2Lmosek_4fusion_4Model_2(v,m)
   def _ctor_init_Lmosek_4fusion_4SymLinearVariable_2Lmosek_4fusion_4Model_2(self,v,m):
    mosek_fusion_ModelVariable._ctor_init_Lmosek_4fusion_4ModelVariable_2Lmosek_4fusion_4Model_2(self,v,m)
-   self.__nativeidxs = (numpy.array([(v.__nativeidxs)[_0] for _0 in range(0,int(((v.__nativeidxs)).shape[0]))], dtype=numpy.dtype(numpy.int32)) if (((v.__nativeidxs) is not None) ) else None)
+   self.__nativeidxs = ((v.__nativeidxs) if (((v.__nativeidxs) is not None) ) else None)
    self.__idxmap = ((v.__idxmap)._clone_() if (((v.__idxmap) is not None) ) else None)
    self.__dom = (v.__dom)
    (self.__dim) = (v.__dim)
@@ -15457,7 +16524,7 @@ def __mk_mosek_fusion_SymLinearVariable():
    assert nativeidxs is None or isinstance(nativeidxs,numpy.ndarray)
    mosek_fusion_ModelVariable._ctor_init_Lmosek_4fusion_4Model_2SLmosek_4fusion_4Set_2J(self,model,name,mosek.fusion.Set._make_II(dim,dim),varid)
    (self.__nativeidxs) = nativeidxs
-   self.__idxmap = (mosek.fusion.Utils.IntMap() if (((self.__nativeidxs) is None) ) else None)
+   self.__idxmap = (mosek.fusion.Utils.SortedIntMap() if (((self.__nativeidxs) is None) ) else None)
    (self.__dom) = dom
    (self.__dim) = dim
    self.__names_flushed = False
@@ -15631,19 +16698,19 @@ def __mk_mosek_fusion_SymLinearVariable():
    for _10 in range(0,_6):
     _5 = (_5 * _1[_10])
    if (self.__nativeidxs is not None):
+    _16=_7._materialize_()
     for _11 in range(0,_5):
-     _12=self.__nativeidxs[self.__tril_1lin_1idx_J(_7.get())]
+     _12=self.__nativeidxs[self.__tril_1lin_1idx_J(_16[_11])]
      _4[(_11 + _3)] = (_8[_12] - _9[_12])
-     _7.inc()
    else:
     _13=self._model.getPrimalSolutionStatus()
+    _17=_7._materialize_()
     for _14 in range(0,numpy.int32(_5)):
-     if self.__idxmap._hasItem_J(self.__tril_1lin_1idx_J(_7.get())):
-      _15=self.__idxmap._getItem_J(_7.get())
+     if self.__idxmap._hasItem_J(self.__tril_1lin_1idx_J(_17[_14])):
+      _15=self.__idxmap._getItem_J(_17[_14])
       _4[(_3 + _14)] = (_8[_15] - _9[_15])
      else:
       _4[(_3 + _14)] = 0.0
-     _7.inc()
   def __dual_1values_alt__3JI_3D(self,_t__0,_t__1,_t__2):
    _0=numpy.array(_t__0,dtype=numpy.dtype(numpy.int64))
    _1=numpy.int32(_t__1)
@@ -15717,14 +16784,15 @@ def __mk_mosek_fusion_SymLinearVariable():
     for _9 in range(0,_7):
      _6 = (_6 * _1[_9])
     if (self.__nativeidxs is not None):
-     _10=int((self.__nativeidxs).shape[0])
-     _11=numpy.array([self.__nativeidxs[self.__tril_1lin_1idx_J(_8.next())] for _12 in range(0,_6)], dtype=numpy.dtype(numpy.int32))
+     _11=numpy.array([self.__nativeidxs[self.__tril_1lin_1idx_J(_12)] for _12 in _8._materialize_()], dtype=numpy.dtype(numpy.int32))
+     _10=int((_11).shape[0])
      _13=(numpy.array([_4[(_3 + _14)] for _14 in range(0,_10)], dtype=numpy.dtype(numpy.float64)) if ((_3 > 0) ) else _4)
      self._model._setSolution_1xx__3I_3D(_11,_13)
     else:
      _15=numpy.zeros((_6,), dtype=numpy.dtype(numpy.int32))
+     _19=_8._materialize_()
      for _16 in range(0,_6):
-      self.inst(_8.next(),_16,_15,None,None)
+      self.inst(_19[_16],_16,_15,None,None)
      _17=numpy.array([_4[(_3 + _18)] for _18 in range(0,_6)], dtype=numpy.dtype(numpy.float64))
      self._model._setSolution_1xx__3I_3D(_15,_17)
    else:
@@ -15758,7 +16826,7 @@ def __mk_mosek_fusion_SymLinearVariable():
    assert _1 is None or isinstance(_1,numpy.ndarray)
    if _2:
     if (self.__nativeidxs is not None):
-     _3=int((self.__nativeidxs).shape[0])
+     _3=int((_0).shape[0])
      _4=numpy.array([self.__nativeidxs[self.__tril_1lin_1idx_J(_0[_5])] for _5 in range(0,_3)], dtype=numpy.dtype(numpy.int32))
      _6=numpy.array([_1[_7] for _7 in range(0,_3)], dtype=numpy.dtype(numpy.float64))
      self._model._setSolution_1xx__3I_3D(_4,_6)
@@ -15812,25 +16880,25 @@ def __mk_mosek_fusion_SymLinearVariable():
     for _10 in range(0,_7):
      _6 *= _1[_10]
     if (self.__nativeidxs is not None):
+     _15=_8._materialize_()
      for _11 in range(0,_6):
-      _4[(_11 + _3)] = _9[self.__nativeidxs[self.__tril_1lin_1idx_J(_8.get())]]
-      _8.inc()
+      _4[(_11 + _3)] = _9[self.__nativeidxs[self.__tril_1lin_1idx_J(_15[_11])]]
     else:
      _12=self._model.getPrimalSolutionStatus()
      if ((_12==mosek.fusion.SolutionStatus.Optimal) or ((_12==mosek.fusion.SolutionStatus.NearOptimal) or ((_12==mosek.fusion.SolutionStatus.Feasible) or (_12==mosek.fusion.SolutionStatus.NearFeasible)))):
+      _16=_8._materialize_()
       for _13 in range(0,numpy.int32(_6)):
-       if self.__idxmap._hasItem_J(_8.get()):
-        _4[(_3 + _13)] = _9[self.__idxmap._getItem_J(_8.get())]
+       if self.__idxmap._hasItem_J(_16[_13]):
+        _4[(_3 + _13)] = _9[self.__idxmap._getItem_J(_16[_13])]
        else:
-        _4[(_3 + _13)] = self.__dom._get_1rhs_1item_J(self.__tril_1idx_J(_8.get()))
-       _8.inc()
+        _4[(_3 + _13)] = self.__dom._get_1rhs_1item_J(self.__tril_1idx_J(_16[_13]))
      else:
+      _17=_8._materialize_()
       for _14 in range(0,numpy.int32(_6)):
-       if self.__idxmap._hasItem_J(_8.get()):
-        _4[(_3 + _14)] = _9[self.__idxmap._getItem_J(_8.get())]
+       if self.__idxmap._hasItem_J(_17[_14]):
+        _4[(_3 + _14)] = _9[self.__idxmap._getItem_J(_17[_14])]
        else:
         _4[(_3 + _14)] = 0.0
-       _8.inc()
    else:
     self.__dual_1values_J_3I_3JI_3D(_0,_1,_2,_3,_4)
   @staticmethod
@@ -16057,7 +17125,7 @@ def __mk_mosek_fusion_LinearVariable():
     self._ctor_init_Lmosek_4fusion_4LinearVariable_2Lmosek_4fusion_4Model_2(v,m)
   def _ctor_init_Lmosek_4fusion_4LinearVariable_2Lmosek_4fusion_4Model_2(self,v,m):
    mosek_fusion_ModelVariable._ctor_init_Lmosek_4fusion_4ModelVariable_2Lmosek_4fusion_4Model_2(self,v,m)
-   self.__nativeidxs = (numpy.array([(v.__nativeidxs)[_0] for _0 in range(0,int(((v.__nativeidxs)).shape[0]))], dtype=numpy.dtype(numpy.int32)) if (((v.__nativeidxs) is not None) ) else None)
+   self.__nativeidxs = ((v.__nativeidxs) if (((v.__nativeidxs) is not None) ) else None)
    self.__idxmap = ((v.__idxmap)._clone_() if (((v.__idxmap) is not None) ) else None)
    self.__dom = (v.__dom)
    self.__names_flushed = (v.__names_flushed)
@@ -16083,7 +17151,7 @@ def __mk_mosek_fusion_LinearVariable():
    mosek_fusion_ModelVariable._ctor_init_Lmosek_4fusion_4Model_2SLmosek_4fusion_4Set_2J(self,model_,name_,shape_p,varid_)
    self.__nativeidxs = nativeidxs_
    if (nativeidxs_ is None):
-    self.__idxmap = mosek.fusion.Utils.IntMap()
+    self.__idxmap = mosek.fusion.Utils.SortedIntMap()
    else:
     self.__idxmap = None
    self.__dom = dom_
@@ -16123,13 +17191,11 @@ def __mk_mosek_fusion_LinearVariable():
   def _flushNames_(self,):
    if ((not self.__names_flushed) and (int(len(self._name)) > 0)):
     if (self.__nativeidxs is not None):
-     for _0 in range(0,int((self.__nativeidxs).shape[0])):
-      self._model._varname_IS(self.__nativeidxs[_0],("" if ((int(len(self._name))==0) ) else mosek.fusion.Utils.StringBuffer()._a_S(self._name)._a_S("[")._a_S(self._shape_p.getname(_0))._a_S("]")._toString_()))
+     self._model._task_1var_1names__3J_3S(self.__nativeidxs,self._shape_p._getnames_S_3JS(self._name,numpy.arange(0,int((self.__nativeidxs).shape[0]),dtype=numpy.dtype(numpy.int64)),""))
     else:
      _1=self.__idxmap._keys_()
      _2=self.__idxmap._values_()
-     for _3 in range(0,int((_1).shape[0])):
-      self._model._varname_IS(_2[_3],mosek.fusion.Utils.StringBuffer()._a_S(self._name)._a_S("[")._a_S(self._shape_p.getname(_1[_3]))._a_S("]")._toString_())
+     self._model._task_1var_1names__3J_3S(_2,self._shape_p._getnames_S_3JS(self._name,_1,""))
     self.__names_flushed = True
   @staticmethod
   def _match_inst__3JIIJJ_3I_3I_3I(*args):
@@ -16177,7 +17243,9 @@ def __mk_mosek_fusion_LinearVariable():
     for _8 in range(_1,_2):
      _5[(_4 + numpy.int64((_8 - _1)))] = self.__nativeidxs[_0[(numpy.int64(_8) - _3)]]
    else:
-    for _9 in range(_1,_2):
+    _11=self.__idxmap._getItems__3J(_0[(_1 - _3):(_2 - _3)])
+    _5[_4:(_4 + (_2 - _1))] = _11
+    for _9 in (numpy.nonzero(_11 < 0)[0] + _1):
      if (not self.__idxmap._hasItem_J(_0[(numpy.int64(_9) - _3)])):
       _10=self._model._append_1linearvar_Lmosek_4fusion_4ModelVariable_2JEmosek_4fusion_4RelationKey_2D(self,_0[(numpy.int64(_9) - _3)],(self.__dom._key),self.__dom._get_1rhs_1item_J(_0[(numpy.int64(_9) - _3)]))
       self.__idxmap._setItem_JI(_0[(_9 - _3)],_10)
@@ -16260,22 +17328,22 @@ def __mk_mosek_fusion_LinearVariable():
    for _10 in range(0,_6):
     _5 = (_5 * _1[_10])
    if (self.__nativeidxs is not None):
-    for _11 in range(0,_5):
-     _12=self.__nativeidxs[_7.get()]
-     _4[(_11 + _3)] = (_8[_12] - _9[_12])
-     _7.inc()
+    _19=_7._materialize_()
+    _11=numpy.arange(0,_5)
+    _12=self.__nativeidxs[_19]
+    _4[(_11 + _3)] = (_8[_12] - _9[_12])
    else:
+    _16=_7._materialize_()
     _13=self._model.getPrimalSolutionStatus()
-    for _14 in range(0,numpy.int32(_5)):
-     if self.__idxmap._hasItem_J(_7.get()):
-      _15=self.__idxmap._getItem_J(_7.get())
-      _4[(_3 + _14)] = (_8[_15] - _9[_15])
-     else:
-      if ((_13==mosek.fusion.SolutionStatus.Optimal) or ((_13==mosek.fusion.SolutionStatus.NearOptimal) or ((_13==mosek.fusion.SolutionStatus.Feasible) or (_13==mosek.fusion.SolutionStatus.NearFeasible)))):
-       _4[(_3 + _14)] = self.__dom._get_1rhs_1item_J(_7.get())
-      else:
-       _4[(_3 + _14)] = 0.0
-     _7.inc()
+    _15=self.__idxmap._getItems__3J(_16)
+    _14=numpy.nonzero(_15 >= 0)[0]
+    _4[(_3 + _14)] = (_8[_15[_14]] - _9[_15[_14]])
+    _17=numpy.nonzero(_15 < 0)[0]
+    if ((_13==mosek.fusion.SolutionStatus.Optimal) or ((_13==mosek.fusion.SolutionStatus.NearOptimal) or ((_13==mosek.fusion.SolutionStatus.Feasible) or (_13==mosek.fusion.SolutionStatus.NearFeasible)))):
+     for _18 in _17:
+      _4[(_3 + _18)] = self.__dom._get_1rhs_1item_J(_16[_18])
+    else:
+     _4[(_3 + _17)] = 0.0
   def __dual_1values_alt__3JI_3D(self,_t__0,_t__1,_t__2):
    _0=numpy.array(_t__0,dtype=numpy.dtype(numpy.int64))
    _1=numpy.int32(_t__1)
@@ -16301,15 +17369,15 @@ def __mk_mosek_fusion_LinearVariable():
      _2[(_1 + _5)] = (_3[_6] - _4[_6])
    else:
     _7=self._model.getPrimalSolutionStatus()
-    for _8 in range(0,int((_0).shape[0])):
-     if self.__idxmap._hasItem_J(_0[_8]):
-      _9=self.__idxmap._getItem_J(_0[_8])
-      _2[(_1 + _8)] = (_3[_9] - _4[_9])
-     else:
-      if ((_7==mosek.fusion.SolutionStatus.Optimal) or ((_7==mosek.fusion.SolutionStatus.NearOptimal) or ((_7==mosek.fusion.SolutionStatus.Feasible) or (_7==mosek.fusion.SolutionStatus.NearFeasible)))):
-       _2[(_1 + _8)] = self.__dom._get_1rhs_1item_J(_0[_8])
-      else:
-       _2[(_1 + _8)] = 0.0
+    _9=self.__idxmap._getItems__3J(_0)
+    _8=numpy.nonzero(_9 >= 0)[0]
+    _2[(_1 + _8)] = (_3[_9[_8]] - _4[_9[_8]])
+    _10=numpy.nonzero(_9 < 0)[0]
+    if ((_7==mosek.fusion.SolutionStatus.Optimal) or ((_7==mosek.fusion.SolutionStatus.NearOptimal) or ((_7==mosek.fusion.SolutionStatus.Feasible) or (_7==mosek.fusion.SolutionStatus.NearFeasible)))):
+     for _11 in _10:
+      _2[(_1 + _11)] = self.__dom._get_1rhs_1item_J(_0[_11])
+    else:
+     _2[(_1 + _10)] = 0.0
   @staticmethod
   def _match_set_1values_J_3I_3JI_3DZ(*args):
     if len(args) != 6: return False
@@ -16352,14 +17420,15 @@ def __mk_mosek_fusion_LinearVariable():
     for _9 in range(0,_7):
      _6 = (_6 * _1[_9])
     if (self.__nativeidxs is not None):
-     _10=int((self.__nativeidxs).shape[0])
-     _11=numpy.array([self.__nativeidxs[_8.next()] for _12 in range(0,_6)], dtype=numpy.dtype(numpy.int32))
-     _13=(numpy.array([_4[_14] for _14 in range(0,_10)], dtype=numpy.dtype(numpy.float64)) if ((_3 > 0) ) else _4)
+     _11=self.__nativeidxs[_8._materialize_()]
+     _10=int((_11).shape[0])
+     _13=(numpy.array([_4[(_3 + _14)] for _14 in range(0,_10)], dtype=numpy.dtype(numpy.float64)) if ((_3 > 0) ) else _4)
      self._model._setSolution_1xx__3I_3D(_11,_13)
     else:
      _15=numpy.zeros((_6,), dtype=numpy.dtype(numpy.int32))
+     _19=_8._materialize_()
      for _16 in range(0,_6):
-      self.inst(_8.next(),_16,_15,None,None)
+      self.inst(_19[_16],_16,_15,None,None)
      _17=numpy.array([_4[(_3 + _18)] for _18 in range(0,_6)], dtype=numpy.dtype(numpy.float64))
      self._model._setSolution_1xx__3I_3D(_15,_17)
    else:
@@ -16393,7 +17462,7 @@ def __mk_mosek_fusion_LinearVariable():
    assert _1 is None or isinstance(_1,numpy.ndarray)
    if _2:
     if (self.__nativeidxs is not None):
-     _3=int((self.__nativeidxs).shape[0])
+     _3=int((_0).shape[0])
      _4=numpy.array([self.__nativeidxs[_0[_5]] for _5 in range(0,_3)], dtype=numpy.dtype(numpy.int32))
      _6=numpy.array([_1[_7] for _7 in range(0,_3)], dtype=numpy.dtype(numpy.float64))
      self._model._setSolution_1xx__3I_3D(_4,_6)
@@ -16450,20 +17519,21 @@ def __mk_mosek_fusion_LinearVariable():
     for _10 in range(0,_7):
      _6 = (_6 * _1[_10])
     if (self.__nativeidxs is not None):
-     for _11 in range(0,_6):
-      _4[(_11 + _3)] = _9[self.__nativeidxs[_8.get()]]
-      _8.inc()
+     _18=_8._materialize_()
+     _11=numpy.arange(0,_6)
+     _4[(_11 + _3)] = _9[self.__nativeidxs[_18]]
     else:
+     _14=_8._materialize_()
      _12=self._model.getPrimalSolutionStatus()
-     for _13 in range(0,numpy.int32(_6)):
-      if self.__idxmap._hasItem_J(_8.get()):
-       _4[(_3 + _13)] = _9[self.__idxmap._getItem_J(_8.get())]
-      else:
-       if ((_12==mosek.fusion.SolutionStatus.Optimal) or ((_12==mosek.fusion.SolutionStatus.NearOptimal) or ((_12==mosek.fusion.SolutionStatus.Feasible) or (_12==mosek.fusion.SolutionStatus.NearFeasible)))):
-        _4[(_3 + _13)] = self.__dom._get_1rhs_1item_J(_8.get())
-       else:
-        _4[(_3 + _13)] = 0.0
-      _8.inc()
+     _15=self.__idxmap._getItems__3J(_14)
+     _13=numpy.nonzero(_15 >= 0)[0]
+     _4[(_3 + _13)] = _9[_15[_13]]
+     _16=numpy.nonzero(_15 < 0)[0]
+     if ((_12==mosek.fusion.SolutionStatus.Optimal) or ((_12==mosek.fusion.SolutionStatus.NearOptimal) or ((_12==mosek.fusion.SolutionStatus.Feasible) or (_12==mosek.fusion.SolutionStatus.NearFeasible)))):
+      for _17 in _16:
+       _4[(_3 + _17)] = self.__dom._get_1rhs_1item_J(_14[_17])
+     else:
+      _4[(_3 + _16)] = 0.0
   @staticmethod
   def _match_make_1continuous__3J(*args):
     if len(args) != 1: return False
@@ -16553,14 +17623,15 @@ def __mk_mosek_fusion_LinearVariable():
       _2[(_1 + _5)] = _4[self.__nativeidxs[_0[_5]]]
     else:
      _6=self._model.getPrimalSolutionStatus()
-     for _7 in range(0,int((_0).shape[0])):
-      if self.__idxmap._hasItem_J(_0[_7]):
-       _2[(_1 + _7)] = _4[self.__idxmap._getItem_J(_0[_7])]
-      else:
-       if ((_6==mosek.fusion.SolutionStatus.Optimal) or ((_6==mosek.fusion.SolutionStatus.NearOptimal) or ((_6==mosek.fusion.SolutionStatus.Feasible) or (_6==mosek.fusion.SolutionStatus.NearFeasible)))):
-        _2[(_1 + _7)] = self.__dom._get_1rhs_1item_J(_0[_7])
-       else:
-        _2[(_1 + _7)] = 0.0
+     _8=self.__idxmap._getItems__3J(_0)
+     _7=numpy.nonzero(_8 >= 0)[0]
+     _2[(_1 + _7)] = _4[_8[_7]]
+     _9=numpy.nonzero(_8 < 0)[0]
+     if ((_6==mosek.fusion.SolutionStatus.Optimal) or ((_6==mosek.fusion.SolutionStatus.NearOptimal) or ((_6==mosek.fusion.SolutionStatus.Feasible) or (_6==mosek.fusion.SolutionStatus.NearFeasible)))):
+      for _10 in _9:
+       _2[(_1 + _10)] = self.__dom._get_1rhs_1item_J(_0[_10])
+     else:
+      _2[(_1 + _9)] = 0.0
   def _clone_alt_Lmosek_4fusion_4Model_2(self,_t__0):
     return self._clone_Lmosek_4fusion_4Model_2(_0)
   def _clone_Lmosek_4fusion_4Model_2(self,_0):
@@ -16677,7 +17748,7 @@ def __mk_mosek_fusion_ConicVariable():
    self.__coneidx = (v.__coneidx)
    self.__conesize = (v.__conesize)
    self.__numcone = (v.__numcone)
-   self.__nativeidxs = (numpy.array([(v.__nativeidxs)[_0] for _0 in range(0,int(((v.__nativeidxs)).shape[0]))], dtype=numpy.dtype(numpy.int32)) if (((v.__nativeidxs) is not None) ) else None)
+   self.__nativeidxs = ((v.__nativeidxs) if (((v.__nativeidxs) is not None) ) else None)
    self.__names_flushed = (v.__names_flushed)
   @staticmethod
   def _ctor_Lmosek_4fusion_4Model_2SLmosek_4fusion_4QConeDomain_2Lmosek_4fusion_4Set_2_3IIIIJ(model_,name_,dom_,shape_p,nativeidxs_,conesize_,firstcone_,numcone_,varid_):
@@ -16760,8 +17831,7 @@ def __mk_mosek_fusion_ConicVariable():
     return self._flushNames_()
   def _flushNames_(self,):
    if ((not self.__names_flushed) and (int(len(self._name)) > 0)):
-    for _0 in range(0,int((self.__nativeidxs).shape[0])):
-     self._model._varname_IS(self.__nativeidxs[_0],mosek.fusion.Utils.StringBuffer()._a_S(self._name)._a_S("[")._a_S(self._shape_p.getname(_0))._a_S("]")._toString_())
+    self._model._task_1var_1names__3J_3S(self.__nativeidxs,self._shape_p._getnames_S_3JS(self._name,numpy.arange(0,int((self.__nativeidxs).shape[0]),dtype=numpy.dtype(numpy.int64)),""))
     self.__names_flushed = True
   @staticmethod
   def _match_inst__3JIIJJ_3I_3I_3I(*args):
@@ -16886,8 +17956,8 @@ def __mk_mosek_fusion_ConicVariable():
     _8=mosek_fusion_IndexCounter._ctor_J_3I_3J(_0,_1,_2)
     for _9 in range(0,_7):
      _6 = (_6 * _1[_9])
-    _10=int((self.__nativeidxs).shape[0])
-    _11=numpy.array([self.__nativeidxs[_8.next()] for _12 in range(0,_6)], dtype=numpy.dtype(numpy.int32))
+    _11=self.__nativeidxs[_8._materialize_()]
+    _10=int((_11).shape[0])
     _13=(numpy.array([_4[(_3 + _14)] for _14 in range(0,_10)], dtype=numpy.dtype(numpy.float64)) if ((_3 > 0) ) else _4)
     self._model._setSolution_1xx__3I_3D(_11,_13)
    else:
@@ -16920,7 +17990,7 @@ def __mk_mosek_fusion_ConicVariable():
    assert _0 is None or isinstance(_0,numpy.ndarray)
    assert _1 is None or isinstance(_1,numpy.ndarray)
    if _2:
-    _3=int((self.__nativeidxs).shape[0])
+    _3=int((_0).shape[0])
     _4=numpy.array([self.__nativeidxs[_0[_5]] for _5 in range(0,_3)], dtype=numpy.dtype(numpy.int32))
     _6=numpy.array([_1[_7] for _7 in range(0,_3)], dtype=numpy.dtype(numpy.float64))
     self._model._setSolution_1xx__3I_3D(_4,_6)
@@ -16967,9 +18037,9 @@ def __mk_mosek_fusion_ConicVariable():
    _9=(self._model._getSolution_1xx_Emosek_4fusion_4SolutionType_2(mosek.fusion.SolutionType.Default) if (_5 ) else self._model._getSolution_1snx_Emosek_4fusion_4SolutionType_2(mosek.fusion.SolutionType.Default))
    for _10 in range(0,_7):
     _6 = (_6 * _1[_10])
-   for _11 in range(0,_6):
-    _4[(_11 + _3)] = _9[self.__nativeidxs[_8.get()]]
-    _8.inc()
+   _12=_8._materialize_()
+   _11=numpy.arange(0,_6)
+   _4[(_11 + _3)] = _9[self.__nativeidxs[_12]]
   @staticmethod
   def _match_values__3JI_3DZ(*args):
     if len(args) != 4: return False
@@ -18317,7 +19387,7 @@ del __mk_mosek_fusion_Var
 #BEFORE CLASS
 def __mk_mosek_fusion_ConstraintCache():
  class ConstraintCache(object):
-  __slots__ = ['barmatidx','barsubj','barsubi','nbarnz','nunordered','buffer_subi','buffer_subj','buffer_cof','bfix','cof','subi','subj','nnz','nrows']
+  __slots__ = ['barmatidx','barsubj','barsubi','nbarnz','nunordered','buffer_subi','buffer_subj','buffer_cof','bfix','cof','subi','subj','nnz','nrows','_shared']
   def __init__(self,*args):
     if False: pass
     elif self.__match_ctor__3J_3D_3I_3D_3I_3I_3I(*args): # []int64,[]double,[]int32,[]double,[]int32,[]int32,[]int32
@@ -18372,18 +19442,32 @@ def __mk_mosek_fusion_ConstraintCache():
    object.__init__(self)
    self.nrows = (cc.nrows)
    self.nnz = (cc.nnz)
-   self.subj = (mosek.fusion.Utils.Tools._arraycopy__3I((cc.subj)) if (((cc.subj) is not None) ) else None)
-   self.subi = (mosek.fusion.Utils.Tools._arraycopy__3I((cc.subi)) if (((cc.subi) is not None) ) else None)
-   self.cof = (mosek.fusion.Utils.Tools._arraycopy__3D((cc.cof)) if (((cc.cof) is not None) ) else None)
-   self.bfix = (mosek.fusion.Utils.Tools._arraycopy__3D((cc.bfix)) if (((cc.bfix) is not None) ) else None)
-   self.buffer_cof = (mosek.fusion.Utils.Tools._arraycopy__3D((cc.buffer_cof)) if (((cc.buffer_cof) is not None) ) else None)
-   self.buffer_subj = (mosek.fusion.Utils.Tools._arraycopy__3I((cc.buffer_subj)) if (((cc.buffer_subj) is not None) ) else None)
-   self.buffer_subi = (mosek.fusion.Utils.Tools._arraycopy__3I((cc.buffer_subi)) if (((cc.buffer_subi) is not None) ) else None)
+   self.subj = (cc.subj)
+   self.subi = (cc.subi)
+   self.cof = (cc.cof)
+   self.bfix = (cc.bfix)
+   self.buffer_cof = (cc.buffer_cof)
+   self.buffer_subj = (cc.buffer_subj)
+   self.buffer_subi = (cc.buffer_subi)
    self.nunordered = (cc.nunordered)
    self.nbarnz = (cc.nbarnz)
-   self.barsubi = (mosek.fusion.Utils.Tools._arraycopy__3I((cc.barsubi)) if (((cc.barsubi) is not None) ) else None)
-   self.barsubj = (mosek.fusion.Utils.Tools._arraycopy__3I((cc.barsubj)) if (((cc.barsubj) is not None) ) else None)
-   self.barmatidx = (mosek.fusion.Utils.Tools._arraycopy__3I((cc.barmatidx)) if (((cc.barmatidx) is not None) ) else None)
+   self.barsubi = (cc.barsubi)
+   self.barsubj = (cc.barsubj)
+   self.barmatidx = (cc.barmatidx)
+   self._shared = True
+   cc._shared = True
+  def __unshare_(self,):
+   self.subj = (mosek.fusion.Utils.Tools._arraycopy__3I(self.subj) if ((self.subj is not None) ) else None)
+   self.subi = (mosek.fusion.Utils.Tools._arraycopy__3I(self.subi) if ((self.subi is not None) ) else None)
+   self.cof = (mosek.fusion.Utils.Tools._arraycopy__3D(self.cof) if ((self.cof is not None) ) else None)
+   self.bfix = (mosek.fusion.Utils.Tools._arraycopy__3D(self.bfix) if ((self.bfix is not None) ) else None)
+   self.buffer_cof = (mosek.fusion.Utils.Tools._arraycopy__3D(self.buffer_cof) if ((self.buffer_cof is not None) ) else None)
+   self.buffer_subj = (mosek.fusion.Utils.Tools._arraycopy__3I(self.buffer_subj) if ((self.buffer_subj is not None) ) else None)
+   self.buffer_subi = (mosek.fusion.Utils.Tools._arraycopy__3I(self.buffer_subi) if ((self.buffer_subi is not None) ) else None)
+   self.barsubi = (mosek.fusion.Utils.Tools._arraycopy__3I(self.barsubi) if ((self.barsubi is not None) ) else None)
+   self.barsubj = (mosek.fusion.Utils.Tools._arraycopy__3I(self.barsubj) if ((self.barsubj is not None) ) else None)
+   self.barmatidx = (mosek.fusion.Utils.Tools._arraycopy__3I(self.barmatidx) if ((self.barmatidx is not None) ) else None)
+   self._shared = False
   @staticmethod
   def _ctor__3J_3D_3I_3D_3I_3I_3I(ptrb_,cof_,subj_,bfix_,barsubi_,barsubj_,barmatidx_):
     o = ConstraintCache.__new__(ConstraintCache)
@@ -18410,6 +19494,7 @@ def __mk_mosek_fusion_ConstraintCache():
    assert barsubj_ is None or isinstance(barsubj_,numpy.ndarray)
    assert barmatidx_ is None or isinstance(barmatidx_,numpy.ndarray)
    object.__init__(self)
+   self._shared = False
    self.nrows = (int((ptrb_).shape[0]) - 1)
    self.nnz = ptrb_[(int((ptrb_).shape[0]) - 1)]
    self.subj = numpy.zeros((self.nnz,), dtype=numpy.dtype(numpy.int32))
@@ -18455,6 +19540,8 @@ def __mk_mosek_fusion_ConstraintCache():
    return _1
   def _unchecked_1add_1fx__3D(self,_0):
    assert _0 is None or isinstance(_0,numpy.ndarray)
+   if self._shared:
+    self.__unshare_()
    for _1 in range(0,self.nrows):
     self.bfix[_1] = (self.bfix[_1] + _0[_1])
   def _order_1barentries_alt_(self,):
@@ -18492,6 +19579,8 @@ def __mk_mosek_fusion_ConstraintCache():
    assert _0 is None or isinstance(_0,numpy.ndarray)
    assert _1 is None or isinstance(_1,numpy.ndarray)
    assert _2 is None or isinstance(_2,numpy.ndarray)
+   if self._shared:
+    self.__unshare_()
    if (_0 is not None):
     _3=int((_0).shape[0])
     if (int((_0).shape[0]) <= (self.nbarnz + _3)):
@@ -18538,9 +19627,12 @@ def __mk_mosek_fusion_ConstraintCache():
    assert _1 is None or isinstance(_1,numpy.ndarray)
    assert _2 is None or isinstance(_2,numpy.ndarray)
    assert _3 is None or isinstance(_3,numpy.ndarray)
+   if self._shared:
+    self.__unshare_()
    _4=(self.nunordered + _0[self.nrows])
    _5=_0[self.nrows]
    if ((self.buffer_cof is None) or (int((self.buffer_cof).shape[0]) < _4)):
+    _4 = max(_4,(2 * self.nunordered))
     _6 = numpy.zeros((_4,), dtype=numpy.dtype(numpy.int32))
     _7 = numpy.zeros((_4,), dtype=numpy.dtype(numpy.int32))
     _8 = numpy.zeros((_4,), dtype=numpy.dtype(numpy.float64))
@@ -18552,18 +19644,15 @@ def __mk_mosek_fusion_ConstraintCache():
     _6 = self.buffer_subi
     _7 = self.buffer_subj
     _8 = self.buffer_cof
-   for _9 in range(0,self.nrows):
-    for _10 in range(_0[_9],_0[(_9 + 1)]):
-     _6[(self.nunordered + _10)] = _9
+   _6[self.nunordered:(self.nunordered + _5)] = numpy.repeat(numpy.arange(0,self.nrows,dtype=numpy.int32),numpy.diff(_0[0:(self.nrows + 1)]))
    mosek.fusion.Utils.Tools._arraycopy__3IJ_3IJJ(_1,0,_7,self.nunordered,_5)
    mosek.fusion.Utils.Tools._arraycopy__3DJ_3DJJ(_2,0,_8,self.nunordered,_5)
    self.buffer_subi = _6
    self.buffer_subj = _7
    self.buffer_cof = _8
    if (_3 is not None):
-    for _11 in range(0,self.nrows):
-     self.bfix[_11] = (self.bfix[_11] + _3[_11])
-   self.nunordered = _4
+    self.bfix[0:self.nrows] += _3[0:self.nrows]
+   self.nunordered = (self.nunordered + _5)
   @staticmethod
   def _match_add__3J_3I_3D_3D(*args):
     if len(args) != 4: return False
@@ -18643,122 +19732,41 @@ def __mk_mosek_fusion_ConstraintCache():
    assert _1 is None or isinstance(_1,numpy.ndarray)
    assert _2 is None or isinstance(_2,numpy.ndarray)
    assert _3 is None or isinstance(_3,numpy.ndarray)
-   _4=None
+   if self._shared:
+    self.__unshare_()
    if ((self.bfix is not None) and (_3 is not None)):
-    for _5 in range(0,self.nrows):
-     _3[_5] = self.bfix[_5]
+    _3[0:self.nrows] = self.bfix[0:self.nrows]
    if (self.nunordered==0):
     return numpy.int64(0)
-   _6=False
-   _7=1
-   while ((_7 < self.nunordered) and ((self.buffer_subi[(_7 - 1)] < self.buffer_subi[_7]) or ((self.buffer_subi[(_7 - 1)]==self.buffer_subi[_7]) and (self.buffer_subj[(_7 - 1)] <= self.buffer_subj[_7])))):
-    _7 += 1
-   _6 = (_7==self.nunordered)
-   if (not _6):
-    _4 = numpy.array([_8 for _8 in range(0,self.nunordered)], dtype=numpy.dtype(numpy.int64))
-    mosek.fusion.CommonTools._argQsort__3J_3I_3IJJ(_4,self.buffer_subi,self.buffer_subj,0,self.nunordered)
-   _9=self.nnz
-   _10=numpy.zeros(((self.nunordered + _9),), dtype=numpy.dtype(numpy.int32))
-   _11=numpy.zeros(((self.nunordered + _9),), dtype=numpy.dtype(numpy.int32))
-   _12=numpy.zeros(((self.nunordered + _9),), dtype=numpy.dtype(numpy.float64))
-   _13=0
-   if _6:
-    _14=0
-    _15=0
-    _16=_9
-    _17=self.nunordered
-    _18=0
-    _19=0
-    while ((_14 < _16) and (_15 < _17)):
-     if ((self.subi[_14] < self.buffer_subi[_15]) or ((self.subi[_14]==self.buffer_subi[_15]) and (self.subj[_14] < self.buffer_subj[_15]))):
-      _10[_18] = self.subi[_14]
-      _11[_18] = self.subj[_14]
-      _12[_18] = self.cof[_14]
-      _14 += 1
-      _18 += 1
-     elif ((self.subi[_14] > self.buffer_subi[_15]) or ((self.subi[_14]==self.buffer_subi[_15]) and (self.subj[_14] > self.buffer_subj[_15]))):
-      _10[_18] = self.buffer_subi[_15]
-      _11[_18] = self.buffer_subj[_15]
-      _12[_18] = self.buffer_cof[_15]
-      _0[_13] = _10[_18]
-      _1[_13] = _11[_18]
-      _2[_13] = _12[_18]
-      _13 += 1
-      _15 += 1
-      _18 += 1
-     else:
-      _10[_18] = self.subi[_14]
-      _11[_18] = self.subj[_14]
-      _12[_18] = self.cof[_14]
-      while ((_14 < int((self.subi).shape[0])) and ((_15 < int((self.buffer_subi).shape[0])) and ((self.subi[_14]==self.buffer_subi[_15]) and (self.subj[_14]==self.buffer_subj[_15])))):
-       _12[_18] = (_12[_18] + self.buffer_cof[_15])
-       _15 += 1
-      _0[_13] = _10[_18]
-      _1[_13] = _11[_18]
-      _2[_13] = _12[_18]
-      _13 += 1
-      _14 += 1
-      _18 += 1
-    while (_14 < _16):
-     _10[_18] = self.subi[_14]
-     _11[_18] = self.subj[_14]
-     _12[_18] = self.cof[_14]
-     _14 += 1
-     _18 += 1
-    while (_15 < _17):
-     _10[_18] = self.buffer_subi[_15]
-     _11[_18] = self.buffer_subj[_15]
-     _12[_18] = self.buffer_cof[_15]
-     _0[_13] = _10[_18]
-     _1[_13] = _11[_18]
-     _2[_13] = _12[_18]
-     _13 += 1
-     _15 += 1
-     _18 += 1
-    self.nnz = _18
-   else:
-    _20=0
-    _21=0
-    _22=_9
-    _23=self.nunordered
-    _24=0
-    _25=0
-    while ((_20 < _22) and (_21 < _23)):
-     if ((self.subi[_20] < self.buffer_subi[_4[_21]]) or ((self.subi[_20]==self.buffer_subi[_4[_21]]) and (self.subj[_20] < self.buffer_subj[_4[_21]]))):
-      _10[_24] = self.subi[_20]
-      _11[_24] = self.subj[_20]
-      _12[_24] = self.cof[_20]
-      _20 += 1
-      _24 += 1
-     elif ((self.subi[_20] > self.buffer_subi[_4[_21]]) or ((self.subi[_20]==self.buffer_subi[_4[_21]]) and (self.subj[_20] > self.buffer_subj[_4[_21]]))):
-      _10[_24] = self.buffer_subi[_4[_21]]
-      _11[_24] = self.buffer_subj[_4[_21]]
-      _12[_24] = self.buffer_cof[_4[_21]]
-      _0[_13] = _10[_24]
-      _1[_13] = _11[_24]
-      _2[_13] = _12[_24]
-      _13 += 1
-      _21 += 1
-      _24 += 1
-     else:
-      _10[_24] = self.subi[_20]
-      _11[_24] = self.subj[_20]
-      _12[_24] = self.cof[_20]
-      while ((self.subi[_20]==self.buffer_subi[_4[_21]]) and (self.subj[_20]==self.buffer_subj[_4[_21]])):
-       _12[_24] = (_12[_24] + self.buffer_cof[_4[_21]])
-       _21 += 1
-      _0[_13] = _10[_24]
-      _1[_13] = _11[_24]
-      _2[_13] = _12[_24]
-      _13 += 1
-      _20 += 1
-      _24 += 1
-    self.nnz = _24
-   self.subi = _10
-   self.subj = _11
-   self.cof = _12
+   _4=((self.buffer_subi[0:self.nunordered].astype(numpy.int64) << 32) | self.buffer_subj[0:self.nunordered].astype(numpy.int64))
+   _5,_6=numpy.unique(_4,return_inverse=True)
+   _7=numpy.bincount(_6,weights=self.buffer_cof[0:self.nunordered],minlength=int((_5).shape[0]))
+   _8=((self.subi[0:self.nnz].astype(numpy.int64) << 32) | self.subj[0:self.nnz].astype(numpy.int64))
+   if ((self.nnz > 1) and (not (_8[1:] >= _8[0:-1]).all())):
+    _9=numpy.argsort(_8,kind='stable')
+    _8 = _8[_9]
+    self.subi = self.subi[_9]
+    self.subj = self.subj[_9]
+    self.cof = self.cof[_9]
+   _10=numpy.searchsorted(_8,_5)
+   _11=(_10 < self.nnz)
+   _11[_11] = (_8[_10[_11]]==_5[_11])
+   _12=_10[_11]
+   self.cof[_12] += _7[_11]
+   _7[_11] = self.cof[_12]
+   if (not _11.all()):
+    _13=numpy.logical_not(_11)
+    _14=_10[_13]
+    self.subi = numpy.insert(self.subi[0:self.nnz],_14,(_5[_13] >> 32).astype(numpy.int32))
+    self.subj = numpy.insert(self.subj[0:self.nnz],_14,(_5[_13] & 0xffffffff).astype(numpy.int32))
+    self.cof = numpy.insert(self.cof[0:self.nnz],_14,_7[_13])
+    self.nnz = numpy.int64(int((self.subi).shape[0]))
+   _15=int((_5).shape[0])
+   _0[0:_15] = (_5 >> 32)
+   _1[0:_15] = (_5 & 0xffffffff)
+   _2[0:_15] = _7
    self.nunordered = 0
-   return numpy.int64(_13)
+   return numpy.int64(_15)
   @staticmethod
   def _match_numUnsorted_(*args):
     if len(args) != 0: return False
@@ -20772,9 +21780,9 @@ def __mk_mosek_fusion_ModelConstraint():
   def _ctor_init_Lmosek_4fusion_4ModelConstraint_2Lmosek_4fusion_4Model_2(self,c,m):
    mosek_fusion_Constraint._ctor_init_Lmosek_4fusion_4Constraint_2Lmosek_4fusion_4Model_2(self,c,m)
    self._cache = (c._cache)._clone_()
-   self._nativeindexes = numpy.array([(c._nativeindexes)[_0] for _0 in range(0,int(((c._nativeindexes)).shape[0]))], dtype=numpy.dtype(numpy.int32))
+   self._nativeindexes = (c._nativeindexes)
    self._name = (c._name)
-   self._cache_bfix = numpy.array([(c._cache_bfix)[_1] for _1 in range(0,int(((c._cache_bfix)).shape[0]))], dtype=numpy.dtype(numpy.float64))
+   self._cache_bfix = (c._cache_bfix)
    self.__names_flushed = (c.__names_flushed)
   @staticmethod
   def _ctor_Lmosek_4fusion_4Model_2SLmosek_4fusion_4Set_2_3I_3J_3I_3D_3D_3I_3I_3I(model_,name_,shape_,nidxs_,ptrb,subj,cof,bfix,barsubi_,barsubj_,barsymmatidx_):
@@ -20815,8 +21823,7 @@ def __mk_mosek_fusion_ModelConstraint():
     return self._flushNames_()
   def _flushNames_(self,):
    if ((not self.__names_flushed) and (int(len(self._name)) > 0)):
-    for _0 in range(0,int((self._nativeindexes).shape[0])):
-     self._model._task_1con_1name_IS(self._nativeindexes[_0],("" if ((int(len(self._name))==0) ) else mosek.fusion.Utils.StringBuffer()._a_S(self._name)._a_S("[")._a_S(self._shape_p.getname(_0))._a_S("]")._toString_()))
+    self._model._task_1con_1names__3J_3S(self._nativeindexes,self._shape_p._getnames_S_3JS(self._name,numpy.arange(0,int((self._nativeindexes).shape[0]),dtype=numpy.dtype(numpy.int64)),""))
     self.__names_flushed = True
   @staticmethod
   def _match_toString_(*args):
@@ -20870,6 +21877,7 @@ def __mk_mosek_fusion_ModelConstraint():
     raise mosek_fusion_LengthError._ctor_S("Result array is too small to hold the result")
    _4=mosek.fusion.Utils.StringBuffer()
    _5=0
+   self._model._flushConstraints_()
    _6=self._cache._order_1barentries_()
    _7=0
    for _8 in range(0,int((_0).shape[0])):
@@ -20914,6 +21922,43 @@ def __mk_mosek_fusion_ModelConstraint():
     return self._domainToString_JLmosek_4fusion_4Utils_4StringBuffer_2(numpy.int64(__0),_1)
   def _domainToString_JLmosek_4fusion_4Utils_4StringBuffer_2(self,_0,_1):
    pass
+  def _flush_1cache__3I_3J(self,_0,_1):
+   assert _0 is None or isinstance(_0,numpy.ndarray)
+   assert _1 is None or isinstance(_1,numpy.ndarray)
+   _2=numpy.int32(self._cache.numUnsorted())
+   if (_2==0):
+    return None
+   _3=numpy.zeros((_2,), dtype=numpy.dtype(numpy.int32))
+   _4=numpy.zeros((_2,), dtype=numpy.dtype(numpy.int32))
+   _5=numpy.zeros((_2,), dtype=numpy.dtype(numpy.float64))
+   _6=self._cache.flush(_3,_4,_5,None)
+   _3 = _3[0:_6]
+   _4 = _4[0:_6]
+   _5 = _5[0:_6]
+   _7=(self._cache.nrows)
+   _8=numpy.searchsorted((self._cache.subi)[0:(self._cache.nnz)],numpy.arange(0,(_7 + 1)))
+   _9=numpy.diff(_8)
+   _10=numpy.bincount(_3,minlength=_7)
+   _11=((_10 > 0) & ((2 * _10) >= _9))
+   if (_0 is not None):
+    _11 &= numpy.logical_not(numpy.isin(self._nativeindexes[0:_7],_0))
+   _12=numpy.flatnonzero(_11)
+   if (int((_12).shape[0]) > 0):
+    _13=numpy.zeros(((int((_12).shape[0]) + 1),), dtype=numpy.dtype(numpy.int64))
+    numpy.cumsum(_9[_12],out=_13[1:])
+    _14=(numpy.arange(0,_13[-1]) + numpy.repeat((_8[_12] - _13[0:-1]),_9[_12]))
+    self._model._task_1putarowlist__3I_3J_3I_3D(self._nativeindexes[_12],_13,(self._cache.subj)[_14],(self._cache.cof)[_14])
+    _1[1] += int((_12).shape[0])
+    _1[2] += _13[-1]
+    _15=numpy.logical_not(_11[_3])
+    _3 = _3[_15]
+    _4 = _4[_15]
+    _5 = _5[_15]
+   _16=int((_3).shape[0])
+   if (_16 > 0):
+    self._model._task_1putaijlist__3I_3I_3DJ(self._nativeindexes[_3],_4,_5,numpy.int64(_16))
+    _1[0] += _16
+   return ((self._nativeindexes[_3],_4,_5))
   def _add_1l_alt__3J_3J_3I_3I_3I_3D_3DJII(self,_t__0,_t__1,_t__2,_t__3,_t__4,_t__5,_t__6,_t__7,_t__8,_t__9):
    _0=numpy.array(_t__0,dtype=numpy.dtype(numpy.int64))
    _1=numpy.array(_t__1,dtype=numpy.dtype(numpy.int64))
@@ -21003,73 +22048,18 @@ def __mk_mosek_fusion_ModelConstraint():
       _22 += 1
      else:
       _17[(_23 + 1)] = _17[_23]
+    if ((_14 > 0) and (self._cache.numUnsorted()==0)):
+     self._model._markDirty_Lmosek_4fusion_4ModelConstraint_2(self)
     self._cache.add(_17,_18,_19,_20)
-    _26=(self._cache.nrows)
-    _27=numpy.int32(self._cache.numUnsorted())
-    _28=numpy.zeros((_27,), dtype=numpy.dtype(numpy.int32))
-    _29=numpy.zeros((_27,), dtype=numpy.dtype(numpy.int32))
-    _30=numpy.zeros((_27,), dtype=numpy.dtype(numpy.float64))
-    _31=self._cache.flush(_28,_29,_30,None)
-    for _32 in range(0,_31):
-     _28[_32] = self._nativeindexes[_28[_32]]
-    self._model._task_1putaijlist__3I_3I_3DJ(_28,_29,_30,_31)
     if (_6 is not None):
      self._add_1fx__3J_3DJII(_0,(self._cache.bfix),_7,_8,_9)
    if (_15 > 0):
-    _33=0
-    _34=_1[_8]
-    for _35 in range(0,_9):
-     if (_2[_11[(_1[_8] - _34)]] < 0):
-      _36=1
-      for _37 in range(((_1[(_8 + _35)] - _34) + 1),(_1[((_8 + _35) + 1)] - _34)):
-       if ((_2[_11[_37]] < 0) and (_2[_11[_37]]!=_2[_11[(_37 - 1)]])):
-        _36 += 1
-      _33 += _36
-    _38=numpy.zeros((_33,), dtype=numpy.dtype(numpy.int32))
-    _39=numpy.zeros((_33,), dtype=numpy.dtype(numpy.int32))
-    _40=numpy.zeros((_33,), dtype=numpy.dtype(numpy.int32))
-    _41=numpy.zeros((_33,), dtype=numpy.dtype(numpy.int32))
-    _42=_1[_8]
-    _43=0
-    for _44 in range(0,_9):
-     _45=(_1[(_8 + _44)] - _42)
-     _46=(_1[((_8 + _44) + 1)] - _42)
-     if (_2[_11[_45]] < 0):
-      while ((_45 < _46) and (_2[_11[_45]] < 0)):
-       _39[_43] = numpy.int32(_0[(_8 + _44)])
-       _38[_43] = self._nativeindexes[numpy.int32(_0[(_8 + _44)])]
-       _40[_43] = ((- _2[_11[_45]]) - 1)
-       _47=_45
-       while ((_45 < _46) and ((_2[_11[_45]] < 0) and (_2[_11[_45]]==_2[_11[_47]]))):
-        _45 += 1
-       _51=1
-       if ((_45 - _47) > 1):
-        mosek.fusion.CommonTools._argQsort__3J_3I_3IJJ(_11,_3,_4,numpy.int64(_47),numpy.int64((_45 - _47)))
-        _52=1
-        for _53 in range(1,(_45 - _47)):
-         if ((_3[_11[((_45 + _53) - 1)]]!=_3[_11[(_45 + _53)]]) or (_4[_11[((_45 + _53) - 1)]]!=_4[_11[(_45 + _53)]])):
-          _52 += 1
-        _48 = numpy.zeros((_52,), dtype=numpy.dtype(numpy.int32))
-        _49 = numpy.zeros((_52,), dtype=numpy.dtype(numpy.int32))
-        _50 = numpy.zeros((_52,), dtype=numpy.dtype(numpy.float64))
-        _48[0] = _3[_11[0]]
-        _49[0] = _4[_11[0]]
-        _50[0] = _5[_11[0]]
-        _54=0
-        for _55 in range(1,(_45 - _47)):
-         if ((_48[_11[((_45 + _55) - 1)]]!=_48[_11[(_45 + _55)]]) or (_49[_11[((_45 + _55) - 1)]]!=_49[_11[(_45 + _55)]])):
-          _54 += 1
-          _48[_54] = _3[_11[(_45 + _55)]]
-          _49[_54] = _4[_11[(_45 + _55)]]
-         _50[_54] = (_50[_54] + _5[_11[(_45 + _55)]])
-       else:
-        _48 = numpy.array([_3[_11[_47]]], dtype=numpy.dtype(numpy.int32))
-        _49 = numpy.array([_4[_11[_47]]], dtype=numpy.dtype(numpy.int32))
-        _50 = numpy.array([_5[_11[_47]]], dtype=numpy.dtype(numpy.float64))
-       _56=self._model._task_1append_1barmatrix_I_3I_3I_3D(self._model._task_1barvardim_I(_40[_43]),_48,_49,_50)
-       _41[_43] = _56
-       _43 += 1
-    self._cache._add_1bar__3I_3I_3I(_39,_40,_41)
+    _33=numpy.arange(_1[_8],_1[(_8 + _9)])
+    _34=numpy.repeat(_0[_8:(_8 + _9)],numpy.diff(_1[_8:((_8 + _9) + 1)]))
+    _35=(_2[_33] < 0)
+    _33=_33[_35]
+    _36,_37,_38=self._model._append_1barmatrices__3J_3I_3I_3I_3D(_34[_35],((- _2[_33]) - 1),_3[_33],_4[_33],_5[_33])
+    self._cache._add_1bar__3I_3I_3I(_36.astype(numpy.dtype(numpy.int32)),_37,_38)
   def _add_1fx_alt__3J_3DJII(self,_t__0,_t__1,_t__2,_t__3,_t__4):
    _0=numpy.array(_t__0,dtype=numpy.dtype(numpy.int64))
    _1=numpy.array(_t__1,dtype=numpy.dtype(numpy.float64))
@@ -21302,6 +22292,7 @@ def __mk_mosek_fusion_LinearPSDConstraint():
    if ((int((_0).shape[0]) + _1) > int((_2).shape[0])):
     raise mosek_fusion_LengthError._ctor_S("Result array is too small to hold the result")
    _5=mosek.fusion.Utils.StringBuffer()
+   self._model._flushConstraints_()
    _6=self._cache._order_1barentries_()
    _7=0
    for _8 in range(0,int((_0).shape[0])):
@@ -21428,11 +22419,11 @@ def __mk_mosek_fusion_LinearPSDConstraint():
     _6 *= _1[_7]
    _8=self._model._getSolution_1bars_Emosek_4fusion_4SolutionType_2(mosek.fusion.SolutionType.Default)
    _9=self.__conesize
+   _13=_5._materialize_()
    for _10 in range(0,_6):
-    _11=((_5.get() // _9) + self.__coneidx)
-    _12=(_5.get() % _9)
+    _11=((_13[_10] // _9) + self.__coneidx)
+    _12=(_13[_10] % _9)
     _4[_10] = _8[self.__coneidx][_12]
-    _5.inc()
   def _dual_1values_alt__3JI_3D(self,_t__0,_t__1,_t__2):
    _0=numpy.array(_t__0,dtype=numpy.dtype(numpy.int64))
    _1=numpy.int32(_t__1)
@@ -21486,11 +22477,11 @@ def __mk_mosek_fusion_LinearPSDConstraint():
     _6 *= _1[_7]
    _8=self._model._getSolution_1barx_Emosek_4fusion_4SolutionType_2(mosek.fusion.SolutionType.Default)
    _9=self.__conesize
+   _13=_5._materialize_()
    for _10 in range(0,_6):
-    _11=((_5.get() // _9) + self.__coneidx)
-    _12=(_5.get() % _9)
+    _11=((_13[_10] // _9) + self.__coneidx)
+    _12=(_13[_10] % _9)
     _4[_10] = _8[self.__coneidx][_12]
-    _5.inc()
   def _level_1values_alt__3JI_3D(self,_t__0,_t__1,_t__2):
    _0=numpy.array(_t__0,dtype=numpy.dtype(numpy.int64))
    _1=numpy.int32(_t__1)
@@ -21666,6 +22657,7 @@ def __mk_mosek_fusion_PSDConstraint():
    if ((int((_0).shape[0]) + _1) > int((_2).shape[0])):
     raise mosek_fusion_LengthError._ctor_S("Result array is too small to hold the result")
    _5=mosek.fusion.Utils.StringBuffer()
+   self._model._flushConstraints_()
    _6=self._cache._order_1barentries_()
    _7=0
    for _8 in range(0,int((_0).shape[0])):
@@ -22033,9 +23025,9 @@ def __mk_mosek_fusion_RangedConstraint():
    _7=numpy.zeros((_4,), dtype=numpy.dtype(numpy.int32))
    for _8 in range(0,_4):
     _7[_8] = self._nativeindexes[(_0[(_3 + _8)] - _2)]
-   for _9 in range(0,int((_5).shape[0])):
-    _5[_9] = (self.__dom._get_1lb_1item_J((_0[(_3 + _9)] - _2)) - _1[(_0[(_3 + _9)] - _2)])
-    _6[_9] = (self.__dom._get_1ub_1item_J((_0[(_3 + _9)] - _2)) - _1[(_0[(_3 + _9)] - _2)])
+   _9=(_0[_3:(_3 + int((_5).shape[0]))] - _2)
+   _5[:] = (self.__dom._get_1lb__3J(_9) - _1[_9])
+   _6[:] = (self.__dom._get_1ub__3J(_9) - _1[_9])
    self._model._task_1con_1putboundlist_1ra__3I_3D_3D(_7,_5,_6)
   def _dual_1u_alt_J_3I_3JI_3D(self,_t__0,_t__1,_t__2,_t__3,_t__4):
    _0=numpy.int64(_t__0)
@@ -22068,16 +23060,16 @@ def __mk_mosek_fusion_RangedConstraint():
    for _9 in range(0,_6):
     _5 = (_5 * _1[_9])
    if (self._nativeindexes is not None):
-    for _10 in range(0,_5):
-     _4[(_10 + _3)] = (_8[self._nativeindexes[_7.get()]] + (self._cache.bfix)[_7.get()])
-     _7.inc()
+    _12=_7._materialize_()
+    _10=numpy.arange(0,_5)
+    _4[(_10 + _3)] = (_8[self._nativeindexes[_12]] + (self._cache.bfix)[_12])
    else:
+    _13=_7._materialize_()
     for _11 in range(0,_5):
-     if self.__idxmap._hasItem_J(_7.get()):
-      _4[_11] = (_8[self.__idxmap._getItem_J(_7.get())] + (self._cache.bfix)[_7.get()])
+     if self.__idxmap._hasItem_J(_13[_11]):
+      _4[_11] = (_8[self.__idxmap._getItem_J(_13[_11])] + (self._cache.bfix)[_13[_11]])
      else:
-      _4[_11] = self.__dom._get_1ub_1item_J(_7.get())
-     _7.inc()
+      _4[_11] = self.__dom._get_1ub_1item_J(_13[_11])
   def _dual_1u_alt__3JI_3D(self,_t__0,_t__1,_t__2):
    _0=numpy.array(_t__0,dtype=numpy.dtype(numpy.int64))
    _1=numpy.int32(_t__1)
@@ -22136,16 +23128,16 @@ def __mk_mosek_fusion_RangedConstraint():
    for _9 in range(0,_6):
     _5 = (_5 * _1[_9])
    if (self._nativeindexes is not None):
-    for _10 in range(0,_5):
-     _4[(_10 + _3)] = (_8[self._nativeindexes[_7.get()]] + (self._cache.bfix)[_7.get()])
-     _7.inc()
+    _12=_7._materialize_()
+    _10=numpy.arange(0,_5)
+    _4[(_10 + _3)] = (_8[self._nativeindexes[_12]] + (self._cache.bfix)[_12])
    else:
+    _13=_7._materialize_()
     for _11 in range(0,_5):
-     if self.__idxmap._hasItem_J(_7.get()):
-      _4[_11] = (_8[self.__idxmap._getItem_J(_7.get())] + (self._cache.bfix)[_7.get()])
+     if self.__idxmap._hasItem_J(_13[_11]):
+      _4[_11] = (_8[self.__idxmap._getItem_J(_13[_11])] + (self._cache.bfix)[_13[_11]])
      else:
-      _4[_11] = self.__dom._get_1ub_1item_J(_7.get())
-     _7.inc()
+      _4[_11] = self.__dom._get_1ub_1item_J(_13[_11])
   def _dual_1l_alt__3JI_3D(self,_t__0,_t__1,_t__2):
    _0=numpy.array(_t__0,dtype=numpy.dtype(numpy.int64))
    _1=numpy.int32(_t__1)
@@ -22204,16 +23196,16 @@ def __mk_mosek_fusion_RangedConstraint():
    for _9 in range(0,_6):
     _5 = (_5 * _1[_9])
    if (self._nativeindexes is not None):
-    for _10 in range(0,_5):
-     _4[(_10 + _3)] = (_8[self._nativeindexes[_7.get()]] + (self._cache.bfix)[_7.get()])
-     _7.inc()
+    _12=_7._materialize_()
+    _10=numpy.arange(0,_5)
+    _4[(_10 + _3)] = (_8[self._nativeindexes[_12]] + (self._cache.bfix)[_12])
    else:
+    _13=_7._materialize_()
     for _11 in range(0,_5):
-     if self.__idxmap._hasItem_J(_7.get()):
-      _4[_11] = (_8[self.__idxmap._getItem_J(_7.get())] + (self._cache.bfix)[_7.get()])
+     if self.__idxmap._hasItem_J(_13[_11]):
+      _4[_11] = (_8[self.__idxmap._getItem_J(_13[_11])] + (self._cache.bfix)[_13[_11]])
      else:
-      _4[_11] = self.__dom._get_1ub_1item_J(_7.get())
-     _7.inc()
+      _4[_11] = self.__dom._get_1ub_1item_J(_13[_11])
   def _dual_1values_alt__3JI_3D(self,_t__0,_t__1,_t__2):
    _0=numpy.array(_t__0,dtype=numpy.dtype(numpy.int64))
    _1=numpy.int32(_t__1)
@@ -22272,16 +23264,16 @@ def __mk_mosek_fusion_RangedConstraint():
    for _9 in range(0,_6):
     _5 = (_5 * _1[_9])
    if (self._nativeindexes is not None):
-    for _10 in range(0,_5):
-     _4[(_10 + _3)] = (_8[self._nativeindexes[_7.get()]] + (self._cache.bfix)[_7.get()])
-     _7.inc()
+    _12=_7._materialize_()
+    _10=numpy.arange(0,_5)
+    _4[(_10 + _3)] = (_8[self._nativeindexes[_12]] + (self._cache.bfix)[_12])
    else:
+    _13=_7._materialize_()
     for _11 in range(0,_5):
-     if self.__idxmap._hasItem_J(_7.get()):
-      _4[_11] = (_8[self.__idxmap._getItem_J(_7.get())] + (self._cache.bfix)[_7.get()])
+     if self.__idxmap._hasItem_J(_13[_11]):
+      _4[_11] = (_8[self.__idxmap._getItem_J(_13[_11])] + (self._cache.bfix)[_13[_11]])
      else:
-      _4[_11] = self.__dom._get_1ub_1item_J(_7.get())
-     _7.inc()
+      _4[_11] = self.__dom._get_1ub_1item_J(_13[_11])
   def _level_1values_alt__3JI_3D(self,_t__0,_t__1,_t__2):
    _0=numpy.array(_t__0,dtype=numpy.dtype(numpy.int64))
    _1=numpy.int32(_t__1)
@@ -22364,10 +23356,9 @@ def __mk_mosek_fusion_RangedConstraint():
     _11=numpy.zeros((_10,), dtype=numpy.dtype(numpy.float64))
     _12=numpy.zeros((_10,), dtype=numpy.dtype(numpy.float64))
     _13=numpy.zeros((_9,), dtype=numpy.dtype(numpy.int32))
-    for _14 in range(0,_9):
-     _11[_14] = (self.__dom._get_1lb_1item_J(_0[_14]) - (self._cache.bfix)[_14])
-     _12[_14] = (self.__dom._get_1ub_1item_J(_0[_14]) - (self._cache.bfix)[_14])
-     _13[_14] = self._nativeindexes[_0[_14]]
+    _11[0:_9] = (self.__dom._get_1lb__3J(_0[0:_9]) - (self._cache.bfix)[0:_9])
+    _12[0:_9] = (self.__dom._get_1ub__3J(_0[0:_9]) - (self._cache.bfix)[0:_9])
+    _13[:] = self._nativeindexes[_0[0:_9]]
     self._model._task_1con_1putboundlist_1ra__3I_3D_3D(_13,_11,_12)
   def _domainToString_alt_JLmosek_4fusion_4Utils_4StringBuffer_2(self,_t__0,_t__1):
     return self._domainToString_JLmosek_4fusion_4Utils_4StringBuffer_2(numpy.int64(__0),_1)
@@ -22513,10 +23504,8 @@ def __mk_mosek_fusion_ConicConstraint():
   def _flushNames_(self,):
    mosek_fusion_ModelConstraint._flushNames_(self)
    if ((not self.__names_flushed) and (int(len(self._name)) > 0)):
-    for _0 in range(self.__first_slack,self.__last_slack):
-     self._model._task_1var_1name_IS(_0,("" if ((int(len(self._name))==0) ) else mosek.fusion.Utils.StringBuffer()._a_S(self._name)._a_S("[")._a_S(self._shape_p.getname((_0 - self.__first_slack)))._a_S("].coneslack")._toString_()))
-    for _1 in range(self.__first,self.__last):
-     self._model._task_1cone_1name_IS(_1,("" if ((int(len(self._name))==0) ) else mosek.fusion.Utils.StringBuffer()._a_S(self._name)._a_S("[")._a_I((_1 - self.__first))._a_S("]")._toString_()))
+    self._model._task_1var_1names__3J_3S(numpy.arange(self.__first_slack,self.__last_slack,dtype=numpy.dtype(numpy.int64)),self._shape_p._getnames_S_3JS(self._name,numpy.arange(0,(self.__last_slack - self.__first_slack),dtype=numpy.dtype(numpy.int64)),".coneslack"))
+    self._model._task_1cone_1names__3J_3S(numpy.arange(self.__first,self.__last,dtype=numpy.dtype(numpy.int64)),[(((self._name + "[") + str(_1)) + "]") for _1 in range(0,(self.__last - self.__first))])
     self.__names_flushed = True
   @staticmethod
   def _match_toString_(*args):
@@ -22576,9 +23565,9 @@ def __mk_mosek_fusion_ConicConstraint():
    _8=self._model._getSolution_1snx_Emosek_4fusion_4SolutionType_2(mosek.fusion.SolutionType.Default)
    for _9 in range(0,_6):
     _5 = (_5 * _1[_9])
-   for _10 in range(0,_5):
-    _4[(_10 + _3)] = _8[(numpy.int64(self.__first_slack) + _7.get())]
-    _7.inc()
+   _11=_7._materialize_()
+   _10=numpy.arange(0,_5)
+   _4[(_10 + _3)] = _8[(numpy.int64(self.__first_slack) + _11)]
   def _dual_1values_alt__3JI_3D(self,_t__0,_t__1,_t__2):
    _0=numpy.array(_t__0,dtype=numpy.dtype(numpy.int64))
    _1=numpy.int32(_t__1)
@@ -22630,9 +23619,9 @@ def __mk_mosek_fusion_ConicConstraint():
    _9=self._model._getSolution_1xc_Emosek_4fusion_4SolutionType_2(mosek.fusion.SolutionType.Default)
    for _10 in range(0,_6):
     _5 = (_5 * _1[_10])
-   for _11 in range(0,_5):
-    _4[(_11 + _3)] = (_8[(self.__first_slack + _7.get())] + _9[self._nativeindexes[_7.get()]])
-    _7.inc()
+   _12=_7._materialize_()
+   _11=numpy.arange(0,_5)
+   _4[(_11 + _3)] = (_8[(self.__first_slack + _12)] + _9[self._nativeindexes[_12]])
   def _level_1values_alt__3JI_3D(self,_t__0,_t__1,_t__2):
    _0=numpy.array(_t__0,dtype=numpy.dtype(numpy.int64))
    _1=numpy.int32(_t__1)
@@ -22829,8 +23818,9 @@ def __mk_mosek_fusion_LinearConstraint():
     pass
    else:
     _5 = numpy.zeros((_4,), dtype=numpy.dtype(numpy.float64))
-    _6=numpy.array([self._nativeindexes[(_0[(_3 + _7)] - _2)] for _7 in range(0,_4)], dtype=numpy.dtype(numpy.int32))
-    _5 = numpy.array([(self.__dom._get_1rhs_1item_J((_0[(_3 + _8)] - _2)) - _1[(_0[(_3 + _8)] - _2)]) for _8 in range(0,_4)], dtype=numpy.dtype(numpy.float64))
+    _8=(_0[_3:(_3 + _4)] - _2)
+    _6=numpy.array(self._nativeindexes[_8],dtype=numpy.dtype(numpy.int32))
+    _5 = (self.__dom._get_1rhs__3J(_8) - _1[_8])
     if ((self.__dom._key)==mosek.fusion.RelationKey.EqualsTo):
      self._model._task_1con_1putboundlist_1fx__3I_3D(_6,_5)
     elif ((self.__dom._key)==mosek.fusion.RelationKey.LessThan):
@@ -22868,16 +23858,16 @@ def __mk_mosek_fusion_LinearConstraint():
    for _9 in range(0,_6):
     _5 = (_5 * _1[_9])
    if (self._nativeindexes is not None):
-    for _10 in range(0,_5):
-     _4[(_10 + _3)] = _8[self._nativeindexes[_7.get()]]
-     _7.inc()
+    _12=_7._materialize_()
+    _10=numpy.arange(0,_5)
+    _4[(_10 + _3)] = _8[self._nativeindexes[_12]]
    else:
+    _13=_7._materialize_()
     for _11 in range(0,_5):
-     if self.__idxmap._hasItem_J(_7.get()):
-      _4[_11] = _8[self.__idxmap._getItem_J(_7.get())]
+     if self.__idxmap._hasItem_J(_13[_11]):
+      _4[_11] = _8[self.__idxmap._getItem_J(_13[_11])]
      else:
       _4[_11] = 0.0
-     _7.inc()
   def _dual_1values_alt__3JI_3D(self,_t__0,_t__1,_t__2):
    _0=numpy.array(_t__0,dtype=numpy.dtype(numpy.int64))
    _1=numpy.int32(_t__1)
@@ -22936,16 +23926,16 @@ def __mk_mosek_fusion_LinearConstraint():
    for _9 in range(0,_6):
     _5 = (_5 * _1[_9])
    if (self._nativeindexes is not None):
-    for _10 in range(0,_5):
-     _4[(_10 + _3)] = _8[self._nativeindexes[_7.get()]]
-     _7.inc()
+    _12=_7._materialize_()
+    _10=numpy.arange(0,_5)
+    _4[(_10 + _3)] = _8[self._nativeindexes[_12]]
    else:
+    _13=_7._materialize_()
     for _11 in range(0,_5):
-     if self.__idxmap._hasItem_J(_7.get()):
-      _4[_11] = _8[self.__idxmap._getItem_J(_7.get())]
+     if self.__idxmap._hasItem_J(_13[_11]):
+      _4[_11] = _8[self.__idxmap._getItem_J(_13[_11])]
      else:
       _4[_11] = 0.0
-     _7.inc()
   def _level_1values_alt__3JI_3D(self,_t__0,_t__1,_t__2):
    _0=numpy.array(_t__0,dtype=numpy.dtype(numpy.int64))
    _1=numpy.int32(_t__1)
@@ -23004,6 +23994,14 @@ def __mk_mosek_fusion_Set():
       return self._idxtokey_alt_J(*args)
     else:
       raise ValueError('Invalid argument list idxtokey('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Set.idxtokey(int64)')
+  def idxtokeys(self,*args):
+    if False: pass
+    elif mosek_fusion_Set._match_idxtokeys__3J(*args): # []int64
+      return self._idxtokeys__3J(*args)
+    elif mosek_fusion_Set._match_alt_idxtokeys__3J(*args): # []int64
+      return self._idxtokeys_alt__3J(*args)
+    else:
+      raise ValueError('Invalid argument list idxtokeys('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Set.idxtokeys(array(int64,ndim=1))')
   def dim(self,*args):
     if False: pass
     elif mosek_fusion_Set._match_dim_I(*args): # int32
@@ -23264,6 +24262,29 @@ def __mk_mosek_fusion_Set():
     _2 = (_2 % self.stride(_3))
    return (_1)
   @staticmethod
+  def _match_idxtokeys__3J(*args):
+    if len(args) != 1: return False
+    _0, = args
+    return (__arg_match__3J__(_0))
+  @staticmethod
+  def _match_alt_idxtokeys__3J(*args):
+    if len(args) != 1: return False
+    _0, = args
+    return (__arg_alt_match__3J__(_0))
+  def _idxtokeys_alt__3J(self,_t__0):
+   _0=numpy.array(_t__0,dtype=numpy.dtype(numpy.int64))
+   return self._idxtokeys__3J(_0)
+  # Keys of all the linear indexes in _0, one row per index.
+  def _idxtokeys__3J(self,_0):
+   assert _0 is None or isinstance(_0,numpy.ndarray)
+   _1=numpy.zeros((int((_0).shape[0]),self._nd_p), dtype=numpy.dtype(numpy.int32))
+   _2=numpy.array(_0,dtype=numpy.dtype(numpy.int64))
+   for _3 in range(0,self._nd_p):
+    _4=self._stride_I(_3)
+    _1[:,_3] = (_2 // _4)
+    _2 = (_2 % _4)
+   return (_1)
+  @staticmethod
   def _match_getname__3I(*args):
     if len(args) != 1: return False
     _0, = args
@@ -23298,6 +24319,14 @@ def __mk_mosek_fusion_Set():
     return self._getname_J(numpy.int64(__0))
   def _getname_J(self,_0):
    pass
+  # getname() of each linear index in _0.
+  def _getnames__3J(self,_0):
+   return ([self._getname_J(_1) for _1 in _0])
+  # The element names _0[key]_2 for the linear indexes _1.
+  def _getnames_S_3JS(self,_0,_1,_2):
+   _3=(_0 + "[")
+   _4=("]" + _2)
+   return ([((_3 + _5) + _4) for _5 in self._getnames__3J(_1)])
   @staticmethod
   def _match_stride_I(*args):
     if len(args) != 1: return False
@@ -23758,6 +24787,8 @@ def __mk_mosek_fusion_IntSet():
     return self._getname_J(numpy.int64(__0))
   def _getname_J(self,_0):
    return (mosek.fusion.Utils.Tools._stringvalue_J(_0))
+  def _getnames__3J(self,_0):
+   return ([str(_1) for _1 in numpy.asarray(_0).tolist()])
   @staticmethod
   def _match_slice__3I_3I(*args):
     if len(args) != 2: return False
@@ -23970,6 +25001,8 @@ def __mk_mosek_fusion_StringSet():
     return self._getname_J(numpy.int64(__0))
   def _getname_J(self,_0):
    return (self.__keys[_0])
+  def _getnames__3J(self,_0):
+   return (self.__keys[_0].tolist())
   def _slice_1_alt__3I_3I(self,_t__0,_t__1):
    _0=numpy.array(_t__0,dtype=numpy.dtype(numpy.int32))
    _1=numpy.array(_t__1,dtype=numpy.dtype(numpy.int32))
@@ -24288,6 +25321,11 @@ def __mk_mosek_fusion_NDSet():
     return (_4._toString_())
    else:
     return (self.getname(self._idxtokey_J(_0)))
+  def _getnames__3J(self,_0):
+   if (self.nd==1):
+    return ([str(_1) for _1 in numpy.asarray(_0).tolist()])
+   else:
+    return ([",".join([str(_2) for _2 in _1]) for _1 in self._idxtokeys__3J(_0).tolist()])
   @staticmethod
   def _match_dim_I(*args):
     if len(args) != 1: return False
@@ -24748,7 +25786,7 @@ del __mk_mosek_fusion_PSDDomain
 #BEFORE CLASS
 def __mk_mosek_fusion_RangeDomain():
  class RangeDomain(object):
-  __slots__ = ['_sparse_flag','_cardinal_flag','_RangeDomain__ub','_RangeDomain__lb','_RangeDomain__idxmap','_shape']
+  __slots__ = ['_sparse_flag','_cardinal_flag','_RangeDomain__ub','_RangeDomain__lb','_RangeDomain__idxmap','_shape','_params']
   def symmetric(self,*args):
     if False: pass
     elif mosek_fusion_RangeDomain._match_symmetric_(*args): # 
@@ -24804,13 +25842,12 @@ def __mk_mosek_fusion_RangeDomain():
    else:
     self._shape = mosek.fusion.Set._make__3I(dims)
    if (inst is not None):
-    self.__idxmap = mosek.fusion.Utils.IntMap()
-    for _0 in range(0,int((lb_).shape[0])):
-     self.__idxmap._setItem_JI(inst[_0],_0)
+    self.__idxmap = mosek.fusion.Utils.SortedIntMap(inst[0:int((lb_).shape[0])],numpy.arange(0,int((lb_).shape[0])))
    else:
     self.__idxmap = None
    self.__ub = ub_
    self.__lb = lb_
+   self._params = None
   @staticmethod
   def _ctor_Lmosek_4fusion_4RangeDomain_2(other):
     o = RangeDomain.__new__(RangeDomain)
@@ -24836,6 +25873,7 @@ def __mk_mosek_fusion_RangeDomain():
    self.__idxmap = (other.__idxmap)
    self.__ub = (other.__ub)
    self.__lb = (other.__lb)
+   self._params = (other._params)
   @staticmethod
   def _match_symmetric_(*args):
     if len(args) != 0: return False
@@ -24847,6 +25885,8 @@ def __mk_mosek_fusion_RangeDomain():
   def _symmetric_alt_(self,):
     return self._symmetric_()
   def _symmetric_(self,):
+   if (self._params is not None):
+    raise mosek_fusion_DomainError._ctor_S("Symmetric domains cannot depend on parameters")
    return (mosek_fusion_SymmetricRangeDomain._ctor_Lmosek_4fusion_4RangeDomain_2(self))
   @staticmethod
   def _match_sparse_(*args):
@@ -24920,6 +25960,28 @@ def __mk_mosek_fusion_RangeDomain():
      return numpy.float64(self.__lb[_0])
     else:
      return numpy.float64(0.0)
+  # Bulk versions of get_lb_item/get_ub_item: the bounds of the items
+  # 0,...,n-1, or of an array of item indexes, as float64 arrays.
+  def _get_1lb_J(self,_0):
+   return (self._get_1lb__3J(numpy.arange(0,_0,dtype=numpy.dtype(numpy.int64))))
+  def _get_1ub_J(self,_0):
+   return (self._get_1ub__3J(numpy.arange(0,_0,dtype=numpy.dtype(numpy.int64))))
+  def _get_1lb__3J(self,_0):
+   return (self.__bound_1items__3D_3J(self.__lb,_0))
+  def _get_1ub__3J(self,_0):
+   return (self.__bound_1items__3D_3J(self.__ub,_0))
+  def __bound_1items__3D_3J(self,_0,_1):
+   if (self.__idxmap is not None):
+    _2=numpy.zeros((int((_1).shape[0]),), dtype=numpy.dtype(numpy.float64))
+    if (_0 is not None):
+     _3=self.__idxmap._getItems__3J(_1)
+     _4=(_3 >= 0)
+     _2[_4] = _0[_3[_4]]
+    return (_2)
+   elif (int((_0).shape[0])==1):
+    return (numpy.full((int((_1).shape[0]),),_0[0],dtype=numpy.dtype(numpy.float64)))
+   else:
+    return (numpy.array(_0[_1],dtype=numpy.dtype(numpy.float64)))
  return RangeDomain
 mosek_fusion_RangeDomain=__mk_mosek_fusion_RangeDomain()
 del __mk_mosek_fusion_RangeDomain
@@ -25039,13 +26101,17 @@ def __mk_mosek_fusion_SymmetricLinearDomain():
     return self._get_1rhs_1item_J(numpy.int64(__0))
   def _get_1rhs_1item_J(self,_0):
    return numpy.float64(self._dom._get_1rhs_1item_J(_0))
+  def _get_1rhs_J(self,_0):
+   return (self._dom._get_1rhs_J(_0))
+  def _get_1rhs__3J(self,_0):
+   return (self._dom._get_1rhs__3J(_0))
  return SymmetricLinearDomain
 mosek_fusion_SymmetricLinearDomain=__mk_mosek_fusion_SymmetricLinearDomain()
 del __mk_mosek_fusion_SymmetricLinearDomain
 #BEFORE CLASS
 def __mk_mosek_fusion_LinearDomain():
  class LinearDomain(object):
-  __slots__ = ['_sparse_flag','_cardinal_flag','_key','_LinearDomain__bnd','_LinearDomain__inst','_shape']
+  __slots__ = ['_sparse_flag','_cardinal_flag','_key','_LinearDomain__bnd','_LinearDomain__inst','_shape','_params']
   def sparse(self,*args):
     if False: pass
     elif mosek_fusion_LinearDomain._match_sparse_(*args): # 
@@ -25097,13 +26163,12 @@ def __mk_mosek_fusion_LinearDomain():
    self._key = k
    self.__bnd = rhs
    if (sp is not None):
-    self.__inst = mosek.fusion.Utils.IntMap()
-    for _0 in range(0,int((sp).shape[0])):
-     self.__inst._setItem_JI(sp[_0],_0)
+    self.__inst = mosek.fusion.Utils.SortedIntMap(sp,numpy.arange(0,int((sp).shape[0])))
    else:
     self.__inst = None
    self._cardinal_flag = False
    self._sparse_flag = False
+   self._params = None
   @staticmethod
   def _ctor_Lmosek_4fusion_4LinearDomain_2(other):
     o = LinearDomain.__new__(LinearDomain)
@@ -25129,6 +26194,7 @@ def __mk_mosek_fusion_LinearDomain():
    self._key = (other._key)
    self._cardinal_flag = (other._cardinal_flag)
    self._sparse_flag = (other._sparse_flag)
+   self._params = (other._params)
   @staticmethod
   def _match_symmetric_(*args):
     if len(args) != 0: return False
@@ -25140,6 +26206,8 @@ def __mk_mosek_fusion_LinearDomain():
   def _symmetric_alt_(self,):
     return self._symmetric_()
   def _symmetric_(self,):
+   if (self._params is not None):
+    raise mosek_fusion_DomainError._ctor_S("Symmetric domains cannot depend on parameters")
    return (mosek_fusion_SymmetricLinearDomain._ctor_Lmosek_4fusion_4LinearDomain_2(self))
   @staticmethod
   def _match_sparse_(*args):
@@ -25199,6 +26267,21 @@ def __mk_mosek_fusion_LinearDomain():
      return numpy.float64((self.__bnd[0] if ((self.__bnd is not None) ) else 0.0))
     else:
      return numpy.float64((self.__bnd[_0] if ((self.__bnd is not None) ) else 0.0))
+  # Bulk versions of get_rhs_item: the right-hand sides of the items
+  # 0,...,n-1, or of an array of item indexes, as a float64 array.
+  def _get_1rhs_J(self,_0):
+   return (self._get_1rhs__3J(numpy.arange(0,_0,dtype=numpy.dtype(numpy.int64))))
+  def _get_1rhs__3J(self,_0):
+   if (self.__inst is not None):
+    _1=numpy.zeros((int((_0).shape[0]),), dtype=numpy.dtype(numpy.float64))
+    _2=self.__inst._getItems__3J(_0)
+    _3=(_2 >= 0)
+    _1[_3] = self.__bnd[_2[_3]]
+    return (_1)
+   elif self.__scalable_():
+    return (numpy.full((int((_0).shape[0]),),(self.__bnd[0] if ((self.__bnd is not None) ) else 0.0),dtype=numpy.dtype(numpy.float64)))
+   else:
+    return (numpy.array(self.__bnd[_0],dtype=numpy.dtype(numpy.float64)))
   def __scalable_alt_(self,):
     return self.__scalable_()
   def __scalable_(self,):
@@ -25265,8 +26348,12 @@ def __mk_mosek_fusion_Domain():
       return mosek_fusion_Domain._equalsTo_DII(*args)
     elif mosek_fusion_Domain._match_alt_equalsTo_DII(*args): # double,int32,int32
       return mosek_fusion_Domain._equalsTo_alt_DII(*args)
+    elif mosek_fusion_Domain._match_equalsTo_Lmosek_4fusion_4Parameter_2(*args): # mosek.fusion.Parameter
+      return mosek_fusion_Domain._equalsTo_Lmosek_4fusion_4Parameter_2(*args)
+    elif mosek_fusion_Domain._match_alt_equalsTo_Lmosek_4fusion_4Parameter_2(*args): # mosek.fusion.Parameter
+      return mosek_fusion_Domain._equalsTo_alt_Lmosek_4fusion_4Parameter_2(*args)
     else:
-      raise ValueError('Invalid argument list equalsTo('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Domain.equalsTo(array(double,ndim=1))\n\tmosek.fusion.Domain.equalsTo(mosek.fusion.Matrix)\n\tmosek.fusion.Domain.equalsTo(array(double,ndim=2))\n\tmosek.fusion.Domain.equalsTo(double)\n\tmosek.fusion.Domain.equalsTo(double,array(int32,ndim=1))\n\tmosek.fusion.Domain.equalsTo(array(double,ndim=1),array(int32,ndim=1))\n\tmosek.fusion.Domain.equalsTo(double,int32)\n\tmosek.fusion.Domain.equalsTo(double,int32,int32)')
+      raise ValueError('Invalid argument list equalsTo('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Domain.equalsTo(array(double,ndim=1))\n\tmosek.fusion.Domain.equalsTo(mosek.fusion.Matrix)\n\tmosek.fusion.Domain.equalsTo(array(double,ndim=2))\n\tmosek.fusion.Domain.equalsTo(double)\n\tmosek.fusion.Domain.equalsTo(double,array(int32,ndim=1))\n\tmosek.fusion.Domain.equalsTo(array(double,ndim=1),array(int32,ndim=1))\n\tmosek.fusion.Domain.equalsTo(double,int32)\n\tmosek.fusion.Domain.equalsTo(double,int32,int32)\n\tmosek.fusion.Domain.equalsTo(mosek.fusion.Parameter)')
   @staticmethod
   def inQCone(*args):
     if False: pass
@@ -25336,8 +26423,12 @@ def __mk_mosek_fusion_Domain():
       return mosek_fusion_Domain._greaterThan_DII(*args)
     elif mosek_fusion_Domain._match_alt_greaterThan_DII(*args): # double,int32,int32
       return mosek_fusion_Domain._greaterThan_alt_DII(*args)
+    elif mosek_fusion_Domain._match_greaterThan_Lmosek_4fusion_4Parameter_2(*args): # mosek.fusion.Parameter
+      return mosek_fusion_Domain._greaterThan_Lmosek_4fusion_4Parameter_2(*args)
+    elif mosek_fusion_Domain._match_alt_greaterThan_Lmosek_4fusion_4Parameter_2(*args): # mosek.fusion.Parameter
+      return mosek_fusion_Domain._greaterThan_alt_Lmosek_4fusion_4Parameter_2(*args)
     else:
-      raise ValueError('Invalid argument list greaterThan('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Domain.greaterThan(array(double,ndim=1))\n\tmosek.fusion.Domain.greaterThan(mosek.fusion.Matrix)\n\tmosek.fusion.Domain.greaterThan(array(double,ndim=2))\n\tmosek.fusion.Domain.greaterThan(double)\n\tmosek.fusion.Domain.greaterThan(double,array(int32,ndim=1))\n\tmosek.fusion.Domain.greaterThan(array(double,ndim=1),array(int32,ndim=1))\n\tmosek.fusion.Domain.greaterThan(double,int32)\n\tmosek.fusion.Domain.greaterThan(double,int32,int32)')
+      raise ValueError('Invalid argument list greaterThan('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Domain.greaterThan(array(double,ndim=1))\n\tmosek.fusion.Domain.greaterThan(mosek.fusion.Matrix)\n\tmosek.fusion.Domain.greaterThan(array(double,ndim=2))\n\tmosek.fusion.Domain.greaterThan(double)\n\tmosek.fusion.Domain.greaterThan(double,array(int32,ndim=1))\n\tmosek.fusion.Domain.greaterThan(array(double,ndim=1),array(int32,ndim=1))\n\tmosek.fusion.Domain.greaterThan(double,int32)\n\tmosek.fusion.Domain.greaterThan(double,int32,int32)\n\tmosek.fusion.Domain.greaterThan(mosek.fusion.Parameter)')
   @staticmethod
   def sparse(*args):
     if False: pass
@@ -25420,8 +26511,20 @@ def __mk_mosek_fusion_Domain():
       return mosek_fusion_Domain._inRange_D_3D(*args)
     elif mosek_fusion_Domain._match_alt_inRange_D_3D(*args): # double,[]double
       return mosek_fusion_Domain._inRange_alt_D_3D(*args)
-    else:
-      raise ValueError('Invalid argument list inRange('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Domain.inRange(double,mosek.fusion.Matrix)\n\tmosek.fusion.Domain.inRange(mosek.fusion.Matrix,double)\n\tmosek.fusion.Domain.inRange(double,double)\n\tmosek.fusion.Domain.inRange(array(double,ndim=1),array(double,ndim=1))\n\tmosek.fusion.Domain.inRange(array(double,ndim=1),double)\n\tmosek.fusion.Domain.inRange(mosek.fusion.Matrix,mosek.fusion.Matrix)\n\tmosek.fusion.Domain.inRange(double,array(double,ndim=1))')
+    elif mosek_fusion_Domain._match_inRange_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Parameter_2(*args): # mosek.fusion.Parameter,mosek.fusion.Parameter
+      return mosek_fusion_Domain._inRange_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Parameter_2(*args)
+    elif mosek_fusion_Domain._match_alt_inRange_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Parameter_2(*args): # mosek.fusion.Parameter,mosek.fusion.Parameter
+      return mosek_fusion_Domain._inRange_alt_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Parameter_2(*args)
+    elif mosek_fusion_Domain._match_inRange_DLmosek_4fusion_4Parameter_2(*args): # double,mosek.fusion.Parameter
+      return mosek_fusion_Domain._inRange_DLmosek_4fusion_4Parameter_2(*args)
+    elif mosek_fusion_Domain._match_alt_inRange_DLmosek_4fusion_4Parameter_2(*args): # double,mosek.fusion.Parameter
+      return mosek_fusion_Domain._inRange_alt_DLmosek_4fusion_4Parameter_2(*args)
+    elif mosek_fusion_Domain._match_inRange_Lmosek_4fusion_4Parameter_2D(*args): # mosek.fusion.Parameter,double
+      return mosek_fusion_Domain._inRange_Lmosek_4fusion_4Parameter_2D(*args)
+    elif mosek_fusion_Domain._match_alt_inRange_Lmosek_4fusion_4Parameter_2D(*args): # mosek.fusion.Parameter,double
+      return mosek_fusion_Domain._inRange_alt_Lmosek_4fusion_4Parameter_2D(*args)
+    else:
+      raise ValueError('Invalid argument list inRange('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Domain.inRange(double,mosek.fusion.Matrix)\n\tmosek.fusion.Domain.inRange(mosek.fusion.Matrix,double)\n\tmosek.fusion.Domain.inRange(double,double)\n\tmosek.fusion.Domain.inRange(array(double,ndim=1),array(double,ndim=1))\n\tmosek.fusion.Domain.inRange(array(double,ndim=1),double)\n\tmosek.fusion.Domain.inRange(mosek.fusion.Matrix,mosek.fusion.Matrix)\n\tmosek.fusion.Domain.inRange(double,array(double,ndim=1))\n\tmosek.fusion.Domain.inRange(mosek.fusion.Parameter,mosek.fusion.Parameter)\n\tmosek.fusion.Domain.inRange(double,mosek.fusion.Parameter)\n\tmosek.fusion.Domain.inRange(mosek.fusion.Parameter,double)')
   @staticmethod
   def axis(*args):
     if False: pass
@@ -25504,8 +26607,12 @@ def __mk_mosek_fusion_Domain():
       return mosek_fusion_Domain._lessThan_DII(*args)
     elif mosek_fusion_Domain._match_alt_lessThan_DII(*args): # double,int32,int32
       return mosek_fusion_Domain._lessThan_alt_DII(*args)
+    elif mosek_fusion_Domain._match_lessThan_Lmosek_4fusion_4Parameter_2(*args): # mosek.fusion.Parameter
+      return mosek_fusion_Domain._lessThan_Lmosek_4fusion_4Parameter_2(*args)
+    elif mosek_fusion_Domain._match_alt_lessThan_Lmosek_4fusion_4Parameter_2(*args): # mosek.fusion.Parameter
+      return mosek_fusion_Domain._lessThan_alt_Lmosek_4fusion_4Parameter_2(*args)
     else:
-      raise ValueError('Invalid argument list lessThan('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Domain.lessThan(array(double,ndim=1))\n\tmosek.fusion.Domain.lessThan(mosek.fusion.Matrix)\n\tmosek.fusion.Domain.lessThan(array(double,ndim=2))\n\tmosek.fusion.Domain.lessThan(double)\n\tmosek.fusion.Domain.lessThan(double,array(int32,ndim=1))\n\tmosek.fusion.Domain.lessThan(array(double,ndim=1),array(int32,ndim=1))\n\tmosek.fusion.Domain.lessThan(double,int32)\n\tmosek.fusion.Domain.lessThan(double,int32,int32)')
+      raise ValueError('Invalid argument list lessThan('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Domain.lessThan(array(double,ndim=1))\n\tmosek.fusion.Domain.lessThan(mosek.fusion.Matrix)\n\tmosek.fusion.Domain.lessThan(array(double,ndim=2))\n\tmosek.fusion.Domain.lessThan(double)\n\tmosek.fusion.Domain.lessThan(double,array(int32,ndim=1))\n\tmosek.fusion.Domain.lessThan(array(double,ndim=1),array(int32,ndim=1))\n\tmosek.fusion.Domain.lessThan(double,int32)\n\tmosek.fusion.Domain.lessThan(double,int32,int32)\n\tmosek.fusion.Domain.lessThan(mosek.fusion.Parameter)')
   @staticmethod
   def inPSDCone(*args):
     if False: pass
@@ -25574,7 +26681,7 @@ def __mk_mosek_fusion_Domain():
   @staticmethod
   def __mkLinearDomain_alt_Emosek_4fusion_4RelationKey_2_3_5D(_t__0,_t__1):
    _0=_t__0
-   _1=numpy.array(_t__1,ndmin=_monty.checkShape(_t__1,2),dtype=numpy.dtype(numpy.float64))
+   _1=_monty.makeArray(_t__1,2,numpy.dtype(numpy.float64))
    _1 = mosek_fusion_Domain.__mkLinearDomain_Emosek_4fusion_4RelationKey_2_3_5D(_0,_1)
    return _1
   @staticmethod
@@ -26339,7 +27446,7 @@ def __mk_mosek_fusion_Domain():
     return (__arg_alt_match__3_5D__(_0))
   @staticmethod
   def _greaterThan_alt__3_5D(_t__0):
-   _0=numpy.array(_t__0,ndmin=_monty.checkShape(_t__0,2),dtype=numpy.dtype(numpy.float64))
+   _0=_monty.makeArray(_t__0,2,numpy.dtype(numpy.float64))
    _1 = mosek_fusion_Domain._greaterThan__3_5D(_0)
    return _1
   @staticmethod
@@ -26498,7 +27605,7 @@ def __mk_mosek_fusion_Domain():
     return (__arg_alt_match__3_5D__(_0))
   @staticmethod
   def _lessThan_alt__3_5D(_t__0):
-   _0=numpy.array(_t__0,ndmin=_monty.checkShape(_t__0,2),dtype=numpy.dtype(numpy.float64))
+   _0=_monty.makeArray(_t__0,2,numpy.dtype(numpy.float64))
    _1 = mosek_fusion_Domain._lessThan__3_5D(_0)
    return _1
   @staticmethod
@@ -26657,7 +27764,7 @@ def __mk_mosek_fusion_Domain():
     return (__arg_alt_match__3_5D__(_0))
   @staticmethod
   def _equalsTo_alt__3_5D(_t__0):
-   _0=numpy.array(_t__0,ndmin=_monty.checkShape(_t__0,2),dtype=numpy.dtype(numpy.float64))
+   _0=_monty.makeArray(_t__0,2,numpy.dtype(numpy.float64))
    _1 = mosek_fusion_Domain._equalsTo__3_5D(_0)
    return _1
   @staticmethod
@@ -26828,6 +27935,113 @@ def __mk_mosek_fusion_Domain():
   @staticmethod
   def _unbounded_():
    return (mosek_fusion_LinearDomain._ctor_Emosek_4fusion_4RelationKey_2_3D_3J_3I(mosek.fusion.RelationKey.IsFree,None,None,None))
+  @staticmethod
+  def _match_equalsTo_Lmosek_4fusion_4Parameter_2(*args):
+    if len(args) != 1: return False
+    _0, = args
+    return (__arg_match_Lmosek_4fusion_4Parameter_2__(_0))
+  @staticmethod
+  def _match_alt_equalsTo_Lmosek_4fusion_4Parameter_2(*args):
+    if len(args) != 1: return False
+    _0, = args
+    return (__arg_alt_match_Lmosek_4fusion_4Parameter_2__(_0))
+  @staticmethod
+  def _equalsTo_alt_Lmosek_4fusion_4Parameter_2(_t__0):
+    return mosek_fusion_Domain._equalsTo_Lmosek_4fusion_4Parameter_2(_t__0)
+  @staticmethod
+  def _equalsTo_Lmosek_4fusion_4Parameter_2(_0):
+   return (mosek.fusion.Domain.__mkParamDomain_Emosek_4fusion_4RelationKey_2Lmosek_4fusion_4Parameter_2(mosek.fusion.RelationKey.EqualsTo,_0))
+  @staticmethod
+  def _match_greaterThan_Lmosek_4fusion_4Parameter_2(*args):
+    if len(args) != 1: return False
+    _0, = args
+    return (__arg_match_Lmosek_4fusion_4Parameter_2__(_0))
+  @staticmethod
+  def _match_alt_greaterThan_Lmosek_4fusion_4Parameter_2(*args):
+    if len(args) != 1: return False
+    _0, = args
+    return (__arg_alt_match_Lmosek_4fusion_4Parameter_2__(_0))
+  @staticmethod
+  def _greaterThan_alt_Lmosek_4fusion_4Parameter_2(_t__0):
+    return mosek_fusion_Domain._greaterThan_Lmosek_4fusion_4Parameter_2(_t__0)
+  @staticmethod
+  def _greaterThan_Lmosek_4fusion_4Parameter_2(_0):
+   return (mosek.fusion.Domain.__mkParamDomain_Emosek_4fusion_4RelationKey_2Lmosek_4fusion_4Parameter_2(mosek.fusion.RelationKey.GreaterThan,_0))
+  @staticmethod
+  def _match_lessThan_Lmosek_4fusion_4Parameter_2(*args):
+    if len(args) != 1: return False
+    _0, = args
+    return (__arg_match_Lmosek_4fusion_4Parameter_2__(_0))
+  @staticmethod
+  def _match_alt_lessThan_Lmosek_4fusion_4Parameter_2(*args):
+    if len(args) != 1: return False
+    _0, = args
+    return (__arg_alt_match_Lmosek_4fusion_4Parameter_2__(_0))
+  @staticmethod
+  def _lessThan_alt_Lmosek_4fusion_4Parameter_2(_t__0):
+    return mosek_fusion_Domain._lessThan_Lmosek_4fusion_4Parameter_2(_t__0)
+  @staticmethod
+  def _lessThan_Lmosek_4fusion_4Parameter_2(_0):
+   return (mosek.fusion.Domain.__mkParamDomain_Emosek_4fusion_4RelationKey_2Lmosek_4fusion_4Parameter_2(mosek.fusion.RelationKey.LessThan,_0))
+  @staticmethod
+  def _match_inRange_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Parameter_2(*args):
+    if len(args) != 2: return False
+    _0,_1, = args
+    return (__arg_match_Lmosek_4fusion_4Parameter_2__(_0) and __arg_match_Lmosek_4fusion_4Parameter_2__(_1))
+  @staticmethod
+  def _match_alt_inRange_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Parameter_2(*args):
+    if len(args) != 2: return False
+    _0,_1, = args
+    return (__arg_alt_match_Lmosek_4fusion_4Parameter_2__(_0) and __arg_alt_match_Lmosek_4fusion_4Parameter_2__(_1))
+  @staticmethod
+  def _inRange_alt_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Parameter_2(_t__0,_t__1):
+    return mosek_fusion_Domain._inRange_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Parameter_2(_t__0,_t__1)
+  @staticmethod
+  def _inRange_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Parameter_2(_0,_1):
+   _2=mosek.fusion.Domain.__inRange__3D_3D_3I(_0._values_(),_1._values_(),_0._dims_())
+   _2._params = [_0,_1]
+   return (_2)
+  @staticmethod
+  def _match_inRange_DLmosek_4fusion_4Parameter_2(*args):
+    if len(args) != 2: return False
+    _0,_1, = args
+    return (__arg_match_D__(_0) and __arg_match_Lmosek_4fusion_4Parameter_2__(_1))
+  @staticmethod
+  def _match_alt_inRange_DLmosek_4fusion_4Parameter_2(*args):
+    if len(args) != 2: return False
+    _0,_1, = args
+    return (__arg_alt_match_D__(_0) and __arg_alt_match_Lmosek_4fusion_4Parameter_2__(_1))
+  @staticmethod
+  def _inRange_alt_DLmosek_4fusion_4Parameter_2(_t__0,_t__1):
+    return mosek_fusion_Domain._inRange_DLmosek_4fusion_4Parameter_2(numpy.float64(_t__0),_t__1)
+  @staticmethod
+  def _inRange_DLmosek_4fusion_4Parameter_2(_0,_1):
+   _2=mosek.fusion.Domain.__inRange__3D_3D_3I(mosek.fusion.Utils.Tools._makevector_DI(_0,numpy.int32(int((_1._values_()).shape[0]))),_1._values_(),_1._dims_())
+   _2._params = [_1]
+   return (_2)
+  @staticmethod
+  def _match_inRange_Lmosek_4fusion_4Parameter_2D(*args):
+    if len(args) != 2: return False
+    _0,_1, = args
+    return (__arg_match_Lmosek_4fusion_4Parameter_2__(_0) and __arg_match_D__(_1))
+  @staticmethod
+  def _match_alt_inRange_Lmosek_4fusion_4Parameter_2D(*args):
+    if len(args) != 2: return False
+    _0,_1, = args
+    return (__arg_alt_match_Lmosek_4fusion_4Parameter_2__(_0) and __arg_alt_match_D__(_1))
+  @staticmethod
+  def _inRange_alt_Lmosek_4fusion_4Parameter_2D(_t__0,_t__1):
+    return mosek_fusion_Domain._inRange_Lmosek_4fusion_4Parameter_2D(_t__0,numpy.float64(_t__1))
+  @staticmethod
+  def _inRange_Lmosek_4fusion_4Parameter_2D(_0,_1):
+   _2=mosek.fusion.Domain.__inRange__3D_3D_3I(_0._values_(),mosek.fusion.Utils.Tools._makevector_DI(_1,numpy.int32(int((_0._values_()).shape[0]))),_0._dims_())
+   _2._params = [_0]
+   return (_2)
+  @staticmethod
+  def __mkParamDomain_Emosek_4fusion_4RelationKey_2Lmosek_4fusion_4Parameter_2(_0,_1):
+   _2=mosek_fusion_LinearDomain._ctor_Emosek_4fusion_4RelationKey_2_3D_3J_3I(_0,_1._values_(),None,_1._dims_())
+   _2._params = [_1]
+   return (_2)
  return Domain
 mosek_fusion_Domain=__mk_mosek_fusion_Domain()
 del __mk_mosek_fusion_Domain
@@ -26925,7 +28139,7 @@ del __mk_mosek_fusion_SymmetricExpr
 #BEFORE CLASS
 def __mk_mosek_fusion_Expr():
  class Expr(mosek_fusion_Expression,object):
-  __slots__ = ['_Expr__varsb','_Expr__inst','_Expr__cof_v','_Expr__x','_Expr__subj','_Expr__ptrb','_Expr__bfix','_Expr__shape_p','_Expr__model']
+  __slots__ = ['_Expr__varsb','_Expr__inst','_Expr__cof_v','_Expr__x','_Expr__subj','_Expr__ptrb','_Expr__bfix','_Expr__shape_p','_Expr__model','_Expr__params','_Expr__buildtime','_Expr__derived']
   def __init__(self,*args):
     if False: pass
     elif self.__match_ctor__3J_3Lmosek_4fusion_4Variable_2_3J_3D_3DLmosek_4fusion_4Set_2_3J(*args): # []int64,[]mosek.fusion.Variable,[]int64,[]double,[]double,mosek.fusion.Set,[]int64
@@ -26936,6 +28150,10 @@ def __mk_mosek_fusion_Expr():
       raise ValueError('Invalid argument list for constructor. Candidates are:\n\tmosek.fusion.Expr.ctor(array(int64,ndim=1),array(mosek.fusion.Variable,ndim=1),array(int64,ndim=1),array(double,ndim=1),array(double,ndim=1),mosek.fusion.Set,array(int64,ndim=1))')
   @staticmethod
   def sub(*args):
+    if mosek_fusion_BuildProfiler._timing_():
+      return mosek_fusion_BuildProfiler._expr_S(mosek_fusion_Expr.sub,args)
+    if mosek_fusion_Parameter._tracking_():
+      return mosek_fusion_Parameter._track_S(mosek_fusion_Expr.sub,args)
     if False: pass
     elif mosek_fusion_Expr._match_sub_Lmosek_4fusion_4Variable_2Lmosek_4fusion_4NDSparseArray_2(*args): # mosek.fusion.Variable,mosek.fusion.NDSparseArray
       return mosek_fusion_Expr._sub_Lmosek_4fusion_4Variable_2Lmosek_4fusion_4NDSparseArray_2(*args)
@@ -27045,6 +28263,10 @@ def __mk_mosek_fusion_Expr():
       raise ValueError('Invalid argument list getModel('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Expr.getModel()')
   @staticmethod
   def hstack(*args):
+    if mosek_fusion_BuildProfiler._timing_():
+      return mosek_fusion_BuildProfiler._expr_S(mosek_fusion_Expr.hstack,args)
+    if mosek_fusion_Parameter._tracking_():
+      return mosek_fusion_Parameter._track_S(mosek_fusion_Expr.hstack,args)
     if False: pass
     elif mosek_fusion_Expr._match_hstack__3Lmosek_4fusion_4Expression_2(*args): # []mosek.fusion.Expression
       return mosek_fusion_Expr._hstack__3Lmosek_4fusion_4Expression_2(*args)
@@ -27190,6 +28412,10 @@ def __mk_mosek_fusion_Expr():
       raise ValueError('Invalid argument list hstack('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Expr.hstack(array(mosek.fusion.Expression,ndim=1))\n\tmosek.fusion.Expr.hstack(double,mosek.fusion.Expression)\n\tmosek.fusion.Expr.hstack(mosek.fusion.Variable,double)\n\tmosek.fusion.Expr.hstack(mosek.fusion.Variable,mosek.fusion.Variable)\n\tmosek.fusion.Expr.hstack(mosek.fusion.Variable,mosek.fusion.Expression)\n\tmosek.fusion.Expr.hstack(mosek.fusion.Expression,mosek.fusion.Expression)\n\tmosek.fusion.Expr.hstack(double,mosek.fusion.Variable)\n\tmosek.fusion.Expr.hstack(mosek.fusion.Expression,double)\n\tmosek.fusion.Expr.hstack(mosek.fusion.Expression,mosek.fusion.Variable)\n\tmosek.fusion.Expr.hstack(double,mosek.fusion.Variable,double)\n\tmosek.fusion.Expr.hstack(mosek.fusion.Expression,double,double)\n\tmosek.fusion.Expr.hstack(double,double,mosek.fusion.Expression)\n\tmosek.fusion.Expr.hstack(mosek.fusion.Expression,mosek.fusion.Variable,double)\n\tmosek.fusion.Expr.hstack(mosek.fusion.Expression,mosek.fusion.Expression,mosek.fusion.Variable)\n\tmosek.fusion.Expr.hstack(mosek.fusion.Variable,double,mosek.fusion.Variable)\n\tmosek.fusion.Expr.hstack(mosek.fusion.Expression,double,mosek.fusion.Variable)\n\tmosek.fusion.Expr.hstack(mosek.fusion.Expression,mosek.fusion.Variable,mosek.fusion.Expression)\n\tmosek.fusion.Expr.hstack(double,mosek.fusion.Expression,double)\n\tmosek.fusion.Expr.hstack(double,mosek.fusion.Expression,mosek.fusion.Variable)\n\tmosek.fusion.Expr.hstack(double,mosek.fusion.Variable,mosek.fusion.Expression)\n\tmosek.fusion.Expr.hstack(mosek.fusion.Variable,mosek.fusion.Variable,mosek.fusion.Variable)\n\tmosek.fusion.Expr.hstack(mosek.fusion.Expression,mosek.fusion.Expression,mosek.fusion.Expression)\n\tmosek.fusion.Expr.hstack(double,mosek.fusion.Variable,mosek.fusion.Variable)\n\tmosek.fusion.Expr.hstack(mosek.fusion.Expression,mosek.fusion.Variable,mosek.fusion.Variable)\n\tmosek.fusion.Expr.hstack(double,mosek.fusion.Expression,mosek.fusion.Expression)\n\tmosek.fusion.Expr.hstack(mosek.fusion.Variable,mosek.fusion.Variable,mosek.fusion.Expression)\n\tmosek.fusion.Expr.hstack(mosek.fusion.Variable,mosek.fusion.Expression,double)\n\tmosek.fusion.Expr.hstack(mosek.fusion.Variable,mosek.fusion.Variable,double)\n\tmosek.fusion.Expr.hstack(mosek.fusion.Expression,double,mosek.fusion.Expression)\n\tmosek.fusion.Expr.hstack(mosek.fusion.Variable,double,mosek.fusion.Expression)\n\tmosek.fusion.Expr.hstack(mosek.fusion.Variable,mosek.fusion.Expression,mosek.fusion.Expression)\n\tmosek.fusion.Expr.hstack(mosek.fusion.Variable,mosek.fusion.Expression,mosek.fusion.Variable)\n\tmosek.fusion.Expr.hstack(mosek.fusion.Variable,double,double)\n\tmosek.fusion.Expr.hstack(mosek.fusion.Expression,mosek.fusion.Expression,double)\n\tmosek.fusion.Expr.hstack(double,double,mosek.fusion.Variable)')
   @staticmethod
   def dot(*args):
+    if mosek_fusion_BuildProfiler._timing_():
+      return mosek_fusion_BuildProfiler._expr_S(mosek_fusion_Expr.dot,args)
+    if mosek_fusion_Parameter._tracking_():
+      return mosek_fusion_Parameter._track_S(mosek_fusion_Expr.dot,args)
     if False: pass
     elif mosek_fusion_Expr._match_dot_Lmosek_4fusion_4Variable_2Lmosek_4fusion_4NDSparseArray_2(*args): # mosek.fusion.Variable,mosek.fusion.NDSparseArray
       return mosek_fusion_Expr._dot_Lmosek_4fusion_4Variable_2Lmosek_4fusion_4NDSparseArray_2(*args)
@@ -27255,8 +28481,12 @@ def __mk_mosek_fusion_Expr():
       return mosek_fusion_Expr._dot_Lmosek_4fusion_4Expression_2_3_5D(*args)
     elif mosek_fusion_Expr._match_alt_dot_Lmosek_4fusion_4Expression_2_3_5D(*args): # mosek.fusion.Expression,[,]double
       return mosek_fusion_Expr._dot_alt_Lmosek_4fusion_4Expression_2_3_5D(*args)
+    elif mosek_fusion_Expr._match_dot_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Variable_2(*args): # mosek.fusion.Parameter,mosek.fusion.Variable
+      return mosek_fusion_Expr._dot_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Variable_2(*args)
+    elif mosek_fusion_Expr._match_alt_dot_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Variable_2(*args): # mosek.fusion.Parameter,mosek.fusion.Variable
+      return mosek_fusion_Expr._dot_alt_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Variable_2(*args)
     else:
-      raise ValueError('Invalid argument list dot('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Expr.dot(mosek.fusion.Variable,mosek.fusion.NDSparseArray)\n\tmosek.fusion.Expr.dot(mosek.fusion.Expression,array(double,ndim=1))\n\tmosek.fusion.Expr.dot(mosek.fusion.NDSparseArray,mosek.fusion.Variable)\n\tmosek.fusion.Expr.dot(mosek.fusion.Matrix,mosek.fusion.Variable)\n\tmosek.fusion.Expr.dot(array(double,ndim=1),mosek.fusion.Expression)\n\tmosek.fusion.Expr.dot(array(double,ndim=1),mosek.fusion.Variable)\n\tmosek.fusion.Expr.dot(mosek.fusion.NDSparseArray,mosek.fusion.Expression)\n\tmosek.fusion.Expr.dot(mosek.fusion.Variable,array(double,ndim=1))\n\tmosek.fusion.Expr.dot(mosek.fusion.Matrix,mosek.fusion.Expression)\n\tmosek.fusion.Expr.dot(mosek.fusion.Variable,mosek.fusion.Matrix)\n\tmosek.fusion.Expr.dot(array(double,ndim=2),mosek.fusion.Variable)\n\tmosek.fusion.Expr.dot(array(double,ndim=2),mosek.fusion.Expression)\n\tmosek.fusion.Expr.dot(mosek.fusion.Variable,array(double,ndim=2))\n\tmosek.fusion.Expr.dot(mosek.fusion.Expression,mosek.fusion.Matrix)\n\tmosek.fusion.Expr.dot(mosek.fusion.Expression,mosek.fusion.NDSparseArray)\n\tmosek.fusion.Expr.dot(mosek.fusion.Expression,array(double,ndim=2))')
+      raise ValueError('Invalid argument list dot('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Expr.dot(mosek.fusion.Variable,mosek.fusion.NDSparseArray)\n\tmosek.fusion.Expr.dot(mosek.fusion.Expression,array(double,ndim=1))\n\tmosek.fusion.Expr.dot(mosek.fusion.NDSparseArray,mosek.fusion.Variable)\n\tmosek.fusion.Expr.dot(mosek.fusion.Matrix,mosek.fusion.Variable)\n\tmosek.fusion.Expr.dot(array(double,ndim=1),mosek.fusion.Expression)\n\tmosek.fusion.Expr.dot(array(double,ndim=1),mosek.fusion.Variable)\n\tmosek.fusion.Expr.dot(mosek.fusion.NDSparseArray,mosek.fusion.Expression)\n\tmosek.fusion.Expr.dot(mosek.fusion.Variable,array(double,ndim=1))\n\tmosek.fusion.Expr.dot(mosek.fusion.Matrix,mosek.fusion.Expression)\n\tmosek.fusion.Expr.dot(mosek.fusion.Variable,mosek.fusion.Matrix)\n\tmosek.fusion.Expr.dot(array(double,ndim=2),mosek.fusion.Variable)\n\tmosek.fusion.Expr.dot(array(double,ndim=2),mosek.fusion.Expression)\n\tmosek.fusion.Expr.dot(mosek.fusion.Variable,array(double,ndim=2))\n\tmosek.fusion.Expr.dot(mosek.fusion.Expression,mosek.fusion.Matrix)\n\tmosek.fusion.Expr.dot(mosek.fusion.Expression,mosek.fusion.NDSparseArray)\n\tmosek.fusion.Expr.dot(mosek.fusion.Expression,array(double,ndim=2))\n\tmosek.fusion.Expr.dot(mosek.fusion.Parameter,mosek.fusion.Variable)')
   def eval(self,*args):
     if False: pass
     elif mosek_fusion_Expr._match_eval_(*args): # 
@@ -27267,6 +28497,10 @@ def __mk_mosek_fusion_Expr():
       raise ValueError('Invalid argument list eval('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Expr.eval()')
   @staticmethod
   def repeat(*args):
+    if mosek_fusion_BuildProfiler._timing_():
+      return mosek_fusion_BuildProfiler._expr_S(mosek_fusion_Expr.repeat,args)
+    if mosek_fusion_Parameter._tracking_():
+      return mosek_fusion_Parameter._track_S(mosek_fusion_Expr.repeat,args)
     if False: pass
     elif mosek_fusion_Expr._match_repeat_Lmosek_4fusion_4Expression_2II(*args): # mosek.fusion.Expression,int32,int32
       return mosek_fusion_Expr._repeat_Lmosek_4fusion_4Expression_2II(*args)
@@ -27283,6 +28517,10 @@ def __mk_mosek_fusion_Expr():
     else:
       raise ValueError('Invalid argument list numNonzeros('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Expr.numNonzeros()')
   def pick(self,*args):
+    if mosek_fusion_BuildProfiler._timing_():
+      return mosek_fusion_BuildProfiler._expr_S(mosek_fusion_Expr.pick,(self,)+args)
+    if mosek_fusion_Parameter._tracking_():
+      return mosek_fusion_Parameter._track_S(mosek_fusion_Expr.pick,(self,)+args)
     if False: pass
     elif mosek_fusion_Expr._match_pick__3I(*args): # []int32
       return self._pick__3I(*args)
@@ -27296,6 +28534,10 @@ def __mk_mosek_fusion_Expr():
       raise ValueError('Invalid argument list pick('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Expr.pick(array(int32,ndim=1))\n\tmosek.fusion.Expr.pick(array(int32,ndim=2))')
   @staticmethod
   def stack(*args):
+    if mosek_fusion_BuildProfiler._timing_():
+      return mosek_fusion_BuildProfiler._expr_S(mosek_fusion_Expr.stack,args)
+    if mosek_fusion_Parameter._tracking_():
+      return mosek_fusion_Parameter._track_S(mosek_fusion_Expr.stack,args)
     if False: pass
     elif mosek_fusion_Expr._match_stack__3_3Lmosek_4fusion_4Expression_2(*args): # [][]mosek.fusion.Expression
       return mosek_fusion_Expr._stack__3_3Lmosek_4fusion_4Expression_2(*args)
@@ -27444,6 +28686,10 @@ def __mk_mosek_fusion_Expr():
     else:
       raise ValueError('Invalid argument list stack('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Expr.stack(array(array(mosek.fusion.Expression,ndim=1),ndim=1))\n\tmosek.fusion.Expr.stack(int32,array(mosek.fusion.Expression,ndim=1))\n\tmosek.fusion.Expr.stack(int32,double,mosek.fusion.Variable)\n\tmosek.fusion.Expr.stack(int32,mosek.fusion.Expression,double)\n\tmosek.fusion.Expr.stack(int32,mosek.fusion.Variable,mosek.fusion.Expression)\n\tmosek.fusion.Expr.stack(int32,mosek.fusion.Expression,mosek.fusion.Expression)\n\tmosek.fusion.Expr.stack(int32,mosek.fusion.Variable,mosek.fusion.Variable)\n\tmosek.fusion.Expr.stack(int32,double,mosek.fusion.Expression)\n\tmosek.fusion.Expr.stack(int32,mosek.fusion.Expression,mosek.fusion.Variable)\n\tmosek.fusion.Expr.stack(int32,mosek.fusion.Variable,double)\n\tmosek.fusion.Expr.stack(int32,mosek.fusion.Expression,mosek.fusion.Variable,mosek.fusion.Expression)\n\tmosek.fusion.Expr.stack(int32,double,mosek.fusion.Variable,mosek.fusion.Variable)\n\tmosek.fusion.Expr.stack(int32,double,double,mosek.fusion.Expression)\n\tmosek.fusion.Expr.stack(int32,mosek.fusion.Variable,mosek.fusion.Expression,mosek.fusion.Expression)\n\tmosek.fusion.Expr.stack(int32,double,mosek.fusion.Variable,mosek.fusion.Expression)\n\tmosek.fusion.Expr.stack(int32,mosek.fusion.Expression,mosek.fusion.Expression,double)\n\tmosek.fusion.Expr.stack(int32,mosek.fusion.Variable,mosek.fusion.Variable,mosek.fusion.Variable)\n\tmosek.fusion.Expr.stack(int32,double,mosek.fusion.Expression,double)\n\tmosek.fusion.Expr.stack(int32,mosek.fusion.Expression,mosek.fusion.Variable,double)\n\tmosek.fusion.Expr.stack(int32,mosek.fusion.Variable,double,mosek.fusion.Variable)\n\tmosek.fusion.Expr.stack(int32,double,mosek.fusion.Expression,mosek.fusion.Expression)\n\tmosek.fusion.Expr.stack(int32,mosek.fusion.Expression,double,double)\n\tmosek.fusion.Expr.stack(int32,mosek.fusion.Variable,double,double)\n\tmosek.fusion.Expr.stack(int32,mosek.fusion.Variable,mosek.fusion.Variable,mosek.fusion.Expression)\n\tmosek.fusion.Expr.stack(int32,double,double,mosek.fusion.Variable)\n\tmosek.fusion.Expr.stack(int32,double,mosek.fusion.Variable,double)\n\tmosek.fusion.Expr.stack(int32,double,mosek.fusion.Expression,mosek.fusion.Variable)\n\tmosek.fusion.Expr.stack(int32,mosek.fusion.Expression,double,mosek.fusion.Expression)\n\tmosek.fusion.Expr.stack(int32,mosek.fusion.Variable,double,mosek.fusion.Expression)\n\tmosek.fusion.Expr.stack(int32,mosek.fusion.Expression,mosek.fusion.Expression,mosek.fusion.Expression)\n\tmosek.fusion.Expr.stack(int32,mosek.fusion.Expression,double,mosek.fusion.Variable)\n\tmosek.fusion.Expr.stack(int32,mosek.fusion.Variable,mosek.fusion.Expression,mosek.fusion.Variable)\n\tmosek.fusion.Expr.stack(int32,mosek.fusion.Expression,mosek.fusion.Expression,mosek.fusion.Variable)\n\tmosek.fusion.Expr.stack(int32,mosek.fusion.Variable,mosek.fusion.Variable,double)\n\tmosek.fusion.Expr.stack(int32,mosek.fusion.Expression,mosek.fusion.Variable,mosek.fusion.Variable)\n\tmosek.fusion.Expr.stack(int32,mosek.fusion.Variable,mosek.fusion.Expression,double)')
   def transpose(self,*args):
+    if mosek_fusion_BuildProfiler._timing_():
+      return mosek_fusion_BuildProfiler._expr_S(mosek_fusion_Expr.transpose,(self,)+args)
+    if mosek_fusion_Parameter._tracking_():
+      return mosek_fusion_Parameter._track_S(mosek_fusion_Expr.transpose,(self,)+args)
     if False: pass
     elif mosek_fusion_Expr._match_transpose_(*args): # 
       return self._transpose_(*args)
@@ -27461,6 +28707,10 @@ def __mk_mosek_fusion_Expr():
       raise ValueError('Invalid argument list getShape('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Expr.getShape()')
   @staticmethod
   def vstack(*args):
+    if mosek_fusion_BuildProfiler._timing_():
+      return mosek_fusion_BuildProfiler._expr_S(mosek_fusion_Expr.vstack,args)
+    if mosek_fusion_Parameter._tracking_():
+      return mosek_fusion_Parameter._track_S(mosek_fusion_Expr.vstack,args)
     if False: pass
     elif mosek_fusion_Expr._match_vstack__3Lmosek_4fusion_4Expression_2(*args): # []mosek.fusion.Expression
       return mosek_fusion_Expr._vstack__3Lmosek_4fusion_4Expression_2(*args)
@@ -27610,6 +28860,10 @@ def __mk_mosek_fusion_Expr():
       raise ValueError('Invalid argument list vstack('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Expr.vstack(array(mosek.fusion.Expression,ndim=1))\n\tmosek.fusion.Expr.vstack(double,mosek.fusion.Expression)\n\tmosek.fusion.Expr.vstack(mosek.fusion.Variable,double)\n\tmosek.fusion.Expr.vstack(mosek.fusion.Variable,mosek.fusion.Variable)\n\tmosek.fusion.Expr.vstack(mosek.fusion.Variable,mosek.fusion.Expression)\n\tmosek.fusion.Expr.vstack(mosek.fusion.Expression,mosek.fusion.Expression)\n\tmosek.fusion.Expr.vstack(double,mosek.fusion.Variable)\n\tmosek.fusion.Expr.vstack(mosek.fusion.Expression,double)\n\tmosek.fusion.Expr.vstack(mosek.fusion.Expression,mosek.fusion.Variable)\n\tmosek.fusion.Expr.vstack(double,mosek.fusion.Variable,double)\n\tmosek.fusion.Expr.vstack(mosek.fusion.Expression,double,double)\n\tmosek.fusion.Expr.vstack(double,double,mosek.fusion.Expression)\n\tmosek.fusion.Expr.vstack(mosek.fusion.Expression,mosek.fusion.Variable,double)\n\tmosek.fusion.Expr.vstack(mosek.fusion.Expression,mosek.fusion.Expression,mosek.fusion.Variable)\n\tmosek.fusion.Expr.vstack(mosek.fusion.Variable,double,mosek.fusion.Variable)\n\tmosek.fusion.Expr.vstack(mosek.fusion.Expression,double,mosek.fusion.Variable)\n\tmosek.fusion.Expr.vstack(mosek.fusion.Expression,mosek.fusion.Variable,mosek.fusion.Expression)\n\tmosek.fusion.Expr.vstack(double,mosek.fusion.Expression,double)\n\tmosek.fusion.Expr.vstack(double,mosek.fusion.Expression,mosek.fusion.Variable)\n\tmosek.fusion.Expr.vstack(double,mosek.fusion.Variable,mosek.fusion.Expression)\n\tmosek.fusion.Expr.vstack(double,double,double)\n\tmosek.fusion.Expr.vstack(mosek.fusion.Variable,mosek.fusion.Variable,mosek.fusion.Variable)\n\tmosek.fusion.Expr.vstack(mosek.fusion.Expression,mosek.fusion.Expression,mosek.fusion.Expression)\n\tmosek.fusion.Expr.vstack(double,mosek.fusion.Variable,mosek.fusion.Variable)\n\tmosek.fusion.Expr.vstack(mosek.fusion.Expression,mosek.fusion.Variable,mosek.fusion.Variable)\n\tmosek.fusion.Expr.vstack(double,mosek.fusion.Expression,mosek.fusion.Expression)\n\tmosek.fusion.Expr.vstack(mosek.fusion.Variable,mosek.fusion.Variable,mosek.fusion.Expression)\n\tmosek.fusion.Expr.vstack(mosek.fusion.Variable,mosek.fusion.Expression,double)\n\tmosek.fusion.Expr.vstack(mosek.fusion.Variable,mosek.fusion.Variable,double)\n\tmosek.fusion.Expr.vstack(mosek.fusion.Expression,double,mosek.fusion.Expression)\n\tmosek.fusion.Expr.vstack(mosek.fusion.Variable,double,mosek.fusion.Expression)\n\tmosek.fusion.Expr.vstack(mosek.fusion.Variable,mosek.fusion.Expression,mosek.fusion.Expression)\n\tmosek.fusion.Expr.vstack(mosek.fusion.Variable,mosek.fusion.Expression,mosek.fusion.Variable)\n\tmosek.fusion.Expr.vstack(mosek.fusion.Variable,double,double)\n\tmosek.fusion.Expr.vstack(mosek.fusion.Expression,mosek.fusion.Expression,double)\n\tmosek.fusion.Expr.vstack(double,double,mosek.fusion.Variable)')
   @staticmethod
   def sum(*args):
+    if mosek_fusion_BuildProfiler._timing_():
+      return mosek_fusion_BuildProfiler._expr_S(mosek_fusion_Expr.sum,args)
+    if mosek_fusion_Parameter._tracking_():
+      return mosek_fusion_Parameter._track_S(mosek_fusion_Expr.sum,args)
     if False: pass
     elif mosek_fusion_Expr._match_sum_Lmosek_4fusion_4Variable_2(*args): # mosek.fusion.Variable
       return mosek_fusion_Expr._sum_Lmosek_4fusion_4Variable_2(*args)
@@ -27639,6 +28893,10 @@ def __mk_mosek_fusion_Expr():
       raise ValueError('Invalid argument list sum('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Expr.sum(mosek.fusion.Variable)\n\tmosek.fusion.Expr.sum(mosek.fusion.Expression)\n\tmosek.fusion.Expr.sum(mosek.fusion.Expression,int32)\n\tmosek.fusion.Expr.sum(mosek.fusion.Variable,int32)\n\tmosek.fusion.Expr.sum(mosek.fusion.Variable,int32,int32)\n\tmosek.fusion.Expr.sum(mosek.fusion.Expression,int32,int32)')
   @staticmethod
   def reshape(*args):
+    if mosek_fusion_BuildProfiler._timing_():
+      return mosek_fusion_BuildProfiler._expr_S(mosek_fusion_Expr.reshape,args)
+    if mosek_fusion_Parameter._tracking_():
+      return mosek_fusion_Parameter._track_S(mosek_fusion_Expr.reshape,args)
     if False: pass
     elif mosek_fusion_Expr._match_reshape_Lmosek_4fusion_4Expression_2Lmosek_4fusion_4Set_2(*args): # mosek.fusion.Expression,mosek.fusion.Set
       return mosek_fusion_Expr._reshape_Lmosek_4fusion_4Expression_2Lmosek_4fusion_4Set_2(*args)
@@ -27656,6 +28914,10 @@ def __mk_mosek_fusion_Expr():
       raise ValueError('Invalid argument list reshape('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Expr.reshape(mosek.fusion.Expression,mosek.fusion.Set)\n\tmosek.fusion.Expr.reshape(mosek.fusion.Expression,int32)\n\tmosek.fusion.Expr.reshape(mosek.fusion.Expression,int32,int32)')
   @staticmethod
   def zeros(*args):
+    if mosek_fusion_BuildProfiler._timing_():
+      return mosek_fusion_BuildProfiler._expr_S(mosek_fusion_Expr.zeros,args)
+    if mosek_fusion_Parameter._tracking_():
+      return mosek_fusion_Parameter._track_S(mosek_fusion_Expr.zeros,args)
     if False: pass
     elif mosek_fusion_Expr._match_zeros_I(*args): # int32
       return mosek_fusion_Expr._zeros_I(*args)
@@ -27672,6 +28934,10 @@ def __mk_mosek_fusion_Expr():
     else:
       raise ValueError('Invalid argument list toString('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Expr.toString()')
   def index(self,*args):
+    if mosek_fusion_BuildProfiler._timing_():
+      return mosek_fusion_BuildProfiler._expr_S(mosek_fusion_Expr.index,(self,)+args)
+    if mosek_fusion_Parameter._tracking_():
+      return mosek_fusion_Parameter._track_S(mosek_fusion_Expr.index,(self,)+args)
     if False: pass
     elif mosek_fusion_Expr._match_index_I(*args): # int32
       return self._index_I(*args)
@@ -27693,6 +28959,10 @@ def __mk_mosek_fusion_Expr():
       raise ValueError('Invalid argument list shape('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Expr.shape()')
   @staticmethod
   def constTerm(*args):
+    if mosek_fusion_BuildProfiler._timing_():
+      return mosek_fusion_BuildProfiler._expr_S(mosek_fusion_Expr.constTerm,args)
+    if mosek_fusion_Parameter._tracking_():
+      return mosek_fusion_Parameter._track_S(mosek_fusion_Expr.constTerm,args)
     if False: pass
     elif mosek_fusion_Expr._match_constTerm__3D(*args): # []double
       return mosek_fusion_Expr._constTerm__3D(*args)
@@ -27734,6 +29004,10 @@ def __mk_mosek_fusion_Expr():
       raise ValueError('Invalid argument list size('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Expr.size()')
   @staticmethod
   def mul(*args):
+    if mosek_fusion_BuildProfiler._timing_():
+      return mosek_fusion_BuildProfiler._expr_S(mosek_fusion_Expr.mul,args)
+    if mosek_fusion_Parameter._tracking_():
+      return mosek_fusion_Parameter._track_S(mosek_fusion_Expr.mul,args)
     if False: pass
     elif mosek_fusion_Expr._match_mul_Lmosek_4fusion_4Matrix_2Lmosek_4fusion_4Variable_2(*args): # mosek.fusion.Matrix,mosek.fusion.Variable
       return mosek_fusion_Expr._mul_Lmosek_4fusion_4Matrix_2Lmosek_4fusion_4Variable_2(*args)
@@ -27791,10 +29065,18 @@ def __mk_mosek_fusion_Expr():
       return mosek_fusion_Expr._mul_Lmosek_4fusion_4Expression_2D(*args)
     elif mosek_fusion_Expr._match_alt_mul_Lmosek_4fusion_4Expression_2D(*args): # mosek.fusion.Expression,double
       return mosek_fusion_Expr._mul_alt_Lmosek_4fusion_4Expression_2D(*args)
+    elif mosek_fusion_Expr._match_mul_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Variable_2(*args): # mosek.fusion.Parameter,mosek.fusion.Variable
+      return mosek_fusion_Expr._mul_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Variable_2(*args)
+    elif mosek_fusion_Expr._match_alt_mul_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Variable_2(*args): # mosek.fusion.Parameter,mosek.fusion.Variable
+      return mosek_fusion_Expr._mul_alt_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Variable_2(*args)
     else:
-      raise ValueError('Invalid argument list mul('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Expr.mul(mosek.fusion.Matrix,mosek.fusion.Variable)\n\tmosek.fusion.Expr.mul(array(double,ndim=1),mosek.fusion.Expression)\n\tmosek.fusion.Expr.mul(array(double,ndim=1),mosek.fusion.Variable)\n\tmosek.fusion.Expr.mul(double,mosek.fusion.Expression)\n\tmosek.fusion.Expr.mul(mosek.fusion.Variable,array(double,ndim=1))\n\tmosek.fusion.Expr.mul(mosek.fusion.Variable,double)\n\tmosek.fusion.Expr.mul(mosek.fusion.Matrix,mosek.fusion.Expression)\n\tmosek.fusion.Expr.mul(mosek.fusion.Variable,mosek.fusion.Matrix)\n\tmosek.fusion.Expr.mul(double,mosek.fusion.Variable)\n\tmosek.fusion.Expr.mul(array(double,ndim=2),mosek.fusion.Variable)\n\tmosek.fusion.Expr.mul(mosek.fusion.Variable,array(double,ndim=2))\n\tmosek.fusion.Expr.mul(mosek.fusion.Expression,mosek.fusion.Matrix)\n\tmosek.fusion.Expr.mul(mosek.fusion.Expression,array(double,ndim=1))\n\tmosek.fusion.Expr.mul(mosek.fusion.Expression,double)')
+      raise ValueError('Invalid argument list mul('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Expr.mul(mosek.fusion.Matrix,mosek.fusion.Variable)\n\tmosek.fusion.Expr.mul(array(double,ndim=1),mosek.fusion.Expression)\n\tmosek.fusion.Expr.mul(array(double,ndim=1),mosek.fusion.Variable)\n\tmosek.fusion.Expr.mul(double,mosek.fusion.Expression)\n\tmosek.fusion.Expr.mul(mosek.fusion.Variable,array(double,ndim=1))\n\tmosek.fusion.Expr.mul(mosek.fusion.Variable,double)\n\tmosek.fusion.Expr.mul(mosek.fusion.Matrix,mosek.fusion.Expression)\n\tmosek.fusion.Expr.mul(mosek.fusion.Variable,mosek.fusion.Matrix)\n\tmosek.fusion.Expr.mul(double,mosek.fusion.Variable)\n\tmosek.fusion.Expr.mul(array(double,ndim=2),mosek.fusion.Variable)\n\tmosek.fusion.Expr.mul(mosek.fusion.Variable,array(double,ndim=2))\n\tmosek.fusion.Expr.mul(mosek.fusion.Expression,mosek.fusion.Matrix)\n\tmosek.fusion.Expr.mul(mosek.fusion.Expression,array(double,ndim=1))\n\tmosek.fusion.Expr.mul(mosek.fusion.Expression,double)\n\tmosek.fusion.Expr.mul(mosek.fusion.Parameter,mosek.fusion.Variable)')
   @staticmethod
   def mulDiag(*args):
+    if mosek_fusion_BuildProfiler._timing_():
+      return mosek_fusion_BuildProfiler._expr_S(mosek_fusion_Expr.mulDiag,args)
+    if mosek_fusion_Parameter._tracking_():
+      return mosek_fusion_Parameter._track_S(mosek_fusion_Expr.mulDiag,args)
     if False: pass
     elif mosek_fusion_Expr._match_mulDiag_Lmosek_4fusion_4Expression_2_3_5D(*args): # mosek.fusion.Expression,[,]double
       return mosek_fusion_Expr._mulDiag_Lmosek_4fusion_4Expression_2_3_5D(*args)
@@ -27832,6 +29114,10 @@ def __mk_mosek_fusion_Expr():
       raise ValueError('Invalid argument list mulDiag('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Expr.mulDiag(mosek.fusion.Expression,array(double,ndim=2))\n\tmosek.fusion.Expr.mulDiag(mosek.fusion.Matrix,mosek.fusion.Variable)\n\tmosek.fusion.Expr.mulDiag(mosek.fusion.Variable,array(double,ndim=2))\n\tmosek.fusion.Expr.mulDiag(mosek.fusion.Matrix,mosek.fusion.Expression)\n\tmosek.fusion.Expr.mulDiag(mosek.fusion.Variable,mosek.fusion.Matrix)\n\tmosek.fusion.Expr.mulDiag(array(double,ndim=2),mosek.fusion.Variable)\n\tmosek.fusion.Expr.mulDiag(array(double,ndim=2),mosek.fusion.Expression)\n\tmosek.fusion.Expr.mulDiag(mosek.fusion.Expression,mosek.fusion.Matrix)')
   @staticmethod
   def add(*args):
+    if mosek_fusion_BuildProfiler._timing_():
+      return mosek_fusion_BuildProfiler._expr_S(mosek_fusion_Expr.add,args)
+    if mosek_fusion_Parameter._tracking_():
+      return mosek_fusion_Parameter._track_S(mosek_fusion_Expr.add,args)
     if False: pass
     elif mosek_fusion_Expr._match_add__3Lmosek_4fusion_4Expression_2(*args): # []mosek.fusion.Expression
       return mosek_fusion_Expr._add__3Lmosek_4fusion_4Expression_2(*args)
@@ -27941,6 +29227,10 @@ def __mk_mosek_fusion_Expr():
       raise ValueError('Invalid argument list add('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Expr.add(array(mosek.fusion.Expression,ndim=1))\n\tmosek.fusion.Expr.add(array(mosek.fusion.Variable,ndim=1))\n\tmosek.fusion.Expr.add(mosek.fusion.NDSparseArray,mosek.fusion.Variable)\n\tmosek.fusion.Expr.add(mosek.fusion.Matrix,mosek.fusion.Variable)\n\tmosek.fusion.Expr.add(mosek.fusion.Variable,mosek.fusion.Expression)\n\tmosek.fusion.Expr.add(array(double,ndim=1),mosek.fusion.Expression)\n\tmosek.fusion.Expr.add(array(double,ndim=1),mosek.fusion.Variable)\n\tmosek.fusion.Expr.add(mosek.fusion.NDSparseArray,mosek.fusion.Expression)\n\tmosek.fusion.Expr.add(double,mosek.fusion.Expression)\n\tmosek.fusion.Expr.add(mosek.fusion.Variable,array(double,ndim=1))\n\tmosek.fusion.Expr.add(mosek.fusion.Variable,double)\n\tmosek.fusion.Expr.add(mosek.fusion.Variable,mosek.fusion.Variable)\n\tmosek.fusion.Expr.add(mosek.fusion.Variable,mosek.fusion.NDSparseArray)\n\tmosek.fusion.Expr.add(mosek.fusion.Matrix,mosek.fusion.Expression)\n\tmosek.fusion.Expr.add(mosek.fusion.Variable,mosek.fusion.Matrix)\n\tmosek.fusion.Expr.add(mosek.fusion.Expression,array(double,ndim=1))\n\tmosek.fusion.Expr.add(mosek.fusion.Expression,mosek.fusion.Expression)\n\tmosek.fusion.Expr.add(double,mosek.fusion.Variable)\n\tmosek.fusion.Expr.add(array(double,ndim=2),mosek.fusion.Variable)\n\tmosek.fusion.Expr.add(array(double,ndim=2),mosek.fusion.Expression)\n\tmosek.fusion.Expr.add(mosek.fusion.Variable,array(double,ndim=2))\n\tmosek.fusion.Expr.add(mosek.fusion.Expression,mosek.fusion.Matrix)\n\tmosek.fusion.Expr.add(mosek.fusion.Expression,mosek.fusion.NDSparseArray)\n\tmosek.fusion.Expr.add(mosek.fusion.Expression,array(double,ndim=2))\n\tmosek.fusion.Expr.add(mosek.fusion.Expression,double)\n\tmosek.fusion.Expr.add(mosek.fusion.Expression,mosek.fusion.Variable)')
   @staticmethod
   def mulElm(*args):
+    if mosek_fusion_BuildProfiler._timing_():
+      return mosek_fusion_BuildProfiler._expr_S(mosek_fusion_Expr.mulElm,args)
+    if mosek_fusion_Parameter._tracking_():
+      return mosek_fusion_Parameter._track_S(mosek_fusion_Expr.mulElm,args)
     if False: pass
     elif mosek_fusion_Expr._match_mulElm_Lmosek_4fusion_4Variable_2Lmosek_4fusion_4NDSparseArray_2(*args): # mosek.fusion.Variable,mosek.fusion.NDSparseArray
       return mosek_fusion_Expr._mulElm_Lmosek_4fusion_4Variable_2Lmosek_4fusion_4NDSparseArray_2(*args)
@@ -28006,10 +29296,18 @@ def __mk_mosek_fusion_Expr():
       return mosek_fusion_Expr._mulElm_Lmosek_4fusion_4Expression_2_3_5D(*args)
     elif mosek_fusion_Expr._match_alt_mulElm_Lmosek_4fusion_4Expression_2_3_5D(*args): # mosek.fusion.Expression,[,]double
       return mosek_fusion_Expr._mulElm_alt_Lmosek_4fusion_4Expression_2_3_5D(*args)
+    elif mosek_fusion_Expr._match_mulElm_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Variable_2(*args): # mosek.fusion.Parameter,mosek.fusion.Variable
+      return mosek_fusion_Expr._mulElm_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Variable_2(*args)
+    elif mosek_fusion_Expr._match_alt_mulElm_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Variable_2(*args): # mosek.fusion.Parameter,mosek.fusion.Variable
+      return mosek_fusion_Expr._mulElm_alt_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Variable_2(*args)
     else:
-      raise ValueError('Invalid argument list mulElm('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Expr.mulElm(mosek.fusion.Variable,mosek.fusion.NDSparseArray)\n\tmosek.fusion.Expr.mulElm(mosek.fusion.Expression,array(double,ndim=1))\n\tmosek.fusion.Expr.mulElm(mosek.fusion.NDSparseArray,mosek.fusion.Variable)\n\tmosek.fusion.Expr.mulElm(mosek.fusion.Matrix,mosek.fusion.Variable)\n\tmosek.fusion.Expr.mulElm(array(double,ndim=1),mosek.fusion.Expression)\n\tmosek.fusion.Expr.mulElm(array(double,ndim=1),mosek.fusion.Variable)\n\tmosek.fusion.Expr.mulElm(mosek.fusion.NDSparseArray,mosek.fusion.Expression)\n\tmosek.fusion.Expr.mulElm(mosek.fusion.Variable,array(double,ndim=1))\n\tmosek.fusion.Expr.mulElm(mosek.fusion.Matrix,mosek.fusion.Expression)\n\tmosek.fusion.Expr.mulElm(mosek.fusion.Variable,mosek.fusion.Matrix)\n\tmosek.fusion.Expr.mulElm(array(double,ndim=2),mosek.fusion.Variable)\n\tmosek.fusion.Expr.mulElm(array(double,ndim=2),mosek.fusion.Expression)\n\tmosek.fusion.Expr.mulElm(mosek.fusion.Variable,array(double,ndim=2))\n\tmosek.fusion.Expr.mulElm(mosek.fusion.Expression,mosek.fusion.Matrix)\n\tmosek.fusion.Expr.mulElm(mosek.fusion.Expression,mosek.fusion.NDSparseArray)\n\tmosek.fusion.Expr.mulElm(mosek.fusion.Expression,array(double,ndim=2))')
+      raise ValueError('Invalid argument list mulElm('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Expr.mulElm(mosek.fusion.Variable,mosek.fusion.NDSparseArray)\n\tmosek.fusion.Expr.mulElm(mosek.fusion.Expression,array(double,ndim=1))\n\tmosek.fusion.Expr.mulElm(mosek.fusion.NDSparseArray,mosek.fusion.Variable)\n\tmosek.fusion.Expr.mulElm(mosek.fusion.Matrix,mosek.fusion.Variable)\n\tmosek.fusion.Expr.mulElm(array(double,ndim=1),mosek.fusion.Expression)\n\tmosek.fusion.Expr.mulElm(array(double,ndim=1),mosek.fusion.Variable)\n\tmosek.fusion.Expr.mulElm(mosek.fusion.NDSparseArray,mosek.fusion.Expression)\n\tmosek.fusion.Expr.mulElm(mosek.fusion.Variable,array(double,ndim=1))\n\tmosek.fusion.Expr.mulElm(mosek.fusion.Matrix,mosek.fusion.Expression)\n\tmosek.fusion.Expr.mulElm(mosek.fusion.Variable,mosek.fusion.Matrix)\n\tmosek.fusion.Expr.mulElm(array(double,ndim=2),mosek.fusion.Variable)\n\tmosek.fusion.Expr.mulElm(array(double,ndim=2),mosek.fusion.Expression)\n\tmosek.fusion.Expr.mulElm(mosek.fusion.Variable,array(double,ndim=2))\n\tmosek.fusion.Expr.mulElm(mosek.fusion.Expression,mosek.fusion.Matrix)\n\tmosek.fusion.Expr.mulElm(mosek.fusion.Expression,mosek.fusion.NDSparseArray)\n\tmosek.fusion.Expr.mulElm(mosek.fusion.Expression,array(double,ndim=2))\n\tmosek.fusion.Expr.mulElm(mosek.fusion.Parameter,mosek.fusion.Variable)')
   @staticmethod
   def neg(*args):
+    if mosek_fusion_BuildProfiler._timing_():
+      return mosek_fusion_BuildProfiler._expr_S(mosek_fusion_Expr.neg,args)
+    if mosek_fusion_Parameter._tracking_():
+      return mosek_fusion_Parameter._track_S(mosek_fusion_Expr.neg,args)
     if False: pass
     elif mosek_fusion_Expr._match_neg_Lmosek_4fusion_4Expression_2(*args): # mosek.fusion.Expression
       return mosek_fusion_Expr._neg_Lmosek_4fusion_4Expression_2(*args)
@@ -28023,6 +29321,10 @@ def __mk_mosek_fusion_Expr():
       raise ValueError('Invalid argument list neg('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Expr.neg(mosek.fusion.Expression)\n\tmosek.fusion.Expr.neg(mosek.fusion.Variable)')
   @staticmethod
   def ones(*args):
+    if mosek_fusion_BuildProfiler._timing_():
+      return mosek_fusion_BuildProfiler._expr_S(mosek_fusion_Expr.ones,args)
+    if mosek_fusion_Parameter._tracking_():
+      return mosek_fusion_Parameter._track_S(mosek_fusion_Expr.ones,args)
     if False: pass
     elif mosek_fusion_Expr._match_ones_I(*args): # int32
       return mosek_fusion_Expr._ones_I(*args)
@@ -28032,6 +29334,10 @@ def __mk_mosek_fusion_Expr():
       raise ValueError('Invalid argument list ones('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Expr.ones(int32)')
   @staticmethod
   def flatten(*args):
+    if mosek_fusion_BuildProfiler._timing_():
+      return mosek_fusion_BuildProfiler._expr_S(mosek_fusion_Expr.flatten,args)
+    if mosek_fusion_Parameter._tracking_():
+      return mosek_fusion_Parameter._track_S(mosek_fusion_Expr.flatten,args)
     if False: pass
     elif mosek_fusion_Expr._match_flatten_Lmosek_4fusion_4Expression_2(*args): # mosek.fusion.Expression
       return mosek_fusion_Expr._flatten_Lmosek_4fusion_4Expression_2(*args)
@@ -28041,6 +29347,10 @@ def __mk_mosek_fusion_Expr():
       raise ValueError('Invalid argument list flatten('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Expr.flatten(mosek.fusion.Expression)')
   @staticmethod
   def outer(*args):
+    if mosek_fusion_BuildProfiler._timing_():
+      return mosek_fusion_BuildProfiler._expr_S(mosek_fusion_Expr.outer,args)
+    if mosek_fusion_Parameter._tracking_():
+      return mosek_fusion_Parameter._track_S(mosek_fusion_Expr.outer,args)
     if False: pass
     elif mosek_fusion_Expr._match_outer_Lmosek_4fusion_4Matrix_2Lmosek_4fusion_4Variable_2(*args): # mosek.fusion.Matrix,mosek.fusion.Variable
       return mosek_fusion_Expr._outer_Lmosek_4fusion_4Matrix_2Lmosek_4fusion_4Variable_2(*args)
@@ -28069,6 +29379,10 @@ def __mk_mosek_fusion_Expr():
     else:
       raise ValueError('Invalid argument list outer('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Expr.outer(mosek.fusion.Matrix,mosek.fusion.Variable)\n\tmosek.fusion.Expr.outer(array(double,ndim=1),mosek.fusion.Expression)\n\tmosek.fusion.Expr.outer(array(double,ndim=1),mosek.fusion.Variable)\n\tmosek.fusion.Expr.outer(mosek.fusion.Variable,mosek.fusion.Matrix)\n\tmosek.fusion.Expr.outer(mosek.fusion.Variable,array(double,ndim=1))\n\tmosek.fusion.Expr.outer(mosek.fusion.Expression,array(double,ndim=1))')
   def slice(self,*args):
+    if mosek_fusion_BuildProfiler._timing_():
+      return mosek_fusion_BuildProfiler._expr_S(mosek_fusion_Expr.slice,(self,)+args)
+    if mosek_fusion_Parameter._tracking_():
+      return mosek_fusion_Parameter._track_S(mosek_fusion_Expr.slice,(self,)+args)
     if False: pass
     elif mosek_fusion_Expr._match_slice_II(*args): # int32,int32
       return self._slice_II(*args)
@@ -28107,6 +29421,7 @@ def __mk_mosek_fusion_Expr():
    assert bfix_ is None or isinstance(bfix_,numpy.ndarray)
    assert inst_ is None or isinstance(inst_,numpy.ndarray)
    object.__init__(self)
+   self.__params = None
    self.__model = mosek.fusion.Expr.__extractModel__3Lmosek_4fusion_4Variable_2(v)
    self.__shape_p = shp
    self.__x = v
@@ -28155,6 +29470,7 @@ def __mk_mosek_fusion_Expr():
    assert bfix_ is None or isinstance(bfix_,numpy.ndarray)
    assert inst_ is None or isinstance(inst_,numpy.ndarray)
    object.__init__(self)
+   self.__params = None
    self.__model = mosek.fusion.Expr.__extractModel__3Lmosek_4fusion_4Variable_2(v)
    (self.__shape_p) = shp
    self.__x = v
@@ -28188,6 +29504,7 @@ def __mk_mosek_fusion_Expr():
     self._ctor_init_Lmosek_4fusion_4Expression_2(e)
   def _ctor_init_Lmosek_4fusion_4Expression_2(self,e):
    object.__init__(self)
+   self.__params = None
    _1=e
    if   isinstance(_1,mosek_fusion_Expr):
     ee=_1
@@ -28485,7 +29802,7 @@ def __mk_mosek_fusion_Expr():
    _4=numpy.zeros((0,), dtype=numpy.dtype(numpy.int64))
    _5=numpy.zeros((0,), dtype=numpy.dtype(numpy.float64))
    _6=mosek.fusion.Utils.Tools._arraycopy__3D((_0._cof))
-   _7=mosek.fusion.Utils.Tools._arraycopy__3J((_0._inst))
+   _7=numpy.array((_0._inst),dtype=numpy.dtype(numpy.int64))
    return (mosek_fusion_Expr._ctor__3J_3Lmosek_4fusion_4Variable_2_3J_3D_3DLmosek_4fusion_4Set_2_3J(_2,_3,_4,_5,_6,_1,_7))
   @staticmethod
   def _match_constTerm_Lmosek_4fusion_4Matrix_2(*args):
@@ -28594,7 +29911,7 @@ def __mk_mosek_fusion_Expr():
     return (__arg_alt_match__3_5D__(_0))
   @staticmethod
   def _constTerm_alt__3_5D(_t__0):
-   _0=numpy.array(_t__0,ndmin=_monty.checkShape(_t__0,2),dtype=numpy.dtype(numpy.float64))
+   _0=_monty.makeArray(_t__0,2,numpy.dtype(numpy.float64))
    _1 = mosek_fusion_Expr._constTerm__3_5D(_0)
    return _1
   @staticmethod
@@ -29941,7 +31258,7 @@ def __mk_mosek_fusion_Expr():
   @staticmethod
   def _mulDiag_alt_Lmosek_4fusion_4Variable_2_3_5D(_t__0,_t__1):
    _0=_t__0
-   _1=numpy.array(_t__1,ndmin=_monty.checkShape(_t__1,2),dtype=numpy.dtype(numpy.float64))
+   _1=_monty.makeArray(_t__1,2,numpy.dtype(numpy.float64))
    _1 = mosek_fusion_Expr._mulDiag_Lmosek_4fusion_4Variable_2_3_5D(_0,_1)
    return _1
   @staticmethod
@@ -29960,7 +31277,7 @@ def __mk_mosek_fusion_Expr():
     return (__arg_alt_match__3_5D__(_0) and __arg_alt_match_Lmosek_4fusion_4Variable_2__(_1))
   @staticmethod
   def _mulDiag_alt__3_5DLmosek_4fusion_4Variable_2(_t__0,_t__1):
-   _0=numpy.array(_t__0,ndmin=_monty.checkShape(_t__0,2),dtype=numpy.dtype(numpy.float64))
+   _0=_monty.makeArray(_t__0,2,numpy.dtype(numpy.float64))
    _1=_t__1
    _1 = mosek_fusion_Expr._mulDiag__3_5DLmosek_4fusion_4Variable_2(_0,_1)
    return _1
@@ -29981,7 +31298,7 @@ def __mk_mosek_fusion_Expr():
   @staticmethod
   def _mulDiag_alt_Lmosek_4fusion_4Expression_2_3_5D(_t__0,_t__1):
    _0=_t__0
-   _1=numpy.array(_t__1,ndmin=_monty.checkShape(_t__1,2),dtype=numpy.dtype(numpy.float64))
+   _1=_monty.makeArray(_t__1,2,numpy.dtype(numpy.float64))
    _1 = mosek_fusion_Expr._mulDiag_Lmosek_4fusion_4Expression_2_3_5D(_0,_1)
    return _1
   @staticmethod
@@ -30000,7 +31317,7 @@ def __mk_mosek_fusion_Expr():
     return (__arg_alt_match__3_5D__(_0) and __arg_alt_match_Lmosek_4fusion_4Expression_2__(_1))
   @staticmethod
   def _mulDiag_alt__3_5DLmosek_4fusion_4Expression_2(_t__0,_t__1):
-   _0=numpy.array(_t__0,ndmin=_monty.checkShape(_t__0,2),dtype=numpy.dtype(numpy.float64))
+   _0=_monty.makeArray(_t__0,2,numpy.dtype(numpy.float64))
    _1=_t__1
    _1 = mosek_fusion_Expr._mulDiag__3_5DLmosek_4fusion_4Expression_2(_0,_1)
    return _1
@@ -30015,12 +31332,16 @@ def __mk_mosek_fusion_Expr():
   def __mulElm_1_Lmosek_4fusion_4Matrix_2Lmosek_4fusion_4Expression_2(_0,_1):
    if ((_0.numRows()!=_1.shape().dim(0)) or ((_0.numColumns()!=_1.shape().dim(1)) or ((_0.numRows() * _0.numColumns())!=_1.shape().getSize()))):
     raise mosek_fusion_DimensionError._ctor_S("Dimensions of operands do not match")
-   _2=_0.numNonzeros()
-   _3=numpy.zeros((_2,), dtype=numpy.dtype(numpy.int32))
-   _4=numpy.zeros((_2,), dtype=numpy.dtype(numpy.int32))
-   _5=numpy.zeros((_2,), dtype=numpy.dtype(numpy.float64))
-   _0.getDataAsTriplets(_3,_4,_5)
-   _6=numpy.array([((_3[_7] * _0.numColumns()) + _4[_7]) for _7 in range(0,_2)], dtype=numpy.dtype(numpy.int64))
+   if _0._isSparse_():
+    _3,_4,_5=_0._csr_()
+    _6=((numpy.repeat(numpy.arange(0,_0._numRows_(),dtype=numpy.dtype(numpy.int64)),numpy.diff(_3)) * _0._numColumns_()) + _4)
+   else:
+    _2=_0._numNonzeros_()
+    _3=numpy.zeros((_2,), dtype=numpy.dtype(numpy.int32))
+    _4=numpy.zeros((_2,), dtype=numpy.dtype(numpy.int32))
+    _5=numpy.zeros((_2,), dtype=numpy.dtype(numpy.float64))
+    _0._getDataAsTriplets__3I_3I_3D(_3,_4,_5)
+    _6=((_3.astype(numpy.int64) * _0._numColumns_()) + _4)
    _8=_1.eval()
    return (mosek.fusion.Expr.__dotmul_1__3J_3D_3J_3J_3D_3D_3J_3Lmosek_4fusion_4Variable_2Lmosek_4fusion_4Set_2(_6,_5,(_8.ptrb),(_8.subj),(_8.cof),(_8.bfix),(_8.inst),(_8.x),(_8.shape)))
   @staticmethod
@@ -30030,12 +31351,16 @@ def __mk_mosek_fusion_Expr():
   def __mulElm_1_Lmosek_4fusion_4Matrix_2Lmosek_4fusion_4Variable_2(_0,_1):
    if ((_0.numRows()!=_1.shape().dim(0)) or ((_0.numColumns()!=_1.shape().dim(1)) or ((_0.numRows() * _0.numColumns())!=_1.shape().getSize()))):
     raise mosek_fusion_DimensionError._ctor_S("Dimensions of operands do not match")
-   _2=_0.numNonzeros()
-   _3=numpy.zeros((_2,), dtype=numpy.dtype(numpy.int32))
-   _4=numpy.zeros((_2,), dtype=numpy.dtype(numpy.int32))
-   _5=numpy.zeros((_2,), dtype=numpy.dtype(numpy.float64))
-   _0.getDataAsTriplets(_3,_4,_5)
-   _6=numpy.array([((_3[_7] * _0.numColumns()) + _4[_7]) for _7 in range(0,_2)], dtype=numpy.dtype(numpy.int64))
+   if _0._isSparse_():
+    _3,_4,_5=_0._csr_()
+    _6=((numpy.repeat(numpy.arange(0,_0._numRows_(),dtype=numpy.dtype(numpy.int64)),numpy.diff(_3)) * _0._numColumns_()) + _4)
+   else:
+    _2=_0._numNonzeros_()
+    _3=numpy.zeros((_2,), dtype=numpy.dtype(numpy.int32))
+    _4=numpy.zeros((_2,), dtype=numpy.dtype(numpy.int32))
+    _5=numpy.zeros((_2,), dtype=numpy.dtype(numpy.float64))
+    _0._getDataAsTriplets__3I_3I_3D(_3,_4,_5)
+    _6=((_3.astype(numpy.int64) * _0._numColumns_()) + _4)
    return (mosek.fusion.Expr.__dotmul_1__3J_3DLmosek_4fusion_4Variable_2Lmosek_4fusion_4Set_2(_6,_5,_1,_1.shape()))
   @staticmethod
   def __mulElm_1_alt__3DLmosek_4fusion_4Variable_2(_t__0,_t__1):
@@ -30091,7 +31416,7 @@ def __mk_mosek_fusion_Expr():
     if ((_0._dims)[_4]!=_1.shape().dim(_4)):
      raise mosek_fusion_LengthError._ctor_S("Dimension mismatch")
    _5=_1.eval()
-   return (mosek.fusion.Expr.__dotmul_1__3J_3D_3J_3J_3D_3D_3J_3Lmosek_4fusion_4Variable_2Lmosek_4fusion_4Set_2((_0._inst),(_0._cof),(_5.ptrb),(_5.subj),(_5.cof),(_5.bfix),(_5.inst),(_5.x),(_5.shape)))
+   return (mosek.fusion.Expr.__dotmul_1__3J_3D_3J_3J_3D_3D_3J_3Lmosek_4fusion_4Variable_2Lmosek_4fusion_4Set_2(_0._inst64_(),(_0._cof),(_5.ptrb),(_5.subj),(_5.cof),(_5.bfix),(_5.inst),(_5.x),(_5.shape)))
   @staticmethod
   def __mulElm_1_alt_Lmosek_4fusion_4NDSparseArray_2Lmosek_4fusion_4Variable_2(_t__0,_t__1):
     return mosek_fusion_Expr.__mulElm_1_Lmosek_4fusion_4NDSparseArray_2Lmosek_4fusion_4Variable_2(_0,_1)
@@ -30102,7 +31427,7 @@ def __mk_mosek_fusion_Expr():
    for _2 in range(0,int(((_0._dims)).shape[0])):
     if ((_0._dims)[_2]!=_1.shape().dim(_2)):
      raise mosek_fusion_LengthError._ctor_S("Dimension mismatch")
-   return (mosek.fusion.Expr.__dotmul_1__3J_3DLmosek_4fusion_4Variable_2Lmosek_4fusion_4Set_2((_0._inst),(_0._cof),_1,_1.shape()))
+   return (mosek.fusion.Expr.__dotmul_1__3J_3DLmosek_4fusion_4Variable_2Lmosek_4fusion_4Set_2(_0._inst64_(),(_0._cof),_1,_1.shape()))
   @staticmethod
   def __dotmul_1_alt__3J_3DLmosek_4fusion_4Variable_2Lmosek_4fusion_4Set_2(_t__0,_t__1,_t__2,_t__3):
    _0=numpy.array(_t__0,dtype=numpy.dtype(numpy.int64))
@@ -31083,7 +32408,7 @@ def __mk_mosek_fusion_Expr():
   @staticmethod
   def _mul_alt_Lmosek_4fusion_4Variable_2_3_5D(_t__0,_t__1):
    _0=_t__0
-   _1=numpy.array(_t__1,ndmin=_monty.checkShape(_t__1,2),dtype=numpy.dtype(numpy.float64))
+   _1=_monty.makeArray(_t__1,2,numpy.dtype(numpy.float64))
    _1 = mosek_fusion_Expr._mul_Lmosek_4fusion_4Variable_2_3_5D(_0,_1)
    return _1
   @staticmethod
@@ -31110,7 +32435,7 @@ def __mk_mosek_fusion_Expr():
     return (__arg_alt_match__3_5D__(_0) and __arg_alt_match_Lmosek_4fusion_4Variable_2__(_1))
   @staticmethod
   def _mul_alt__3_5DLmosek_4fusion_4Variable_2(_t__0,_t__1):
-   _0=numpy.array(_t__0,ndmin=_monty.checkShape(_t__0,2),dtype=numpy.dtype(numpy.float64))
+   _0=_monty.makeArray(_t__0,2,numpy.dtype(numpy.float64))
    _1=_t__1
    _1 = mosek_fusion_Expr._mul__3_5DLmosek_4fusion_4Variable_2(_0,_1)
    return _1
@@ -31305,53 +32630,29 @@ def __mk_mosek_fusion_Expr():
      _11 = mosek_fusion_NDSet._ctor_II(_9,_10)
     if (not _1.isSparse()):
      _12=(numpy.int64(_9) * numpy.int64(_10))
-     _13=_1.getDataAsArray()
-     _14=numpy.array([_15 for _15 in range(0,(((numpy.int64(_9) * _10) * _6) + 1),_6)], dtype=numpy.dtype(numpy.int64))
-     _16=numpy.array([((numpy.int64(_17) * _6) + _19) for _17 in range(0,_9) for _18 in range(0,_10) for _19 in range(0,_6)], dtype=numpy.dtype(numpy.int64))
-     _20=numpy.array([_13[((_23 * _5) + _22)] for _21 in range(0,_9) for _22 in range(0,_10) for _23 in range(0,_6)], dtype=numpy.dtype(numpy.float64))
+     _13=_1._dataView_().reshape(_4,_5)
+     # Row (r,j) of the result is x[r,:]*A[:,j]
+     _14=numpy.arange(0,((_12 * _6) + 1),_6,dtype=numpy.dtype(numpy.int64))
+     _16=numpy.repeat(((numpy.arange(0,_9,dtype=numpy.dtype(numpy.int64)) * _6).reshape(-1,1) + numpy.arange(0,_6,dtype=numpy.dtype(numpy.int64))),_10,axis=0).ravel()
+     _20=numpy.tile(_13.T.ravel(),_9)
+     if mosek.fusion.Utils.Tools._denseskipzeros:
+      _21=numpy.tile((_13.T!=0.0).ravel(),_9)
+      _14=numpy.zeros(((_12 + 1),), dtype=numpy.dtype(numpy.int64))
+      numpy.cumsum(numpy.tile(numpy.count_nonzero(_13,axis=0),_9),out=_14[1:])
+      _16=_16[_21]
+      _20=_20[_21]
      return (mosek_fusion_Expr._ctor__3J_3Lmosek_4fusion_4Variable_2_3J_3D_3DLmosek_4fusion_4Set_2_3J(_14,numpy.array([_0], dtype=numpy.dtype(object)),_16,_20,None,_11,None))
     elif (_8 > 0):
-     _24=numpy.zeros((_8,), dtype=numpy.dtype(numpy.int32))
-     _25=numpy.zeros((_8,), dtype=numpy.dtype(numpy.int32))
-     _26=numpy.zeros((_8,), dtype=numpy.dtype(numpy.float64))
-     _27=numpy.array([_28 for _28 in range(0,_8)], dtype=numpy.dtype(numpy.int64))
-     _1.getDataAsTriplets(_24,_25,_26)
-     if (_8 > _5):
-      mosek.fusion.Sort._argbucketsort__3J_3IJJII(_27,_25,0,_8,0,_5)
-     else:
-      mosek.fusion.Sort._argsort__3J_3IJJZ(_27,_25,0,_8,False)
-     _29=0
-     if (_8 > 0):
-      _29 = 1
-      _30=1
-      while (_30 < _8):
-       if (_25[_27[_30]] > _25[_27[(_30 - 1)]]):
-        _29 += 1
-       _30 += 1
-     _31=(_29 * numpy.int64(_7))
-     _32=numpy.zeros(((_31 + 1),), dtype=numpy.dtype(numpy.int64))
-     _33=numpy.zeros((_31,), dtype=numpy.dtype(numpy.int64))
-     _34=numpy.zeros(((_8 * _7),), dtype=numpy.dtype(numpy.int64))
-     _35=numpy.zeros(((_8 * _7),), dtype=numpy.dtype(numpy.float64))
-     _36=0
-     _37=0
-     for _38 in range(0,_9):
-      _39=0
-      while (_39 < _8):
-       _40=_25[_27[_39]]
-       _41=_39
-       _42=_39
-       while ((_42 < _8) and (_25[_27[_42]]==_25[_27[_39]])):
-        _42 += 1
-       for _43 in range(_41,_42):
-        _34[_37] = ((numpy.int64(_38) * _6) + _24[_27[_43]])
-        _35[_37] = _26[_27[_43]]
-        _37 += 1
-       _32[(_36 + 1)] = _37
-       _33[_36] = ((numpy.int64(_38) * _10) + _40)
-       _36 += 1
-       _39 = _42
-     return (mosek_fusion_Expr._ctor__3J_3Lmosek_4fusion_4Variable_2_3J_3D_3DLmosek_4fusion_4Set_2_3J(_32,numpy.array([_0], dtype=numpy.dtype(object)),_34,_35,None,_11,_33))
+     _24,_25,_26=_1._csc_()
+     _27=numpy.diff(_24)
+     _28=numpy.nonzero(_27)[0]
+     _29=numpy.arange(0,_9,dtype=numpy.dtype(numpy.int64)).reshape(-1,1)
+     _30=numpy.zeros((((_9 * int((_28).shape[0])) + 1),), dtype=numpy.dtype(numpy.int64))
+     numpy.cumsum(numpy.tile(_27[_28],_9),out=_30[1:])
+     _31=((_29 * _10) + _28).ravel()
+     _32=((_29 * _6) + _25).ravel()
+     _33=numpy.tile(_26,_9)
+     return (mosek_fusion_Expr._ctor__3J_3Lmosek_4fusion_4Variable_2_3J_3D_3DLmosek_4fusion_4Set_2_3J(_30,numpy.array([_0], dtype=numpy.dtype(object)),_32,_33,None,_11,_31))
     else:
      return (mosek_fusion_Expr._ctor__3J_3Lmosek_4fusion_4Variable_2_3J_3D_3DLmosek_4fusion_4Set_2_3J(numpy.array([0], dtype=numpy.dtype(numpy.int64)),numpy.array([_0], dtype=numpy.dtype(object)),numpy.zeros((0,), dtype=numpy.dtype(numpy.int64)),numpy.zeros((0,), dtype=numpy.dtype(numpy.float64)),None,_11,numpy.zeros((0,), dtype=numpy.dtype(numpy.int64))))
   @staticmethod
@@ -31392,75 +32693,60 @@ def __mk_mosek_fusion_Expr():
    else:
     _10 = mosek_fusion_NDSet._ctor_II(_7,_8)
    if (((_2.nd)==1) and (_2.dim(0)==1)):
-    if _0.isSparse():
-     _11=numpy.zeros((_0.numNonzeros(),), dtype=numpy.dtype(numpy.int32))
-     _12=numpy.zeros((_0.numNonzeros(),), dtype=numpy.dtype(numpy.int32))
-     _13=numpy.zeros((_0.numNonzeros(),), dtype=numpy.dtype(numpy.float64))
-     _0.getDataAsTriplets(_11,_12,_13)
-     _14=numpy.array([((numpy.int64(_11[_15]) * _4) + _12[_15]) for _15 in range(0,int((_12).shape[0]))], dtype=numpy.dtype(numpy.int64))
-     _9 = mosek_fusion_Expr._ctor__3J_3Lmosek_4fusion_4Variable_2_3J_3D_3DLmosek_4fusion_4Set_2_3J(mosek.fusion.Utils.Tools._range_JJ(0,(_0.numNonzeros() + 1)),numpy.array([_1], dtype=numpy.dtype(object)),mosek.fusion.Utils.Tools._makevector_JI(0,numpy.int32(_0.numNonzeros())),_13,None,_10,_14)
-    else:
-     _9 = mosek_fusion_Expr._ctor__3J_3Lmosek_4fusion_4Variable_2_3J_3D_3DLmosek_4fusion_4Set_2_3J(mosek.fusion.Utils.Tools._range_JJ(0,(_0.numNonzeros() + 1)),numpy.array([_1], dtype=numpy.dtype(object)),numpy.array([0 for _16 in range(0,_0.numNonzeros())], dtype=numpy.dtype(numpy.int64)),_0.getDataAsArray(),None,_10,None)
+    if _0._isSparse_():
+     _11,_12,_13=_0._csr_()
+     _14=((numpy.repeat(numpy.arange(0,_3,dtype=numpy.dtype(numpy.int64)),numpy.diff(_11)) * _4) + _12)
+     _9 = mosek_fusion_Expr._ctor__3J_3Lmosek_4fusion_4Variable_2_3J_3D_3DLmosek_4fusion_4Set_2_3J(mosek.fusion.Utils.Tools._range_JJ(0,(_0.numNonzeros() + 1)),numpy.array([_1], dtype=numpy.dtype(object)),mosek.fusion.Utils.Tools._makevector_JI(0,numpy.int32(_0.numNonzeros())),numpy.array(_13,dtype=numpy.dtype(numpy.float64)),None,_10,_14)
+    else:
+     _15=numpy.array(_0._dataView_(),dtype=numpy.dtype(numpy.float64))
+     _16=None
+     if mosek.fusion.Utils.Tools._denseskipzeros:
+      _16=numpy.nonzero(_15)[0]
+      _15=_15[_16]
+     _9 = mosek_fusion_Expr._ctor__3J_3Lmosek_4fusion_4Variable_2_3J_3D_3DLmosek_4fusion_4Set_2_3J(numpy.arange(0,(int((_15).shape[0]) + 1),dtype=numpy.dtype(numpy.int64)),numpy.array([_1], dtype=numpy.dtype(object)),numpy.zeros((int((_15).shape[0]),), dtype=numpy.dtype(numpy.int64)),_15,None,_10,_16)
    elif (_4==_5):
     if _0.isSparse():
      if (_0.numNonzeros() > 0):
-      _17=numpy.zeros((_0.numNonzeros(),), dtype=numpy.dtype(numpy.int32))
-      _18=numpy.zeros((_0.numNonzeros(),), dtype=numpy.dtype(numpy.int32))
-      _19=numpy.zeros((_0.numNonzeros(),), dtype=numpy.dtype(numpy.float64))
+      _17,_18,_19=_0._csr_()
       _20=int((_19).shape[0])
-      _0.getDataAsTriplets(_17,_18,_19)
-      _21=(int((_19).shape[0]) * _6)
-      _22=0
-      _23=0
-      while (_23 < _20):
-       _24=_17[_23]
-       _25=(_23 + 1)
-       while ((_25 < _20) and (_24==_17[_25])):
-        _25 += 1
-       _22 += 1
-       _23 = _25
-      _26=(_22 * _6)
-      _27=numpy.zeros(((_26 + 1),), dtype=numpy.dtype(numpy.int64))
-      _28=numpy.zeros((_26,), dtype=numpy.dtype(numpy.int64))
-      _29=numpy.zeros((_21,), dtype=numpy.dtype(numpy.int64))
-      _30=numpy.zeros((_21,), dtype=numpy.dtype(numpy.float64))
-      if (_22 > 0):
-       _31=0
-       _32=0
-       _33=0
-       while (_33 < _20):
-        _34=_17[_33]
-        _35=(_33 + 1)
-        while ((_35 < _20) and (_34==_17[_35])):
-         _35 += 1
-        for _36 in range(0,_6):
-         _27[(_31 + 1)] = (_27[_31] + (_35 - _33))
-         _28[_31] = ((numpy.int64(_34) * _6) + _36)
-         for _37 in range(_33,_35):
-          _29[_32] = ((numpy.int64(_18[_37]) * _6) + _36)
-          _30[_32] = _19[_37]
-          _32 += 1
-         _31 += 1
-        _33 = _35
-      if (int((_28).shape[0])==(_7 * _8)):
-       _28 = None
-      _9 = mosek_fusion_Expr._ctor__3J_3Lmosek_4fusion_4Variable_2_3J_3D_3DLmosek_4fusion_4Set_2_3J(_27,numpy.array([_1], dtype=numpy.dtype(object)),_29,_30,None,_10,_28)
+      _21=numpy.diff(_17)
+      _22=numpy.nonzero(_21)[0]
+      _23=numpy.zeros((((int((_22).shape[0]) * _6) + 1),), dtype=numpy.dtype(numpy.int64))
+      numpy.cumsum(numpy.repeat(_21[_22],_6),out=_23[1:])
+      _24=((_22.reshape(-1,1) * _6) + numpy.arange(0,_6,dtype=numpy.dtype(numpy.int64))).ravel()
+      if (_6==1):
+       _25=_18.astype(numpy.int64)
+       _26=numpy.array(_19,dtype=numpy.dtype(numpy.float64))
+      else:
+       # Row i of A is repeated for each column c of x: its k'th element
+       # goes to position ptrb[i]*_6 + c*nnz(i) + (k-ptrb[i]).
+       _27=numpy.arange(0,_6,dtype=numpy.dtype(numpy.int64))
+       _28=numpy.repeat(_17[:-1],_21)
+       _29=numpy.repeat(_21,_21)
+       _30=((numpy.arange(0,_20,dtype=numpy.dtype(numpy.int64)) + (_28 * (_6 - 1))).reshape(-1,1) + (_29.reshape(-1,1) * _27))
+       _25=numpy.zeros(((_20 * _6),), dtype=numpy.dtype(numpy.int64))
+       _26=numpy.zeros(((_20 * _6),), dtype=numpy.dtype(numpy.float64))
+       _25[_30] = ((_18.astype(numpy.int64) * _6).reshape(-1,1) + _27)
+       _26[_30] = _19.reshape(-1,1)
+      if (int((_24).shape[0])==(_7 * _8)):
+       _24 = None
+      _9 = mosek_fusion_Expr._ctor__3J_3Lmosek_4fusion_4Variable_2_3J_3D_3DLmosek_4fusion_4Set_2_3J(_23,numpy.array([_1], dtype=numpy.dtype(object)),_25,_26,None,_10,_24)
      else:
       _9 = mosek_fusion_Expr._ctor__3J_3Lmosek_4fusion_4Variable_2_3J_3D_3DLmosek_4fusion_4Set_2_3J(numpy.array([0], dtype=numpy.dtype(numpy.int64)),numpy.array([_1], dtype=numpy.dtype(object)),numpy.zeros((0,), dtype=numpy.dtype(numpy.int64)),numpy.zeros((0,), dtype=numpy.dtype(numpy.float64)),None,_10,numpy.zeros((0,), dtype=numpy.dtype(numpy.int64)))
     else:
-     _38=((_3 * _4) * _6)
-     _39=_0.getDataAsArray()
-     _40=mosek.fusion.Utils.Tools._range_JJJ(0,(_38 + 1),(_4 if ((_4 > 0) ) else 1))
-     _41=numpy.zeros((_38,), dtype=numpy.dtype(numpy.int64))
-     _42=numpy.zeros((_38,), dtype=numpy.dtype(numpy.float64))
-     _43=0
-     for _44 in range(0,_7):
-      for _45 in range(0,_8):
-       for _46 in range(0,_4):
-        _41[_43] = numpy.int64(((_46 * _6) + _45))
-        _42[_43] = _39[((_44 * _4) + _46)]
-        _43 += 1
-     _9 = mosek_fusion_Expr._ctor__3J_3Lmosek_4fusion_4Variable_2_3J_3D_3DLmosek_4fusion_4Set_2_3J(_40,numpy.array([_1], dtype=numpy.dtype(object)),_41,_42,None,_10,None)
+     _28=((_3 * _4) * _6)
+     _29=_0._dataView_().reshape(_3,_4)
+     # Row (i,c) of the result is A[i,:]*x[:,c]
+     _30=mosek.fusion.Utils.Tools._range_JJJ(0,(_28 + 1),(_4 if ((_4 > 0) ) else 1))
+     _31=numpy.tile(((numpy.arange(0,_4,dtype=numpy.dtype(numpy.int64)) * _6) + numpy.arange(0,_6,dtype=numpy.dtype(numpy.int64)).reshape(-1,1)).ravel(),_3)
+     _32=numpy.repeat(_29,_6,axis=0).ravel()
+     if mosek.fusion.Utils.Tools._denseskipzeros:
+      _33=(_32!=0.0)
+      _30=numpy.zeros((((_3 * _6) + 1),), dtype=numpy.dtype(numpy.int64))
+      numpy.cumsum(numpy.repeat(numpy.count_nonzero(_29,axis=1),_6),out=_30[1:])
+      _31=_31[_33]
+      _32=_32[_33]
+     _9 = mosek_fusion_Expr._ctor__3J_3Lmosek_4fusion_4Variable_2_3J_3D_3DLmosek_4fusion_4Set_2_3J(_30,numpy.array([_1], dtype=numpy.dtype(object)),_31,_32,None,_10,None)
    else:
     raise mosek_fusion_LengthError._ctor_S("Operand shapes do not match.")
    return (_9)
@@ -31471,12 +32757,16 @@ def __mk_mosek_fusion_Expr():
   def __dot_1_Lmosek_4fusion_4Matrix_2Lmosek_4fusion_4Expression_2(_0,_1):
    if ((_0.numRows()!=_1.shape().dim(0)) or ((_0.numColumns()!=_1.shape().dim(1)) or ((_0.numRows() * _0.numColumns())!=_1.shape().getSize()))):
     raise mosek_fusion_DimensionError._ctor_S("Dimensions of operands do not match")
-   _2=_0.numNonzeros()
-   _3=numpy.zeros((_2,), dtype=numpy.dtype(numpy.int32))
-   _4=numpy.zeros((_2,), dtype=numpy.dtype(numpy.int32))
-   _5=numpy.zeros((_2,), dtype=numpy.dtype(numpy.float64))
-   _0.getDataAsTriplets(_3,_4,_5)
-   _6=numpy.array([((_3[_7] * _0.numColumns()) + _4[_7]) for _7 in range(0,_2)], dtype=numpy.dtype(numpy.int64))
+   if _0._isSparse_():
+    _3,_4,_5=_0._csr_()
+    _6=((numpy.repeat(numpy.arange(0,_0._numRows_(),dtype=numpy.dtype(numpy.int64)),numpy.diff(_3)) * _0._numColumns_()) + _4)
+   else:
+    _2=_0._numNonzeros_()
+    _3=numpy.zeros((_2,), dtype=numpy.dtype(numpy.int32))
+    _4=numpy.zeros((_2,), dtype=numpy.dtype(numpy.int32))
+    _5=numpy.zeros((_2,), dtype=numpy.dtype(numpy.float64))
+    _0._getDataAsTriplets__3I_3I_3D(_3,_4,_5)
+    _6=((_3.astype(numpy.int64) * _0._numColumns_()) + _4)
    _8=_1.eval()
    return (mosek.fusion.Expr.__inner_1__3J_3D_3J_3J_3D_3D_3J_3Lmosek_4fusion_4Variable_2(_6,_5,(_8.ptrb),(_8.subj),(_8.cof),(_8.bfix),(_8.inst),(_8.x)))
   @staticmethod
@@ -31486,12 +32776,16 @@ def __mk_mosek_fusion_Expr():
   def __dot_1_Lmosek_4fusion_4Matrix_2Lmosek_4fusion_4Variable_2(_0,_1):
    if ((_0.numRows()!=_1.shape().dim(0)) or ((_0.numColumns()!=_1.shape().dim(1)) or ((_0.numRows() * _0.numColumns())!=_1.shape().getSize()))):
     raise mosek_fusion_DimensionError._ctor_S("Dimensions of operands do not match")
-   _2=_0.numNonzeros()
-   _3=numpy.zeros((_2,), dtype=numpy.dtype(numpy.int32))
-   _4=numpy.zeros((_2,), dtype=numpy.dtype(numpy.int32))
-   _5=numpy.zeros((_2,), dtype=numpy.dtype(numpy.float64))
-   _0.getDataAsTriplets(_3,_4,_5)
-   _6=numpy.array([((_3[_7] * _0.numColumns()) + _4[_7]) for _7 in range(0,_2)], dtype=numpy.dtype(numpy.int64))
+   if _0._isSparse_():
+    _3,_4,_5=_0._csr_()
+    _6=((numpy.repeat(numpy.arange(0,_0._numRows_(),dtype=numpy.dtype(numpy.int64)),numpy.diff(_3)) * _0._numColumns_()) + _4)
+   else:
+    _2=_0._numNonzeros_()
+    _3=numpy.zeros((_2,), dtype=numpy.dtype(numpy.int32))
+    _4=numpy.zeros((_2,), dtype=numpy.dtype(numpy.int32))
+    _5=numpy.zeros((_2,), dtype=numpy.dtype(numpy.float64))
+    _0._getDataAsTriplets__3I_3I_3D(_3,_4,_5)
+    _6=((_3.astype(numpy.int64) * _0._numColumns_()) + _4)
    return (mosek.fusion.Expr.__inner_1__3J_3DLmosek_4fusion_4Variable_2(_6,_5,_1))
   @staticmethod
   def __dot_1_alt__3DLmosek_4fusion_4Variable_2(_t__0,_t__1):
@@ -31547,7 +32841,7 @@ def __mk_mosek_fusion_Expr():
     if ((_0._dims)[_4]!=_1.shape().dim(_4)):
      raise mosek_fusion_LengthError._ctor_S("Dimension mismatch")
    _5=_1.eval()
-   return (mosek.fusion.Expr.__inner_1__3J_3D_3J_3J_3D_3D_3J_3Lmosek_4fusion_4Variable_2((_0._inst),(_0._cof),(_5.ptrb),(_5.subj),(_5.cof),(_5.bfix),(_5.inst),(_5.x)))
+   return (mosek.fusion.Expr.__inner_1__3J_3D_3J_3J_3D_3D_3J_3Lmosek_4fusion_4Variable_2(_0._inst64_(),(_0._cof),(_5.ptrb),(_5.subj),(_5.cof),(_5.bfix),(_5.inst),(_5.x)))
   @staticmethod
   def __dot_1_alt_Lmosek_4fusion_4NDSparseArray_2Lmosek_4fusion_4Variable_2(_t__0,_t__1):
     return mosek_fusion_Expr.__dot_1_Lmosek_4fusion_4NDSparseArray_2Lmosek_4fusion_4Variable_2(_0,_1)
@@ -31558,7 +32852,7 @@ def __mk_mosek_fusion_Expr():
    for _2 in range(0,int(((_0._dims)).shape[0])):
     if ((_0._dims)[_2]!=_1.shape().dim(_2)):
      raise mosek_fusion_LengthError._ctor_S("Dimension mismatch")
-   return (mosek.fusion.Expr.__inner_1__3J_3DLmosek_4fusion_4Variable_2((_0._inst),(_0._cof),_1))
+   return (mosek.fusion.Expr.__inner_1__3J_3DLmosek_4fusion_4Variable_2(_0._inst64_(),(_0._cof),_1))
   @staticmethod
   def __inner_1_alt__3J_3DLmosek_4fusion_4Variable_2(_t__0,_t__1,_t__2):
    _0=numpy.array(_t__0,dtype=numpy.dtype(numpy.int64))
@@ -32034,7 +33328,7 @@ def __mk_mosek_fusion_Expr():
     _0, = args
     return (__arg_alt_match__3_5I__(_0))
   def _pick_alt__3_5I(self,_t__0):
-   _0=numpy.array(_t__0,ndmin=_monty.checkShape(_t__0,2),dtype=numpy.dtype(numpy.int32))
+   _0=_monty.makeArray(_t__0,2,numpy.dtype(numpy.int32))
    _1 = self._pick__3_5I(_0)
    return _1
   def _pick__3_5I(self,_0):
@@ -34816,7 +36110,7 @@ def __mk_mosek_fusion_Expr():
     return (__arg_alt_match__3_5D__(_0) and __arg_alt_match_Lmosek_4fusion_4Variable_2__(_1))
   @staticmethod
   def _mulElm_alt__3_5DLmosek_4fusion_4Variable_2(_t__0,_t__1):
-   _0=numpy.array(_t__0,ndmin=_monty.checkShape(_t__0,2),dtype=numpy.dtype(numpy.float64))
+   _0=_monty.makeArray(_t__0,2,numpy.dtype(numpy.float64))
    _1=_t__1
    _1 = mosek_fusion_Expr._mulElm__3_5DLmosek_4fusion_4Variable_2(_0,_1)
    return _1
@@ -34836,7 +36130,7 @@ def __mk_mosek_fusion_Expr():
     return (__arg_alt_match__3_5D__(_0) and __arg_alt_match_Lmosek_4fusion_4Expression_2__(_1))
   @staticmethod
   def _mulElm_alt__3_5DLmosek_4fusion_4Expression_2(_t__0,_t__1):
-   _0=numpy.array(_t__0,ndmin=_monty.checkShape(_t__0,2),dtype=numpy.dtype(numpy.float64))
+   _0=_monty.makeArray(_t__0,2,numpy.dtype(numpy.float64))
    _1=_t__1
    _1 = mosek_fusion_Expr._mulElm__3_5DLmosek_4fusion_4Expression_2(_0,_1)
    return _1
@@ -34921,7 +36215,7 @@ def __mk_mosek_fusion_Expr():
   @staticmethod
   def _mulElm_alt_Lmosek_4fusion_4Expression_2_3_5D(_t__0,_t__1):
    _0=_t__0
-   _1=numpy.array(_t__1,ndmin=_monty.checkShape(_t__1,2),dtype=numpy.dtype(numpy.float64))
+   _1=_monty.makeArray(_t__1,2,numpy.dtype(numpy.float64))
    _1 = mosek_fusion_Expr._mulElm_Lmosek_4fusion_4Expression_2_3_5D(_0,_1)
    return _1
   @staticmethod
@@ -35013,7 +36307,7 @@ def __mk_mosek_fusion_Expr():
   @staticmethod
   def _mulElm_alt_Lmosek_4fusion_4Variable_2_3_5D(_t__0,_t__1):
    _0=_t__0
-   _1=numpy.array(_t__1,ndmin=_monty.checkShape(_t__1,2),dtype=numpy.dtype(numpy.float64))
+   _1=_monty.makeArray(_t__1,2,numpy.dtype(numpy.float64))
    _1 = mosek_fusion_Expr._mulElm_Lmosek_4fusion_4Variable_2_3_5D(_0,_1)
    return _1
   @staticmethod
@@ -35120,7 +36414,7 @@ def __mk_mosek_fusion_Expr():
     return (__arg_alt_match__3_5D__(_0) and __arg_alt_match_Lmosek_4fusion_4Variable_2__(_1))
   @staticmethod
   def _dot_alt__3_5DLmosek_4fusion_4Variable_2(_t__0,_t__1):
-   _0=numpy.array(_t__0,ndmin=_monty.checkShape(_t__0,2),dtype=numpy.dtype(numpy.float64))
+   _0=_monty.makeArray(_t__0,2,numpy.dtype(numpy.float64))
    _1=_t__1
    _1 = mosek_fusion_Expr._dot__3_5DLmosek_4fusion_4Variable_2(_0,_1)
    return _1
@@ -35140,7 +36434,7 @@ def __mk_mosek_fusion_Expr():
     return (__arg_alt_match__3_5D__(_0) and __arg_alt_match_Lmosek_4fusion_4Expression_2__(_1))
   @staticmethod
   def _dot_alt__3_5DLmosek_4fusion_4Expression_2(_t__0,_t__1):
-   _0=numpy.array(_t__0,ndmin=_monty.checkShape(_t__0,2),dtype=numpy.dtype(numpy.float64))
+   _0=_monty.makeArray(_t__0,2,numpy.dtype(numpy.float64))
    _1=_t__1
    _1 = mosek_fusion_Expr._dot__3_5DLmosek_4fusion_4Expression_2(_0,_1)
    return _1
@@ -35225,7 +36519,7 @@ def __mk_mosek_fusion_Expr():
   @staticmethod
   def _dot_alt_Lmosek_4fusion_4Expression_2_3_5D(_t__0,_t__1):
    _0=_t__0
-   _1=numpy.array(_t__1,ndmin=_monty.checkShape(_t__1,2),dtype=numpy.dtype(numpy.float64))
+   _1=_monty.makeArray(_t__1,2,numpy.dtype(numpy.float64))
    _1 = mosek_fusion_Expr._dot_Lmosek_4fusion_4Expression_2_3_5D(_0,_1)
    return _1
   @staticmethod
@@ -35317,7 +36611,7 @@ def __mk_mosek_fusion_Expr():
   @staticmethod
   def _dot_alt_Lmosek_4fusion_4Variable_2_3_5D(_t__0,_t__1):
    _0=_t__0
-   _1=numpy.array(_t__1,ndmin=_monty.checkShape(_t__1,2),dtype=numpy.dtype(numpy.float64))
+   _1=_monty.makeArray(_t__1,2,numpy.dtype(numpy.float64))
    _1 = mosek_fusion_Expr._dot_Lmosek_4fusion_4Variable_2_3_5D(_0,_1)
    return _1
   @staticmethod
@@ -35456,7 +36750,7 @@ def __mk_mosek_fusion_Expr():
     return (__arg_alt_match__3_5D__(_0) and __arg_alt_match_Lmosek_4fusion_4Variable_2__(_1))
   @staticmethod
   def _sub_alt__3_5DLmosek_4fusion_4Variable_2(_t__0,_t__1):
-   _0=numpy.array(_t__0,ndmin=_monty.checkShape(_t__0,2),dtype=numpy.dtype(numpy.float64))
+   _0=_monty.makeArray(_t__0,2,numpy.dtype(numpy.float64))
    _1=_t__1
    _1 = mosek_fusion_Expr._sub__3_5DLmosek_4fusion_4Variable_2(_0,_1)
    return _1
@@ -35501,7 +36795,7 @@ def __mk_mosek_fusion_Expr():
   @staticmethod
   def _sub_alt_Lmosek_4fusion_4Variable_2_3_5D(_t__0,_t__1):
    _0=_t__0
-   _1=numpy.array(_t__1,ndmin=_monty.checkShape(_t__1,2),dtype=numpy.dtype(numpy.float64))
+   _1=_monty.makeArray(_t__1,2,numpy.dtype(numpy.float64))
    _1 = mosek_fusion_Expr._sub_Lmosek_4fusion_4Variable_2_3_5D(_0,_1)
    return _1
   @staticmethod
@@ -35656,7 +36950,7 @@ def __mk_mosek_fusion_Expr():
     return (__arg_alt_match__3_5D__(_0) and __arg_alt_match_Lmosek_4fusion_4Expression_2__(_1))
   @staticmethod
   def _sub_alt__3_5DLmosek_4fusion_4Expression_2(_t__0,_t__1):
-   _0=numpy.array(_t__0,ndmin=_monty.checkShape(_t__0,2),dtype=numpy.dtype(numpy.float64))
+   _0=_monty.makeArray(_t__0,2,numpy.dtype(numpy.float64))
    _1=_t__1
    _1 = mosek_fusion_Expr._sub__3_5DLmosek_4fusion_4Expression_2(_0,_1)
    return _1
@@ -35701,7 +36995,7 @@ def __mk_mosek_fusion_Expr():
   @staticmethod
   def _sub_alt_Lmosek_4fusion_4Expression_2_3_5D(_t__0,_t__1):
    _0=_t__0
-   _1=numpy.array(_t__1,ndmin=_monty.checkShape(_t__1,2),dtype=numpy.dtype(numpy.float64))
+   _1=_monty.makeArray(_t__1,2,numpy.dtype(numpy.float64))
    _1 = mosek_fusion_Expr._sub_Lmosek_4fusion_4Expression_2_3_5D(_0,_1)
    return _1
   @staticmethod
@@ -35888,7 +37182,7 @@ def __mk_mosek_fusion_Expr():
     return (__arg_alt_match__3_5D__(_0) and __arg_alt_match_Lmosek_4fusion_4Variable_2__(_1))
   @staticmethod
   def _add_alt__3_5DLmosek_4fusion_4Variable_2(_t__0,_t__1):
-   _0=numpy.array(_t__0,ndmin=_monty.checkShape(_t__0,2),dtype=numpy.dtype(numpy.float64))
+   _0=_monty.makeArray(_t__0,2,numpy.dtype(numpy.float64))
    _1=_t__1
    _1 = mosek_fusion_Expr._add__3_5DLmosek_4fusion_4Variable_2(_0,_1)
    return _1
@@ -35933,7 +37227,7 @@ def __mk_mosek_fusion_Expr():
   @staticmethod
   def _add_alt_Lmosek_4fusion_4Variable_2_3_5D(_t__0,_t__1):
    _0=_t__0
-   _1=numpy.array(_t__1,ndmin=_monty.checkShape(_t__1,2),dtype=numpy.dtype(numpy.float64))
+   _1=_monty.makeArray(_t__1,2,numpy.dtype(numpy.float64))
    _1 = mosek_fusion_Expr._add_Lmosek_4fusion_4Variable_2_3_5D(_0,_1)
    return _1
   @staticmethod
@@ -36088,7 +37382,7 @@ def __mk_mosek_fusion_Expr():
     return (__arg_alt_match__3_5D__(_0) and __arg_alt_match_Lmosek_4fusion_4Expression_2__(_1))
   @staticmethod
   def _add_alt__3_5DLmosek_4fusion_4Expression_2(_t__0,_t__1):
-   _0=numpy.array(_t__0,ndmin=_monty.checkShape(_t__0,2),dtype=numpy.dtype(numpy.float64))
+   _0=_monty.makeArray(_t__0,2,numpy.dtype(numpy.float64))
    _1=_t__1
    _1 = mosek_fusion_Expr._add__3_5DLmosek_4fusion_4Expression_2(_0,_1)
    return _1
@@ -36133,7 +37427,7 @@ def __mk_mosek_fusion_Expr():
   @staticmethod
   def _add_alt_Lmosek_4fusion_4Expression_2_3_5D(_t__0,_t__1):
    _0=_t__0
-   _1=numpy.array(_t__1,ndmin=_monty.checkShape(_t__1,2),dtype=numpy.dtype(numpy.float64))
+   _1=_monty.makeArray(_t__1,2,numpy.dtype(numpy.float64))
    _1 = mosek_fusion_Expr._add_Lmosek_4fusion_4Expression_2_3_5D(_0,_1)
    return _1
   @staticmethod
@@ -36355,6 +37649,108 @@ def __mk_mosek_fusion_Expr():
   def __extractModel__3Lmosek_4fusion_4Variable_2(_0):
    assert _0 is None or isinstance(_0,numpy.ndarray)
    return ((None if (((_0 is None) or (int((_0).shape[0])==0)) ) else _0[0].getModel()))
+  @staticmethod
+  def _match_dot_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Variable_2(*args):
+    if len(args) != 2: return False
+    _0,_1, = args
+    return (__arg_match_Lmosek_4fusion_4Parameter_2__(_0) and __arg_match_Lmosek_4fusion_4Variable_2__(_1))
+  @staticmethod
+  def _match_alt_dot_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Variable_2(*args):
+    if len(args) != 2: return False
+    _0,_1, = args
+    return (__arg_alt_match_Lmosek_4fusion_4Parameter_2__(_0) and __arg_alt_match_Lmosek_4fusion_4Variable_2__(_1))
+  @staticmethod
+  def _dot_alt_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Variable_2(_t__0,_t__1):
+    return mosek_fusion_Expr._dot_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Variable_2(_t__0,_t__1)
+  @staticmethod
+  def _dot_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Variable_2(_0,_1):
+   if ((_1 is None) or (_0 is None)):
+    raise ValueError("Arguments for dot may not be null")
+   _2=_0.getSize()
+   if (not _1.shape().compare(_0.getShape())):
+    raise mosek_fusion_DimensionError._ctor_S("Dimensions of operands do not match")
+   _3=mosek.fusion.Utils.Tools._range_JJ(0,_2)
+   return (mosek.fusion.Expr.__parametric_1Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Variable_2_3J_3J_3JLmosek_4fusion_4Set_2(_0,_1,numpy.array([0,_2], dtype=numpy.dtype(numpy.int64)),_3,_3,None))
+  @staticmethod
+  def _match_mulElm_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Variable_2(*args):
+    if len(args) != 2: return False
+    _0,_1, = args
+    return (__arg_match_Lmosek_4fusion_4Parameter_2__(_0) and __arg_match_Lmosek_4fusion_4Variable_2__(_1))
+  @staticmethod
+  def _match_alt_mulElm_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Variable_2(*args):
+    if len(args) != 2: return False
+    _0,_1, = args
+    return (__arg_alt_match_Lmosek_4fusion_4Parameter_2__(_0) and __arg_alt_match_Lmosek_4fusion_4Variable_2__(_1))
+  @staticmethod
+  def _mulElm_alt_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Variable_2(_t__0,_t__1):
+    return mosek_fusion_Expr._mulElm_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Variable_2(_t__0,_t__1)
+  @staticmethod
+  def _mulElm_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Variable_2(_0,_1):
+   if ((_1 is None) or (_0 is None)):
+    raise ValueError("Arguments for mulElm may not be null")
+   _2=_0.getSize()
+   if (not _1.shape().compare(_0.getShape())):
+    raise mosek_fusion_DimensionError._ctor_S("Dimensions of operands do not match")
+   _3=mosek.fusion.Utils.Tools._range_JJ(0,_2)
+   return (mosek.fusion.Expr.__parametric_1Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Variable_2_3J_3J_3JLmosek_4fusion_4Set_2(_0,_1,mosek.fusion.Utils.Tools._range_JJ(0,(_2 + 1)),_3,_3,_1.shape()))
+  @staticmethod
+  def _match_mul_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Variable_2(*args):
+    if len(args) != 2: return False
+    _0,_1, = args
+    return (__arg_match_Lmosek_4fusion_4Parameter_2__(_0) and __arg_match_Lmosek_4fusion_4Variable_2__(_1))
+  @staticmethod
+  def _match_alt_mul_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Variable_2(*args):
+    if len(args) != 2: return False
+    _0,_1, = args
+    return (__arg_alt_match_Lmosek_4fusion_4Parameter_2__(_0) and __arg_alt_match_Lmosek_4fusion_4Variable_2__(_1))
+  @staticmethod
+  def _mul_alt_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Variable_2(_t__0,_t__1):
+    return mosek_fusion_Expr._mul_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Variable_2(_t__0,_t__1)
+  @staticmethod
+  def _mul_Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Variable_2(_0,_1):
+   if ((_1 is None) or (_0 is None)):
+    raise ValueError("Arguments for mul may not be null")
+   _2=_1.shape()
+   if (_0.getSize()==1):
+    _3=(_2._size)
+    _4=mosek.fusion.Utils.Tools._range_JJ(0,_3)
+    return (mosek.fusion.Expr.__parametric_1Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Variable_2_3J_3J_3JLmosek_4fusion_4Set_2(_0,_1,mosek.fusion.Utils.Tools._range_JJ(0,(_3 + 1)),_4,numpy.zeros((_3,), dtype=numpy.dtype(numpy.int64)),_2))
+   _5=_0.getShape()
+   if ((_5.nd)!=2):
+    raise mosek_fusion_DimensionError._ctor_S("Only scalar or matrix parameters can multiply a variable")
+   _6=_5.dim(0)
+   _7=_5.dim(1)
+   if ((_2.nd)==1):
+    _8=_2.dim(0)
+    _9=1
+    _10=mosek_fusion_IntSet._ctor_I(_6)
+   elif ((_2.nd)==2):
+    _8=_2.dim(0)
+    _9=_2.dim(1)
+    _10=mosek_fusion_NDSet._ctor_II(_6,_9)
+   else:
+    raise mosek_fusion_DimensionError._ctor_S("Dimensions of operands do not match")
+   if (_8!=_7):
+    raise mosek_fusion_DimensionError._ctor_S("Dimensions of operands do not match")
+   # Row (i,k) of the result is the sum over j of P[i,j]*x[j,k]
+   _11,_12,_13=numpy.meshgrid(numpy.arange(0,_6,dtype=numpy.int64),numpy.arange(0,_9,dtype=numpy.int64),numpy.arange(0,_7,dtype=numpy.int64),indexing='ij')
+   return (mosek.fusion.Expr.__parametric_1Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Variable_2_3J_3J_3JLmosek_4fusion_4Set_2(_0,_1,(numpy.arange(0,((_6 * _9) + 1),dtype=numpy.int64) * _7),((_13 * _9) + _12).ravel(),((_11 * _7) + _13).ravel(),_10))
+  @staticmethod
+  def __parametric_1Lmosek_4fusion_4Parameter_2Lmosek_4fusion_4Variable_2_3J_3J_3JLmosek_4fusion_4Set_2(_0,_1,_2,_3,_4,_5):
+   assert _2 is None or isinstance(_2,numpy.ndarray)
+   assert _3 is None or isinstance(_3,numpy.ndarray)
+   assert _4 is None or isinstance(_4,numpy.ndarray)
+   _6=mosek_fusion_Expr._ctor__3J_3Lmosek_4fusion_4Variable_2_3J_3D_3DLmosek_4fusion_4Set_2_3J(_2,numpy.array([_1], dtype=numpy.dtype(object)),_3,(_0._values_())[_4],None,_5,None)
+   _6.__params = (_0,_4)
+   _0._addExpr_(_6)
+   return (_6)
+  def _parameters_(self,):
+   return (self.__params)
+  def _dependsOn_(self,):
+   _0=getattr(self,'_Expr__derived',())
+   return ((((self.__params[0],) + _0) if ((self.__params is not None) ) else _0))
+  def _refreshParameter_(self,):
+   self.__cof_v[:] = (self.__params[0]._values_())[self.__params[1]]
  return Expr
 mosek_fusion_Expr=__mk_mosek_fusion_Expr()
 del __mk_mosek_fusion_Expr
@@ -36835,12 +38231,16 @@ def __mk_mosek_fusion_NDSparseArray():
       return mosek_fusion_NDSparseArray._make__3I_3J_3D(*args)
     elif mosek_fusion_NDSparseArray._match_alt_make__3I_3J_3D(*args): # []int32,[]int64,[]double
       return mosek_fusion_NDSparseArray._make_alt__3I_3J_3D(*args)
+    elif mosek_fusion_NDSparseArray._match_make__3I_3J_3DZ(*args): # []int32,[]int64,[]double,bool
+      return mosek_fusion_NDSparseArray._make__3I_3J_3DZ(*args)
+    elif mosek_fusion_NDSparseArray._match_alt_make__3I_3J_3DZ(*args): # []int32,[]int64,[]double,bool
+      return mosek_fusion_NDSparseArray._make_alt__3I_3J_3DZ(*args)
     elif mosek_fusion_NDSparseArray._match_make__3I_3_5I_3D(*args): # []int32,[,]int32,[]double
       return mosek_fusion_NDSparseArray._make__3I_3_5I_3D(*args)
     elif mosek_fusion_NDSparseArray._match_alt_make__3I_3_5I_3D(*args): # []int32,[,]int32,[]double
       return mosek_fusion_NDSparseArray._make_alt__3I_3_5I_3D(*args)
     else:
-      raise ValueError('Invalid argument list make('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.NDSparseArray.make(mosek.fusion.Matrix)\n\tmosek.fusion.NDSparseArray.make(array(int32,ndim=1),array(int64,ndim=1),array(double,ndim=1))\n\tmosek.fusion.NDSparseArray.make(array(int32,ndim=1),array(int32,ndim=2),array(double,ndim=1))')
+      raise ValueError('Invalid argument list make('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.NDSparseArray.make(mosek.fusion.Matrix)\n\tmosek.fusion.NDSparseArray.make(array(int32,ndim=1),array(int64,ndim=1),array(double,ndim=1))\n\tmosek.fusion.NDSparseArray.make(array(int32,ndim=1),array(int64,ndim=1),array(double,ndim=1),bool)\n\tmosek.fusion.NDSparseArray.make(array(int32,ndim=1),array(int32,ndim=2),array(double,ndim=1))')
   def __repr__(self): return 'mosek.fusion.NDSparseArray'
   @staticmethod
   def _ctor__3I_3_5I_3D(dims_,sub,cof_):
@@ -36864,68 +38264,19 @@ def __mk_mosek_fusion_NDSparseArray():
    assert sub is None or isinstance(sub,numpy.ndarray)
    assert cof_ is None or isinstance(cof_,numpy.ndarray)
    object.__init__(self)
-   _0=numpy.zeros((int((sub).shape[0]),), dtype=numpy.dtype(numpy.int64))
-   self._size = 1
-   for _1 in range(0,int((dims_).shape[0])):
-    self._size = (self._size * dims_[_1])
-   _2=int((dims_).shape[0])
+   self._size = numpy.int64(numpy.prod(dims_,dtype=numpy.dtype(numpy.int64)))
+   _0=int((dims_).shape[0])
    if (int((sub).shape[0])!=int((cof_).shape[0])):
     raise mosek_fusion_LengthError._ctor_S("Mismatching data array length")
-   if (int((sub).shape[1])!=_2):
+   if (int((sub).shape[1])!=_0):
     raise mosek_fusion_IndexError._ctor_S("An index key in sub has wrong length")
-   for _3 in range(0,int((sub).shape[0])):
-    for _4 in range(0,int((sub).shape[1])):
-     if ((sub[_3,_4] < 0) or (sub[_3,_4] >= dims_[_4])):
-      raise mosek_fusion_IndexError._ctor_S("An index in sub is out of bounds")
-   for _5 in range(0,int((sub).shape[0])):
-    _6=0
-    for _7 in range(0,int((sub).shape[1])):
-     _6 = ((_6 * dims_[((_2 - _7) - 1)]) + sub[_5,_7])
-    _0[_5] = _6
+   if ((sub < 0).any() or (sub >= dims_.reshape(1,-1)).any()):
+    raise mosek_fusion_IndexError._ctor_S("An index in sub is out of bounds")
+   _1=numpy.zeros((int((sub).shape[0]),), dtype=numpy.dtype(numpy.int64))
+   for _2 in range(0,_0):
+    _1 = ((_1 * dims_[_2]) + sub[:,_2])
    self._dims = mosek.fusion.Utils.Tools._arraycopy__3I(dims_)
-   _8=True
-   for _9 in range(1,int((_0).shape[0])):
-    _8 = (_8 and (_0[_9] >= _0[(_9 - 1)]))
-   if _8:
-    _10=1
-    for _11 in range(1,int((_0).shape[0])):
-     if (_0[(_11 - 1)] > _0[_11]):
-      _10 += 1
-    if (_10==int((_0).shape[0])):
-     self._inst = mosek.fusion.Utils.Tools._arraycopy__3J(_0)
-     self._cof = mosek.fusion.Utils.Tools._arraycopy__3D(cof_)
-    else:
-     self._inst = numpy.zeros((_10,), dtype=numpy.dtype(numpy.int64))
-     self._inst[0] = _0[0]
-     self._cof = numpy.zeros((_10,), dtype=numpy.dtype(numpy.float64))
-     self._cof[0] = cof_[0]
-     _12=0
-     for _13 in range(1,int((_0).shape[0])):
-      if (_0[_13] > _0[(_13 - 1)]):
-       _12 += 1
-       self._inst[_12] = _0[_13]
-       self._cof[_12] = cof_[_13]
-      else:
-       self._cof[_12] = (self._cof[_12] + cof_[_13])
-   else:
-    _14=mosek.fusion.Utils.Tools._range_J(int((_0).shape[0]))
-    mosek.fusion.CommonTools._argQsort__3J_3J_3JJJ(_14,_0,None,0,int((_0).shape[0]))
-    _15=1
-    for _16 in range(1,int((_0).shape[0])):
-     if (_0[_14[(_16 - 1)]] < _0[_14[_16]]):
-      _15 += 1
-    self._inst = numpy.zeros((_15,), dtype=numpy.dtype(numpy.int64))
-    self._inst[0] = _0[_14[0]]
-    self._cof = numpy.zeros((_15,), dtype=numpy.dtype(numpy.float64))
-    self._cof[0] = cof_[_14[0]]
-    _17=0
-    for _18 in range(1,int((_0).shape[0])):
-     if (_0[_14[_18]] > _0[_14[(_18 - 1)]]):
-      _17 += 1
-      self._inst[_17] = _0[_14[_18]]
-      self._cof[_17] = cof_[_14[_18]]
-     else:
-      self._cof[_17] = (self._cof[_17] + cof_[_14[_18]])
+   self.__setentries(_1,cof_)
   @staticmethod
   def _ctor__3I_3J_3D(dims_,inst_,cof_):
     o = NDSparseArray.__new__(NDSparseArray)
@@ -36948,58 +38299,47 @@ def __mk_mosek_fusion_NDSparseArray():
    assert inst_ is None or isinstance(inst_,numpy.ndarray)
    assert cof_ is None or isinstance(cof_,numpy.ndarray)
    object.__init__(self)
-   self._size = 1
-   for _0 in range(0,int((dims_).shape[0])):
-    self._size = (self._size * dims_[_0])
+   self._size = numpy.int64(numpy.prod(dims_,dtype=numpy.dtype(numpy.int64)))
    if (int((inst_).shape[0])!=int((cof_).shape[0])):
     raise mosek_fusion_LengthError._ctor_S("Mismatching data array length")
-   for _1 in range(0,int((inst_).shape[0])):
-    if ((inst_[_1] < 0) or (inst_[_1] >= self._size)):
-     raise mosek_fusion_IndexError._ctor_S("An index in inst is out of bounds")
+   if ((inst_ < 0).any() or (inst_ >= self._size).any()):
+    raise mosek_fusion_IndexError._ctor_S("An index in inst is out of bounds")
    self._dims = mosek.fusion.Utils.Tools._arraycopy__3I(dims_)
-   _2=True
-   for _3 in range(1,int((inst_).shape[0])):
-    _2 = (_2 and (inst_[_3] >= inst_[(_3 - 1)]))
-   if _2:
-    _4=1
-    for _5 in range(1,int((inst_).shape[0])):
-     if (inst_[(_5 - 1)] > inst_[_5]):
-      _4 += 1
-    if (_4==int((inst_).shape[0])):
-     self._inst = mosek.fusion.Utils.Tools._arraycopy__3J(inst_)
-     self._cof = mosek.fusion.Utils.Tools._arraycopy__3D(cof_)
-    else:
-     self._inst = numpy.zeros((_4,), dtype=numpy.dtype(numpy.int64))
-     self._inst[0] = inst_[0]
-     self._cof = numpy.zeros((_4,), dtype=numpy.dtype(numpy.float64))
-     self._cof[0] = cof_[0]
-     _6=0
-     for _7 in range(1,int((inst_).shape[0])):
-      if (inst_[_7] > inst_[(_7 - 1)]):
-       _6 += 1
-       self._inst[_6] = inst_[_7]
-       self._cof[_6] = cof_[_7]
-      else:
-       self._cof[_6] = (self._cof[_6] + cof_[_7])
+   self.__setentries(inst_,cof_)
+  @staticmethod
+  def _ctor__3I_3J_3DZ(dims_,inst_,cof_,canonical_):
+    o = NDSparseArray.__new__(NDSparseArray)
+    o._ctor_init__3I_3J_3DZ(dims_,inst_,cof_,canonical_)
+    return o
+  @staticmethod
+  def __match_ctor__3I_3J_3DZ(*args):
+    if len(args) != 4: return False
+    dims_,inst_,cof_,canonical_, = args
+    return (__arg_match__3I__(dims_) and __arg_match__3J__(inst_) and __arg_match__3D__(cof_) and __arg_match_Z__(canonical_))
+  @staticmethod
+  def __match_alt_ctor__3I_3J_3DZ(*args):
+    if len(args) != 4: return False
+    dims_,inst_,cof_,canonical_, = args
+    return (__arg_alt_match__3I__(dims_) and __arg_alt_match__3J__(inst_) and __arg_alt_match__3D__(cof_) and __arg_alt_match_Z__(canonical_))
+  def _ctor_alt_init__3I_3J_3DZ(self,dims_,inst_,cof_,canonical_):
+    self._ctor_init__3I_3J_3DZ(numpy.array(dims_,dtype=numpy.dtype(numpy.int32)),numpy.asarray(inst_,dtype=numpy.dtype(numpy.int64)),numpy.asarray(cof_,dtype=numpy.dtype(numpy.float64)),bool(canonical_))
+  # With canonical_ the caller guarantees that inst_ is strictly
+  # increasing and within bounds; the entries are then taken as they
+  # are without any checks. cof_ is shared, not copied.
+  def _ctor_init__3I_3J_3DZ(self,dims_,inst_,cof_,canonical_):
+   assert dims_ is None or isinstance(dims_,numpy.ndarray)
+   assert inst_ is None or isinstance(inst_,numpy.ndarray)
+   assert cof_ is None or isinstance(cof_,numpy.ndarray)
+   if (not canonical_):
+    self._ctor_init__3I_3J_3D(dims_,inst_,cof_)
    else:
-    _8=mosek.fusion.Utils.Tools._range_J(int((inst_).shape[0]))
-    mosek.fusion.CommonTools._argQsort__3J_3J_3JJJ(_8,inst_,None,0,int((inst_).shape[0]))
-    _9=1
-    for _10 in range(1,int((inst_).shape[0])):
-     if (inst_[_8[(_10 - 1)]] < inst_[_8[_10]]):
-      _9 += 1
-    self._inst = numpy.zeros((_9,), dtype=numpy.dtype(numpy.int64))
-    self._inst[0] = inst_[_8[0]]
-    self._cof = numpy.zeros((_9,), dtype=numpy.dtype(numpy.float64))
-    self._cof[0] = cof_[_8[0]]
-    _11=0
-    for _12 in range(1,int((inst_).shape[0])):
-     if (inst_[_8[_12]] > self._inst[_8[(_12 - 1)]]):
-      _11 += 1
-      self._inst[_11] = inst_[_8[_12]]
-      self._cof[_11] = cof_[_8[_12]]
-     else:
-      self._cof[_11] = (self._cof[_11] + cof_[_8[_12]])
+    object.__init__(self)
+    self._size = numpy.int64(numpy.prod(dims_,dtype=numpy.dtype(numpy.int64)))
+    if (int((inst_).shape[0])!=int((cof_).shape[0])):
+     raise mosek_fusion_LengthError._ctor_S("Mismatching data array length")
+    self._dims = mosek.fusion.Utils.Tools._arraycopy__3I(dims_)
+    self._inst = inst_.astype(self.__indextype(),copy=False)
+    self._cof = cof_
   @staticmethod
   def _ctor_Lmosek_4fusion_4Matrix_2(m):
     o = NDSparseArray.__new__(NDSparseArray)
@@ -37028,8 +38368,33 @@ def __mk_mosek_fusion_NDSparseArray():
    m.getDataAsTriplets(_3,_4,_5)
    self._size = (numpy.int64(m.numRows()) * numpy.int64(m.numColumns()))
    self._dims = numpy.array([_1,_2], dtype=numpy.dtype(numpy.int32))
-   self._inst = numpy.array([((numpy.int64(_3[_6]) * _2) + numpy.int64(_4[_6])) for _6 in range(0,_0)], dtype=numpy.dtype(numpy.int64))
-   self._cof = _5
+   self.__setentries(((_3.astype(numpy.int64) * _2) + _4),_5)
+  # Linear indexes are stored as int32 when every index of the array
+  # fits, otherwise as int64.
+  def __indextype(self,):
+   if (self._size <= 2147483647):
+    return (numpy.dtype(numpy.int32))
+   else:
+    return (numpy.dtype(numpy.int64))
+  # Store the entries sorted by linear index, summing the values of
+  # repeated indexes.
+  def __setentries(self,inst_,cof_):
+   _0=inst_
+   _1=cof_
+   if ((int((_0).shape[0]) > 1) and (not (_0[1:] > _0[:-1]).all())):
+    _2=numpy.argsort(_0,kind='mergesort')
+    _0=_0[_2]
+    _3=numpy.nonzero(numpy.concatenate((numpy.ones((1,),dtype=numpy.dtype(bool)),(_0[1:]!=_0[:-1]))))[0]
+    _0=_0[_3]
+    _1=numpy.add.reduceat(_1[_2],_3)
+   else:
+    _1=numpy.array(_1,dtype=numpy.dtype(numpy.float64))
+   self._inst = _0.astype(self.__indextype())
+   self._cof = _1
+  # The linear indexes as int64, without copying unless they are stored
+  # as int32.
+  def _inst64_(self,):
+   return (self._inst.astype(numpy.dtype(numpy.int64),copy=False))
   @staticmethod
   def _match_make_Lmosek_4fusion_4Matrix_2(*args):
     if len(args) != 1: return False
@@ -37082,6 +38447,28 @@ def __mk_mosek_fusion_NDSparseArray():
    assert _2 is None or isinstance(_2,numpy.ndarray)
    return (mosek_fusion_NDSparseArray._ctor__3I_3J_3D(_0,_1,_2))
   @staticmethod
+  def _match_make__3I_3J_3DZ(*args):
+    if len(args) != 4: return False
+    _0,_1,_2,_3, = args
+    return (__arg_match__3I__(_0) and __arg_match__3J__(_1) and __arg_match__3D__(_2) and __arg_match_Z__(_3))
+  @staticmethod
+  def _match_alt_make__3I_3J_3DZ(*args):
+    if len(args) != 4: return False
+    _0,_1,_2,_3, = args
+    return (__arg_alt_match__3I__(_0) and __arg_alt_match__3J__(_1) and __arg_alt_match__3D__(_2) and __arg_alt_match_Z__(_3))
+  @staticmethod
+  def _make_alt__3I_3J_3DZ(_t__0,_t__1,_t__2,_t__3):
+   _0=numpy.array(_t__0,dtype=numpy.dtype(numpy.int32))
+   _1=numpy.asarray(_t__1,dtype=numpy.dtype(numpy.int64))
+   _2=numpy.asarray(_t__2,dtype=numpy.dtype(numpy.float64))
+   return mosek_fusion_NDSparseArray._make__3I_3J_3DZ(_0,_1,_2,bool(_t__3))
+  @staticmethod
+  def _make__3I_3J_3DZ(_0,_1,_2,_3):
+   assert _0 is None or isinstance(_0,numpy.ndarray)
+   assert _1 is None or isinstance(_1,numpy.ndarray)
+   assert _2 is None or isinstance(_2,numpy.ndarray)
+   return (mosek_fusion_NDSparseArray._ctor__3I_3J_3DZ(_0,_1,_2,_3))
+  @staticmethod
   def _match_make__3I_3_5I_3D(*args):
     if len(args) != 3: return False
     _0,_1,_2, = args
@@ -37094,7 +38481,7 @@ def __mk_mosek_fusion_NDSparseArray():
   @staticmethod
   def _make_alt__3I_3_5I_3D(_t__0,_t__1,_t__2):
    _0=numpy.array(_t__0,dtype=numpy.dtype(numpy.int32))
-   _1=numpy.array(_t__1,ndmin=_monty.checkShape(_t__1,2),dtype=numpy.dtype(numpy.int32))
+   _1=_monty.makeArray(_t__1,2,numpy.dtype(numpy.int32))
    _2=numpy.array(_t__2,dtype=numpy.dtype(numpy.float64))
    _1 = mosek_fusion_NDSparseArray._make__3I_3_5I_3D(_0,_1,_2)
    try:
@@ -37283,6 +38670,8 @@ def __mk_mosek_fusion_Matrix():
   @staticmethod
   def sparse(*args):
     if False: pass
+    elif mosek_fusion_Matrix._match_sparse_Lscipy_4sparse_4spmatrix_2(*args): # scipy.sparse.spmatrix
+      return mosek_fusion_Matrix._sparse_Lscipy_4sparse_4spmatrix_2(*args)
     elif mosek_fusion_Matrix._match_sparse__3_5D(*args): # [,]double
       return mosek_fusion_Matrix._sparse__3_5D(*args)
     elif mosek_fusion_Matrix._match_alt_sparse__3_5D(*args): # [,]double
@@ -37316,7 +38705,7 @@ def __mk_mosek_fusion_Matrix():
     elif mosek_fusion_Matrix._match_alt_sparse_II_3I_3I_3D(*args): # int32,int32,[]int32,[]int32,[]double
       return mosek_fusion_Matrix._sparse_alt_II_3I_3I_3D(*args)
     else:
-      raise ValueError('Invalid argument list sparse('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Matrix.sparse(array(double,ndim=2))\n\tmosek.fusion.Matrix.sparse(array(array(mosek.fusion.Matrix,ndim=1),ndim=1))\n\tmosek.fusion.Matrix.sparse(mosek.fusion.Matrix)\n\tmosek.fusion.Matrix.sparse(int32,int32)\n\tmosek.fusion.Matrix.sparse(array(int32,ndim=1),array(int32,ndim=1),array(double,ndim=1))\n\tmosek.fusion.Matrix.sparse(array(int32,ndim=1),array(int32,ndim=1),double)\n\tmosek.fusion.Matrix.sparse(int32,int32,array(int32,ndim=1),array(int32,ndim=1),double)\n\tmosek.fusion.Matrix.sparse(int32,int32,array(int32,ndim=1),array(int32,ndim=1),array(double,ndim=1))')
+      raise ValueError('Invalid argument list sparse('+','.join(map(repr,args))+'). Candidates are\n\tmosek.fusion.Matrix.sparse(array(double,ndim=2))\n\tmosek.fusion.Matrix.sparse(array(array(mosek.fusion.Matrix,ndim=1),ndim=1))\n\tmosek.fusion.Matrix.sparse(mosek.fusion.Matrix)\n\tmosek.fusion.Matrix.sparse(int32,int32)\n\tmosek.fusion.Matrix.sparse(array(int32,ndim=1),array(int32,ndim=1),array(double,ndim=1))\n\tmosek.fusion.Matrix.sparse(array(int32,ndim=1),array(int32,ndim=1),double)\n\tmosek.fusion.Matrix.sparse(int32,int32,array(int32,ndim=1),array(int32,ndim=1),double)\n\tmosek.fusion.Matrix.sparse(int32,int32,array(int32,ndim=1),array(int32,ndim=1),array(double,ndim=1))\n\tmosek.fusion.Matrix.sparse(scipy.sparse.spmatrix)')
   def __str__(self): return self._toString_()
   def __repr__(self): return 'mosek.fusion.Matrix: '+self._toString_()
   @staticmethod
@@ -37715,7 +39104,7 @@ def __mk_mosek_fusion_Matrix():
     return (__arg_alt_match__3_5D__(_0))
   @staticmethod
   def _dense_alt__3_5D(_t__0):
-   _0=numpy.array(_t__0,ndmin=_monty.checkShape(_t__0,2),dtype=numpy.dtype(numpy.float64))
+   _0=_monty.makeArray(_t__0,2,numpy.dtype(numpy.float64))
    _1 = mosek_fusion_Matrix._dense__3_5D(_0)
    return _1
   @staticmethod
@@ -37723,6 +39112,29 @@ def __mk_mosek_fusion_Matrix():
    assert _0 is None or isinstance(_0,numpy.ndarray)
    return (mosek_fusion_DenseMatrix._ctor__3_5D(_0))
   @staticmethod
+  def _match_sparse_Lscipy_4sparse_4spmatrix_2(*args):
+    if len(args) != 1: return False
+    _0, = args
+    # A SciPy matrix can only be passed if SciPy is already loaded
+    return (('scipy.sparse' in sys.modules) and sys.modules['scipy.sparse'].issparse(_0))
+  @staticmethod
+  def _sparse_Lscipy_4sparse_4spmatrix_2(_0):
+   # CSR data is shared with the SciPy matrix when the format and dtypes
+   # allow it; other formats are converted by SciPy first.
+   _1=(_0 if ((_0.format=='csr') ) else _0.tocsr())
+   if (not _1.has_canonical_format):
+    _1 = _1.copy()
+    _1.sum_duplicates()
+   _2=numpy.asarray(_1.indptr,dtype=numpy.dtype(numpy.int64))
+   _3=numpy.asarray(_1.indices,dtype=numpy.dtype(numpy.int32))
+   _4=numpy.asarray(_1.data,dtype=numpy.dtype(numpy.float64))
+   if (not _4.all()):
+    _5=numpy.nonzero(_4)[0]
+    _2 = numpy.searchsorted(_5,_2)
+    _3 = _3[_5]
+    _4 = _4[_5]
+   return (mosek_fusion_SparseMatrix._ctor_csr_II_3J_3I_3D(numpy.int32(_1.shape[0]),numpy.int32(_1.shape[1]),_2,_3,_4))
+  @staticmethod
   def _match_sparse_Lmosek_4fusion_4Matrix_2(*args):
     if len(args) != 1: return False
     _0, = args
@@ -37857,7 +39269,7 @@ def __mk_mosek_fusion_Matrix():
     return (__arg_alt_match__3_5D__(_0))
   @staticmethod
   def _sparse_alt__3_5D(_t__0):
-   _0=numpy.array(_t__0,ndmin=_monty.checkShape(_t__0,2),dtype=numpy.dtype(numpy.float64))
+   _0=_monty.makeArray(_t__0,2,numpy.dtype(numpy.float64))
    _1 = mosek_fusion_Matrix._sparse__3_5D(_0)
    return _1
   @staticmethod
@@ -38312,7 +39724,7 @@ def __mk_mosek_fusion_DenseMatrix():
   def _ctor_init__3_5D(self,d):
    assert d is None or isinstance(d,numpy.ndarray)
    mosek_fusion_Matrix._ctor_init_II(self,int((d).shape[0]),int((d).shape[1]))
-   self._data = numpy.array([d[_0,_1] for _0 in range(0,self._dimi) for _1 in range(0,self._dimj)], dtype=numpy.dtype(numpy.float64))
+   self._data = numpy.array(d,dtype=numpy.dtype(numpy.float64)).reshape(-1)
    self._nnz = numpy.int64((self._dimi * self._dimj))
   @staticmethod
   def _ctor_IID(dimi_,dimj_,value_):
@@ -38333,7 +39745,7 @@ def __mk_mosek_fusion_DenseMatrix():
     self._ctor_init_IID(numpy.int32(dimi_),numpy.int32(dimj_),numpy.float64(value_))
   def _ctor_init_IID(self,dimi_,dimj_,value_):
    mosek_fusion_Matrix._ctor_init_II(self,dimi_,dimj_)
-   self._data = numpy.array([value_ for _0 in range(0,dimi_) for _1 in range(0,dimj_)], dtype=numpy.dtype(numpy.float64))
+   self._data = numpy.full(((dimi_ * dimj_),),value_,dtype=numpy.dtype(numpy.float64))
    self._nnz = numpy.int64((dimi_ * dimj_))
   @staticmethod
   def _match_toString_(*args):
@@ -38415,6 +39827,10 @@ def __mk_mosek_fusion_DenseMatrix():
     return self._getDataAsArray_()
   def _getDataAsArray_(self,):
    return (mosek.fusion.Utils.Tools._arraycopy__3D(self._data))
+  # The data array in row major order without copying it. The result
+  # is shared with the matrix and must not be modified.
+  def _dataView_(self,):
+   return (numpy.ascontiguousarray(self._data,dtype=numpy.dtype(numpy.float64)).reshape(-1))
   @staticmethod
   def _match_getDataAsTriplets__3I_3I_3D(*args):
     if len(args) != 3: return False
@@ -38488,7 +39904,7 @@ del __mk_mosek_fusion_DenseMatrix
 #BEFORE CLASS
 def __mk_mosek_fusion_SparseMatrix():
  class SparseMatrix(mosek_fusion_Matrix):
-  __slots__ = ['_nnz','_val','_subj','_subi']
+  __slots__ = ['_nnz','_val','_subj','_subi','_SparseMatrix__csr','_SparseMatrix__csc']
   def isSparse(self,*args):
     if False: pass
     elif mosek_fusion_SparseMatrix._match_isSparse_(*args): # 
@@ -38569,6 +39985,8 @@ def __mk_mosek_fusion_SparseMatrix():
    assert subj_ is None or isinstance(subj_,numpy.ndarray)
    assert val_ is None or isinstance(val_,numpy.ndarray)
    mosek_fusion_Matrix._ctor_init_II(self,dimi_,dimj_)
+   self.__csr = None
+   self.__csc = None
    if (nelm > 0):
     if ((int((subi_).shape[0]) < nelm) or ((int((subj_).shape[0]) < nelm) or (int((val_).shape[0]) < nelm))):
      raise mosek_fusion_SparseFormatError._ctor_S("Mismatching arrays in sparse data.")
@@ -38610,6 +40028,8 @@ def __mk_mosek_fusion_SparseMatrix():
    assert subj_ is None or isinstance(subj_,numpy.ndarray)
    assert val_ is None or isinstance(val_,numpy.ndarray)
    mosek_fusion_Matrix._ctor_init_II(self,dimi_,dimj_)
+   self.__csr = None
+   self.__csc = None
    _0=0
    for _1 in range(0,int((val_).shape[0])):
     if ((val_[_1] > 0) or (val_[_1] < 0)):
@@ -38647,6 +40067,50 @@ def __mk_mosek_fusion_SparseMatrix():
    _0[self._dimi] = _1
    return (_0)
   @staticmethod
+  def _ctor_csr_II_3J_3I_3D(dimi_,dimj_,ptrb_,subj_,val_):
+    o = SparseMatrix.__new__(SparseMatrix)
+    o._ctor_init_csr_II_3J_3I_3D(dimi_,dimj_,ptrb_,subj_,val_)
+    return o
+  # Construct from compressed rows with sorted column subscripts and no
+  # duplicates. The arrays are kept as they are and serve as the cached
+  # CSR form.
+  def _ctor_init_csr_II_3J_3I_3D(self,dimi_,dimj_,ptrb_,subj_,val_):
+   mosek_fusion_Matrix._ctor_init_II(self,dimi_,dimj_)
+   self._subi = numpy.repeat(numpy.arange(0,dimi_,dtype=numpy.dtype(numpy.int32)),numpy.diff(ptrb_))
+   self._subj = subj_
+   self._val = val_
+   self._nnz = int((val_).shape[0])
+   self.__csr = (ptrb_,subj_,val_)
+   self.__csc = None
+  def __triplets(self,):
+   if (self._nnz==0):
+    return (numpy.zeros((0,), dtype=numpy.dtype(numpy.int32)),numpy.zeros((0,), dtype=numpy.dtype(numpy.int32)),numpy.zeros((0,), dtype=numpy.dtype(numpy.float64)))
+   return (numpy.asarray(self._subi[0:self._nnz],dtype=numpy.dtype(numpy.int32)),numpy.asarray(self._subj[0:self._nnz],dtype=numpy.dtype(numpy.int32)),numpy.asarray(self._val[0:self._nnz],dtype=numpy.dtype(numpy.float64)))
+  # Compressed row form (ptrb,subj,val): row i holds the entries
+  # ptrb[i]:ptrb[i+1], sorted by column. Computed on first use and
+  # cached; the triplets are not modified after construction.
+  def _csr_(self,):
+   if (self.__csr is None):
+    _0,_1,_2=self.__triplets()
+    _3=((_0.astype(numpy.int64) * self._dimj) + _1)
+    if (_3[1:] < _3[:-1]).any():
+     _4=numpy.argsort(_3,kind='mergesort')
+     _0,_1,_2=_0[_4],_1[_4],_2[_4]
+    _5=numpy.zeros(((self._dimi + 1),), dtype=numpy.dtype(numpy.int64))
+    numpy.cumsum(numpy.bincount(_0,minlength=self._dimi),out=_5[1:])
+    self.__csr = (_5,_1,_2)
+   return (self.__csr)
+  # Compressed column form (ptrb,subi,val), sorted by row within each
+  # column. Cached like the row form.
+  def _csc_(self,):
+   if (self.__csc is None):
+    _0,_1,_2=self.__triplets()
+    _3=numpy.argsort(((_1.astype(numpy.int64) * self._dimi) + _0),kind='mergesort')
+    _4=numpy.zeros(((self._dimj + 1),), dtype=numpy.dtype(numpy.int64))
+    numpy.cumsum(numpy.bincount(_1,minlength=self._dimj),out=_4[1:])
+    self.__csc = (_4,_0[_3],_2[_3])
+   return (self.__csc)
+  @staticmethod
   def _match_toString_(*args):
     if len(args) != 0: return False
     return True
@@ -44992,14 +46456,21 @@ def __mk_mosek_fusion_Utils_StringIntMap():
   class StringIntMap:
     def __init__ (self):
       self.__d = {}
+      self.__shared = False
     def _hasItem_S(self,key): return key in self.__d
     def _getItem_S(self,key): return self.__d[key]
-    def _setItem_SI(self,key,val): self.__d[key] = val
+    def _setItem_SI(self,key,val):
+      if self.__shared:
+        self.__d = dict(self.__d)
+        self.__shared = False
+      self.__d[key] = val
     def _keys_(self): return numpy.array(list(self.__d.keys()))
     def _values_(self): return numpy.array(list(self.__d.values()))
     def _clone_(self):
+      # The dict is shared until either map is written to
       r = self.__class__()
-      r.__d.update(self.__d)
+      r.__d = self.__d
+      r.__shared = self.__shared = True
       return r
   return StringIntMap
 mosek_fusion_Utils_StringIntMap=__mk_mosek_fusion_Utils_StringIntMap()
@@ -45007,20 +46478,125 @@ def __mk_mosek_fusion_Utils_IntMap():
   class IntMap:
     def __init__ (self):
       self.__d = {}
+      self.__shared = False
     def _hasItem_J(self,key): return key in self.__d
     def _getItem_J(self,key): return self.__d[key]
-    def _setItem_JI(self,key,val): self.__d[key] = val
+    def _setItem_JI(self,key,val):
+      if self.__shared:
+        self.__d = dict(self.__d)
+        self.__shared = False
+      self.__d[key] = val
     def _keys_(self): return numpy.array(list(self.__d.keys()))
     def _values_(self): return numpy.array(list(self.__d.values()))
+    def _getItems__3J(self,keys):
+      return numpy.array([ self.__d.get(k,-1) for k in keys ],dtype=numpy.int32)
     def _clone_(self):
+      # The dict is shared until either map is written to
       r = self.__class__()
-      r.__d.update(self.__d)
+      r.__d = self.__d
+      r.__shared = self.__shared = True
       return r
   
   
   
   return IntMap
 mosek_fusion_Utils_IntMap=__mk_mosek_fusion_Utils_IntMap()
+def __mk_mosek_fusion_Utils_SortedIntMap():
+  class SortedIntMap:
+    """
+    Map from int64 keys to int32 values with the same interface as
+    IntMap, stored as two arrays sorted by key. It uses about 12 bytes
+    per entry, and _getItems__3J looks up a whole array of keys with one
+    searchsorted.
+
+    Keys added with _setItem_JI are kept in a dict and merged into the
+    arrays when a batch operation needs them, or when the dict grows as
+    large as the arrays.
+    """
+    def __init__ (self,keys=None,values=None):
+      self.__new = {}
+      self.__shared = False
+      if keys is None:
+        self.__k = numpy.zeros((0,),dtype=numpy.int64)
+        self.__v = numpy.zeros((0,),dtype=numpy.int32)
+      else:
+        keys = numpy.asarray(keys,dtype=numpy.int64)
+        values = numpy.asarray(values,dtype=numpy.int32)
+        perm = numpy.argsort(keys,kind='mergesort')
+        self.__k = keys[perm]
+        self.__v = values[perm]
+        if self.__k.shape[0] > 1:
+          # On duplicate keys the last value wins, as with IntMap
+          last = numpy.ones(self.__k.shape,dtype=bool)
+          last[:-1] = self.__k[1:] != self.__k[:-1]
+          self.__k = self.__k[last]
+          self.__v = self.__v[last]
+    def __find(self,key):
+      i = int(numpy.searchsorted(self.__k,key))
+      if i < self.__k.shape[0] and self.__k[i] == key: return i
+      else: return -1
+    def __merge(self):
+      if self.__new:
+        k = numpy.fromiter(self.__new.keys(),dtype=numpy.int64,count=len(self.__new))
+        v = numpy.fromiter(self.__new.values(),dtype=numpy.int32,count=len(self.__new))
+        self.__new = {}
+        perm = numpy.argsort(k)
+        k = k[perm]
+        pos = numpy.searchsorted(self.__k,k)
+        self.__k = numpy.insert(self.__k,pos,k)
+        self.__v = numpy.insert(self.__v,pos,v[perm])
+        self.__shared = False
+    def _hasItem_J(self,key): return key in self.__new or self.__find(key) >= 0
+    def _getItem_J(self,key):
+      if key in self.__new: return self.__new[key]
+      i = self.__find(key)
+      if i < 0: raise KeyError(key)
+      return self.__v[i]
+    def _setItem_JI(self,key,val):
+      i = -1 if key in self.__new else self.__find(key)
+      if i >= 0:
+        if self.__shared:
+          self.__v = self.__v.copy()
+          self.__shared = False
+        self.__v[i] = val
+      else:
+        self.__new[int(key)] = int(val)
+        if len(self.__new) >= max(1024,self.__k.shape[0]):
+          self.__merge()
+    def _getItems__3J(self,keys):
+      """
+      Look up an array of keys. Returns an int32 array holding the value
+      of each key, or -1 where the key is not in the map.
+      """
+      self.__merge()
+      keys = numpy.asarray(keys,dtype=numpy.int64)
+      if self.__k.shape[0] == 0:
+        return numpy.full(keys.shape,-1,dtype=numpy.int32)
+      if keys.shape[0] > 1024 and not (keys[1:] >= keys[:-1]).all():
+        # Searching for sorted keys is much more cache friendly
+        perm = numpy.argsort(keys)
+        pos = numpy.empty(keys.shape,dtype=numpy.intp)
+        pos[perm] = numpy.searchsorted(self.__k,keys[perm])
+      else:
+        pos = numpy.searchsorted(self.__k,keys)
+      pos = numpy.minimum(pos,self.__k.shape[0]-1)
+      return numpy.where(self.__k[pos] == keys,self.__v[pos],-1).astype(numpy.int32)
+    def _keys_(self):
+      self.__merge()
+      return self.__k.copy()
+    def _values_(self):
+      self.__merge()
+      return self.__v.copy()
+    def _clone_(self):
+      # The arrays are shared until either map overwrites a value
+      self.__merge()
+      r = self.__class__()
+      r.__k = self.__k
+      r.__v = self.__v
+      r.__shared = self.__shared = True
+      return r
+  return SortedIntMap
+mosek_fusion_Utils_SortedIntMap=__mk_mosek_fusion_Utils_SortedIntMap()
 def __mk_mosek_fusion_Utils_StringBuffer():
   class StringBuffer:
     def __init__(self):
@@ -45068,7 +46644,7 @@ def __mk_mosek_fusion_Utils_StringBuffer():
 mosek_fusion_Utils_StringBuffer=__mk_mosek_fusion_Utils_StringBuffer()
 def __mk_mosek_fusion_Utils_Tools():
   
-  import random,ctypes,math
+  import random,ctypes,math,os
   class Tools:
     @staticmethod
     def __arraycopy(src,srcoffset,tgt,tgtoffset,size):
@@ -45186,35 +46762,19 @@ def __mk_mosek_fusion_Utils_Tools():
   
     @staticmethod   
     def _makevector_DI(val,num): 
-      r = numpy.zeros((num,), numpy.float64)
-      r[:] = val
-      return r
+      return numpy.full((num,), val, numpy.float64)
     @staticmethod   
     def _makevector_II(val,num): 
-      r = numpy.zeros((num,), numpy.int32)
-      r[:] = val
-      return r
+      return numpy.full((num,), val, numpy.int32)
     @staticmethod   
     def _makevector_JI(val,num): 
-      r = numpy.zeros((num,), numpy.int64)
-      r[:] = val
-      return r
+      return numpy.full((num,), val, numpy.int64)
     @staticmethod   
     def _repeatrange_III(first,last,num):
-      res = numpy.zeros(((last-first)*num,),numpy.int32)
-      ra = numpy.arange(first,last)
-      l = last-first
-      for i in range(num):
-        res[i*l:(i+1)*l] = ra
-      return res
+      return numpy.tile(numpy.arange(first,last,dtype=numpy.int32),num)
     @staticmethod   
     def _repeatrange_JJJ(first,last,num):
-      res = numpy.zeros(((last-first)*num,),numpy.int64)
-      ra = numpy.arange(first,last)
-      l = last-first
-      for i in range(num):
-        res[i*l:(i+1)*l] = ra
-      return res
+      return numpy.tile(numpy.arange(first,last,dtype=numpy.int64),num)
     @staticmethod
     def  _stringvalue_I(v): return str(v)
     @staticmethod
@@ -45233,15 +46793,20 @@ def __mk_mosek_fusion_Utils_Tools():
       return int(v)
   
   
+    # Stable argsort of perm[first:last] by v (and v1 as secondary
+    # key). The sort is done on the gathered keys of the sub-range, so
+    # the permutation is applied in one indexing operation.
     @staticmethod 
     def _argsort2(perm,v,first,last):
-      l = sorted(perm[first:last],key=lambda i: v[i])
-      perm[first:last] = l
+      if last-first > 1:
+        p = perm[first:last]
+        perm[first:last] = p[numpy.argsort(numpy.asarray(v)[p],kind='mergesort')]
     
     @staticmethod 
     def _argsort2x(perm,v0,v1,first,last):
-      l = sorted(perm[first:last],key=lambda i: (v0[i],v1[i]))
-      perm[first:last] = l
+      if last-first > 1:
+        p = perm[first:last]
+        perm[first:last] = p[numpy.lexsort((numpy.asarray(v1)[p],numpy.asarray(v0)[p]))]
   
   
   
@@ -45261,100 +46826,98 @@ def __mk_mosek_fusion_Utils_Tools():
     def _argsort__3J_3J_3JJJ(perm,v0,v1,first,last):
       return Tools._argsort2x(perm,v0,v1,first,last)
   
+    # Implementation used by the bucket sorts:
+    #   'numpy'  - vectorized stable counting sort (default),
+    #   'native' - MSK_bucketsort from the MOSEK library (ctypes builds only,
+    #              numpy where the library is not loaded),
+    #   'python' - the reference implementation.
+    # The default may be overridden with the environment variable
+    # MOSEK_FUSION_BUCKETSORT.
+    _bucketsortimpl = os.environ.get('MOSEK_FUSION_BUCKETSORT','numpy')
+
+    # If set, products with dense matrices leave out the terms whose
+    # coefficient is zero. Off by default, since the result then depends
+    # on the values and not only on the shape of the matrix. May be set
+    # with the environment variable MOSEK_FUSION_DENSE_SKIPZEROS.
+    _denseskipzeros = os.environ.get('MOSEK_FUSION_DENSE_SKIPZEROS','0') not in ('','0')
+
+    @staticmethod
+    def _bucketsort_ref(perm,first,last,v,minval,maxval):
+      count = numpy.zeros((maxval-minval+2,),numpy.int64)
+      for i in range(first,last): count[v[perm[i]]-minval+1] += 1
+      ptrb = count.cumsum()
+      rperm = numpy.zeros((last-first,),numpy.int64)
+      for i in range(first,last):
+        rperm[ptrb[v[perm[i]]-minval]] = perm[i]
+        ptrb[v[perm[i]]-minval] += 1
+      perm[first:last] = rperm
+
+    @staticmethod
+    def _bucketsort_numpy(perm,first,last,v,minval,maxval):
+      if last-first > 1:
+        p = perm[first:last]
+        keys = numpy.asarray(v)[p] - minval
+        # NumPy's stable sort of 16 bit keys is a radix sort, i.e. the
+        # same O(n+m) counting sort as the reference implementation.
+        if maxval-minval < 65536:
+          keys = keys.astype(numpy.uint16)
+        perm[first:last] = p[numpy.argsort(keys,kind='mergesort')]
+
+    # Symbols and key types of the native bucket sorts. Both sort
+    # perm[first:last] in place by v[perm[i]], and take the arguments
+    # (perm,first,last,v,minval,maxval,workspace), with workspace room for
+    # maxval-minval+1+last-first int64 values.
+    _bucketsortsymbols = { 'int32' : ('MSK_bucketsort__3JSS_3III_3V',ctypes.c_int),
+                           'int64' : ('MSK_bucketsort__3JSS_3JJJ_3V',ctypes.c_longlong) }
+
+    # The native bucket sort for keys of the given type and the ctypes
+    # type of its keys, or None if the library does not provide it.
+    @staticmethod
+    def _nativebucketsort(dtype):
+      name,ctype = Tools._bucketsortsymbols[dtype]
+      fn = getattr(getattr(mosek,'__library__',None),name,None)
+      if fn is not None and fn.argtypes is None:
+        i64p = ctypes.POINTER(ctypes.c_longlong)
+        fn.argtypes = [ i64p, ctypes.c_longlong, ctypes.c_longlong, ctypes.POINTER(ctype), ctype, ctype, i64p ]
+        fn.restype  = None
+      return fn,ctype
+
+    @staticmethod
+    def _bucketsort_native(perm,first,last,v,minval,maxval,dtype):
+      fn,ctype = Tools._nativebucketsort(dtype)
+      if fn is None:
+        Tools._bucketsort_numpy(perm,first,last,v,minval,maxval)
+      elif last-first > 1:
+        # The library indexes perm from its start, so a copy must cover
+        # all of it, not only perm[first:last].
+        p = numpy.ascontiguousarray(perm,numpy.int64)
+        k = numpy.ascontiguousarray(v,dtype)
+        workspace = (ctypes.c_longlong*(maxval-minval+1+last-first))()
+        fn(p.ctypes.data_as(ctypes.POINTER(ctypes.c_longlong)),first,last,
+           k.ctypes.data_as(ctypes.POINTER(ctype)),minval,maxval,workspace)
+        if p is not perm:
+          perm[first:last] = p[first:last]
+
     @staticmethod
     def _bucketsort__3JJJ_3III(perm,first,last,v,minval,maxval):
-      if True:
-        count = numpy.zeros((maxval-minval+2,),numpy.int64)
-        for i in range(first,last): count[v[perm[i]]-minval+1] += 1
-        ptrb = count.cumsum()
-        rperm = numpy.zeros((last-first,),numpy.int64)
-        for i in range(first,last):
-          rperm[ptrb[v[perm[i]]-minval]] = perm[i]
-          ptrb[v[perm[i]]-minval] += 1
-        perm[first:last] = rperm
-  
+      impl = Tools._bucketsortimpl
+      if impl == 'python':
+        Tools._bucketsort_ref(perm,first,last,v,minval,maxval)
+      elif impl == 'native':
+        Tools._bucketsort_native(perm,first,last,v,minval,maxval,'int32')
       else:
-        perm_ct = perm.ctypes
-        v_ct    = v.ctypes
-        if perm_ct.strides[0] == 8:
-          #print( perm_ct.strides[:], perm_ct.shape[:],perm_ct.get_data())
-          arg_perm  = perm_ct.data_as(ctypes.POINTER(ctypes.c_longlong))
-          copy_perm = False
-        else:
-          tmpperm = numpy.array(perm_ct[first:last],numpy.int64)
-          arg_perm  = tmpperm.ctypes.data_as(ctypes.POINTER(ctypes.c_longlong))
-          copy_perm = True
-  
-        if v_ct.strides[0] == 4:
-          arg_v = v_ct.data_as(ctypes.POINTER(ctypes.c_int))
-          copy_v = False
-        else:
-          tmpv = numpy.array(v_ct,numpy.int32)
-          arg_v  = tmpv.ctypes.data_as(ctypes.POINTER(ctypes.c_int))
-          copy_v = True
-  
-        n = last-first
-        m = maxval - minval + 1
-        workspace = (ctypes.c_longlong*(m+n))()
-  
-        mosek.__library__.MSK_bucketsort__3JS_3III_3V(arg_perm,first,last,arg_v,minval,maxval,workspace)
-        del arg_perm,arg_v
-  
-        if copy_v: 
-          v[:] = tmpv
-          del tmpv
-        if copy_perm: 
-          perm[first:last] = tmpperm
-          del tmpperm
-  
-      
+        Tools._bucketsort_numpy(perm,first,last,v,minval,maxval)
+
     @staticmethod
     def _bucketsort__3JJJ_3JJJ(perm,first,last,v,minval,maxval):
-      if True:
-        count = numpy.zeros((maxval-minval+2,),numpy.int64)
-        for i in range(first,last): count[v[perm[i]]-minval+1] += 1
-        ptrb = count.cumsum()
-        rperm = numpy.zeros((last-first,),numpy.int64)
-        for i in range(first,last):
-          rperm[ptrb[v[perm[i]]-minval]] = perm[i]
-          ptrb[v[perm[i]]-minval] += 1
-        perm[first:last] = rperm
-        #print( rperm,v)
-  
+      impl = Tools._bucketsortimpl
+      if impl == 'python':
+        Tools._bucketsort_ref(perm,first,last,v,minval,maxval)
+      elif impl == 'native':
+        Tools._bucketsort_native(perm,first,last,v,minval,maxval,'int64')
       else:
-        perm_ct = perm.ctypes
-        v_ct    = v.ctypes
-        
-       
-        if perm_ct.strides[0] == 8:
-          arg_perm  = perm_ct.data_as(ctypes.POINTER(ctypes.c_longlong))
-          copy_perm = False
-        else:
-          tmpperm = numpy.array(perm_ct[first:last],numpy.int64)
-          arg_perm  = tmpperm.ctypes.data_as(ctypes.POINTER(ctypes.c_longlong))
-          copy_perm = True
-  
-  
-        if v_ct.strides[0] == 8:
-          arg_v = v_ct.data_as(ctypes.POINTER(ctypes.c_longlong))
-          copy_v = False
-        else:
-          tmpv = numpy.array(v_ct,numpy.int64)
-          arg_v  = tmpv.ctypes.data_as(ctypes.POINTER(ctypes.c_longlong))
-          copy_v = True
-  
-        n = last-first
-        m = maxval - minval + 1
-        workspace = (ctypes.c_longlong*(m+n))()
-  
-        mosek.__library__.MSK_bucketsort__3JS_3JJJ_3V(arg_perm,first,last,arg_v,minval,maxval,workspace)
-  
-        if copy_v: v[:] = tmpv
-        if copy_perm: perm[first:last] = tmpperm
-  
-  
-  
-  
+        Tools._bucketsort_numpy(perm,first,last,v,minval,maxval)
+
   return Tools
 mosek_fusion_Utils_Tools=__mk_mosek_fusion_Utils_Tools()
 def __mk_mosek_fusion_SolverInfo():
@@ -45501,7 +47064,7 @@ def __arg_alt_match__3I__(v):
 def __arg_match__3_5D__(v):
   return v is None or (isinstance(v,numpy.ndarray) and v.ndim == 2 and v.dtype == numpy.dtype(numpy.float64))
 def __arg_alt_match__3_5D__(v):
-  return _monty.arg_match_sloppy_array(v,__arg_alt_match_D__,2)
+  return _monty.arg_match_sloppy_array(v,__arg_alt_match_D__,2,kinds='biuf')
 def __arg_match_LSystem_4StreamWriter_2__(v):
   return v is None or isinstance(v,object)
 def __arg_alt_match_LSystem_4StreamWriter_2__(v):
@@ -45533,7 +47096,7 @@ def __arg_alt_match_Lmosek_4fusion_4LinearDomain_2__(v):
 def __arg_match__3_5I__(v):
   return v is None or (isinstance(v,numpy.ndarray) and v.ndim == 2 and v.dtype == numpy.dtype(numpy.int32))
 def __arg_alt_match__3_5I__(v):
-  return _monty.arg_match_sloppy_array(v,__arg_alt_match_I__,2)
+  return _monty.arg_match_sloppy_array(v,__arg_alt_match_I__,2,kinds='biu')
 def __arg_match_Emosek_4fusion_4SolutionStatus_2__(v):
   return isinstance(v,mosek_fusion_SolutionStatus)
 def __arg_alt_match_Emosek_4fusion_4SolutionStatus_2__(v):
@@ -45578,6 +47141,14 @@ def __arg_match_Lmosek_4fusion_4BaseVariable_2__(v):
   return v is None or isinstance(v,mosek_fusion_BaseVariable)
 def __arg_alt_match_Lmosek_4fusion_4BaseVariable_2__(v):
   return __arg_match_Lmosek_4fusion_4BaseVariable_2__(v)
+def __arg_match_Lmosek_4fusion_4BuildProfiler_2__(v):
+  return v is None or isinstance(v,mosek_fusion_BuildProfiler)
+def __arg_alt_match_Lmosek_4fusion_4BuildProfiler_2__(v):
+  return __arg_match_Lmosek_4fusion_4BuildProfiler_2__(v)
+def __arg_match_Lmosek_4fusion_4Parameter_2__(v):
+  return v is None or isinstance(v,mosek_fusion_Parameter)
+def __arg_alt_match_Lmosek_4fusion_4Parameter_2__(v):
+  return __arg_match_Lmosek_4fusion_4Parameter_2__(v)
 def __arg_match_Lmosek_4fusion_4Model_2__(v):
   return v is None or isinstance(v,mosek_fusion_Model)
 def __arg_alt_match_Lmosek_4fusion_4Model_2__(v):
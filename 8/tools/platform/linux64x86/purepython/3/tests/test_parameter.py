@@ -0,0 +1,120 @@
+"""
+Checks when Parameter.setValue is allowed: only expressions that were
+composed further and then used in the model pin the parameter value. Also
+checks that the task entries written for parameters keep terms added with
+Constraint.add, and the shapes Expr.mul, Expr.mulElm and Expr.dot accept.
+
+Usage:
+  python -m pytest tests/test_parameter.py
+"""
+import os,sys
+import numpy
+import pytest
+
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),'..'))
+from mosek.fusion import *
+
+def test_unused_expressions():
+    with Model('param') as M:
+        x = M.variable('x', 3)
+        p = M.parameter('p', 3)
+        Expr.dot(p,x)
+        e = Expr.add(Expr.mulElm(p,x),Expr.neg(x))
+        p.setValue([1.0,2.0,3.0])
+
+def test_direct_use():
+    with Model('param') as M:
+        x = M.variable('x', 3)
+        p = M.parameter('p', 3)
+        M.constraint(Expr.dot(p,x), Domain.lessThan(1.0))
+        M.objective(ObjectiveSense.Maximize, Expr.dot(p,x))
+        p.setValue([1.0,2.0,3.0])
+
+@pytest.mark.parametrize('compose', [ lambda e,x: Expr.add(e,1.0),
+                                      lambda e,x: Expr.vstack(e,Expr.sum(x)).index(0),
+                                      lambda e,x: Expr.add([Expr.sum(x),Expr.mul(2.0,e)]) ])
+def test_composed_use(compose):
+    with Model('param') as M:
+        x = M.variable('x', 3)
+        p = M.parameter('p', 3)
+        e = compose(Expr.dot(p,x),x)
+        p.setValue([1.0,1.0,1.0])
+        M.constraint(e, Domain.lessThan(1.0))
+        with pytest.raises(ExpressionError):
+            p.setValue([1.0,2.0,3.0])
+
+def test_direct_and_conic_use():
+    # Conic constraints do not bind parameters, so their coefficients
+    # would go stale.
+    with Model('param') as M:
+        x = M.variable('x', 3)
+        p = M.parameter('p', 3)
+        e = Expr.mulElm(p,x)
+        M.constraint(e, Domain.lessThan(1.0))
+        M.constraint(e, Domain.inQCone())
+        with pytest.raises(ExpressionError):
+            p.setValue([1.0,2.0,3.0])
+
+def fixed(M,shape):
+    # x is fixed to 1,2,3,... so constraint levels show the coefficients.
+    n = int(numpy.prod(shape))
+    return M.variable('x', Domain.equalsTo(numpy.arange(1.0,n+1.0),numpy.array(shape,dtype=numpy.int32)))
+
+def test_add_to_bound_row():
+    # Terms added with Constraint.add to entries that also hold a parameter
+    # are kept when the parameter is written.
+    with Model('param') as M:
+        x = fixed(M,[3])
+        p = M.parameter('p', 3)
+        p.setValue([1.0,2.0,3.0])
+        c = M.constraint(Expr.mulElm(p,x), Domain.unbounded())
+        c.add(x)
+        M.solve()
+        assert numpy.allclose(c.level(), [ 2.0, 6.0, 12.0 ])
+
+        p.setValue([4.0,5.0,6.0])
+        M.solve()
+        assert numpy.allclose(c.level(), [ 5.0, 12.0, 21.0 ])
+
+        c.add(Expr.mul(2.0,x))
+        M.solve()
+        assert numpy.allclose(c.level(), [ 7.0, 16.0, 27.0 ])
+
+@pytest.mark.parametrize('k', [ None, 2 ])
+def test_matrix_parameter(k):
+    with Model('param') as M:
+        x = fixed(M,[3] if k is None else [3,k])
+        xv = numpy.arange(1.0,3*(k or 1)+1.0).reshape(3,k or 1)
+        P = M.parameter('P', [2,3])
+        P.setValue(numpy.ones((2,3)))
+        c = M.constraint(Expr.mul(P,x), Domain.unbounded())
+        M.solve()
+        assert numpy.allclose(c.level(), numpy.ones((2,3)).dot(xv).ravel())
+
+        Pv = numpy.array([[1.0,0.0,-1.0],[2.0,3.0,0.5]])
+        P.setValue(Pv)
+        M.solve()
+        assert numpy.allclose(c.level(), Pv.dot(xv).ravel())
+
+def test_matrix_parameter_shape():
+    with Model('param') as M:
+        x = M.variable('x', 4)
+        with pytest.raises(DimensionError):
+            Expr.mul(M.parameter('P', [2,3]),x)
+        with pytest.raises(DimensionError):
+            Expr.mul(M.parameter('q', 4),x)
+
+def test_nd_mulelm_and_dot():
+    with Model('param') as M:
+        x = fixed(M,[2,3])
+        P = M.parameter('P', [2,3])
+        Pv = numpy.arange(6.0).reshape(2,3) - 2.0
+        P.setValue(Pv)
+        e = M.constraint(Expr.mulElm(P,x), Domain.unbounded())
+        d = M.constraint(Expr.dot(P,x), Domain.unbounded())
+        M.solve()
+        xv = numpy.arange(1.0,7.0).reshape(2,3)
+        assert numpy.allclose(e.level(), (Pv*xv).ravel())
+        assert numpy.allclose(d.level(), [ (Pv*xv).sum() ])
+        with pytest.raises(DimensionError):
+            Expr.dot(P,M.variable('y', 6))
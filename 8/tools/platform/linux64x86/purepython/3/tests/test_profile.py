@@ -0,0 +1,41 @@
+"""
+Checks that a BuildProfiler charges the time spent in Expr operations to
+the constraint that consumes the expression.
+
+Usage:
+  python -m pytest tests/test_profile.py
+"""
+import os,sys
+import time
+import numpy
+
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),'..'))
+from mosek.fusion import *
+
+def test_expr_time_is_charged():
+    n = 200
+    A = Matrix.dense(numpy.random.RandomState(0).rand(n,n))
+    with Model('profile') as M:
+        x = M.variable('x', n)
+        P = BuildProfiler()
+        M.setBuildProfiler(P)
+        t0 = time.time()
+        e = Expr.add(Expr.mul(A,x),Expr.mul(2.0,x))
+        texpr = time.time()-t0
+        M.constraint('c', e, Domain.lessThan(1.0))
+
+        r, = P.getRecords()
+        assert r['eval'] >= 0.5*texpr
+        assert r['time'] >= r['eval'] + r['assembly'] + r['native'] - 1e-9
+
+def test_detached_profiler_stops_timing():
+    with Model('profile') as M:
+        x = M.variable('x', 3)
+        M.setBuildProfiler(BuildProfiler())
+        M.setBuildProfiler(None)
+        M.constraint('c', Expr.mul(2.0,x), Domain.lessThan(1.0))
+    with Model('profile') as M:
+        x = M.variable('x', 3)
+        M.setBuildProfiler(BuildProfiler())
+    # Neither model has a profiler any more, so the result carries no time.
+    assert getattr(Expr.mul(2.0,x),'_Expr__buildtime',None) is None
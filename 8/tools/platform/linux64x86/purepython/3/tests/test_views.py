@@ -0,0 +1,74 @@
+"""
+Checks that chains of variable views (slice, pick, flatten, transpose and
+reshape) address the same elements as the corresponding numpy indexing.
+
+Usage:
+  python -m pytest tests/test_views.py
+
+The variable x is fixed to 0,1,2,... so that the level of a view, and the
+level of a constraint on it, must equal the same view of numpy.arange.
+"""
+import os,sys
+import numpy
+import pytest
+
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),'..'))
+from mosek.fusion import *
+
+def i32(a):
+    return numpy.array(a,dtype=numpy.int32)
+
+def step(rng,v,r):
+    op = rng.randint(5)
+    if op == 0:
+        a = [ rng.randint(0,d) for d in r.shape ]
+        b = [ rng.randint(a[k]+1,r.shape[k]+1) for k in range(r.ndim) ]
+        if r.ndim == 1:
+            return v.slice(a[0],b[0]), r[a[0]:b[0]]
+        return v.slice(i32(a),i32(b)), r[tuple(slice(a[k],b[k]) for k in range(r.ndim))]
+    elif op == 1 and r.ndim == 1:
+        p = rng.randint(0,r.shape[0],rng.randint(1,8))
+        return v.pick(i32(p)), r[p]
+    elif op == 2 and r.ndim > 1:
+        return Var.flatten(v), r.ravel()
+    elif op == 3 and r.ndim == 2:
+        return v.transpose(), r.T
+    elif op == 4:
+        ds = [ d for d in range(2,r.size) if r.size % d == 0 ]
+        if len(ds) > 0:
+            d = ds[rng.randint(len(ds))]
+            return Var.reshape(v,d,r.size//d), r.reshape(d,r.size//d)
+    return v,r
+
+def fixed(M,shape):
+    n = int(numpy.prod(shape))
+    x = M.variable('x', Domain.equalsTo(numpy.arange(n,dtype=float),i32(shape)))
+    return x, numpy.arange(n).reshape(shape)
+
+@pytest.mark.parametrize('seed', range(10))
+def test_random_chains(seed):
+    rng = numpy.random.RandomState(seed)
+    with Model('views') as M:
+        shape = [ rng.randint(1,6) for k in range(rng.randint(1,4)) ]
+        x,ref = fixed(M,shape)
+        views = []
+        for t in range(20):
+            v,r = x,ref
+            for s in range(rng.randint(1,7)):
+                v,r = step(rng,v,r)
+            views.append((v,r,M.constraint(v,Domain.unbounded())))
+        M.solve()
+
+        for v,r,c in views:
+            assert numpy.allclose(v.level(), r.ravel())
+            assert numpy.allclose(c.level(), r.ravel())
+
+def test_slice_of_flattened_column():
+    with Model('views') as M:
+        x,ref = fixed(M,[4,5])
+        f = Var.flatten(x.slice(i32([0,2]),i32([4,3])))
+        c = M.constraint(f.slice(1,3),Domain.unbounded())
+        M.solve()
+
+        assert numpy.allclose(f.slice(1,3).level(), ref[1:3,2])
+        assert numpy.allclose(c.level(), ref[1:3,2])
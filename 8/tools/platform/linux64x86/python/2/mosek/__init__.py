@@ -10356,6 +10356,35 @@ class Task:
         result,msg = self.__getlasterror(res)
         raise Error(rescode(res),msg)
     
+    def putparams(self,params): # 2
+      """
+      Sets a number of parameters in one call.
+    
+      putparams(self,params)
+        params: dict or list of (parameter,value) pairs. A parameter is either a
+          mosek.iparam, mosek.dparam or mosek.sparam item, or a parameter name
+          as accepted by putparam. Parameters are applied in the given order.
+      """
+      obj = self.__obj
+      if isinstance(params,dict):
+        params = params.items()
+      for param_,parvalue_ in params:
+        if isinstance(param_,iparam):
+          res = obj.putintparam(param_,parvalue_)
+        elif isinstance(param_,dparam):
+          res = obj.putdouparam(param_,parvalue_)
+        elif isinstance(param_,sparam):
+          res = obj.putstrparam(param_,parvalue_)
+        elif isinstance(param_,basestring):
+          if isinstance(parvalue_,float):         parvalue_ = repr(parvalue_)
+          elif isinstance(parvalue_,(int,long)):  parvalue_ = str(int(parvalue_))
+          res = obj.putparam(param_,parvalue_)
+        else:
+          raise TypeError("Invalid parameter %s" % repr(param_))
+        if res != 0:
+          result,msg = self.__getlasterror(res)
+          raise Error(rescode(res),msg)
+    
     def putqcon(self,qcsubk,qcsubi,qcsubj,qcval): # 2
       """
       Replaces all quadratic terms in constraints.
@@ -0,0 +1,60 @@
+"""
+Checks and times the bucket sort kernels in mosek.fusion.Utils.Tools.
+
+Usage:
+  python bench/bench_bucketsort.py [trials]
+
+The selected implementation (Tools._bucketsortimpl, set from
+MOSEK_FUSION_BUCKETSORT) is first compared against the reference Python
+implementation on random sub-ranges of random permutations, and then
+timed against it on inputs of one million entries.
+"""
+import os,sys
+import timeit
+import numpy
+
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),'..'))
+import mosek.fusion
+Tools = mosek.fusion.Utils.Tools
+
+def check(trials):
+    rng = numpy.random.RandomState(0)
+    for trial in range(trials):
+        dtype = numpy.int32 if trial % 2 == 0 else numpy.int64
+        n     = rng.randint(1,100)
+        span  = rng.choice([1,3,50,70000])
+        v     = (rng.randint(-1000,1000) + rng.randint(0,span,n)).astype(dtype)
+        perm  = rng.permutation(n).astype(numpy.int64)
+        first = rng.randint(0,n)
+        last  = rng.randint(first+1,n+1)
+        minval = dtype(v[perm[first:last]].min())
+        maxval = dtype(v[perm[first:last]].max())
+
+        ref = perm.copy()
+        Tools._bucketsort_ref(ref,first,last,v,minval,maxval)
+        if dtype is numpy.int32:
+            Tools._bucketsort__3JJJ_3III(perm,first,last,v,minval,maxval)
+        else:
+            Tools._bucketsort__3JJJ_3JJJ(perm,first,last,v,minval,maxval)
+        if not (perm == ref).all():
+            raise AssertionError('Mismatch in trial %d: %s != %s' % (trial,perm,ref))
+    print('%s: %d random trials agree with the reference' % (Tools._bucketsortimpl,trials))
+
+def bench():
+    n = 1000000
+    rng = numpy.random.RandomState(1)
+    for span in [100,10000,n]:
+        v = rng.randint(0,span,n).astype(numpy.int32)
+        def ref():
+            perm = numpy.arange(n,dtype=numpy.int64)
+            Tools._bucketsort_ref(perm,0,n,v,numpy.int32(0),numpy.int32(span-1))
+        def new():
+            perm = numpy.arange(n,dtype=numpy.int64)
+            Tools._bucketsort__3JJJ_3III(perm,0,n,v,numpy.int32(0),numpy.int32(span-1))
+        print('  n = %d, %7d buckets: reference %8.4f s, %s %8.4f s' %
+              (n,span,min(timeit.repeat(ref,number=1,repeat=1)),
+               Tools._bucketsortimpl,min(timeit.repeat(new,number=1,repeat=3))))
+
+if __name__ == '__main__':
+    check(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
+    bench()
@@ -0,0 +1,64 @@
+"""
+Times Model.clone on a model with a large dense constraint block and reports
+how much memory the clones hold on the Python side.
+
+Usage:
+  python bench/bench_clone.py [n] [clones]
+
+The model has an n x n dense constraint Ax <= b (default n = 1000, i.e. one
+million nonzeros) and is cloned the given number of times (default 100).
+Each clone then changes one row with Constraint.add and is solved, which must
+leave the original model untouched. Memory is measured with tracemalloc, so
+it covers the Fusion metadata (constraint caches, index maps, solutions) but
+not the task itself, which MOSEK always copies in full.
+"""
+import os,sys
+import time
+import tracemalloc
+import numpy
+
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),'..'))
+from mosek.fusion import *
+
+def build(n):
+    rng = numpy.random.RandomState(0)
+    M = Model('clone')
+    x = M.variable('x', n, Domain.inRange(-1.0,1.0))
+    M.constraint('c', Expr.mul(Matrix.dense(rng.rand(n,n)),x), Domain.lessThan(rng.rand(n)))
+    M.objective(ObjectiveSense.Maximize, Expr.sum(x))
+    M.solve()
+    return M
+
+def main(n,clones):
+    M = build(n)
+    ref = M.primalObjValue()
+
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    t0 = time.time()
+    Ms = [ M.clone() for i in range(clones) ]
+    tclone = time.time()-t0
+    mclone = tracemalloc.get_traced_memory()[0]-base
+
+    t0 = time.time()
+    for i,Mi in enumerate(Ms):
+        Mi.getConstraint('c').index(i % n).add(Expr.mul(-1.0,Mi.getVariable('x').index(i % n)))
+        Mi.solve()
+    tbranch = time.time()-t0
+    mbranch = tracemalloc.get_traced_memory()[0]-base
+    tracemalloc.stop()
+
+    M.solve()
+    if abs(M.primalObjValue()-ref) > 1e-8*(1+abs(ref)):
+        raise AssertionError('changing a clone changed the original model')
+    for Mi in Ms:
+        Mi.dispose()
+    M.dispose()
+
+    print('n = %d (%d nonzeros), %d clones' % (n,n*n,clones))
+    print('  clone               %8.4f s per clone, %8.1f kB per clone' % (tclone/clones,mclone/1024.0/clones))
+    print('  change row and solve %7.4f s per clone, %8.1f kB per clone' % (tbranch/clones,mbranch/1024.0/clones))
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 100)
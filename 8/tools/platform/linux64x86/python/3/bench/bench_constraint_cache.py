@@ -0,0 +1,77 @@
+"""
+Checks and times incremental flushing of mosek.fusion.ConstraintCache, the
+row store behind Constraint.add.
+
+Usage:
+  python bench/bench_constraint_cache.py [nrows] [rowlen] [changes]
+
+A cache with nrows rows of rowlen nonzeros each (defaults 100000 and 10)
+receives a number of rounds of random updates of the given total size
+(default 100). Each round touches both existing and new entries and is then
+flushed; the flushed entries are compared against a dense reference, and the
+time per add/flush round is reported.
+"""
+import os,sys
+import timeit
+import numpy
+
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),'..'))
+from mosek.fusion import ConstraintCache
+
+def mkcache(rng,nrows,ncols,rowlen):
+    ptrb = numpy.arange(0,nrows+1,dtype=numpy.int64)*rowlen
+    subj = numpy.concatenate([ numpy.sort(rng.choice(ncols,rowlen,replace=False)) for i in range(nrows) ]).astype(numpy.int32)
+    cof = rng.rand(nrows*rowlen)
+    return ConstraintCache(ptrb,cof,subj,numpy.zeros((nrows,)),None,None,None)
+
+def update(rng,nrows,ncols,changes):
+    subi = numpy.sort(rng.randint(0,nrows,changes))
+    ptrb = numpy.zeros((nrows+1,),numpy.int64)
+    numpy.cumsum(numpy.bincount(subi,minlength=nrows),out=ptrb[1:])
+    return ptrb,rng.randint(0,ncols,changes).astype(numpy.int32),rng.rand(changes)-0.5
+
+def flush(cc):
+    n = cc.numUnsorted()
+    subi,subj,cof = numpy.zeros((n,),numpy.int32),numpy.zeros((n,),numpy.int32),numpy.zeros((n,))
+    num = cc.flush(subi,subj,cof,None)
+    return subi[:num],subj[:num],cof[:num]
+
+def check(trials):
+    rng = numpy.random.RandomState(0)
+    for trial in range(trials):
+        nrows,ncols = rng.randint(1,10),rng.randint(5,20)
+        cc = mkcache(rng,nrows,ncols,rng.randint(0,5))
+        ref = numpy.zeros((nrows,ncols))
+        numpy.add.at(ref,(cc.subi,cc.subj),cc.cof)
+        for r in range(5):
+            for a in range(rng.randint(1,3)):
+                ptrb,subj,cof = update(rng,nrows,ncols,rng.randint(0,10))
+                cc.add(ptrb,subj,cof,None)
+                numpy.add.at(ref,(numpy.repeat(numpy.arange(nrows),numpy.diff(ptrb)),subj),cof)
+            for i,j,v in zip(*flush(cc)):
+                if abs(ref[i,j]-v) > 1e-12:
+                    raise AssertionError('flushed entry (%d,%d) mismatch in trial %d' % (i,j,trial))
+            got = numpy.zeros((nrows,ncols))
+            numpy.add.at(got,(cc.subi[:cc.nnz],cc.subj[:cc.nnz]),cc.cof[:cc.nnz])
+            if not numpy.allclose(got,ref):
+                raise AssertionError('cache contents mismatch in trial %d' % trial)
+    print('%d random trials agree with the reference' % trials)
+
+def main(nrows,rowlen,changes):
+    rng = numpy.random.RandomState(1)
+    ncols = 10*rowlen
+    cc = mkcache(rng,nrows,ncols,rowlen)
+    rounds = [ update(rng,nrows,ncols,changes) for i in range(20) ]
+    it = iter(rounds*100)
+    def step():
+        ptrb,subj,cof = next(it)
+        cc.add(ptrb,subj,cof,None)
+        flush(cc)
+    print('nrows = %d, rowlen = %d, %d changes per round' % (nrows,rowlen,changes))
+    print('  add + flush %8.6f s per round' % (min(timeit.repeat(step,number=20,repeat=3))/20))
+
+if __name__ == '__main__':
+    check(200)
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 10,
+         int(sys.argv[3]) if len(sys.argv) > 3 else 100)
@@ -0,0 +1,48 @@
+"""
+Times adding many independent constraint blocks one by one and with
+Model.constraintsParallel.
+
+Usage:
+  python bench/bench_parallel.py [k] [m] [n] [workers]
+
+The model has k dense blocks A_i x <= b_i with A_i of size m x n (defaults
+k = 40, m = 100, n = 500). Both builds number the constraints the same way,
+which the benchmark checks before printing the timings.
+"""
+import os,sys
+import time
+import numpy
+
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),'..'))
+from mosek.fusion import *
+
+def build(k,m,n,workers):
+    rng = numpy.random.RandomState(0)
+    M = Model('parallel')
+    x = M.variable('x', n, Domain.unbounded())
+    blocks = [ ('c%d' % i, Expr.mul(Matrix.dense(rng.rand(m,n)),x), Domain.lessThan(rng.rand(m)))
+               for i in range(k) ]
+    t0 = time.time()
+    if workers == 0:
+        cons = [ M.constraint(*b) for b in blocks ]
+    else:
+        cons = M.constraintsParallel(blocks,workers)
+    t = time.time()-t0
+    first = [ c.index(0).toString() for c in cons ]
+    M.dispose()
+    return t,first
+
+def main(k,m,n,workers):
+    tser,first = build(k,m,n,0)
+    tpar,firstpar = build(k,m,n,workers)
+    assert first == firstpar
+
+    print('k = %d, m = %d, n = %d' % (k,m,n))
+    print('  serial    %8.4f s' % tser)
+    print('  parallel  %8.4f s' % tpar)
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 40,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 100,
+         int(sys.argv[3]) if len(sys.argv) > 3 else 500,
+         int(sys.argv[4]) if len(sys.argv) > 4 else None)
@@ -0,0 +1,73 @@
+"""
+Times re-solving the basic Markowitz model from examples/fusion/python/portfolio.py
+with new data, once by rebuilding the Model and once by updating parameters.
+
+Usage:
+  python bench/bench_parameter.py [n] [rounds]
+
+The expected returns mu, the initial wealth and the rows of GT are drawn
+at random for n assets (default 200). In each of the given number of rounds
+(default 20) mu and the wealth are redrawn, and the model is either rebuilt
+from scratch and solved, or the parameters of a single model are updated
+with Parameter.setValue and the model is solved again. Both variants must
+report the same optimal expected return.
+"""
+import os,sys
+import time
+import numpy
+
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),'..'))
+from mosek.fusion import *
+
+def rebuild(n,mu,GT,w,gamma):
+    with Model("Basic Markowitz") as M:
+        x = M.variable("x", n, Domain.greaterThan(0.0))
+        M.objective('obj', ObjectiveSense.Maximize, Expr.dot(mu,x))
+        M.constraint('budget', Expr.sum(x), Domain.equalsTo(w))
+        M.constraint('risk', Expr.vstack(gamma,Expr.mul(GT,x)), Domain.inQCone())
+        M.solve()
+        return numpy.dot(mu,x.level())
+
+class Parametric(object):
+    def __init__(self,n,GT,gamma):
+        self.M = Model("Basic Markowitz")
+        self.mu = self.M.parameter('mu', n)
+        self.w = self.M.parameter('w')
+        self.x = self.M.variable("x", n, Domain.greaterThan(0.0))
+        self.M.objective('obj', ObjectiveSense.Maximize, Expr.dot(self.mu,self.x))
+        self.M.constraint('budget', Expr.sum(self.x), Domain.equalsTo(self.w))
+        self.M.constraint('risk', Expr.vstack(gamma,Expr.mul(GT,self.x)), Domain.inQCone())
+
+    def solve(self,mu,w):
+        self.mu.setValue(mu)
+        self.w.setValue(w)
+        self.M.solve()
+        return numpy.dot(mu,self.x.level())
+
+def main(n,rounds):
+    rng = numpy.random.RandomState(0)
+    GT = Matrix.dense(rng.rand(n,n).tolist())
+    gamma = 0.05
+    data = [ (0.05+0.1*rng.rand(n),1.0+rng.rand()) for r in range(rounds) ]
+
+    t0 = time.time()
+    ref = [ rebuild(n,mu,GT,w,gamma) for mu,w in data ]
+    trebuild = time.time()-t0
+
+    t0 = time.time()
+    P = Parametric(n,GT,gamma)
+    tbuild = time.time()-t0
+    t0 = time.time()
+    res = [ P.solve(mu,w) for mu,w in data ]
+    tresolve = time.time()-t0
+    P.M.dispose()
+
+    if not numpy.allclose(ref,res,rtol=1e-6,atol=1e-8):
+        raise AssertionError('re-solved objective values differ from the rebuilt ones')
+    print('n = %d, %d rounds' % (n,rounds))
+    print('  rebuild and solve   %8.4f s per round' % (trebuild/rounds))
+    print('  setValue and solve  %8.4f s per round (initial build %.4f s)' % (tresolve/rounds,tbuild))
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 20)
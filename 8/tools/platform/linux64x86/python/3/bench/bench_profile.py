@@ -0,0 +1,53 @@
+"""
+Builds a mixed model with and without a BuildProfiler attached and prints the
+profiler's report together with the overhead of profiling.
+
+Usage:
+  python bench/bench_profile.py [n] [json]
+
+The model has an n x n dense constraint block (default n = 300), a sparse
+block, a quadratic cone and a semidefinite constraint. When a file name is
+given, the records are also written to it as JSON.
+"""
+import os,sys
+import time
+import numpy
+
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),'..'))
+from mosek.fusion import *
+
+def build(n,profiler=None):
+    rng = numpy.random.RandomState(0)
+    M = Model('profile')
+    if profiler is not None:
+        M.setBuildProfiler(profiler)
+    x = M.variable('x', n, Domain.greaterThan(0.0))
+    t = M.variable('t', 1, Domain.unbounded())
+    X = M.variable('X', Domain.inPSDCone(10))
+    k = numpy.unique(rng.randint(0,n*n,n*10))
+    S = Matrix.sparse(n,n,(k//n).astype(numpy.int32),(k%n).astype(numpy.int32),rng.rand(k.size))
+    M.constraint('dense', Expr.mul(Matrix.dense(rng.rand(n,n)),x), Domain.lessThan(1.0))
+    M.constraint('sparse', Expr.mul(S,x), Domain.inRange(-1.0,1.0))
+    M.constraint('cone', Expr.vstack(t,x), Domain.inQCone())
+    M.constraint('psd', Expr.sub(X,Matrix.dense(numpy.eye(10))), Domain.inPSDCone(10))
+    M.objective(ObjectiveSense.Minimize, t)
+    return M
+
+def main(n,filename):
+    t0 = time.time()
+    build(n).dispose()
+    tplain = time.time()-t0
+
+    P = BuildProfiler(memory=True)
+    t0 = time.time()
+    build(n,P).dispose()
+    tprof = time.time()-t0
+
+    print(P.report())
+    print('build %.4f s, with profiler %.4f s' % (tplain,tprof))
+    if filename is not None:
+        P.dump(filename)
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300,
+         sys.argv[2] if len(sys.argv) > 2 else None)
@@ -0,0 +1,46 @@
+"""
+Times building a model with many semidefinite terms, in the style of the
+nearestcorr.py example.
+
+Usage:
+  python bench/bench_psd.py [n] [k]
+
+The model has k semidefinite variables X_i of dimension n (defaults n = 50,
+k = 20). Every X_i has its diagonal fixed to one and is bounded by the
+semidefinite constraint X_i - (1/n) J >= 0 on the expression. The objective
+is the sum of <C_i, X_i> for random symmetric C_i. Each constraint and
+objective term adds symmetric coefficient matrices to the task, and the
+benchmark measures how long emitting them takes.
+"""
+import os,sys
+import time
+import numpy
+
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),'..'))
+from mosek.fusion import *
+
+def build(n,k):
+    rng = numpy.random.RandomState(0)
+    M = Model('psd')
+    obj = []
+    for i in range(k):
+        X = M.variable('X%d' % i, Domain.inPSDCone(n))
+        M.constraint('diag%d' % i, X.diag(), Domain.equalsTo(1.0))
+        M.constraint('lb%d' % i, Expr.sub(X, Matrix.dense(numpy.full((n,n),1.0/n))), Domain.inPSDCone(n))
+        C = rng.rand(n,n)
+        obj.append(Expr.dot(Matrix.dense(C+C.T), X))
+    M.objective(ObjectiveSense.Minimize, Expr.add(obj))
+    return M
+
+def main(n,k):
+    t0 = time.time()
+    M = build(n,k)
+    tbuild = time.time()-t0
+    M.dispose()
+
+    print('n = %d, k = %d' % (n,k))
+    print('  build  %8.4f s' % tbuild)
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 20)
@@ -0,0 +1,71 @@
+"""
+Times Model.save and Model.load against building a model from scratch.
+
+Usage:
+  python bench/bench_save.py [m] [n] [density] [file]
+
+A model with a sparse random m x n constraint matrix (defaults 100000 x 10000
+with density 0.001), a few differently constrained variables and named
+constraints is built, solved and saved to the given file (default a temporary
+file). The file is then loaded again and the restored model must report the
+same levels and duals as the original one.
+"""
+import os,sys
+import time
+import tempfile
+import numpy
+
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),'..'))
+from mosek.fusion import *
+
+def build(m,n,density):
+    rng = numpy.random.RandomState(0)
+    k = numpy.unique(rng.randint(0,m*n,int(m*n*density)))
+    A = Matrix.sparse(m,n,(k//n).astype(numpy.int32),(k%n).astype(numpy.int32),rng.rand(k.size))
+    M = Model('save')
+    x = M.variable('x', n, Domain.inRange(0.0,1.0))
+    t = M.variable('t', 1, Domain.unbounded())
+    M.constraint('A', Expr.mul(A,x), Domain.lessThan(1.0))
+    M.constraint('norm', Expr.vstack(t,x.slice(0,min(n,100))), Domain.inQCone())
+    M.objective(ObjectiveSense.Maximize, Expr.sub(Expr.sum(x),t))
+    return M
+
+def main(m,n,density,filename):
+    t0 = time.time()
+    M = build(m,n,density)
+    tbuild = time.time()-t0
+    M.solve()
+    x,dual = M.getVariable('x').level(),M.getConstraint('A').dual()
+
+    t0 = time.time()
+    M.save(filename)
+    tsave = time.time()-t0
+    size = os.path.getsize(filename)
+
+    t0 = time.time()
+    N = Model.load(filename)
+    tload = time.time()-t0
+    if not (numpy.array_equal(N.getVariable('x').level(),x) and numpy.array_equal(N.getConstraint('A').dual(),dual)):
+        raise AssertionError('loaded model reports a different solution')
+    N.solve()
+    N.dispose()
+    M.dispose()
+
+    print('m = %d, n = %d, density %g, file %.1f MB' % (m,n,density,size/1e6))
+    print('  build  %8.4f s' % tbuild)
+    print('  save   %8.4f s' % tsave)
+    print('  load   %8.4f s (%.1f MB/s)' % (tload,size/1e6/tload))
+
+if __name__ == '__main__':
+    filename = sys.argv[4] if len(sys.argv) > 4 else None
+    if filename is None:
+        fd,filename = tempfile.mkstemp(suffix='.fusion')
+        os.close(fd)
+    try:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000,
+             int(sys.argv[2]) if len(sys.argv) > 2 else 10000,
+             float(sys.argv[3]) if len(sys.argv) > 3 else 0.001,
+             filename)
+    finally:
+        if len(sys.argv) <= 4:
+            os.remove(filename)
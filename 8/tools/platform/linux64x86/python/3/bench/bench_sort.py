@@ -0,0 +1,54 @@
+"""
+Microbenchmarks for the Fusion sort kernels in mosek.fusion.Utils.Tools
+and mosek.fusion.Sort.
+
+Usage:
+  python bench/bench_sort.py [n]
+
+Each kernel is timed on sorted, reverse-sorted, random and bucketable
+(few distinct keys) inputs of length n (default 1000000).
+"""
+import os,sys
+import timeit
+import numpy
+
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),'..'))
+import mosek.fusion
+from mosek.fusion import Sort
+Tools = mosek.fusion.Utils.Tools
+
+def inputs(n,dtype):
+    rng = numpy.random.RandomState(0)
+    return [ ('sorted',     numpy.arange(n,dtype=dtype)),
+             ('reverse',    numpy.arange(n,0,-1,dtype=dtype)),
+             ('random',     rng.randint(0,n,n).astype(dtype)),
+             ('bucketable', rng.randint(0,max(1,n//100),n).astype(dtype)) ]
+
+def bench(name,fun,number=3):
+    t = min(timeit.repeat(fun,number=1,repeat=number))
+    print('  %-40s %10.4f s' % (name,t))
+
+def main(n):
+    for dtype,suffix in [(numpy.int32,'I'),(numpy.int64,'J')]:
+        print('keys: %s, n = %d' % (numpy.dtype(dtype).name,n))
+        for kind,v in inputs(n,dtype):
+            w = v[::-1].copy()
+            def argsort1():
+                perm = numpy.arange(n,dtype=numpy.int64)
+                getattr(Tools,'_argsort__3J_3%sJJ' % suffix)(perm,v,0,n)
+            def argsort2():
+                perm = numpy.arange(n,dtype=numpy.int64)
+                getattr(Tools,'_argsort__3J_3%s_3%sJJ' % (suffix,suffix))(perm,v,w,0,n)
+            def sortcheck1():
+                perm = numpy.arange(n,dtype=numpy.int64)
+                getattr(Sort,'_argsort__3J_3%sJJZ' % suffix)(perm,v,0,n,True)
+            def sortcheck2():
+                perm = numpy.arange(n,dtype=numpy.int64)
+                getattr(Sort,'_argsort__3J_3%s_3%sJJZ' % (suffix,suffix))(perm,v,w,0,n,True)
+            bench('%-10s Tools argsort, one key'  % kind, argsort1)
+            bench('%-10s Tools argsort, two keys' % kind, argsort2)
+            bench('%-10s Sort argsort, one key'   % kind, sortcheck1)
+            bench('%-10s Sort argsort, two keys'  % kind, sortcheck2)
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
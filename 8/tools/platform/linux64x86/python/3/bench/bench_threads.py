@@ -0,0 +1,55 @@
+"""
+Times building and dropping many small models from a pool of threads, with
+all threads sharing the default Env and with one Env per thread.
+
+Usage:
+  python bench/bench_threads.py [models] [n] [threads]
+
+Each thread builds its share of the models (default 400 models in total, 4
+threads), each with a dense n x n constraint block (default n = 100), and
+drops every model as soon as it is built. Dropped models have their tasks
+deleted in the background, so the build threads do not wait for it.
+"""
+import os,sys
+import time
+import threading
+import numpy
+
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),'..'))
+import mosek
+from mosek.fusion import *
+
+def work(count,n,ownenv):
+    if ownenv:
+        Model.setThreadEnv(mosek.Env())
+    rng = numpy.random.RandomState(0)
+    A = Matrix.dense(rng.rand(n,n))
+    for i in range(count):
+        M = Model('m%d' % i)
+        x = M.variable('x', n, Domain.greaterThan(0.0))
+        M.constraint(Expr.mul(A,x), Domain.lessThan(1.0))
+        M.objective(ObjectiveSense.Maximize, Expr.sum(x))
+        M.dispose()
+    Model.setThreadEnv(None)
+
+def run(models,n,threads,ownenv):
+    ts = [ threading.Thread(target=work,args=(models//threads,n,ownenv)) for i in range(threads) ]
+    t0 = time.time()
+    for t in ts:
+        t.start()
+    for t in ts:
+        t.join()
+    return time.time()-t0
+
+def main(models,n,threads):
+    tshared = run(models,n,threads,False)
+    town    = run(models,n,threads,True)
+
+    print('%d models, n = %d, %d threads' % (models,n,threads))
+    print('  shared Env      %8.4f s' % tshared)
+    print('  Env per thread  %8.4f s' % town)
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 400,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 100,
+         int(sys.argv[3]) if len(sys.argv) > 3 else 4)
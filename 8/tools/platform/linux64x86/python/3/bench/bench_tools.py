@@ -0,0 +1,113 @@
+"""
+Checks and times the vector helpers in mosek.fusion.Utils.Tools and the
+triplet kernels in mosek.fusion.CommonTools.
+
+Usage:
+  python bench/bench_tools.py [n]
+
+Each primitive is first compared against a plain Python reference
+(the loops it replaced) on small random inputs, and then both are timed
+on inputs of length n (default 1000000).
+"""
+import os,sys
+import timeit
+import numpy
+
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),'..'))
+import mosek.fusion
+from mosek.fusion import CommonTools
+Tools = mosek.fusion.Utils.Tools
+
+def makevector_ref(val,num,dtype):
+    r = numpy.zeros((num,),dtype)
+    r[:] = val
+    return r
+
+def repeatrange_ref(first,last,num,dtype):
+    res = numpy.zeros(((last-first)*num,),dtype)
+    ra = numpy.arange(first,last)
+    l = last-first
+    for i in range(num):
+        res[i*l:(i+1)*l] = ra
+    return res
+
+def tripletsort_ref(subi,subj,val,nelm):
+    perm = sorted(range(nelm),key = lambda k: (subi[k],subj[k]))
+    ri,rj,rv = [],[],[]
+    for k in perm:
+        if ri and ri[-1] == subi[k] and rj[-1] == subj[k]:
+            rv[-1] += val[k]
+        else:
+            ri.append(subi[k]); rj.append(subj[k]); rv.append(val[k])
+    return ri,rj,rv
+
+def transpose_ref(subi,subj,val,nelm):
+    perm = sorted(range(nelm),key = lambda k: (subj[k],subi[k]))
+    return [ subj[k] for k in perm ],[ subi[k] for k in perm ],[ val[k] for k in perm ]
+
+def triplets(rng,m,n,nelm):
+    return (rng.randint(0,m,nelm).astype(numpy.int32),
+            rng.randint(0,n,nelm).astype(numpy.int32),
+            rng.rand(nelm))
+
+def tripletsort(subi,subj,val,nelm,m,n):
+    res = [ numpy.empty((1,),object) for i in range(3) ]
+    CommonTools._tripletSort__3I_3I_3D_3_3I_3_3I_3_3DJII(subi,subj,val,res[0],res[1],res[2],numpy.int64(nelm),numpy.int32(m),numpy.int32(n))
+    return [ r[0] for r in res ]
+
+def transpose(subi,subj,val,nelm,m,n):
+    res = [ numpy.empty((1,),object) for i in range(3) ]
+    CommonTools._transposeTriplets__3I_3I_3D_3_3J_3_3J_3_3DJII(subi,subj,val,res[0],res[1],res[2],numpy.int64(nelm),numpy.int32(m),numpy.int32(n))
+    return [ r[0] for r in res ]
+
+def check(trials):
+    rng = numpy.random.RandomState(0)
+    for trial in range(trials):
+        num = rng.randint(0,20)
+        first = rng.randint(-10,10)
+        last = first + rng.randint(0,10)
+        for dtype,mv,rr in [(numpy.int32,Tools._makevector_II,Tools._repeatrange_III),
+                            (numpy.int64,Tools._makevector_JI,Tools._repeatrange_JJJ)]:
+            if not (mv(first,num) == makevector_ref(first,num,dtype)).all() or mv(first,num).dtype != dtype:
+                raise AssertionError('makevector mismatch in trial %d' % trial)
+            if not (rr(first,last,num) == repeatrange_ref(first,last,num,dtype)).all() or rr(first,last,num).dtype != dtype:
+                raise AssertionError('repeatrange mismatch in trial %d' % trial)
+        if not (Tools._makevector_DI(0.5,num) == makevector_ref(0.5,num,numpy.float64)).all():
+            raise AssertionError('makevector mismatch in trial %d' % trial)
+
+        m,n = rng.randint(1,20),rng.randint(1,20)
+        nelm = rng.randint(1,100)
+        subi,subj,val = triplets(rng,m,n,nelm+rng.randint(0,3))
+        for name,fun,ref in [('tripletSort',tripletsort,tripletsort_ref),
+                             ('transposeTriplets',transpose,transpose_ref)]:
+            res = fun(subi,subj,val,nelm,m,n)
+            if any([ list(r) != list(e) for r,e in zip(res,ref(subi,subj,val,nelm)) ]):
+                raise AssertionError('%s mismatch in trial %d' % (name,trial))
+    print('%d random trials agree with the reference' % trials)
+
+def bench(name,ref,new):
+    print('  %-40s reference %8.4f s, numpy %8.4f s' %
+          (name,min(timeit.repeat(ref,number=1,repeat=1)),min(timeit.repeat(new,number=1,repeat=3))))
+
+def main(n):
+    rng = numpy.random.RandomState(1)
+    print('n = %d' % n)
+    bench('makevector_JI',
+          lambda: makevector_ref(7,n,numpy.int64),
+          lambda: Tools._makevector_JI(7,n))
+    for l in [3,1000]:
+        bench('repeatrange_JJJ, range length %d' % l,
+              lambda: repeatrange_ref(0,l,n//l,numpy.int64),
+              lambda: Tools._repeatrange_JJJ(0,l,n//l))
+    m = int(numpy.sqrt(n))
+    subi,subj,val = triplets(rng,m,m,n)
+    bench('tripletSort, %dx%d' % (m,m),
+          lambda: tripletsort_ref(subi,subj,val,n),
+          lambda: tripletsort(subi,subj,val,n,m,m))
+    bench('transposeTriplets, %dx%d' % (m,m),
+          lambda: transpose_ref(subi,subj,val,n),
+          lambda: transpose(subi,subj,val,n,m,m))
+
+if __name__ == '__main__':
+    check(500)
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,43 @@
+"""
+Times building constraints on chains of variable views such as
+x.slice(...).pick(...).index(...).
+
+Usage:
+  python bench/bench_views.py [n] [k]
+
+x is an n x n variable (default n = 400). The benchmark adds k constraints
+(default k = 200), each on a pick of a slice of a transposed slice of x, and
+a constraint on every row of a reshaped pick of x.
+"""
+import os,sys
+import time
+import numpy
+
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),'..'))
+from mosek.fusion import *
+
+def build(n,k):
+    rng = numpy.random.RandomState(0)
+    M = Model('views')
+    x = M.variable('x', [n,n], Domain.unbounded())
+    h = n//2
+    for i in range(k):
+        v = x.slice([0,0],[n,n-1]).transpose().slice([1,1],[h+1,h+1])
+        p = v.pick(rng.randint(0,h,h).astype(numpy.int32),rng.randint(0,h,h).astype(numpy.int32))
+        M.constraint(Expr.sum(p.slice(0,h-1)), Domain.lessThan(1.0))
+    r = Var.reshape(x.pick(numpy.arange(n,dtype=numpy.int32),numpy.arange(n,dtype=numpy.int32)[::-1].copy()),[n//4,4])
+    M.constraint(Expr.sum(r,1), Domain.equalsTo(0.0))
+    return M
+
+def main(n,k):
+    t0 = time.time()
+    M = build(n,k)
+    tbuild = time.time()-t0
+    M.dispose()
+
+    print('n = %d, k = %d' % (n,k))
+    print('  build  %8.4f s' % tbuild)
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 400,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 200)
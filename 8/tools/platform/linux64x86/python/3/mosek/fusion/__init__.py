@@ -8,6 +8,7 @@ from mosek.fusion.impl._implementation import mosek_fusion_QConeKey as QConeKey
 from mosek.fusion.impl._implementation import mosek_fusion_PSDKey as PSDKey
 from mosek.fusion.impl._implementation import mosek_fusion_RelationKey as RelationKey
 from mosek.fusion.impl._implementation import mosek_fusion_BaseModel as BaseModel
+from mosek.fusion.impl._implementation import mosek_fusion_BuildProfiler as BuildProfiler
 from mosek.fusion.impl._implementation import mosek_fusion_Debug as Debug
 from mosek.fusion.impl._implementation import mosek_fusion_Sort as Sort
 from mosek.fusion.impl._implementation import mosek_fusion_IndexCounter as IndexCounter
@@ -15,6 +16,7 @@ from mosek.fusion.impl._implementation import mosek_fusion_CommonTools as Common
 from mosek.fusion.impl._implementation import mosek_fusion_SolutionStruct as SolutionStruct
 from mosek.fusion.impl._implementation import mosek_fusion_ConNZStruct as ConNZStruct
 from mosek.fusion.impl._implementation import mosek_fusion_Model as Model
+from mosek.fusion.impl._implementation import mosek_fusion_Parameter as Parameter
 from mosek.fusion.impl._implementation import mosek_fusion_CompoundVariable as CompoundVariable
 from mosek.fusion.impl._implementation import mosek_fusion_RepeatVariable as RepeatVariable
 from mosek.fusion.impl._implementation import mosek_fusion_PickVariable as PickVariable
@@ -0,0 +1,91 @@
+"""
+Checks the bucket sort kernels in mosek.fusion.Utils.Tools against the
+reference implementation, for every value of MOSEK_FUSION_BUCKETSORT and
+both key types.
+
+Usage:
+  python -m pytest tests/test_bucketsort.py
+"""
+import os,sys
+import subprocess
+import numpy
+import pytest
+
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),'..'))
+import mosek
+import mosek.fusion
+
+Tools = mosek.fusion.Utils.Tools
+
+sorts = { numpy.int32 : Tools._bucketsort__3JJJ_3III,
+          numpy.int64 : Tools._bucketsort__3JJJ_3JJJ }
+
+def cases(rng):
+    # (n, first, last, minval, maxval), including empty and single element
+    # ranges and key ranges too wide for 16 bit keys.
+    yield 0, 0, 0, 0, 0
+    yield 5, 2, 2, 0, 3
+    yield 5, 4, 5, -2, 3
+    yield 1000, 0, 1000, 0, 0
+    yield 1000, 0, 1000, -70000, 70000
+    for k in range(20):
+        n = rng.randint(1,2000)
+        first = rng.randint(0,n+1)
+        last = rng.randint(first,n+1)
+        minval = rng.randint(-100,100)
+        maxval = minval + rng.choice([ 0, 1, 10, 1000, 100000 ])
+        yield n, first, last, minval, maxval
+
+def hasnative():
+    return all(Tools._nativebucketsort(t)[0] is not None for t in ('int32','int64'))
+
+def expected(perm,first,last,v):
+    res = perm.copy()
+    p = perm[first:last]
+    res[first:last] = p[numpy.argsort(v[p],kind='mergesort')]
+    return res
+
+@pytest.mark.parametrize('impl', [ 'numpy', 'native', 'python' ])
+@pytest.mark.parametrize('dtype', [ numpy.int32, numpy.int64 ])
+@pytest.mark.parametrize('seed', range(3))
+def test_bucketsort(monkeypatch,impl,dtype,seed):
+    if impl == 'native' and not hasnative():
+        pytest.skip('native bucket sort needs MSK_bucketsort from the MOSEK library')
+    monkeypatch.setattr(Tools,'_bucketsortimpl',impl)
+    rng = numpy.random.RandomState(seed)
+    for n,first,last,minval,maxval in cases(rng):
+        v = rng.randint(minval,maxval+1,n).astype(dtype)
+        perm = rng.permutation(n).astype(numpy.int64)
+
+        ref = perm.copy()
+        Tools._bucketsort_ref(ref,first,last,v,minval,maxval)
+        assert numpy.array_equal(ref,expected(perm,first,last,v))
+
+        res = perm.copy()
+        sorts[dtype](res,first,last,v,minval,maxval)
+        assert numpy.array_equal(res,ref), (n,first,last,minval,maxval)
+
+@pytest.mark.parametrize('impl', [ 'numpy', 'native', 'python' ])
+@pytest.mark.parametrize('dtype', [ numpy.int32, numpy.int64 ])
+def test_bucketsort_strided(monkeypatch,impl,dtype):
+    # Strided arrays are copied before the native call; only perm[first:last]
+    # may change.
+    if impl == 'native' and not hasnative():
+        pytest.skip('native bucket sort needs MSK_bucketsort from the MOSEK library')
+    monkeypatch.setattr(Tools,'_bucketsortimpl',impl)
+    rng = numpy.random.RandomState(0)
+    n,first,last = 500,100,400
+    v = numpy.repeat(rng.randint(-10,10,n).astype(dtype),2)[::2]
+    perm = numpy.repeat(rng.permutation(n).astype(numpy.int64),2)[::2]
+    ref = expected(perm,first,last,v)
+    sorts[dtype](perm,first,last,v,-10,9)
+    assert numpy.array_equal(perm,ref)
+
+@pytest.mark.parametrize('impl', [ 'numpy', 'native', 'python' ])
+def test_environment(impl):
+    env = dict(os.environ,MOSEK_FUSION_BUCKETSORT=impl)
+    out = subprocess.check_output([ sys.executable, '-c',
+                                    'import sys; sys.path.insert(0,sys.argv[1]); import mosek.fusion; print(mosek.fusion.Utils.Tools._bucketsortimpl)',
+                                    os.path.join(os.path.dirname(os.path.abspath(__file__)),'..') ],
+                                  env=env)
+    assert out.decode().strip() == impl
@@ -0,0 +1,75 @@
+"""
+Checks that Model.save and Model.load round-trip a model and that load
+rejects files that refer to anything but Fusion and numpy data types.
+
+Usage:
+  python -m pytest tests/test_save.py
+"""
+import os,sys
+import io
+import json
+import pickle
+import numpy
+import pytest
+
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),'..'))
+from mosek.fusion import *
+
+def build(fname):
+    with Model('save') as M:
+        x = M.variable('x', [3,4], Domain.greaterThan(0.0))
+        M.constraint('c', Expr.sum(x,0), Domain.lessThan(1.0))
+        M.objective(ObjectiveSense.Maximize, Expr.sum(x))
+        M.save(fname)
+
+def rewrite(fname,**entries):
+    with numpy.load(fname) as f:
+        data = dict((k,f[k]) for k in f.files)
+    data.update(entries)
+    with open(fname,'wb') as f:
+        numpy.savez(f,**data)
+
+def tobytes(b):
+    return numpy.frombuffer(b,dtype=numpy.uint8)
+
+class Payload(object):
+    def __reduce__(self):
+        return (os.system,('exit 1',))
+
+def test_roundtrip(tmpdir):
+    fname = str(tmpdir.join('m.fsn'))
+    build(fname)
+    with Model.load(fname) as M:
+        assert M.getVariable('x').getShape().dim(1) == 4
+        assert M.getConstraint('c').size() == 4
+
+def test_header(tmpdir):
+    fname = str(tmpdir.join('m.fsn'))
+    build(fname)
+    with numpy.load(fname) as f:
+        header = json.loads(f['header'].tobytes().decode('ascii'))
+    assert header['format'] == 'mosek.fusion.Model' and header['version'] == 2
+
+    header['version'] += 1
+    rewrite(fname,header=tobytes(json.dumps(header).encode('ascii')))
+    with pytest.raises(ModelError):
+        Model.load(fname)
+
+def test_rejects_globals(tmpdir):
+    fname = str(tmpdir.join('m.fsn'))
+    build(fname)
+    rewrite(fname,fusion=tobytes(pickle.dumps({ '_synched' : Payload() },2)))
+    with pytest.raises(ModelError):
+        Model.load(fname)
+
+def test_rejects_persistent_ids(tmpdir):
+    class Pickler(pickle.Pickler):
+        def persistent_id(self,o):
+            return ('class','os') if isinstance(o,Payload) else None
+    fname = str(tmpdir.join('m.fsn'))
+    build(fname)
+    data = io.BytesIO()
+    Pickler(data,2).dump({ '_synched' : Payload() })
+    rewrite(fname,fusion=tobytes(data.getvalue()))
+    with pytest.raises(ModelError):
+        Model.load(fname)